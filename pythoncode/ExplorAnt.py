@@ -1,7 +1,11 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2020-05-07"
+__version__ = "2026-10-18"
+# 2026-10-18    Pairing: the device is taken from the extended data of the
+#               broadcast, ChannelID requested only if the dongle does not
+#               support extended messages
+# 2026-10-18    Received ANT messages are handled by antDispatcher
 # 2020-05-07    clsAntDongle encapsulates all functions
 #               and implements dongle recovery
 # 2020-05-01    Added: Vortex Headunit
@@ -34,6 +38,7 @@ import wx
 
 from datetime import datetime
 
+import antDispatcher
 import antDongle         as ant
 import antHRM            as hrm
 import antFE             as fe
@@ -49,6 +54,245 @@ class clsDeviceID(object):
         self.DeviceTypeID        = DeviceTypeID
         self.TransmissionType    = TransmissionType
 
+#-------------------------------------------------------------------------------
+# ANT message handlers, registered in the Dispatcher below
+#
+# A message is the communication with the network (the dongle)
+# A datapage is the data that is exchanged with another device on the network
+#
+# The handlers return None when handled, otherwise the message is IGNORED.
+#-------------------------------------------------------------------------------
+#-------------------------------------------------------------------------------
+# HRM_s = Heart rate Monitor Display
+# We are slave, listening to a master (Heartrate belt)
+# Data page 0...4 HRM data
+#-------------------------------------------------------------------------------
+def HRM_Data(info, _Channel, _DataPageNumber):
+    global HRM_s_count, HRM_HeartRate, HRM_page2_done, HRM_page3_done
+    HRM_s_count += 1
+    if HRM_s_count > 99: HRM_s_count= 0
+
+    _Channel, DataPageNumber, Spec1, Spec2, Spec3, _HeartBeatEventTime, _HeartBeatCount, HRM_HeartRate = \
+        ant.msgUnpage_Hrm(info)
+    if DataPageNumber & 0x7f == 2:
+        if HRM_page2_done == False:
+            HRM_page2_done = True
+            HRM_ManufacturerID = Spec1
+            HRM_SerialNumber   = (Spec3 << 8) + Spec2
+            logfile.Console ("HRM page=%s ManufacturerID=%s SerialNumber=%s" % \
+                        (DataPageNumber, HRM_ManufacturerID, HRM_SerialNumber))
+
+    if DataPageNumber & 0x7f == 3:
+        if HRM_page3_done == False:
+            HRM_page3_done = True
+            HRM_HWrevision = Spec1
+            HRM_SWversion  = Spec2
+            HRM_Model      = Spec3
+            logfile.Console ("HRM page=%s HWrevision=%s, SWversion=%s Model=%s" % \
+                    (DataPageNumber, HRM_HWrevision, HRM_SWversion, HRM_Model))
+
+def HRM_Unknown(_info, _Channel, _DataPageNumber):
+    global HRM_s_count
+    HRM_s_count += 1
+    if HRM_s_count > 99: HRM_s_count= 0
+    return "Unknown HRM data page"
+
+#-------------------------------------------------------------------------------
+# FE_s = Cycle Training Program (e.g. Zwift, Trainer Road)
+# We are slave, listening to a master Tacx Trainer
+#-------------------------------------------------------------------------------
+def FE_s_Received():
+    global FE_s_count
+    FE_s_count += 1
+    if FE_s_count > 99: FE_s_count= 0
+
+#-------------------------------------------------------------------------------
+# Data page 16 (0x10) General FE data
+#-------------------------------------------------------------------------------
+def FE_GeneralFEdata(info, _Channel, _DataPageNumber):
+    global FE_Speed, FE_HeartRate
+    FE_s_Received()
+    _Channel, _DataPageNumber, _EquipmentType, _ElapsedTime, _DistanceTravelled, \
+        FE_Speed, FE_HeartRate, _Capabilities = \
+        ant.msgUnpage16_GeneralFEdata(info)
+
+    FE_Speed = round( FE_Speed / ( 1000*1000/3600 ), 1)
+
+#-------------------------------------------------------------------------------
+# Data page 25 (0x19) Trainer info
+#-------------------------------------------------------------------------------
+def FE_TrainerData(info, _Channel, _DataPageNumber):
+    global FE_Cadence, FE_Power
+    FE_s_Received()
+    _Channel, _DataPageNumber, _Event, FE_Cadence, _AccPower, FE_Power, _Flags = \
+        ant.msgUnpage25_TrainerData(info)
+
+#-------------------------------------------------------------------------------
+# Data page 80 (0x50) Manufacturers info
+#-------------------------------------------------------------------------------
+def FE_ManufacturerInfo(info, _Channel, _DataPageNumber):
+    global FE_page80_done
+    FE_s_Received()
+    if FE_page80_done == False:
+        FE_page80_done = True
+        _Channel, DataPageNumber, _Reserved, _Reserved, FE_HWrevision, FE_ManufacturerID, FE_ModelNumber = \
+            ant.msgUnpage80_ManufacturerInfo(info)
+        logfile.Console ("FE Page=%s HWrevision=%s ManufacturerID=%s Model=%s" % \
+                       (DataPageNumber, FE_HWrevision, FE_ManufacturerID, FE_ModelNumber))
+
+#-------------------------------------------------------------------------------
+# Data page 81 (0x51) Product Information
+#-------------------------------------------------------------------------------
+def FE_ProductInformation(info, _Channel, _DataPageNumber):
+    global FE_page81_done
+    FE_s_Received()
+    if FE_page81_done == False:
+        FE_page81_done = True
+        _Channel, DataPageNumber, _Reserved1, FE_SWrevisionSupp, FE_SWrevisionMain, FE_SerialNumber = \
+            ant.msgUnpage81_ProductInformation(info)
+        logfile.Console ("FE Page=%s SWrevision=%s.%s Serial#=%s" % \
+                       (DataPageNumber, FE_SWrevisionMain, FE_SWrevisionSupp, FE_SerialNumber))
+
+def FE_s_Unknown(_info, _Channel, _DataPageNumber):
+    FE_s_Received()
+    return "Unknown FE data page"
+
+#-------------------------------------------------------------------------------
+# SCS_s = Speed Cadence Sensor Display
+# We are slave, listening to a master (Speed Cadence Sensor)
+# Only one Data page for SCS! msgUnpage_SCS
+#-------------------------------------------------------------------------------
+def SCS_SpeedCadence(info, _Channel, _DataPageNumber):
+    global SCS_s_count, pEventTime, pCadenceRevolutionCount, pSpeedRevolutionCount
+    SCS_s_count += 1
+    if SCS_s_count > 99: SCS_s_count= 0
+
+    EventTime, CadenceRevolutionCount, _EventTime, \
+        SpeedRevolutionCount = ant.msgUnpage_SCS(info)
+
+    if pEventTime != None and EventTime != pEventTime:
+        cadence = 60 * (CadenceRevolutionCount - pCadenceRevolutionCount) * 1024 / \
+                    (EventTime - pEventTime)
+        cadence = int(cadence)
+
+        speed   = (SpeedRevolutionCount - pSpeedRevolutionCount) * 2.096 * 3.600 /  \
+                    (EventTime - pEventTime)
+        print ('EventTime=%5s (%5s) CadenceRevolutionCount=%5s (%5s) Cadence=%3s EventTime=%5s SpeedRevolutionCount=%5s Speed=%4.1f' % \
+            (EventTime, EventTime - pEventTime, \
+             CadenceRevolutionCount, CadenceRevolutionCount - pCadenceRevolutionCount, \
+             cadence, _EventTime, SpeedRevolutionCount, speed))
+    pCadenceRevolutionCount = CadenceRevolutionCount
+    pSpeedRevolutionCount   = SpeedRevolutionCount
+    pEventTime              = EventTime
+
+#-------------------------------------------------------------------------------
+# VTX_s = Tacx i-Vortex trainer
+# We are slave, listening to a master (the real trainer)
+#-------------------------------------------------------------------------------
+#-------------------------------------------------------------------------------
+# Data page 00 msgUnpage00_TacxVortexDataSpeed
+#-------------------------------------------------------------------------------
+def VTX_DataSpeed(info, _Channel, _DataPageNumber):
+    global VTX_UsingVirtualSpeed, VTX_Power, VTX_Speed, VTX_CalibrationState, VTX_Cadence
+    VTX_UsingVirtualSpeed, VTX_Power, VTX_Speed, VTX_CalibrationState, VTX_Cadence = \
+        ant.msgUnpage00_TacxVortexDataSpeed(info)
+    VTX_Speed = round( VTX_Speed / ( 100 * 1000 / 3600 ), 1)
+    # logfile.Console ('i-Vortex Page=%s UsingVirtualSpeed=%s Power=%s Speed=%s State=%s Cadence=%s' % \
+    #   (DataPageNumber, VTX_UsingVirtualSpeed, VTX_Power, VTX_Speed, VTX_CalibrationState, VTX_Cadence) )
+
+#-------------------------------------------------------------------------------
+# Data page 01 msgUnpage01_TacxVortexDataSerial
+#-------------------------------------------------------------------------------
+def VTX_DataSerial(info, _Channel, DataPageNumber):
+    global VTX_S1, VTX_S2, VTX_Serial, VTX_Alarm
+    VTX_S1, VTX_S2, VTX_Serial, VTX_Alarm = ant.msgUnpage01_TacxVortexDataSerial(info)
+    logfile.Console ('i-Vortex Page=%s S1=%s S2=%s Serial=%s Alarm=%s' % \
+        (DataPageNumber, VTX_S1, VTX_S2, VTX_Serial, VTX_Alarm) )
+
+#-------------------------------------------------------------------------------
+# Data page 02 msgUnpage02_TacxVortexDataVersion
+#-------------------------------------------------------------------------------
+def VTX_DataVersion(info, _Channel, DataPageNumber):
+    global VTX_Major, VTX_Minor, VTX_Build
+    VTX_Major, VTX_Minor, VTX_Build = ant.msgUnpage02_TacxVortexDataVersion(info)
+    logfile.Console ('i-Vortex Page=%s Major=%s Minor=%s Build=%s' % \
+        (DataPageNumber, VTX_Major, VTX_Minor, VTX_Build))
+
+#-------------------------------------------------------------------------------
+# Data page 03 msgUnpage03_TacxVortexDataCalibration
+#-------------------------------------------------------------------------------
+def VTX_DataCalibration(info, _Channel, _DataPageNumber):
+    global VTX_Calibration, VTX_VortexID
+    VTX_Calibration, VTX_VortexID = ant.msgUnpage03_TacxVortexDataCalibration(info)
+    # logfile.Console ('i-Vortex Page=%s Calibration=%s VortexID=%s' % \
+    #    (DataPageNumber, VTX_Calibration, VTX_VortexID))
+
+#-------------------------------------------------------------------------------
+# VTX = Cycle Training Program (e.g. Zwift, Trainer Road)
+# We are slave, listening to a master Fortius ANT or TTS
+#-------------------------------------------------------------------------------
+def VTX_SetPower(info, _Channel, _DataPageNumber):
+    _VTX_Channel, _VTX_DataPageNumber, _VTX_VortexID, _VTX_Command, _VTX_Subcommand, \
+        _VTX_NoCalibrationData, _VTX_Power = ant.msgUnpage16_TacxVortexSetPower(info)
+
+#-------------------------------------------------------------------------------
+# AcknowledgedData: Fitness Equipment Channel inputs (Trainer Road, Zwift)
+#-------------------------------------------------------------------------------
+def FE_Command(_info, _Channel, DataPageNumber):
+    global dpBasicResistance, dpTargetPower, dpTrackResistance, dpUserConfiguration
+    if   DataPageNumber == 48: dpBasicResistance   += 1     # Basic resistance
+    elif DataPageNumber == 49: dpTargetPower       += 1     # Target Power
+    elif DataPageNumber == 51: dpTrackResistance   += 1     # Track resistance
+    elif DataPageNumber == 55: dpUserConfiguration += 1     # User configuration
+
+#-------------------------------------------------------------------------------
+# Data page 70 Request data page
+#-------------------------------------------------------------------------------
+def FE_RequestDataPage(info, _Channel, _DataPageNumber):
+    global dpRequestDatapage
+    dpRequestDatapage += 1
+    _SlaveSerialNumber, _DescriptorByte1, _DescriptorByte2, _AckRequired, NrTimes, \
+        RequestedPageNumber, _CommandType = ant.msgUnpage70_RequestDataPage(info)
+
+    if   RequestedPageNumber == 80:
+        info = ant.msgPage80_ManufacturerInfo(ant.channel_FE, 0xff, 0xff, \
+            ant.HWrevision_FE, ant.Manufacturer_tacx, ant.ModelNumber_FE)
+    elif RequestedPageNumber == 81:
+        info = ant.msgPage81_ProductInformation(ant.channel_FE, 0xff, \
+            ant.SWrevisionSupp_FE, ant.SWrevisionMain_FE, ant.SerialNumber_FE)
+    elif RequestedPageNumber == 82:
+        info = ant.msgPage82_BatteryStatus(ant.channel_FE)
+    else:
+        return "Requested page not suported"
+
+    d = ant.ComposeMessage (ant.msgID_BroadcastData, info)
+    AntDongle.Write([d] * NrTimes, False)
+
+#-------------------------------------------------------------------------------
+# Message ChannelResponse, acknowledges a message
+#-------------------------------------------------------------------------------
+def Ignore(_info, _Channel, _DataPageNumber):
+    pass
+
+Dispatcher = antDispatcher.clsAntDispatcher()
+Dispatcher.Register(Ignore,                 ant.msgID_ChannelResponse,  Name='ChannelResponse')
+Dispatcher.Register(HRM_Data,               ant.msgID_BroadcastData,    ant.channel_HRM_s, \
+                    [p | t for p in (0,1,2,3,4,5,6,7,89) for t in (0x00, 0x80)])
+Dispatcher.Register(HRM_Unknown,            ant.msgID_BroadcastData,    ant.channel_HRM_s)
+Dispatcher.Register(FE_GeneralFEdata,       ant.msgID_BroadcastData,    ant.channel_FE_s, [16])
+Dispatcher.Register(FE_TrainerData,         ant.msgID_BroadcastData,    ant.channel_FE_s, [25])
+Dispatcher.Register(FE_ManufacturerInfo,    ant.msgID_BroadcastData,    ant.channel_FE_s, [80])
+Dispatcher.Register(FE_ProductInformation,  ant.msgID_BroadcastData,    ant.channel_FE_s, [81])
+Dispatcher.Register(FE_s_Unknown,           ant.msgID_BroadcastData,    ant.channel_FE_s)
+Dispatcher.Register(SCS_SpeedCadence,       ant.msgID_BroadcastData,    ant.channel_SCS_s)
+Dispatcher.Register(VTX_DataSpeed,          ant.msgID_BroadcastData,    ant.channel_VTX_s, [0])
+Dispatcher.Register(VTX_DataSerial,         ant.msgID_BroadcastData,    ant.channel_VTX_s, [1])
+Dispatcher.Register(VTX_DataVersion,        ant.msgID_BroadcastData,    ant.channel_VTX_s, [2])
+Dispatcher.Register(VTX_DataCalibration,    ant.msgID_BroadcastData,    ant.channel_VTX_s, [3])
+Dispatcher.Register(VTX_SetPower,           ant.msgID_BroadcastData,    ant.channel_VTX, [16])
+Dispatcher.Register(FE_Command,             ant.msgID_AcknowledgedData, ant.channel_FE, [48, 49, 51, 55])
+Dispatcher.Register(FE_RequestDataPage,     ant.msgID_AcknowledgedData, ant.channel_FE, [70])
+
 
 # ==============================================================================
 # Main program; Command line parameters
@@ -161,11 +405,15 @@ if AntDongle.OK and not clv.SimulateTrainer:
         #-------------------------------------------------------------------
         # Ask for ChannelID message
         # Refer to D0652.pdf, page 120. en section 9.5.4.4
+        # Not needed with extended messages; then each broadcast tells the
+        # device that is paired
         #-------------------------------------------------------------------
-        messages = []
-        for i in range(0, NrDevicesToPair):
-            messages.append (ant.msg4D_RequestMessage(i, ant.msgID_ChannelID) )
-        AntDongle.Write(messages, False, False)
+        if not AntDongle.ExtendedMessages:
+            messages = []
+            for i in range(0, NrDevicesToPair):
+                messages.append (ant.msg4D_RequestMessage(i, ant.msgID_ChannelID) )
+            AntDongle.Write(messages, False, False)
+        Discovered = set()          # Channels paired with a device
 
         print ('Wait for responses from channel what device is paired: ', end='')
         while RunningSwitch == True and pairingCounter > 0:
@@ -185,6 +433,7 @@ if AntDongle.OK and not clv.SimulateTrainer:
             for d in data:
                 synch, length, id, info, checksum, rest, Channel, DataPageNumber = \
                     ant.DecomposeMessage(d)
+                PairedID = None
 
                 #---------------------------------------------------------------
                 # ChannelResponse: acknowledge message
@@ -194,17 +443,31 @@ if AntDongle.OK and not clv.SimulateTrainer:
 
                 #---------------------------------------------------------------
                 # Message BroadcastData, provides a datapage from master
+                # and, with extended data, the master device (once per channel)
                 #---------------------------------------------------------------
                 elif id == ant.msgID_BroadcastData:
                     Unknown = False
+                    ExtendedData = ant.unmsgExtendedData(d)
+                    if ExtendedData and ExtendedData.DeviceNumber and Channel not in Discovered:
+                        PairedID = (Channel, ExtendedData.DeviceNumber, \
+                                    ExtendedData.DeviceTypeID, ExtendedData.TransmissionType)
 
                 #---------------------------------------------------------------
                 # ChannelID - the info from a Master device on the network
                 #---------------------------------------------------------------
                 elif id == ant.msgID_ChannelID:
                     Unknown = False
-                    Channel, DeviceNumber, DeviceTypeID, TransmissionType = \
-                        ant.unmsg51_ChannelID(info)
+                    PairedID = ant.unmsg51_ChannelID(info)
+
+                else:
+                    logfile.Console ("Ignore message id=%s ch=%s page=%s" % (hex(id), Channel, DataPageNumber))
+                    pass
+
+                #---------------------------------------------------------------
+                # A device is paired on the channel
+                #---------------------------------------------------------------
+                if PairedID:
+                    Channel, DeviceNumber, DeviceTypeID, TransmissionType = PairedID
 
                     #-----------------------------------------------------------
                     # Check what DeviceType is discovered
@@ -243,6 +506,7 @@ if AntDongle.OK and not clv.SimulateTrainer:
                         pass
                     else:
                         d = deviceID
+                        Discovered.add(Channel)
                         logfile.Write ("ExplorANT: %3s discovered on channel=%s, number=%5s typeID=%3s TrType=%3s" % \
                             (d.DeviceType, d.Channel, d.DeviceNumber, d.DeviceTypeID, d.TransmissionType) )
                         if not deviceID in deviceIDs:
@@ -262,9 +526,6 @@ if AntDongle.OK and not clv.SimulateTrainer:
                             logfile.Write('ExplorANT: already in list')
 
                     deviceID = None
-                else:
-                    logfile.Console ("Ignore message id=%s ch=%s page=%s" % (hex(id), Channel, DataPageNumber))
-                    pass
 
             #-------------------------------------------------------------------
             # Show some movement on screen during pairing
@@ -383,6 +644,9 @@ while AntDongle.OK:
             FE_page81_done      = False
 
             SCS_s_count         = 0
+            pEventTime          = None
+            pCadenceRevolutionCount = 0
+            pSpeedRevolutionCount   = 0
 
             VTX_UsingVirtualSpeed, VTX_Power, VTX_Speed, VTX_CalibrationState, VTX_Cadence = 0,0,0,0,0
             VTX_S1, VTX_S2, VTX_Serial, VTX_Alarm = 0,0,0,0
@@ -462,266 +726,11 @@ while AntDongle.OK:
 
                 #---------------------------------------------------------------
                 # Here all response from the ANT dongle are processed
-                #
-                # A message is the communication with the network (the dongle)
-                # A datapage is the data that is exchanged with another device
-                #       on the network
+                # by the handlers registered in the Dispatcher
                 #---------------------------------------------------------------
-                Unknown = True
                 for d in data:
-                    synch, length, id, info, checksum, rest, Channel, DataPageNumber = ant.DecomposeMessage(d)
-
-                    #-----------------------------------------------------------
-                    # Message ChannelResponse, acknowledges a message
-                    #-----------------------------------------------------------
-                    if id == ant.msgID_ChannelResponse:
-                        # Ignore
-                        Unknown = False
-
-                    #-----------------------------------------------------------
-                    # Message BroadcastData, provides a datapage from master
-                    #-----------------------------------------------------------
-                    elif id == ant.msgID_BroadcastData:
-                        #-------------------------------------------------------
-                        # HRM_s = Heart rate Monitor Display
-                        # We are slave, listening to a master (Heartrate belt)
-                        #-------------------------------------------------------
-                        if Channel == ant.channel_HRM_s:
-                            HRM_s_count += 1
-                            if HRM_s_count > 99: HRM_s_count= 0
-                            #---------------------------------------------------
-                            # Data page 0...4 HRM data
-                            #---------------------------------------------------
-                            if DataPageNumber & 0x7f in (0,1,2,3,4,5,6,7,89):
-                                Unknown = False
-                                Channel, DataPageNumber, Spec1, Spec2, Spec3, HeartBeatEventTime, HeartBeatCount, HRM_HeartRate = \
-                                    ant.msgUnpage_Hrm(info)
-                                if DataPageNumber & 0x7f == 2:
-                                    if HRM_page2_done == False:
-                                        HRM_page2_done = True
-                                        HRM_ManufacturerID = Spec1
-                                        HRM_SerialNumber   = (Spec3 << 8) + Spec2
-                                        logfile.Console ("HRM page=%s ManufacturerID=%s SerialNumber=%s" % \
-                                                    (DataPageNumber, HRM_ManufacturerID, HRM_SerialNumber))
-
-                                if DataPageNumber & 0x7f == 3:
-                                    if HRM_page3_done == False:
-                                        HRM_page3_done = True
-                                        HRM_HWrevision = Spec1
-                                        HRM_SWversion  = Spec2
-                                        HRM_Model      = Spec3
-                                        logfile.Console ("HRM page=%s HWrevision=%s, SWversion=%s Model=%s" % \
-                                                (DataPageNumber, HRM_HWrevision, HRM_SWversion, HRM_Model))
-
-
-                            #---------------------------------------------------
-                            # Data page 89   ??????????????????????????????
-                            #---------------------------------------------------
-                            elif DataPageNumber == 89:
-                                Unknown = True
-
-                        #-------------------------------------------------------
-                        # FE_s = Cycle Training Program (e.g. Zwift, Trainer Road)
-                        # We are slave, listening to a master Tacx Trainer
-                        #-------------------------------------------------------
-                        elif Channel == ant.channel_FE_s:
-                            FE_s_count += 1
-                            if FE_s_count > 99: FE_s_count= 0
-                            #---------------------------------------------------
-                            # Data page 16 (0x10) General FE data
-                            #---------------------------------------------------
-                            if DataPageNumber == 16:
-                                Unknown = False
-                                Channel, DataPageNumber, EquipmentType, ElapsedTime, DistanceTravelled, \
-                                    FE_Speed, FE_HeartRate, Capabilities = \
-                                    ant.msgUnpage16_GeneralFEdata(info)
-
-                                FE_Speed = round( FE_Speed / ( 1000*1000/3600 ), 1)
-
-                            #---------------------------------------------------
-                            # Data page 25 (0x19) Trainer info
-                            #---------------------------------------------------
-                            elif DataPageNumber == 25:
-                                Unknown = False
-                                Channel, DataPageNumber, xx_Event, FE_Cadence, xx_AccPower, FE_Power, xx_Flags = \
-                                    ant.msgUnpage25_TrainerData(info)
-
-                            #---------------------------------------------------
-                            # Data page 80 (0x50) Manufacturers info
-                            #---------------------------------------------------
-                            elif DataPageNumber == 80:
-                                Unknown = False
-                                if FE_page80_done == False:
-                                    FE_page80_done = True
-                                    Channel, DataPageNumber, Reserved, Reserved, FE_HWrevision, FE_ManufacturerID, FE_ModelNumber = \
-                                        ant.msgUnpage80_ManufacturerInfo(info)
-                                    logfile.Console ("FE Page=%s HWrevision=%s ManufacturerID=%s Model=%s" % \
-                                                   (DataPageNumber, FE_HWrevision, FE_ManufacturerID, FE_ModelNumber))
-
-                            #---------------------------------------------------
-                            # Data page 81 (0x51) Product Information
-                            #---------------------------------------------------
-                            elif DataPageNumber == 81:
-                                Unknown = False
-                                if FE_page81_done == False:
-                                    FE_page81_done = True
-                                    Channel, DataPageNumber, Reserved1, FE_SWrevisionSupp, FE_SWrevisionMain, FE_SerialNumber = \
-                                        ant.msgUnpage81_ProductInformation(info)
-                                    logfile.Console ("FE Page=%s SWrevision=%s.%s Serial#=%s" % \
-                                                   (DataPageNumber, FE_SWrevisionMain, FE_SWrevisionSupp, FE_SerialNumber))
-
-                        #-------------------------------------------------------
-                        # SCS_s = Heart rate Monitor Display
-                        # We are slave, listening to a master (Speed Cadence Sensor)
-                        #-------------------------------------------------------
-                        if Channel == ant.channel_SCS_s:
-                            SCS_s_count += 1
-                            if SCS_s_count > 99: SCS_s_count= 0
-
-                            #---------------------------------------------------
-                            # Only one Data page for SCS! msgUnpage_SCS
-                            #---------------------------------------------------
-                            Unknown = False
-                            EventTime, CadenceRevolutionCount, _EventTime, \
-                                SpeedRevolutionCount = ant.msgUnpage_SCS(info)
-
-                            try:
-                                _ = pEventTime
-                            except:
-                                pass
-                            else:
-                                if EventTime != pEventTime:
-                                    cadence = 60 * (CadenceRevolutionCount - pCadenceRevolutionCount) * 1024 / \
-                                                (EventTime - pEventTime)
-                                    cadence = int(cadence)
-
-                                    speed   = (SpeedRevolutionCount - pSpeedRevolutionCount) * 2.096 * 3.600 /  \
-                                                (EventTime - pEventTime)
-                                    print ('EventTime=%5s (%5s) CadenceRevolutionCount=%5s (%5s) Cadence=%3s EventTime=%5s SpeedRevolutionCount=%5s Speed=%4.1f' % \
-                                        (EventTime, EventTime - pEventTime, \
-                                         CadenceRevolutionCount, CadenceRevolutionCount - pCadenceRevolutionCount, \
-                                         cadence, _EventTime, SpeedRevolutionCount, speed))
-                            pCadenceRevolutionCount = CadenceRevolutionCount
-                            pSpeedRevolutionCount   = SpeedRevolutionCount
-                            pEventTime              = EventTime
-
-                        #-------------------------------------------------------
-                        # VTX_s = Tacx i-Vortex trainer
-                        # We are slave, listening to a master (the real trainer)
-                        #-------------------------------------------------------
-                        elif Channel == ant.channel_VTX_s:
-                            #---------------------------------------------------
-                            # Data page 00 msgUnpage00_TacxVortexDataSpeed
-                            #---------------------------------------------------
-                            if DataPageNumber == 0:
-                                Unknown = False
-                                VTX_UsingVirtualSpeed, VTX_Power, VTX_Speed, VTX_CalibrationState, VTX_Cadence = \
-                                    ant.msgUnpage00_TacxVortexDataSpeed(info)
-                                VTX_Speed = round( VTX_Speed / ( 100 * 1000 / 3600 ), 1)
-                                # logfile.Console ('i-Vortex Page=%s UsingVirtualSpeed=%s Power=%s Speed=%s State=%s Cadence=%s' % \
-                                #   (DataPageNumber, VTX_UsingVirtualSpeed, VTX_Power, VTX_Speed, VTX_CalibrationState, VTX_Cadence) )
-
-                            #---------------------------------------------------
-                            # Data page 01 msgUnpage01_TacxVortexDataSerial
-                            #---------------------------------------------------
-                            elif DataPageNumber == 1:
-                                Unknown = False
-                                VTX_S1, VTX_S2, VTX_Serial, VTX_Alarm = ant.msgUnpage01_TacxVortexDataSerial(info)
-                                logfile.Console ('i-Vortex Page=%s S1=%s S2=%s Serial=%s Alarm=%s' % \
-                                    (DataPageNumber, VTX_S1, VTX_S2, VTX_Serial, VTX_Alarm) )
-
-                            #---------------------------------------------------
-                            # Data page 02 msgUnpage02_TacxVortexDataVersion
-                            #---------------------------------------------------
-                            elif DataPageNumber == 2:
-                                Unknown = False
-                                VTX_Major, VTX_Minor, VTX_Build = ant.msgUnpage02_TacxVortexDataVersion(info)
-                                logfile.Console ('i-Vortex Page=%s Major=%s Minor=%s Build=%s' % \
-                                    (DataPageNumber, VTX_Major, VTX_Minor, VTX_Build))
-
-                            #---------------------------------------------------
-                            # Data page 03 msgUnpage03_TacxVortexDataCalibration
-                            #---------------------------------------------------
-                            elif DataPageNumber == 3:
-                                Unknown = False
-                                VTX_Calibration, VTX_VortexID = ant.msgUnpage03_TacxVortexDataCalibration(info)
-                                # logfile.Console ('i-Vortex Page=%s Calibration=%s VortexID=%s' % \
-                                #    (DataPageNumber, VTX_Calibration, VTX_VortexID))
-
-                        #-------------------------------------------------------
-                        # VTX = Cycle Training Program (e.g. Zwift, Trainer Road)
-                        # We are slave, listening to a master Fortius ANT or TTS
-                        #
-                        #-------------------------------------------------------
-                        elif Channel == ant.channel_VTX:
-                            VTX_Channel, VTX_DataPageNumber, VTX_VortexID, VTX_Command, VTX_Subcommand, VTX_NoCalibrationData, VTX_Power = \
-                                ant.msgUnpage16_TacxVortexSetPower(info)
-                            Unknown = False
-
-                    elif id == ant.msgID_AcknowledgedData:
-                        #-----------------------------------------------------------
-                        # Fitness Equipment Channel inputs (Trainer Road, Zwift)
-                        #-----------------------------------------------------------
-                        if Channel == ant.channel_FE:
-                            #-------------------------------------------------------
-                            # Data page 48 (0x30) Basic resistance
-                            #-------------------------------------------------------
-                            if   DataPageNumber == 48:
-                                dpBasicResistance += 1
-
-                            #-------------------------------------------------------
-                            # Data page 49 (0x31) Target Power
-                            #-------------------------------------------------------
-                            elif   DataPageNumber == 49:
-                                dpTargetPower += 1
-
-                            #-------------------------------------------------------
-                            # Data page 51 (0x33) Track resistance
-                            #-------------------------------------------------------
-                            elif DataPageNumber == 51:
-                                dpTrackResistance += 1
-
-                            #-------------------------------------------------------
-                            # Data page 55 User configuration
-                            #-------------------------------------------------------
-                            elif DataPageNumber == 55:
-                                dpUserConfiguration += 1
-
-                            #-------------------------------------------------------
-                            # Data page 70 Request data page
-                            #-------------------------------------------------------
-                            elif DataPageNumber == 70:
-                                dpRequestDatapage += 1
-                                SlaveSerialNumber, DescriptorByte1, DescriptorByte2, AckRequired, NrTimes, \
-                                    RequestedPageNumber, CommandType = ant.msgUnpage70_RequestDataPage(info)
-
-                                info = False
-                                if   RequestedPageNumber == 80:
-                                    info = ant.msgPage80_ManufacturerInfo(ant.channel_FE, 0xff, 0xff, \
-                                        ant.HWrevision_FE, ant.Manufacturer_tacx, ant.ModelNumber_FE)
-                                    comment = "(Manufactorer info)"
-                                elif RequestedPageNumber == 81:
-                                    info = ant.msgPage81_ProductInformation(ant.channel_FE, 0xff, \
-                                        ant.SWrevisionSupp_FE, ant.SWrevisionMain_FE, ant.SerialNumber_FE)
-                                    comment = "(Product info)"
-                                elif RequestedPageNumber == 82:
-                                    info = ant.msgPage82_BatteryStatus(ant.channel_FE)
-                                    comment = "(Battery status)"
-                                else:
-                                    error = "Requested page not suported"
-                                if info != False:
-                                    data = []
-                                    d    = ant.ComposeMessage (ant.msgID_BroadcastData, info)
-                                    while (NrTimes):
-                                        data.append(d)
-                                        NrTimes -= 1
-                                    AntDongle.Write(data, False)
-
-                            #-------------------------------------------------------
-                            # Other data pages
-                            #-------------------------------------------------------
-                            else: error = "Unknown FE data page"
-                    if Unknown:
+                    if Dispatcher.Dispatch(d):
+                        _synch, _length, id, info, _checksum, _rest, Channel, DataPageNumber = ant.DecomposeMessage(d)
                         logfile.Console ("IGNORED!! msg=%s ch=%s p=%s info=%s" % \
                                         (hex(id), Channel, DataPageNumber, logfile.HexSpace(info)))
 
@@ -770,6 +779,7 @@ while AntDongle.OK:
             logfile.Console ("Listening stopped")
         except Exception as e:
             logfile.Console ("Listening stopped due to exception: " + str(e))
+        logfile.Console (Dispatcher.Statistics())
         #---------------------------------------------------------------
         # Free channel
         #---------------------------------------------------------------
@@ -1,7 +1,11 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2020-11-18"
+__version__ = "2026-10-18"
+# 2026-10-18    Pedal stroke analysis in console mode; the profile is recorded
+#               by pedalStroke.clsPedalStrokeRecorder, console 'p' shows it
+# 2026-10-18    Loop timing report on request; console 't', GUI Ctrl-T which is
+#               sent to the parent process as cmd_TimingReport
 # 2020-11-18    Logfile shows what version is started; windows exe or python
 # 2020-11-13    Logfile was not closed on end
 # 2020-11-05    New files added, githubWindowTitle() used
@@ -18,6 +22,7 @@ import pickle
 import platform, glob
 import os
 import random
+import select
 import sys
 import struct
 import threading
@@ -31,6 +36,8 @@ import antFE                as fe
 import antPWR               as pwr
 import debug
 import logfile
+import loopTiming
+import pedalStroke
 import FortiusAntBody
 import FortiusAntCommand    as cmd
 import FortiusAntGui        as gui
@@ -55,6 +62,7 @@ cmd_LocateHW            = 19592         # Child->Main; Response = True/False for
 cmd_Runoff              = 19593         # Child->Main; Response = True
 cmd_Tacx2Dongle         = 19594         # Child->Main; Response = True
 cmd_StopButton          = 19595         # Child->Main; Response = True
+cmd_TimingReport        = 19599         # Child->Main; No response expected
 
 cmd_SetMessages         = 19596         # Main->Child; No response expected
 cmd_SetValues           = 19597         # Main->Child; No response expected
@@ -147,6 +155,9 @@ class frmFortiusAnt(gui.frmFortiusAntGui):
     def callTacx2Dongle(self):
         return Tacx2Dongle(self)
 
+    def callTimingReport(self):
+        logfile.Console(loopTiming.Timing.Report())
+
 # ==============================================================================
 # Class to create a Console-GUI
 # ------------------------------------------------------------------------------
@@ -162,11 +173,18 @@ class clsFortiusAntConsole:
     def __init__(self):
         self.RunningSwitch       = False
         self.LastTime            = 0
+        self.PedalStrokeRecorder = None
 
     def Autostart(self):
         if LocateHW(self):
+            if clv.PedalStrokeAnalysis:
+                self.PedalStrokeRecorder = pedalStroke.clsPedalStrokeRecorder()
+                logfile.Console ("Pedal stroke analysis recorded in " + self.PedalStrokeRecorder.filename)
             self.RunningSwitch = True
             Tacx2Dongle(self)
+            if self.PedalStrokeRecorder:
+                self.PedalStrokeRecorder.Close()
+                logfile.Console (self.PedalStrokeRecorder.Report())
 
     def SetValues(self, fSpeed, iRevs, iPower, iTargetMode, iTargetPower, fTargetGrade, iTacx, iHeartRate, iTeeth):
         # ----------------------------------------------------------------------
@@ -187,6 +205,33 @@ class clsFortiusAntConsole:
             msg = "Target=%s Speed=%4.1fkmh hr=%3.0f Current=%3.0fW Cad=%3.0f r=%4.0f T=%3.0f" % \
                   (  sTarget,    fSpeed,  iHeartRate,       iPower,     iRevs,  iTacx, int(iTeeth) )
             logfile.Console (msg)
+            if not clv.gui: self.ConsoleKey()
+
+    # --------------------------------------------------------------------------
+    # Console: 't' (followed by Enter, except on Windows) shows the loop timing
+    #          'p' shows the pedal stroke profile
+    # --------------------------------------------------------------------------
+    def ConsoleKey(self):
+        Key = ''
+        try:
+            if os.name == 'nt':
+                import msvcrt
+                if msvcrt.kbhit(): Key = msvcrt.getwch()
+            elif select.select([sys.stdin], [], [], 0)[0]:
+                Key = sys.stdin.readline()[:1]
+        except:
+            pass                            # No console (e.g. started as service)
+        if Key in ('t', 'T'):
+            logfile.Console(loopTiming.Timing.Report())
+        elif Key in ('p', 'P') and self.PedalStrokeRecorder:
+            logfile.Console(self.PedalStrokeRecorder.Report())
+
+    # --------------------------------------------------------------------------
+    # Console: no RadarGraph, the profile of each stroke is recorded
+    # --------------------------------------------------------------------------
+    def PedalStrokeAnalysis(self, info, Cadence):
+        if self.PedalStrokeRecorder:
+            self.PedalStrokeRecorder.Record(info, Cadence)
 
     def SetMessages(self, Tacx=None, Dongle=None, HRM=None):
         if Tacx   != None:
@@ -300,6 +345,9 @@ class frmFortiusAntChild(gui.frmFortiusAntGui):
         rtn = self.GuiMessageToMain(cmd_Tacx2Dongle)
         return rtn
 
+    def callTimingReport(self):
+        self.GuiMessageToMain(cmd_TimingReport, False)
+
     def OnClick_btnStop(self, event=False):
         gui.frmFortiusAntGui.OnClick_btnStop(self, event)
         self.GuiMessageToMain(cmd_StopButton, False)
@@ -413,6 +461,9 @@ class clsFortiusAntParent:
                 self.RunningSwitch = False
                 self.MainRespondToGUI(cmd_StopButton, True)
 
+            elif gui_command == cmd_TimingReport:
+                logfile.Console(loopTiming.Timing.Report())
+
             else:
                 logfile.Console('Unexpected command from GUI: %s' % gui_command)
                 rtn = False
@@ -502,6 +553,7 @@ if __name__ == "__main__":
         logfile.Write(s % ('FortiusAntCommand',         cmd.__version__ ))
         logfile.Write(s % ('FortiusAntGui',             gui.__version__ ))
         logfile.Write(s % ('logfile',               logfile.__version__ ))
+        logfile.Write(s % ('pedalStroke',       pedalStroke.__version__ ))
         logfile.Write(s % ('RadarGraph',         RadarGraph.__version__ ))
         logfile.Write(s % ('structConstants',            sc.__version__ ))
         logfile.Write(s % ('TCXexport',           TCXexport.__version__ ))
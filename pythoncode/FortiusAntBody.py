@@ -1,7 +1,41 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2020-12-10"
+__version__ = "2026-10-18"
+# 2026-10-18    The trainer thread is started by StartTrainer() and stopped by
+#                   StopTrainer(), after which the stop command is sent;
+#                   target values are shown with TacxTrainer.GetTarget()
+# 2026-10-18    StartTrainer() and StopTrainer() start/stop the background
+#                   USB-transfers (--UsbAsync) at begin/end of Runoff and
+#                   Tacx2Dongle; they do not run while idle
+# 2026-10-18    Pedal stroke analysis also in console mode (recorded by the
+#                   console, see pedalStroke); the collected samples are
+#                   limited to one stroke at low cadence
+# 2026-10-18    Each ANT+ profile (FE, HRM, PWR, SCS) is broadcast at its own
+#                   channel period (or --AntRate), the trainer is polled at
+#                   --PollRate; both are tasks of the scheduler
+# 2026-10-18    The duration of each phase of the Tacx2Dongle and Runoff loops
+#                   is recorded in loopTiming, reported at the end
+# 2026-10-18    --Asyncio; Tacx2DongleAsync() runs the phases of the main loop
+#                   as coroutines, see asyncRuntime
+# 2026-10-18    Runoff and Tacx2Dongle loops use scheduler.clsScheduler; tasks
+#                   with absolute deadlines, so that ANT is broadcast at exactly
+#                   4Hz and overruns are counted per task
+# 2026-10-18    HRM pairing from the extended data of the heartbeat message,
+#                   ChannelID requested only if the dongle does not support it
+# 2026-10-18    Multiple ANT-dongles (-D list) are used as clsAntDonglePool
+# 2026-10-18    ANT channels are configured in one batch (BeginChannelSetup)
+# 2026-10-18    Received ANT messages are handled by antDispatcher; a handler
+#                   per message id, channel and page instead of if/elif
+# 2026-10-18    --AntReceiver; the ANT-dongle is read by a thread and a command
+#                   from the CTP wakes up the main loop immediatly
+# 2026-10-18    Broadcasts are written pipelined (one read for all messages)
+# 2026-10-18    Calibration is skipped when this trainer was calibrated
+#                   recently (e.g. restart during a session), see hardwareCache
+# 2026-10-18    TacxTrainer.Statistics() logged at end of Runoff/Tacx2Dongle
+# 2026-10-18    --TrainerThread; trainer is polled by usbTrainer.clsTrainerThread
+#                   RefreshTrainer() and StopTrainer() hide the difference
+# 2026-10-18    USB async transfer statistics shown at end of Runoff/Tacx2Dongle
 # 2020-12-10    GradeShift/GradeFactor are multipliers
 #               antDeviceID specified on command-line
 # 2020-12-08    GradeAdjust is split into GradeShift/GradeFactor
@@ -191,31 +225,110 @@ import wx
 
 from   datetime                     import datetime
 
+import antDispatcher
 import antDongle         as ant
 import antFE             as fe
 import antHRM            as hrm
 import antPWR            as pwr
 import antSCS            as scs
+import asyncRuntime
 import debug
 from   FortiusAntGui                import mode_Power, mode_Grade
 import logfile
+import loopTiming
+import pedalStroke
+import scheduler
 import TCXexport
 import usbTrainer
 
 PrintWarnings = False   # Print warnings even when logging = off
 CycleTimeFast = 0.02    # TRAINER- SHOULD WRITE THEN READ 70MS LATER REALLY
 CycleTimeANT  = 0.25
+CycleTimeGUI  = 0.25    # Refresh of the user interface
+CycleTimeLog  = 1.0     # Flush of the logfile
 # ------------------------------------------------------------------------------
 # Initialize globals
 # ------------------------------------------------------------------------------
 def Initialize(pclv):
-    global clv, AntDongle, TacxTrainer, tcx
-    clv         = pclv
-    AntDongle   = None
-    TacxTrainer = None
-    tcx         = None
+    global clv, AntDongle, TacxTrainer, TrainerThread, tcx
+    clv           = pclv
+    AntDongle     = None
+    TacxTrainer   = None
+    TrainerThread = None
+    tcx           = None
     if clv.exportTCX: tcx = TCXexport.clsTcxExport()
 
+# ------------------------------------------------------------------------------
+# R e f r e s h T r a i n e r
+# ------------------------------------------------------------------------------
+# input:        TacxTrainer, TrainerThread
+#               QuarterSecond, TacxMode; as for TacxTrainer.Refresh()
+#
+# Description:  Without trainer thread: Refresh() the trainer right here
+#               With    trainer thread: tell the thread what TacxMode to use
+#                                       and take the last published sample
+#
+# Returns:      usbTrainer.TrainerSample
+# ------------------------------------------------------------------------------
+def RefreshTrainer(QuarterSecond, TacxMode):
+    if TrainerThread:
+        TrainerThread.TacxMode = TacxMode
+        rtn = TrainerThread.GetSample()
+    else:
+        TacxTrainer.Refresh(QuarterSecond, TacxMode)
+        rtn = TacxTrainer.GetSample()
+    return rtn
+
+# ------------------------------------------------------------------------------
+# S t a r t T r a i n e r   /   S t o p T r a i n e r
+# ------------------------------------------------------------------------------
+# Description:  StartTrainer() at the start of the Runoff and Tacx2Dongle loops;
+#               starts the background USB-transfers (--UsbAsync) and the
+#               trainer thread (--TrainerThread)
+#
+#               StopTrainer() at the end of the loops; stops the trainer thread
+#               and the background USB-transfers and then sends the stop
+#               command, so that the trainer is not used while idle or by a
+#               next GetTrainer(). The USB-recording (--UsbRecord) is closed.
+# ------------------------------------------------------------------------------
+def StartTrainer():
+    global TrainerThread
+    TacxTrainer.StartAsyncTransfer()
+
+    #---------------------------------------------------------------------------
+    # From now on, the trainer thread is the only one to talk to the trainer
+    #---------------------------------------------------------------------------
+    if clv.TrainerThread and not TrainerThread:
+        TrainerThread = usbTrainer.clsTrainerThread(TacxTrainer, \
+                                1 / clv.PollRate, clv.PedalStrokeAnalysis)
+        TrainerThread.Start()
+
+def StopTrainer():
+    global TrainerThread
+    if TrainerThread:
+        TrainerThread.Stop()                            # Wait for last Refresh()
+        logfile.Console(TrainerThread.Statistics())
+        TrainerThread = None
+    TacxTrainer.StopAsyncTransfer()                     # Stop is sent blocking
+    TacxTrainer.SendToTrainer(True, usbTrainer.modeStop)
+    TacxTrainer.StopUsbRecording()
+
+# ------------------------------------------------------------------------------
+# B r o a d c a s t P e r i o d
+# ------------------------------------------------------------------------------
+# input:        ChannelPeriod   of the ANT+ profile, e.g. ant.ChannelPeriod_FE
+#
+# Description:  The message of a profile is refreshed once per channel period,
+#               unless a lower rate is specified (--AntRate)
+#
+# Returns:      period in seconds
+# ------------------------------------------------------------------------------
+def BroadcastPeriod(ChannelPeriod):
+    rtn = ant.ChannelPeriodSeconds(ChannelPeriod)
+    if clv.AntRate:
+        rtn = max(rtn, 1 / clv.AntRate)
+    return rtn
+
     
 # ==============================================================================
 # Here we go, this is the real work what's all about!
@@ -238,8 +351,7 @@ def IdleFunction(self):
     global TacxTrainer
     rtn = 0
     if TacxTrainer and TacxTrainer.OK:
-        TacxTrainer.Refresh(True, usbTrainer.modeStop)
-        rtn = TacxTrainer.Buttons
+        rtn = RefreshTrainer(True, usbTrainer.modeStop).Buttons
     return rtn
 
 # ------------------------------------------------------------------------------
@@ -267,7 +379,10 @@ def LocateHW(self):
     if AntDongle and AntDongle.OK:
         pass
     else:
-        AntDongle = ant.clsAntDongle(clv.antDeviceID)
+        if isinstance(clv.antDeviceID, list):
+            AntDongle = ant.clsAntDonglePool(clv.antDeviceID, clv.AntSharding)
+        else:
+            AntDongle = ant.clsAntDongle(clv.antDeviceID)
         if AntDongle.OK or not clv.Tacx_iVortex:                    # 2020-09-29
              if clv.manual:      AntDongle.Message += ' (manual power)'
              if clv.manualGrade: AntDongle.Message += ' (manual grade)'
@@ -280,6 +395,8 @@ def LocateHW(self):
     if TacxTrainer and TacxTrainer.OK:
         pass
     else:
+        if TacxTrainer:
+            TacxTrainer.StopAsyncTransfer()     # The device is found again
         TacxTrainer = usbTrainer.clsTacxTrainer.GetTrainer(clv, AntDongle)
         self.SetMessages(Tacx=TacxTrainer.Message)
 
@@ -318,6 +435,7 @@ def Runoff(self):
         logfile.Console('Runoff not implemented for Simulated trainer or Tacx i-Vortex')
         return False
 
+    StartTrainer()
     TacxTrainer.SetPower(100)
     rolldown        = False
     rolldown_time   = 0
@@ -339,55 +457,69 @@ def Runoff(self):
     #3. SpeedKmh up to above 40kph then stop pedaling and freewheel
     #4. Rolldown timer will start automatically when you hit 40kph, so stop pedaling quickly!
     #''')
-    if clv.PedalStrokeAnalysis:
-        CycleTime = CycleTimeFast   # Quick poll to get more info
-        if debug.on(debug.Any):
-            logfile.Console("Runoff; Pedal Stroke Analysis active")
+    if TrainerThread:
+        CycleTime = CycleTimeANT    # The thread polls at PollRate
     else:
-        CycleTime = CycleTimeANT    # 0.25 Seconds, inspired by 4Hz ANT+
+        CycleTime = 1 / clv.PollRate # Default 4Hz, 50Hz for PedalStrokeAnalysis
+    if clv.PedalStrokeAnalysis and debug.on(debug.Any):
+        logfile.Console("Runoff; Pedal Stroke Analysis active")
+
+    Scheduler   = scheduler.clsScheduler()
+    TaskTrainer = Scheduler.AddTask('Trainer', CycleTime)
+    Timing      = loopTiming.Timing
+    Timing.Reset()
 
     while self.RunningSwitch == True:
-        StartTime     = time.time()
+        #-----------------------------------------------------------------------
+        # WAIT untill the trainer is to be polled
+        #-----------------------------------------------------------------------
+        Scheduler.Wait()
+        Scheduler.Due([TaskTrainer])
+        CycleStart = Timing.Start()
+
         #-----------------------------------------------------------------------
         # Get data from trainer
         #-----------------------------------------------------------------------
-        TacxTrainer.Refresh(True, usbTrainer.modeResistance) # This cannot be an ANT trainer
+        Sample = RefreshTrainer(True, usbTrainer.modeResistance) # This cannot be an ANT trainer
 
         #-----------------------------------------------------------------------
         # Show what happens
         #-----------------------------------------------------------------------
+        t = Timing.Start()
         if TacxTrainer.Message == "Not Found":
             self.SetValues(0, 0, 0, 0, 0, 0, 0, 0, 0)
             self.SetMessages(Tacx="Check if trainer is powered on")
         else:
-            self.SetValues( TacxTrainer.SpeedKmh,         TacxTrainer.Cadence, \
-                            TacxTrainer.CurrentPower,     TacxTrainer.TargetMode, \
-                            TacxTrainer.TargetPower,      TacxTrainer.TargetGrade, \
-                            TacxTrainer.TargetResistance, TacxTrainer.HeartRate, \
+            TargetMode, TargetPower, TargetGrade, TargetResistance = TacxTrainer.GetTarget()
+            self.SetValues( Sample.SpeedKmh,              Sample.Cadence, \
+                            Sample.CurrentPower,          TargetMode, \
+                            TargetPower,                  TargetGrade, \
+                            TargetResistance,             Sample.HeartRate, \
                             0)
+            Timing.Stop('SetValues', t)
             if not rolldown or rolldown_time == 0:
                 self.SetMessages(Tacx=TacxTrainer.Message + " - Cycle to above 40kph (then stop)")
             else:
                 self.SetMessages(Tacx=TacxTrainer.Message + \
                                     " - Rolldown timer %s - STOP pedaling!" % \
-                                    ( round((time.time() - rolldown_time),1) ) \
+                                    ( round((time.monotonic() - rolldown_time),1) ) \
                                 )
           
             #---------------------------------------------------------------------
             # SpeedKmh up to 40 km/h and then rolldown
             #---------------------------------------------------------------------
-            if TacxTrainer.SpeedKmh > 40:      # SpeedKmh above 40, start rolldown
+            if Sample.SpeedKmh > 40:           # SpeedKmh above 40, start rolldown
                 rolldown = True
         
-            if rolldown and TacxTrainer.SpeedKmh <=40 and rolldown_time == 0:
+            if rolldown and Sample.SpeedKmh <=40 and rolldown_time == 0:
                 # rolldown timer starts when dips below 40
-                rolldown_time = time.time()
+                rolldown_time = time.monotonic()
           
-            if rolldown and TacxTrainer.SpeedKmh < 0.1 :    # wheel stopped
+            if rolldown and Sample.SpeedKmh < 0.1 :         # wheel stopped
                 self.RunningSwitch = False                  # break loop
                 self.SetMessages(Tacx=TacxTrainer.Message + \
                                     " - Rolldown time = %s seconds (aim 7s)" % \
-                                    round((time.time() - rolldown_time),1) \
+                                    round((time.monotonic() - rolldown_time),1) \
                                 )
 
         #-------------------------------------------------------------------------
@@ -410,47 +542,41 @@ def Runoff(self):
         #       angle = .02 * 6 * 120 = 14.40 degrees
         #                             = 25 samples per circle
         #-------------------------------------------------------------------------
-        if clv.PedalStrokeAnalysis:
-            if LastPedalEcho == 0   and TacxTrainer.PedalEcho == 1 \
+        if clv.PedalStrokeAnalysis and TrainerThread:
+            # Sampled by the trainer thread at the polling rate
+            Stroke = TrainerThread.GetPedalStroke()
+            if Stroke:
+                self.PedalStrokeAnalysis(Stroke[0], Stroke[1])
+
+        elif clv.PedalStrokeAnalysis:
+            if LastPedalEcho == 0   and Sample.PedalEcho == 1 \
                                     and len(pdaInfo) \
-                                    and TacxTrainer.Cadence:
+                                    and Sample.Cadence:
                 # Pedal triggers cadence sensor
-                self.PedalStrokeAnalysis(pdaInfo, TacxTrainer.Cadence)
+                self.PedalStrokeAnalysis(pdaInfo, Sample.Cadence)
                 pdaInfo = []
 
             # Store data for analysis until next signal
-            pdaInfo.append((time.time(), TacxTrainer.CurrentPower)) 
-            LastPedalEcho = TacxTrainer.PedalEcho
+            pdaInfo.append((time.time(), Sample.CurrentPower)) 
+            LastPedalEcho = Sample.PedalEcho
             
-            if TacxTrainer.CurrentPower > 50 and TacxTrainer.Cadence > 30:
+            if Sample.CurrentPower > 50 and Sample.Cadence > 30:
                 # Gather some statistics while really pedaling
                 PowerCount += 1
-                if TacxTrainer.CurrentPower == LastPower: PowerEqual += 1
-                LastPower = TacxTrainer.CurrentPower
+                if Sample.CurrentPower == LastPower: PowerEqual += 1
+                LastPower = Sample.CurrentPower
 
         #-----------------------------------------------------------------------
         # Respond to button press
         #-----------------------------------------------------------------------
-        if   TacxTrainer.Buttons == usbTrainer.EnterButton:     pass
-        elif TacxTrainer.Buttons == usbTrainer.DownButton:      TacxTrainer.AddPower (-50) # Subtract 50 Watts for calibration test
-        elif TacxTrainer.Buttons == usbTrainer.UpButton:        TacxTrainer.AddPower ( 50) # Add 50 Watts for calibration test
-        elif TacxTrainer.Buttons == usbTrainer.CancelButton:    self.RunningSwitch = False # Stop calibration
+        if   Sample.Buttons == usbTrainer.EnterButton:          pass
+        elif Sample.Buttons == usbTrainer.DownButton:           TacxTrainer.AddPower (-50) # Subtract 50 Watts for calibration test
+        elif Sample.Buttons == usbTrainer.UpButton:             TacxTrainer.AddPower ( 50) # Add 50 Watts for calibration test
+        elif Sample.Buttons == usbTrainer.CancelButton:         self.RunningSwitch = False # Stop calibration
         else:                                                   pass
 
-        #-----------------------------------------------------------------------
-        # WAIT untill CycleTime is done
-        #-----------------------------------------------------------------------
-        ElapsedTime = time.time() - StartTime
-        SleepTime = CycleTime - ElapsedTime
-        if SleepTime > 0:
-            time.sleep(SleepTime)
-            if debug.on(debug.Data2):
-                logfile.Write ("Sleep(%4.2f) to fill %s seconds done." % (SleepTime, CycleTime) )
-        else:
-            if ElapsedTime > CycleTime * 2 and debug.on(debug.Any):
-                logfile.Write ("Runoff; Processing time %5.3f is %5.3f longer than planned %5.3f (seconds)" % (ElapsedTime, SleepTime * -1, CycleTime) )
-            pass
-        
+        Timing.Stop('Cycle', CycleStart)
+
     #---------------------------------------------------------------------------
     # Finalize
     #---------------------------------------------------------------------------
@@ -460,6 +586,11 @@ def Runoff(self):
     if debug.on(debug.Any) and PowerCount > 0:
         logfile.Console("Pedal Stroke Analysis: #samples = %s, #equal = %s (%3.0f%%)" % \
                     (PowerCount, PowerEqual, PowerEqual * 100 /PowerCount))
+    logfile.Console(Scheduler.Statistics())
+    logfile.Console(Timing.Report())
+    if TacxTrainer.Statistics():
+        logfile.Console(TacxTrainer.Statistics())
+    StopTrainer()
     return True
     
 # ------------------------------------------------------------------------------
@@ -485,6 +616,10 @@ def Tacx2Dongle(self):
     Restart = False
     while True:
         rtn = Tacx2DongleSub(self, Restart)
+        #-----------------------------------------------------------------------
+        # AntDongle restores the channels after a reconnect; the restart is
+        # only required when that failed
+        #-----------------------------------------------------------------------
         if AntDongle.DongleReconnected:
             self.SetMessages(Dongle=AntDongle.Message)
             AntDongle.ApplicationRestart()
@@ -535,9 +670,11 @@ def Tacx2DongleSub(self, Restart):
     #    one to interface with Tacx i-Vortex headunit (VHU)
     #
     # And if you want a dedicated Speed Cadence Sensor, implement like this...
+    #
+    # The channels are configured in one batch (Begin/EndChannelSetup)
     #---------------------------------------------------------------------------
-    AntDongle.ResetDongle()             # reset dongle
-    AntDongle.Calibrate()               # calibrate ANT+ dongle
+    AntDongle.Calibrate()               # reset and calibrate ANT+ dongle
+    AntDongle.BeginChannelSetup()
     AntDongle.Trainer_ChannelConfig()   # Create ANT+ master channel for FE-C
     
     if clv.hrm == None:
@@ -596,13 +733,21 @@ def Tacx2DongleSub(self, Restart):
         #-------------------------------------------------------------------
         AntDongle.SlaveSCS_ChannelConfig(clv.scs)
         pass
+
+    if not AntDongle.EndChannelSetup():
+        logfile.Console ("Tacx2Dongle; ANT channel setup failed, see previous messages")
     
-    if not clv.gui: logfile.Console ("Ctrl-C to exit")
+    if not clv.gui:
+        if clv.PedalStrokeAnalysis:
+            logfile.Console ("Ctrl-C to exit, t (Enter) to show the loop timing, p (Enter) the pedal stroke profile")
+        else:
+            logfile.Console ("Ctrl-C to exit, t (Enter) to show the loop timing")
 
     #---------------------------------------------------------------------------
     # Loop control
     #---------------------------------------------------------------------------
     EventCounter       = 0
+    StartTrainer()
 
     #---------------------------------------------------------------------------
     # Calibrate trainer
@@ -613,23 +758,39 @@ def Tacx2DongleSub(self, Restart):
     Calibrate       = 0
     StartPedaling   = True
     Counter         = 0
+    Sample          = TacxTrainer.GetSample()
+
+    #---------------------------------------------------------------------------
+    # Recently calibrated (same trainer), no need to do it again
+    #---------------------------------------------------------------------------
+    if clv.calibrate and TacxTrainer.CalibrateSupported():
+        Calibrate = TacxTrainer.GetCachedCalibration()
+        if Calibrate:
+            logfile.Console('Calibration skipped; this trainer was calibrated recently (%s)' % Calibrate)
 
-    if TacxTrainer.CalibrateSupported():
+    if TacxTrainer.CalibrateSupported() and Calibrate == 0:
         self.SetMessages(Tacx="* * * * G I V E   A   P E D A L   K I C K   T O   S T A R T   C A L I B R A T I O N * * * *")
         if debug.on(debug.Function):
             logfile.Write('Tacx2Dongle; start pedaling for calibration')
+    Scheduler     = scheduler.clsScheduler()
+    TaskCalibrate = Scheduler.AddTask('Calibrate', 0.25)
     try:
     # if True:
         while         self.RunningSwitch \
               and     clv.calibrate \
-              and not TacxTrainer.Buttons == usbTrainer.CancelButton \
+              and not Sample.Buttons == usbTrainer.CancelButton \
               and     Calibrate == 0 \
               and     TacxTrainer.CalibrateSupported():
-            StartTime = time.time()
+            #-------------------------------------------------------------------
+            # WAIT        So we do not cycle faster than 4 x per second
+            #-------------------------------------------------------------------
+            Scheduler.Wait()
+            Scheduler.Due([TaskCalibrate])
+
             #-------------------------------------------------------------------
             # Receive / Send trainer
             #-------------------------------------------------------------------
-            TacxTrainer.Refresh(True, usbTrainer.modeCalibrate)
+            Sample = RefreshTrainer(True, usbTrainer.modeCalibrate)
 
             #-------------------------------------------------------------------
             # When calibration IS supported, the following condition will NOT occur.
@@ -640,13 +801,13 @@ def Tacx2DongleSub(self, Restart):
             # so ignore the first x readings before deciding it will not work.
             #-------------------------------------------------------------------
             # print(StartPedaling, SpeedKmh, CurrentResistance)
-            if TacxTrainer.CurrentResistance > 0:
+            if Sample.CurrentResistance > 0:
                 Counter += 1
                 if Counter == 10:
                     logfile.Console('Calibration stopped because of unexpected resistance value')
                     break
 
-            if TacxTrainer.CurrentResistance < 0 and TacxTrainer.SpeedKmh > 0:
+            if Sample.CurrentResistance < 0 and Sample.SpeedKmh > 0:
                 # Calibration is started (with pedal kick)
                 #---------------------------------------------------------------
                 # Show progress (when calibrating is started)
@@ -659,9 +820,9 @@ def Tacx2DongleSub(self, Restart):
                         logfile.Write('Tacx2Dongle; start calibration')
                     StartPedaling = False
 
-                self.SetValues(TacxTrainer.SpeedKmh, int(CountDown/4), \
-                        round(TacxTrainer.CurrentPower * -1,0), \
-                        mode_Power, 0, 0, TacxTrainer.CurrentResistance * -1, 0, 0)
+                self.SetValues(Sample.SpeedKmh, int(CountDown/4), \
+                        round(Sample.CurrentPower * -1,0), \
+                        mode_Power, 0, 0, Sample.CurrentResistance * -1, 0, 0)
 
                 # --------------------------------------------------------------
                 # Average power over the last 20 readings
@@ -669,7 +830,7 @@ def Tacx2DongleSub(self, Restart):
                 # At least 30 seconds but not longer than the countdown time (8 minutes)
                 # Note that the limits are empiracally established.
                 # --------------------------------------------------------------
-                ResistanceArray = numpy.append(ResistanceArray, TacxTrainer.CurrentResistance * -1) # Add new instantaneous value to array
+                ResistanceArray = numpy.append(ResistanceArray, Sample.CurrentResistance * -1) # Add new instantaneous value to array
                 ResistanceArray = numpy.delete(ResistanceArray, 0)                      # Remove oldest from array
 
                 AvgResistanceArray = numpy.append(AvgResistanceArray, numpy.average(ResistanceArray)) # Add new running average value to array
@@ -678,16 +839,11 @@ def Tacx2DongleSub(self, Restart):
                 if CountDown < (120 * 4 - 30) and numpy.min(ResistanceArray) > 0:
                     if (numpy.max(AvgResistanceArray) - numpy.min(AvgResistanceArray) ) < 2 or CountDown <= 0:
                         Calibrate = numpy.average(AvgResistanceArray)
+                        TacxTrainer.SetCachedCalibration(Calibrate)
                         if debug.on(debug.Function):
                             logfile.Write('Tacx2Dongle; calibration ended %s' % Calibrate)
 
                 CountDown -= 0.25                   # If not started, no count down!
-                
-            #-------------------------------------------------------------------
-            # WAIT        So we do not cycle faster than 4 x per second
-            #-------------------------------------------------------------------
-            SleepTime = 0.25 - (time.time() - StartTime)
-            if SleepTime > 0: time.sleep(SleepTime)
     except KeyboardInterrupt:
         logfile.Console ("Stopped")
     except Exception as e:
@@ -697,7 +853,7 @@ def Tacx2DongleSub(self, Restart):
     #---------------------------------------------------------------------------
     if TacxTrainer.OK:
         if debug.on(debug.Function): logfile.Write('Tacx2Dongle; stop trainer')
-        TacxTrainer.SendToTrainer(True, usbTrainer.modeStop)
+        RefreshTrainer(True, usbTrainer.modeStop)
     self.SetMessages(Tacx=TacxTrainer.Message)
 
     #---------------------------------------------------------------------------
@@ -712,12 +868,10 @@ def Tacx2DongleSub(self, Restart):
             TacxTrainer.SetPower(100)
         TacxTrainer.ResetPowercurveFactor()
 
-    TargetPowerTime         = 0             # Time that last TargetPower received
+    TargetPowerTime         = -30           # Time that last TargetPower received
     PowerModeActive         = ''            # Text showing in userinterface
-    
-    LastANTtime             = 0             # ANT+ interface is sent/received only
-                                            # every 250ms
-    
+    Timing                  = loopTiming.Timing # Duration of the loop phases
+
     #---------------------------------------------------------------------------
     # Initialize antHRM and antFE module
     #---------------------------------------------------------------------------
@@ -728,504 +882,618 @@ def Tacx2DongleSub(self, Restart):
     scs.Initialize()
     
     #---------------------------------------------------------------------------
-    # Initialize CycleTime: fast for PedalStrokeAnalysis
+    # Initialize CycleTime: --PollRate, default 4Hz, 50Hz for PedalStrokeAnalysis
     #---------------------------------------------------------------------------
-    if clv.PedalStrokeAnalysis:
-        CycleTime = CycleTimeFast   # Quick poll to get more info
-        if debug.on(debug.Any): logfile.Console("Tacx2Dongle; Pedal Stroke Analysis active")
+    if TrainerThread:
+        CycleTime = CycleTimeANT    # The thread polls at PollRate
     else:
-        CycleTime = CycleTimeANT    # Seconds, default = 0.25 (inspired by 4Hz ANT+)
+        CycleTime = 1 / clv.PollRate
+    if clv.PedalStrokeAnalysis and debug.on(debug.Any):
+        logfile.Console("Tacx2Dongle; Pedal Stroke Analysis active")
 
     #---------------------------------------------------------------------------
-    # Our main loop!
-    # The loop has the following phases
-    # -- Get data from trainer
-    # -- Local adjustments (heartrate monitor, cadence sensor)
-    # -- Display actual values
-    # -- Pedal stroke analysis
-    # -- Modify data, due to Buttons or ANT
+    # The tasks of the main loop; the deadlines are absolute, so each task runs
+    # at its own rate, whatever the rate of the others is.
+    # QuarterSecond is for the trainer (TCX trackpoint, i-Vortex messages); the
+    # ANT+ profiles are tasks of their own, see AntProfiles below.
     #---------------------------------------------------------------------------
-    if debug.on(debug.Function): logfile.Write('Tacx2Dongle; start main loop')
-    try:
-        while self.RunningSwitch == True and not AntDongle.DongleReconnected:
-            StartTime = time.time()
-            #-------------------------------------------------------------------
-            # ANT process is done once every 250ms
-            # In case of PedalStrokeAnalysis, check whether it's time for ANT
-            #-------------------------------------------------------------------
-            if CycleTime == CycleTimeANT or (time.time() - LastANTtime) > 0.25:
-                LastANTtime = time.time()
-                QuarterSecond = True
-            else:
-                QuarterSecond = False 
+    Scheduler   = scheduler.clsScheduler()
+    TaskTrainer = Scheduler.AddTask('Trainer',       CycleTime)
+    TaskQuarter = Scheduler.AddTask('Quarter second',CycleTimeANT)
+    TaskGUI     = Scheduler.AddTask('GUI',           CycleTimeGUI)
+    TaskLog     = Scheduler.AddTask('Log flush',     CycleTimeLog)
 
-            #-------------------------------------------------------------------
-            # Get data from trainer (Receive + Calc + Send)
-            #-------------------------------------------------------------------
-            TacxTrainer.Refresh(QuarterSecond, usbTrainer.modeResistance)
-            if clv.gui: self.SetMessages(Tacx=TacxTrainer.Message + PowerModeActive)
+    #---------------------------------------------------------------------------
+    # ANT receiver: the dongle is read continuously, so that a command from
+    # the CTP (Target power, grade) wakes up the main loop in between cycles
+    #---------------------------------------------------------------------------
+    if clv.AntReceiver:
+        AntDongle.StartReceiver([ant.channel_FE, ant.channel_HRM_s, ant.channel_SCS_s, \
+                                 ant.channel_VTX_s, ant.channel_VHU_s])
 
-            #-------------------------------------------------------------------
-            # If NO Speed Cadence Sensor defined, use Trainer-info
-            # Hook for future development
-            #-------------------------------------------------------------------
-            # if clv.scs == None:
-            #     SpeedKmh   = SpeedKmhSCS
-            #     Cadence    = CadenceSCS
+    #---------------------------------------------------------------------------
+    # ANT message handlers
+    #
+    # Commands from dongle that are expected are:
+    # - TargetGradeFromDongle or TargetPowerFromDongle
+    # - Information from HRM (if paired)
+    # - Information from i-Vortex (if paired)
+    #
+    # Each handler is registered for (message id, channel, page) and returns
+    # None when handled or the reason why the message is ignored.
+    #---------------------------------------------------------------------------
+    def CommandStatus(DataPageNumber, Status, Data2, Data3, Data4):
+        nonlocal p71_LastReceivedCommandID, p71_SequenceNr, p71_CommandStatus, \
+                 p71_Data2, p71_Data3, p71_Data4
+        p71_LastReceivedCommandID   = DataPageNumber
+        p71_SequenceNr              = int(p71_SequenceNr + 1) & 0xff
+        p71_CommandStatus           = Status
+        p71_Data2                   = Data2
+        p71_Data3                   = Data3
+        p71_Data4                   = Data4
 
-            #-------------------------------------------------------------------
-            # If NO HRM defined, use the HeartRate from the trainer
-            #-------------------------------------------------------------------
-            if clv.hrm == None:
-                HeartRate = TacxTrainer.HeartRate
-                # print('Use heartrate from trainer', HeartRate)
-            
-            #-------------------------------------------------------------------
-            # Show actual status
-            #-------------------------------------------------------------------
-            self.SetValues(TacxTrainer.VirtualSpeedKmh, 
-                            TacxTrainer.Cadence, \
-                            TacxTrainer.CurrentPower, \
-                            TacxTrainer.TargetMode, \
-                            TacxTrainer.TargetPower, \
-                            TacxTrainer.TargetGrade, \
-                            TacxTrainer.TargetResistance, \
-                            HeartRate, \
-                            TacxTrainer.Teeth)
+    #---------------------------------------------------------------------------
+    # AcknowledgedData = Slave -> Master
+    #       channel_FE = From CTP (Trainer Road, Zwift) --> Tacx 
+    #---------------------------------------------------------------------------
+    #---------------------------------------------------------------------------
+    # Data page 48 (0x30) Basic resistance
+    #---------------------------------------------------------------------------
+    def FE_BasicResistance(info, _Channel, DataPageNumber):
+        # logfile.Console('Data page 48 Basic mode not implemented')
+        # I never saw this appear anywhere (2020-05-08)
+        # TargetMode            = mode_Basic
+        # TargetGradeFromDongle = 0
+        # TargetPowerFromDongle = ant.msgUnpage48_BasicResistance(info) * 1000  # n % of maximum of 1000Watt
 
-            #-------------------------------------------------------------------
-            # Add trackpoint
-            #-------------------------------------------------------------------
-            if QuarterSecond and clv.exportTCX:
-                tcx.TrackpointX(TacxTrainer, HeartRate)
+        # 2020-11-04 as requested in issue 119
+        # The percentage is used to calculate grade 0...20%
+        Grade = ant.msgUnpage48_BasicResistance(info) * 20
 
-            #-------------------------------------------------------------------
-            # Store in JSON format
-            #-------------------------------------------------------------------
-            logfile.WriteJson(QuarterSecond, TacxTrainer, tcx, HeartRate)
+        # Implemented for Magnetic Brake:
+        # - grade is NOT shifted with GradeShift (here never negative)
+        # - but is reduced with factor
+        # - and is NOT reduced with factorDH since never negative
+        Grade *= clv.GradeFactor
 
-            #-------------------------------------------------------------------
-            # Pedal Stroke Analysis
-            #-------------------------------------------------------------------
-            if clv.PedalStrokeAnalysis:
-                if LastPedalEcho == 0 and TacxTrainer.PedalEcho == 1 and \
-                    len(pdaInfo) and TacxTrainer.Cadence:
-                    # Pedal triggers cadence sensor
-                    self.PedalStrokeAnalysis(pdaInfo, TacxTrainer.Cadence)
-                    pdaInfo = []
-                pdaInfo.append((time.time(), TacxTrainer.CurrentPower)) # Store data for analysis
-                LastPedalEcho = TacxTrainer.PedalEcho                   # until next signal
+        TacxTrainer.SetGrade(Grade)
+        TacxTrainer.SetRollingResistance(0.004)
+        TacxTrainer.SetWind(0.51, 0.0, 1.0)
 
-            #-------------------------------------------------------------------
-            # In manual-mode, power can be incremented or decremented
-            # In all modes, operation can be stopped.
-            #
-            # TargetMode  is set here (manual mode) or received from ANT+ (Zwift)
-            # TargetPower and TargetGrade are set in this section only!
-            #-------------------------------------------------------------------
-            if clv.manual:
-                if   TacxTrainer.Buttons == usbTrainer.EnterButton:     pass
-                elif TacxTrainer.Buttons == usbTrainer.DownButton:      TacxTrainer.AddPower(-50)
-                elif TacxTrainer.Buttons == usbTrainer.OKButton:        TacxTrainer.SetPower(100)
-                elif TacxTrainer.Buttons == usbTrainer.UpButton:        TacxTrainer.AddPower( 50)
-                elif TacxTrainer.Buttons == usbTrainer.CancelButton:    self.RunningSwitch = False
-                else:                                                   pass
-            elif clv.manualGrade:
-                if   TacxTrainer.Buttons == usbTrainer.EnterButton:     pass
-                elif TacxTrainer.Buttons == usbTrainer.DownButton:      TacxTrainer.AddGrade(-1)
-                elif TacxTrainer.Buttons == usbTrainer.OKButton:        TacxTrainer.SetGrade(0)
-                elif TacxTrainer.Buttons == usbTrainer.UpButton:        TacxTrainer.AddGrade( 1)
-                elif TacxTrainer.Buttons == usbTrainer.CancelButton:    self.RunningSwitch = False
-                else:                                                   pass
-            else:
-                if   TacxTrainer.Buttons == usbTrainer.EnterButton:     pass
-                elif TacxTrainer.Buttons == usbTrainer.DownButton:      TacxTrainer.SetPowercurveFactorDown()
-                elif TacxTrainer.Buttons == usbTrainer.OKButton:        TacxTrainer.ResetPowercurveFactor()
-                elif TacxTrainer.Buttons == usbTrainer.UpButton:        TacxTrainer.SetPowercurveFactorUp()
-                elif TacxTrainer.Buttons == usbTrainer.CancelButton:    self.RunningSwitch = False
-                else:                                                   pass
+        CommandStatus(DataPageNumber, 0xff, 0xff, 0xff, 0xff)
 
-            #-------------------------------------------------------------------
-            # Do ANT work every 1/4 second
-            #-------------------------------------------------------------------
-            messages = []       # messages to be sent to ANT
-            data = []           # responses received from ANT
-            if QuarterSecond:
-                # LastANTtime = time.time()         # 2020-11-13 removed since duplicate
-                #---------------------------------------------------------------
-                # Sending i-Vortex messages is done by Refesh() not here
-                #---------------------------------------------------------------
+    #---------------------------------------------------------------------------
+    # Data page 49 (0x31) Target Power
+    #---------------------------------------------------------------------------
+    def FE_TargetPower(info, _Channel, DataPageNumber):
+        nonlocal TargetPowerTime
+        TacxTrainer.SetPower(ant.msgUnpage49_TargetPower(info))
+        TargetPowerTime = time.monotonic()
+        if False and clv.PowerMode and debug.on(debug.Application):
+            logfile.Write('PowerMode: TargetPower info received - timestamp set')
 
-                #---------------------------------------------------------------
-                # Broadcast Heartrate message
-                #---------------------------------------------------------------
-                if clv.hrm == None and TacxTrainer.HeartRate > 0:
-                    messages.append(hrm.BroadcastHeartrateMessage(HeartRate))
+        CommandStatus(DataPageNumber, 0, 0xff, \
+                       int(TacxTrainer.TargetPower) & 0x00ff, \
+                      (int(TacxTrainer.TargetPower) & 0xff00) >> 8)
 
-                #---------------------------------------------------------------
-                # Broadcast Bike Power message
-                #---------------------------------------------------------------
-                if True:
-                    messages.append(pwr.BroadcastMessage( \
-                        TacxTrainer.CurrentPower, TacxTrainer.Cadence))
+    #---------------------------------------------------------------------------
+    # Data page 50 (0x32) Wind Resistance
+    #---------------------------------------------------------------------------
+    def FE_WindResistance(info, _Channel, DataPageNumber):
+        WindResistance, WindSpeed, DraftingFactor = \
+            ant.msgUnpage50_WindResistance(info)
+        TacxTrainer.SetWind(WindResistance, WindSpeed, DraftingFactor)
 
-                #---------------------------------------------------------------
-                # Broadcast Speed and Cadence Sensor message
-                #---------------------------------------------------------------
-                if clv.scs == None:
-                    messages.append(scs.BroadcastMessage( \
-                        TacxTrainer.PedalEchoTime, TacxTrainer.PedalEchoCount, \
-                        TacxTrainer.VirtualSpeedKmh, TacxTrainer.Cadence))
+        CommandStatus(DataPageNumber, 0, WindResistance, WindSpeed, DraftingFactor)
 
-                #---------------------------------------------------------------
-                # Broadcast TrainerData message to the CTP (Trainer Road, ...)
-                #---------------------------------------------------------------
-                # print('fe.BroadcastTrainerDataMessage', Cadence, CurrentPower, SpeedKmh, HeartRate)
-                messages.append(fe.BroadcastTrainerDataMessage (TacxTrainer.Cadence, \
-                    TacxTrainer.CurrentPower, TacxTrainer.SpeedKmh, TacxTrainer.HeartRate))
-                    
+    #---------------------------------------------------------------------------
+    # Data page 51 (0x33) Track resistance
+    #---------------------------------------------------------------------------
+    def FE_TrackResistance(info, _Channel, DataPageNumber):
+        nonlocal PowerModeActive
+        if clv.PowerMode and (time.monotonic() - TargetPowerTime) < 30:
             #-------------------------------------------------------------------
-            # Broadcast and receive ANT+ responses
+            # In PowerMode, TrackResistance is ignored
+            #       (for xx seconds after the last power-command)
+            # So if TrainerRoad is used simultaneously with
+            #       Zwift/Rouvythe power commands from TR 
+            #       take precedence over Zwift/Rouvy and a 
+            #       power-training can be done while riding
+            #       a Zwift/Rouvy simulation/video!
+            # When TrainerRoad is finished, the Track
+            #       resistance is active again
             #-------------------------------------------------------------------
-            if len(messages) > 0:
-                data = AntDongle.Write(messages, True, False)
+            PowerModeActive = ' [P]'
+            if False and clv.PowerMode and debug.on(debug.Application):
+                logfile.Write('PowerMode: Grade info ignored')
+            RollingResistance = p71_Data4       # Not received, previous value
+        else:
+            Grade, RollingResistance = ant.msgUnpage51_TrackResistance(info)
 
             #-------------------------------------------------------------------
-            # Here all response from the ANT dongle are processed (receive=True)
+            # Implemented when implementing Magnetic Brake:
+            # [-] grade is shifted with GradeShift (-10% --> 0) ]
+            # - then reduced with factor (can be re-adjusted with Virtual Gearbox)
+            # - and reduced with factorDH (for downhill only)
             #
-            # Commands from dongle that are expected are:
-            # - TargetGradeFromDongle or TargetPowerFromDongle
-            # - Information from HRM (if paired)
-            # - Information from i-Vortex (if paired)
+            # GradeAdjust is valid for all configurations!
             #
-            # Input is grouped by messageID, then channel. This has little
-            # practical impact; grouping by Channel would enable to handle all
-            # ANT in a channel (device) module. No advantage today.
+            # GradeShift is not expected to be used anymore,
+            # and only left from earliest implementations
+            # to avoid it has to be re-introduced in future again.
             #-------------------------------------------------------------------
-            for d in data:
-                synch, length, id, info, checksum, _rest, Channel, DataPageNumber = ant.DecomposeMessage(d)
-                error = False
+            Grade += clv.GradeShift
+            Grade *= clv.GradeFactor
+            if Grade < 0: Grade *= clv.GradeFactorDH
 
-                if clv.Tacx_iVortex and TacxTrainer.HandleANTmessage(d):
-                    pass                    # Message is handled or ignored
+            TacxTrainer.SetGrade(Grade)
+            TacxTrainer.SetRollingResistance(RollingResistance)
+            PowerModeActive       = ''
 
-                #---------------------------------------------------------------
-                # AcknowledgedData = Slave -> Master
-                #       channel_FE = From CTP (Trainer Road, Zwift) --> Tacx 
-                #---------------------------------------------------------------
-                elif id == ant.msgID_AcknowledgedData:
-                    #-----------------------------------------------------------
-                    # Fitness Equipment Channel inputs
-                    #-----------------------------------------------------------
-                    if Channel == ant.channel_FE:
-                        #-------------------------------------------------------
-                        # Data page 48 (0x30) Basic resistance
-                        #-------------------------------------------------------
-                        if   DataPageNumber == 48:
-                            # logfile.Console('Data page 48 Basic mode not implemented')
-                            # I never saw this appear anywhere (2020-05-08)
-                            # TargetMode            = mode_Basic
-                            # TargetGradeFromDongle = 0
-                            # TargetPowerFromDongle = ant.msgUnpage48_BasicResistance(info) * 1000  # n % of maximum of 1000Watt
-
-                            # 2020-11-04 as requested in issue 119
-                            # The percentage is used to calculate grade 0...20%
-                            Grade = ant.msgUnpage48_BasicResistance(info) * 20
-
-                            # Implemented for Magnetic Brake:
-                            # - grade is NOT shifted with GradeShift (here never negative)
-                            # - but is reduced with factor
-                            # - and is NOT reduced with factorDH since never negative
-                            Grade *= clv.GradeFactor
-
-                            TacxTrainer.SetGrade(Grade)
-                            TacxTrainer.SetRollingResistance(0.004)
-                            TacxTrainer.SetWind(0.51, 0.0, 1.0)
-
-                            p71_LastReceivedCommandID   = DataPageNumber
-                            p71_SequenceNr              = int(p71_SequenceNr + 1) & 0xff
-                            p71_CommandStatus           = 0xff
-                            p71_Data2                   = 0xff
-                            p71_Data3                   = 0xff
-                            p71_Data4                   = 0xff
-                            
-                        #-------------------------------------------------------
-                        # Data page 49 (0x31) Target Power
-                        #-------------------------------------------------------
-                        elif   DataPageNumber == 49:
-                            TacxTrainer.SetPower(ant.msgUnpage49_TargetPower(info))
-                            TargetPowerTime = time.time()
-                            if False and clv.PowerMode and debug.on(debug.Application):
-                                logfile.Write('PowerMode: TargetPower info received - timestamp set')
-
-                            p71_LastReceivedCommandID   = DataPageNumber
-                            p71_SequenceNr              = int(p71_SequenceNr + 1) & 0xff
-                            p71_CommandStatus           = 0
-                            p71_Data2                   = 0xff
-                            p71_Data3                   =  int(TacxTrainer.TargetPower) & 0x00ff
-                            p71_Data4                   = (int(TacxTrainer.TargetPower) & 0xff00) >> 8
-
-                        #-------------------------------------------------------
-                        # Data page 50 (0x32) Wind Resistance
-                        #-------------------------------------------------------
-                        elif   DataPageNumber == 50:
-                            WindResistance, WindSpeed, DraftingFactor = \
-                                ant.msgUnpage50_WindResistance(info)
-                            TacxTrainer.SetWind(WindResistance, WindSpeed, DraftingFactor)
-
-                            p71_LastReceivedCommandID   = DataPageNumber
-                            p71_SequenceNr              = int(p71_SequenceNr + 1) & 0xff
-                            p71_CommandStatus           = 0
-                            p71_Data2                   = WindResistance
-                            p71_Data3                   = WindSpeed
-                            p71_Data4                   = DraftingFactor
-
-                        #-------------------------------------------------------
-                        # Data page 51 (0x33) Track resistance
-                        #-------------------------------------------------------
-                        elif DataPageNumber == 51:
-                            if clv.PowerMode and (time.time() - TargetPowerTime) < 30:
-                                #-----------------------------------------------
-                                # In PowerMode, TrackResistance is ignored
-                                #       (for xx seconds after the last power-command)
-                                # So if TrainerRoad is used simultaneously with
-                                #       Zwift/Rouvythe power commands from TR 
-                                #       take precedence over Zwift/Rouvy and a 
-                                #       power-training can be done while riding
-                                #       a Zwift/Rouvy simulation/video!
-                                # When TrainerRoad is finished, the Track
-                                #       resistance is active again
-                                #-----------------------------------------------
-                                PowerModeActive = ' [P]'
-                                if False and clv.PowerMode and debug.on(debug.Application):
-                                    logfile.Write('PowerMode: Grade info ignored')
-                                pass
-                            else:
-                                Grade, RollingResistance = ant.msgUnpage51_TrackResistance(info)
-
-                                #-----------------------------------------------
-                                # Implemented when implementing Magnetic Brake:
-                                # [-] grade is shifted with GradeShift (-10% --> 0) ]
-                                # - then reduced with factor (can be re-adjusted with Virtual Gearbox)
-                                # - and reduced with factorDH (for downhill only)
-                                #
-                                # GradeAdjust is valid for all configurations!
-                                #
-                                # GradeShift is not expected to be used anymore,
-                                # and only left from earliest implementations
-                                # to avoid it has to be re-introduced in future again.
-                                #-----------------------------------------------
-                                Grade += clv.GradeShift
-                                Grade *= clv.GradeFactor
-                                if Grade < 0: Grade *= clv.GradeFactorDH
-
-                                TacxTrainer.SetGrade(Grade)
-                                TacxTrainer.SetRollingResistance(RollingResistance)
-                                PowerModeActive       = ''
-
-                            p71_LastReceivedCommandID   = DataPageNumber
-                            p71_SequenceNr              = int(p71_SequenceNr + 1) & 0xff
-                            p71_CommandStatus           = 0
-                            p71_Data2                   =  int(TacxTrainer.TargetPower) & 0x00ff
-                            p71_Data3                   = (int(TacxTrainer.TargetPower) & 0xff00) >> 8
-                            p71_Data4                   = RollingResistance
-
-                        #-------------------------------------------------------
-                        # Data page 55 User configuration
-                        #-------------------------------------------------------
-                        elif DataPageNumber == 55:
-                            UserWeight, BicycleWeight, BicycleWheelDiameter, GearRatio = \
-                                ant.msgUnpage55_UserConfiguration(info)
-                            TacxTrainer.SetUserConfiguration(UserWeight, \
-                                BicycleWeight, BicycleWheelDiameter, GearRatio)
-
-                        #-------------------------------------------------------
-                        # Data page 70 Request data page
-                        #-------------------------------------------------------
-                        elif DataPageNumber == 70:
-                            _SlaveSerialNumber, _DescriptorByte1, _DescriptorByte2, \
-                                _AckRequired, NrTimes, RequestedPageNumber, \
-                                _CommandType = ant.msgUnpage70_RequestDataPage(info)
-                            
-                            info = False
-                            if   RequestedPageNumber == 54:
-                                # Capabilities;
-                                # bit 0 = Basic mode
-                                # bit 1 = Target/Power/Ergo mode
-                                # bit 2 = Simulation/Restance/Slope mode
-                                info = ant.msgPage54_FE_Capabilities(ant.channel_FE, 0xff, 0xff, 0xff, 0xff, 1000, 0x07)
-
-                            elif RequestedPageNumber == 71:
-                                info = ant.msgPage71_CommandStatus(ant.channel_FE, p71_LastReceivedCommandID, \
-                                    p71_SequenceNr, p71_CommandStatus, p71_Data1, p71_Data2, p71_Data3, p71_Data4)
-
-                            elif RequestedPageNumber == 80:
-                                info = ant.msgPage80_ManufacturerInfo(ant.channel_FE, 0xff, 0xff, \
-                                    ant.HWrevision_FE, ant.Manufacturer_tacx, ant.ModelNumber_FE)
-
-                            elif RequestedPageNumber == 81:
-                                info = ant.msgPage81_ProductInformation(ant.channel_FE, 0xff, \
-                                    ant.SWrevisionSupp_FE, ant.SWrevisionMain_FE, ant.SerialNumber_FE)
-
-                            elif RequestedPageNumber == 82:
-                                info = ant.msgPage82_BatteryStatus(ant.channel_FE)
-
-                            else:
-                                error = "Requested page not suported"
-
-                            if info != False:
-                                data = []
-                                d    = ant.ComposeMessage (ant.msgID_BroadcastData, info)
-                                while (NrTimes):
-                                    data.append(d)
-                                    NrTimes -= 1
-                                AntDongle.Write(data, False)
-
-                        #-------------------------------------------------------
-                        # Data page 252 ????
-                        #-------------------------------------------------------
-                        elif DataPageNumber == 252 and (PrintWarnings or debug.on(debug.Data1)):
-                            logfile.Write('FE data page 252 ignored. info=%s' % logfile.HexSpace(info))
-                            pass
-                            
-                        #-------------------------------------------------------
-                        # Other data pages
-                        #-------------------------------------------------------
-                        else: error = "Unknown FE data page"
-
-                    #-----------------------------------------------------------
-                    # Unknown channel
-                    #-----------------------------------------------------------
-                    else: error="Unknown channel"
+        CommandStatus(DataPageNumber, 0, \
+                       int(TacxTrainer.TargetPower) & 0x00ff, \
+                      (int(TacxTrainer.TargetPower) & 0xff00) >> 8, \
+                      RollingResistance)
 
-                #---------------------------------------------------------------
-                # BroadcastData = Master -> Slave
-                #       channel_HRM_s = Heartbeat received from HRM
-                #       channel_SCS_s = Speed/Cadence received from SCS
-                #---------------------------------------------------------------
-                elif id == ant.msgID_BroadcastData:
-                    #-----------------------------------------------------------
-                    # Heart Rate Monitor inputs
-                    #-----------------------------------------------------------
-                    if Channel == ant.channel_HRM_s:
-                        #-------------------------------------------------------
-                        # Ask what device is paired
-                        #-------------------------------------------------------
-                        if not AntHRMpaired:
-                            msg = ant.msg4D_RequestMessage(ant.channel_HRM_s, ant.msgID_ChannelID)
-                            AntDongle.Write([msg], False, False)
-
-                        #-------------------------------------------------------
-                        # Data page 0...4 HRM data
-                        # Only expected when -H flag specified
-                        #-------------------------------------------------------
-                        if DataPageNumber & 0x7f in (0,1,2,3,4,5,6,7,89,95):
-                            if clv.hrm >= 0:
-                                _Channel, _DataPageNumber, _Spec1, _Spec2, _Spec3, \
-                                    _HeartBeatEventTime, _HeartBeatCount, HeartRate = \
-                                    ant.msgUnpage_Hrm(info)
-                                # print('Set heartrate from HRM', HeartRate)
-
-                            else:
-                                pass                            # Ignore it
-                                
-                        #-------------------------------------------------------
-                        # Data page 89 (HRM strap Garmin#3), 95(HRM strap Garmin#4)
-                        # Added to previous set, provides HR info
-                        #-------------------------------------------------------
-                        elif DataPageNumber in (89, 95):
-                            pass                                # Ignore it
-
-                        #-------------------------------------------------------
-                        # Other data pages
-                        #-------------------------------------------------------
-                        else: error = "Unknown HRM data page"
-
-                    #-----------------------------------------------------------
-                    # Speed Cadence Sensor inputs
-                    #-----------------------------------------------------------
-                    elif Channel == ant.channel_SCS:
-                        #-------------------------------------------------------
-                        # Data page 0 CSC data
-                        # Only expected when -S flag specified
-                        #-------------------------------------------------------
-                        if False:
-                            pass
-#scs                    elif clv.scs >= 0 and DataPageNumber & 0x7f == 0:
-#scs                        Channel, DataPageNumber, BikeCadenceEventTime, \
-#scs                            CumulativeCadenceRevolutionCount, BikeSpeedEventTime, \
-#scs                            CumulativeSpeedRevolutionCount = \
-#scs                            ant.msgUnpage0_CombinedSpeedCadence(info) 
-#scs                        SpeedKmh   = ...
-#scs                        Cadence    = ...
-
-                        #-------------------------------------------------------
-                        # Other data pages
-                        #-------------------------------------------------------
-                        else: error = "Unknown SCS data page"
-
-                    #-----------------------------------------------------------
-                    # Unknown channel
-                    #-----------------------------------------------------------
-                    else: error = "Unknown channel"
+    #---------------------------------------------------------------------------
+    # Data page 55 User configuration
+    #---------------------------------------------------------------------------
+    def FE_UserConfiguration(info, _Channel, _DataPageNumber):
+        UserWeight, BicycleWeight, BicycleWheelDiameter, GearRatio = \
+            ant.msgUnpage55_UserConfiguration(info)
+        TacxTrainer.SetUserConfiguration(UserWeight, \
+            BicycleWeight, BicycleWheelDiameter, GearRatio)
 
-                #---------------------------------------------------------------
-                # ChannelID - the info that a master on the network is paired
-                #---------------------------------------------------------------
-                elif id == ant.msgID_ChannelID:
-                    Channel, DeviceNumber, DeviceTypeID, _TransmissionType = \
-                        ant.unmsg51_ChannelID(info)
+    #---------------------------------------------------------------------------
+    # Data page 70 Request data page
+    #---------------------------------------------------------------------------
+    def FE_RequestDataPage(info, _Channel, _DataPageNumber):
+        _SlaveSerialNumber, _DescriptorByte1, _DescriptorByte2, \
+            _AckRequired, NrTimes, RequestedPageNumber, \
+            _CommandType = ant.msgUnpage70_RequestDataPage(info)
+        
+        info = False
+        if   RequestedPageNumber == 54:
+            # Capabilities;
+            # bit 0 = Basic mode
+            # bit 1 = Target/Power/Ergo mode
+            # bit 2 = Simulation/Restance/Slope mode
+            info = ant.msgPage54_FE_Capabilities(ant.channel_FE, 0xff, 0xff, 0xff, 0xff, 1000, 0x07)
+
+        elif RequestedPageNumber == 71:
+            info = ant.msgPage71_CommandStatus(ant.channel_FE, p71_LastReceivedCommandID, \
+                p71_SequenceNr, p71_CommandStatus, p71_Data1, p71_Data2, p71_Data3, p71_Data4)
+
+        elif RequestedPageNumber == 80:
+            info = ant.msgPage80_ManufacturerInfo(ant.channel_FE, 0xff, 0xff, \
+                ant.HWrevision_FE, ant.Manufacturer_tacx, ant.ModelNumber_FE)
+
+        elif RequestedPageNumber == 81:
+            info = ant.msgPage81_ProductInformation(ant.channel_FE, 0xff, \
+                ant.SWrevisionSupp_FE, ant.SWrevisionMain_FE, ant.SerialNumber_FE)
+
+        elif RequestedPageNumber == 82:
+            info = ant.msgPage82_BatteryStatus(ant.channel_FE)
+
+        else:
+            return "Requested page not suported"
+
+        d = ant.ComposeMessage (ant.msgID_BroadcastData, info)
+        AntDongle.Write([d] * NrTimes, False)
+
+    #---------------------------------------------------------------------------
+    # Data page 252 ????
+    #---------------------------------------------------------------------------
+    def FE_Page252(info, _Channel, _DataPageNumber):
+        if PrintWarnings or debug.on(debug.Data1):
+            logfile.Write('FE data page 252 ignored. info=%s' % logfile.HexSpace(info))
+
+    #---------------------------------------------------------------------------
+    # Other data pages
+    #---------------------------------------------------------------------------
+    def FE_Unknown(_info, _Channel, _DataPageNumber):
+        return "Unknown FE data page"
+
+    #---------------------------------------------------------------------------
+    # BroadcastData = Master -> Slave
+    #       channel_HRM_s = Heartbeat received from HRM
+    #       channel_SCS_s = Speed/Cadence received from SCS
+    #---------------------------------------------------------------------------
+    #---------------------------------------------------------------------------
+    # Heart Rate Monitor inputs; what device is paired is in the extended data
+    # of the message, otherwise ask for it
+    #---------------------------------------------------------------------------
+    def HRM_RequestChannelID():
+        if AntHRMpaired:
+            pass
+        elif Dispatcher.ExtendedData and Dispatcher.ExtendedData.DeviceNumber:
+            HRM_Paired(Dispatcher.ExtendedData.DeviceNumber)
+        else:
+            msg = ant.msg4D_RequestMessage(ant.channel_HRM_s, ant.msgID_ChannelID)
+            AntDongle.Write([msg], False, False)
+
+    def HRM_Paired(DeviceNumber):
+        nonlocal AntHRMpaired
+        AntHRMpaired = True
+        self.SetMessages(HRM='Heart Rate Monitor paired: %s' % DeviceNumber)
+
+    #---------------------------------------------------------------------------
+    # Data page 0...4 HRM data, 89 (HRM strap Garmin#3), 95(HRM strap Garmin#4)
+    # Only expected when -H flag specified
+    # Pages are registered with and without the page change toggle bit
+    #---------------------------------------------------------------------------
+    HRM_Pages = [p | t for p in (0,1,2,3,4,5,6,7,89,95) for t in (0x00, 0x80)]
+
+    def HRM_HeartRate(info, _Channel, _DataPageNumber):
+        nonlocal HeartRate
+        HRM_RequestChannelID()
+        if clv.hrm >= 0:
+            _Channel, _DataPageNumber, _Spec1, _Spec2, _Spec3, \
+                _HeartBeatEventTime, _HeartBeatCount, HeartRate = \
+                ant.msgUnpage_Hrm(info)
+            # print('Set heartrate from HRM', HeartRate)
 
-                    if DeviceNumber == 0:   # No device paired, ignore
-                        pass
+        else:
+            pass                            # Ignore it
+
+    def HRM_Unknown(_info, _Channel, _DataPageNumber):
+        HRM_RequestChannelID()
+        return "Unknown HRM data page"
+
+    #---------------------------------------------------------------------------
+    # Speed Cadence Sensor inputs
+    # Data page 0 CSC data
+    # Only expected when -S flag specified
+    #---------------------------------------------------------------------------
+#scs def SCS_SpeedCadence(info, _Channel, _DataPageNumber):
+#scs     Channel, DataPageNumber, BikeCadenceEventTime, \
+#scs         CumulativeCadenceRevolutionCount, BikeSpeedEventTime, \
+#scs         CumulativeSpeedRevolutionCount = \
+#scs         ant.msgUnpage0_CombinedSpeedCadence(info) 
+#scs     SpeedKmh   = ...
+#scs     Cadence    = ...
+
+    def SCS_Unknown(_info, _Channel, _DataPageNumber):
+        return "Unknown SCS data page"
+
+    #---------------------------------------------------------------------------
+    # ChannelID - the info that a master on the network is paired
+    #---------------------------------------------------------------------------
+    def ChannelID(info, _Channel, _DataPageNumber):
+        Channel, DeviceNumber, DeviceTypeID, _TransmissionType = \
+            ant.unmsg51_ChannelID(info)
+
+        if DeviceNumber == 0:   # No device paired, ignore
+            pass
+
+        elif Channel == ant.channel_HRM_s and DeviceTypeID == ant.DeviceTypeID_HRM:
+            HRM_Paired(DeviceNumber)
+
+        else:
+            logfile.Console('Unexpected device %s on channel %s' % (DeviceNumber, Channel))
+
+    #---------------------------------------------------------------------------
+    # Message ChannelResponse, acknowledges a message
+    # Message BurstData, ignored
+    #---------------------------------------------------------------------------
+    def Ignore(_info, _Channel, _DataPageNumber):
+        pass
 
-                    elif Channel == ant.channel_HRM_s and DeviceTypeID == ant.DeviceTypeID_HRM:
-                        AntHRMpaired = True
-                        self.SetMessages(HRM='Heart Rate Monitor paired: %s' % DeviceNumber)
+    Dispatcher = antDispatcher.clsAntDispatcher()
+    Dispatcher.Register(FE_BasicResistance,   ant.msgID_AcknowledgedData, ant.channel_FE, [48])
+    Dispatcher.Register(FE_TargetPower,       ant.msgID_AcknowledgedData, ant.channel_FE, [49])
+    Dispatcher.Register(FE_WindResistance,    ant.msgID_AcknowledgedData, ant.channel_FE, [50])
+    Dispatcher.Register(FE_TrackResistance,   ant.msgID_AcknowledgedData, ant.channel_FE, [51])
+    Dispatcher.Register(FE_UserConfiguration, ant.msgID_AcknowledgedData, ant.channel_FE, [55])
+    Dispatcher.Register(FE_RequestDataPage,   ant.msgID_AcknowledgedData, ant.channel_FE, [70])
+    Dispatcher.Register(FE_Page252,           ant.msgID_AcknowledgedData, ant.channel_FE, [252])
+    Dispatcher.Register(FE_Unknown,           ant.msgID_AcknowledgedData, ant.channel_FE)
+    Dispatcher.Register(HRM_HeartRate,        ant.msgID_BroadcastData,    ant.channel_HRM_s, HRM_Pages)
+    Dispatcher.Register(HRM_Unknown,          ant.msgID_BroadcastData,    ant.channel_HRM_s)
+    Dispatcher.Register(SCS_Unknown,          ant.msgID_BroadcastData,    ant.channel_SCS)
+    Dispatcher.Register(ChannelID,            ant.msgID_ChannelID)
+    Dispatcher.Register(Ignore,               ant.msgID_ChannelResponse,  Name='ChannelResponse')
+    Dispatcher.Register(Ignore,               ant.msgID_BurstData,        Name='BurstData')
 
-                    else:
-                        logfile.Console('Unexpected device %s on channel %s' % (DeviceNumber, Channel))
-                        
+    #---------------------------------------------------------------------------
+    # The phases of the main loop
+    # -- Get data from trainer (RefreshTrainer)
+    # -- Local adjustments (heartrate monitor, cadence sensor), recording,
+    #    pedal stroke analysis and buttons                  (HandleSample)
+    # -- Display actual values                              (ShowStatus)
+    # -- Broadcast to ANT and handle the received commands  (AntProfiles,
+    #                                                        HandleAntData)
+    # They are called by the main loop, or by the coroutines of Tacx2DongleAsync
+    #---------------------------------------------------------------------------
+    def HandleSample(QuarterSecond):
+        nonlocal HeartRate, pdaInfo, LastPedalEcho, EventCounter
+        #-----------------------------------------------------------------------
+        # If NO Speed Cadence Sensor defined, use Trainer-info
+        # Hook for future development
+        #-----------------------------------------------------------------------
+        # if clv.scs == None:
+        #     SpeedKmh   = SpeedKmhSCS
+        #     Cadence    = CadenceSCS
 
+        #-----------------------------------------------------------------------
+        # If NO HRM defined, use the HeartRate from the trainer
+        #-----------------------------------------------------------------------
+        if clv.hrm == None:
+            HeartRate = Sample.HeartRate
+            # print('Use heartrate from trainer', HeartRate)
+
+        #-----------------------------------------------------------------------
+        # Add trackpoint
+        #-----------------------------------------------------------------------
+        t = Timing.Start()
+        if QuarterSecond and clv.exportTCX:
+            tcx.TrackpointX(TacxTrainer, HeartRate)
+            t = Timing.Stop('TCX', t)
+
+        #-----------------------------------------------------------------------
+        # Store in JSON format
+        #-----------------------------------------------------------------------
+        if debug.on(debug.LogfileJson):
+            logfile.WriteJson(QuarterSecond, TacxTrainer, tcx, HeartRate)
+            Timing.Stop('WriteJson', t)
+
+        #-----------------------------------------------------------------------
+        # Pedal Stroke Analysis
+        #-----------------------------------------------------------------------
+        if clv.PedalStrokeAnalysis and TrainerThread:
+            # Sampled by the trainer thread at the polling rate
+            Stroke = TrainerThread.GetPedalStroke()
+            if Stroke:
+                self.PedalStrokeAnalysis(Stroke[0], Stroke[1])
+
+        elif clv.PedalStrokeAnalysis:
+            Now = time.monotonic()
+            if LastPedalEcho == 0 and Sample.PedalEcho == 1 and \
+                len(pdaInfo) and Sample.Cadence:
+                # Pedal triggers cadence sensor
+                self.PedalStrokeAnalysis(pdaInfo, Sample.Cadence)
+                pdaInfo = []
+            elif len(pdaInfo) and Now - pdaInfo[0][0] > pedalStroke.MaxStrokeTime:
+                pdaInfo = []                                            # Not pedalling
+            pdaInfo.append((Now, Sample.CurrentPower))                  # Store data for analysis
+            LastPedalEcho = Sample.PedalEcho                            # until next signal
+
+        #-----------------------------------------------------------------------
+        # In manual-mode, power can be incremented or decremented
+        # In all modes, operation can be stopped.
+        #
+        # TargetMode  is set here (manual mode) or received from ANT+ (Zwift)
+        # TargetPower and TargetGrade are set in this section only!
+        #-----------------------------------------------------------------------
+        if clv.manual:
+            if   Sample.Buttons == usbTrainer.EnterButton:          pass
+            elif Sample.Buttons == usbTrainer.DownButton:           TacxTrainer.AddPower(-50)
+            elif Sample.Buttons == usbTrainer.OKButton:             TacxTrainer.SetPower(100)
+            elif Sample.Buttons == usbTrainer.UpButton:             TacxTrainer.AddPower( 50)
+            elif Sample.Buttons == usbTrainer.CancelButton:         self.RunningSwitch = False
+            else:                                                   pass
+        elif clv.manualGrade:
+            if   Sample.Buttons == usbTrainer.EnterButton:          pass
+            elif Sample.Buttons == usbTrainer.DownButton:           TacxTrainer.AddGrade(-1)
+            elif Sample.Buttons == usbTrainer.OKButton:             TacxTrainer.SetGrade(0)
+            elif Sample.Buttons == usbTrainer.UpButton:             TacxTrainer.AddGrade( 1)
+            elif Sample.Buttons == usbTrainer.CancelButton:         self.RunningSwitch = False
+            else:                                                   pass
+        else:
+            if   Sample.Buttons == usbTrainer.EnterButton:          pass
+            elif Sample.Buttons == usbTrainer.DownButton:           TacxTrainer.SetPowercurveFactorDown()
+            elif Sample.Buttons == usbTrainer.OKButton:             TacxTrainer.ResetPowercurveFactor()
+            elif Sample.Buttons == usbTrainer.UpButton:             TacxTrainer.SetPowercurveFactorUp()
+            elif Sample.Buttons == usbTrainer.CancelButton:         self.RunningSwitch = False
+            else:                                                   pass
+
+        EventCounter += 1       # Increment and ...
+        EventCounter &= 0xff    # maximize to 255
+
+    #---------------------------------------------------------------------------
+    # Show actual status
+    #---------------------------------------------------------------------------
+    def ShowStatus():
+        t = Timing.Start()
+        if clv.gui: self.SetMessages(Tacx=TacxTrainer.Message + PowerModeActive)
+        TargetMode, TargetPower, TargetGrade, TargetResistance = TacxTrainer.GetTarget()
+        self.SetValues(Sample.VirtualSpeedKmh,
+                        Sample.Cadence, \
+                        Sample.CurrentPower, \
+                        TargetMode, \
+                        TargetPower, \
+                        TargetGrade, \
+                        TargetResistance, \
+                        HeartRate, \
+                        TacxTrainer.Teeth)
+        Timing.Stop('SetValues', t)
+
+    #---------------------------------------------------------------------------
+    # Broadcast to ANT; returns the received responses
+    #---------------------------------------------------------------------------
+    def AntWrite(messages):
+        t = Timing.Start()
+        rtn = AntDongle.Write(messages, True, False, pipelined=True)
+        Timing.Stop('AntDongle.Write', t)
+        return rtn
+
+    #---------------------------------------------------------------------------
+    # ANT work; the message of each profile, done once per its channel period
+    # Sending i-Vortex messages is done by Refesh() not here
+    #---------------------------------------------------------------------------
+    def BroadcastHRM():
+        if HeartRate > 0:               # Set by HandleSample()
+            return hrm.BroadcastHeartrateMessage(HeartRate)
+        return None
+
+    def BroadcastPWR():
+        return pwr.BroadcastMessage(Sample.CurrentPower, Sample.Cadence)
+
+    def BroadcastSCS():
+        return scs.BroadcastMessage(Sample.PedalEchoTime, Sample.PedalEchoCount, \
+                                    Sample.VirtualSpeedKmh, Sample.Cadence)
+
+    def BroadcastFE():
+        # TrainerData message to the CTP (Trainer Road, ...)
+        return fe.BroadcastTrainerDataMessage(Sample.Cadence, \
+                    Sample.CurrentPower, Sample.SpeedKmh, Sample.HeartRate)
+
+    #---------------------------------------------------------------------------
+    # The ANT+ master profiles: (Name, Period, Message)
+    # HRM and SCS only when not paired with an ANT+ device
+    #---------------------------------------------------------------------------
+    AntProfiles = []
+    if clv.hrm == None:
+        AntProfiles.append(('ANT HRM', BroadcastPeriod(ant.ChannelPeriod_HRM), BroadcastHRM))
+    AntProfiles.append(    ('ANT PWR', BroadcastPeriod(ant.ChannelPeriod_PWR), BroadcastPWR))
+    if clv.scs == None:
+        AntProfiles.append(('ANT SCS', BroadcastPeriod(ant.ChannelPeriod_SCS), BroadcastSCS))
+    AntProfiles.append(    ('ANT FE',  BroadcastPeriod(ant.ChannelPeriod_FE),  BroadcastFE))
+
+    #---------------------------------------------------------------------------
+    # The messages of the profiles that are due; None is not sent (no data)
+    #---------------------------------------------------------------------------
+    def BroadcastMessages(Messages):
+        return [m for m in [Message() for Message in Messages] if m]
+
+    #---------------------------------------------------------------------------
+    # Here all response from the ANT dongle are processed (receive=True)
+    # by the handlers registered in the Dispatcher
+    #---------------------------------------------------------------------------
+    def HandleAntData(data):
+        if not data:
+            return
+        t = Timing.Start()
+        for d in data:
+            if clv.Tacx_iVortex:
+                with TacxTrainer.Lock:  # Trainer may be refreshed meanwhile
+                    Handled = TacxTrainer.HandleANTmessage(d)
+                if Handled:
+                    continue            # Message is handled or ignored
+
+            error = Dispatcher.Dispatch(d)
+
+            #-------------------------------------------------------------------
+            # Unsupported channel, message or page can be silently ignored
+            # Show WHAT we ignore, not to be blind for surprises!
+            #-------------------------------------------------------------------
+            if error and (PrintWarnings or debug.on(debug.Data1)):
+                synch, length, id, info, checksum, _rest, Channel, DataPageNumber = ant.DecomposeMessage(d)
+                logfile.Write(\
+                "ANT Dongle:%s: synch=%s, len=%2s, id=%s, check=%s, channel=%s, page=%s(%s) info=%s" % \
+                (error, synch, length, hex(id), checksum, Channel, DataPageNumber, hex(DataPageNumber), logfile.HexSpace(info)))
+        Timing.Stop('ANT dispatch', t)
+
+    #---------------------------------------------------------------------------
+    # asyncio runtime (--Asyncio)
+    #
+    # The phases are separate coroutines, so that a slow consumer (GUI pipe,
+    # logfile) never delays the refresh of the trainer:
+    # -- Trainer        RefreshTrainer() in the 'Trainer' executor; the sample
+    #                   is handled in the event loop
+    # -- ANT profiles   Write() in the 'AntDongle' executor, each profile at
+    #                   its own period
+    # -- CTP commands   with --AntReceiver, commands are handled on arrival
+    # -- GUI            offloaded to the 'GUI' executor, dropped when busy
+    # -- Log flush      offloaded to the 'Recorder' executor
+    # The i-Vortex is refreshed through ANT, so then trainer and ANT share the
+    # same executor.
+    #---------------------------------------------------------------------------
+    def Tacx2DongleAsync():
+        Runtime     = asyncRuntime.clsAsyncRuntime(lambda: self.RunningSwitch == True \
+                                                   and not AntDongle.DongleReconnected)
+        Quarter     = scheduler.clsScheduler()              # QuarterSecond for
+        TaskQuarter = Quarter.AddTask('Quarter second', CycleTimeANT) # the trainer
+        AntExecutor = 'Trainer' if clv.Tacx_iVortex else 'AntDongle'
+
+        async def Trainer():
+            nonlocal Sample
+            QuarterSecond = TaskQuarter in Quarter.Due()
+            Sample = await Runtime.RunInExecutor('Trainer', RefreshTrainer, \
+                                                 QuarterSecond, usbTrainer.modeResistance)
+            HandleSample(QuarterSecond)
+
+        async def AntBroadcast(Message):
+            messages = BroadcastMessages([Message])
+            if messages:
+                HandleAntData(await Runtime.RunInExecutor(AntExecutor, AntWrite, messages))
+
+        async def CtpCommands():
+            while Runtime.Running():
+                if await Runtime.RunInExecutor('AntReceiver', AntDongle.WaitForData, \
+                                 CycleTimeANT, [ant.channel_FE], [ant.msgID_AcknowledgedData]):
+                    HandleAntData(AntDongle.Read(False, wait=False))
+
+        Runtime.Periodic('Trainer',       CycleTime,    Trainer)
+        for Name, Period, Message in AntProfiles:
+            Runtime.Periodic(Name,        Period,       lambda Message=Message: AntBroadcast(Message))
+        Runtime.Periodic('GUI',           CycleTimeGUI, lambda: Runtime.Offload('GUI', ShowStatus))
+        Runtime.Periodic('Log flush',     CycleTimeLog, lambda: Runtime.Offload('Recorder', logfile.Flush))
+        if AntDongle.Receiver:
+            Runtime.Add(CtpCommands())
+        try:
+            Runtime.Run()
+        finally:
+            logfile.Console(Runtime.Statistics())
+
+    #---------------------------------------------------------------------------
+    # Our main loop!
+    #---------------------------------------------------------------------------
+    if debug.on(debug.Function): logfile.Write('Tacx2Dongle; start main loop')
+    AntTasks = {}                   # Task -> Message function of the profile
+    if not clv.Asyncio:
+        for Name, Period, Message in AntProfiles:
+            AntTasks[Scheduler.AddTask(Name, Period)] = Message
+    logfile.AutoFlush = False
+    Timing.Reset()
+    try:
+        if clv.Asyncio:
+            Tacx2DongleAsync()
+        else:
+            while self.RunningSwitch == True and not AntDongle.DongleReconnected:
                 #---------------------------------------------------------------
-                # Message ChannelResponse, acknowledges a message
+                # WAIT untill the first task is due
+                # When woken up by the ANT receiver, no task is due; only the
+                # received data is handled in between
                 #---------------------------------------------------------------
-                elif id == ant.msgID_ChannelResponse:
-                    Channel, _InitiatingMessageID, _ResponseCode = ant.unmsg64_ChannelResponse(info)
-                    pass
-                    
+                if AntDongle.Receiver:
+                    Scheduler.Wait(lambda Timeout: AntDongle.WaitForData(Timeout, \
+                                   [ant.channel_FE], [ant.msgID_AcknowledgedData]))
+                else:
+                    Scheduler.Wait()
+                Due           = Scheduler.Due()
+                QuarterSecond = TaskQuarter in Due
+                AntMessages   = [AntTasks[Task] for Task in Due if Task in AntTasks]
+                CycleStart    = Timing.Start()
+
                 #---------------------------------------------------------------
-                # Message BurstData, ignored
+                # Get data from trainer; the ANT+ profiles broadcast the last
+                # sample, which is at most one polling cycle old
                 #---------------------------------------------------------------
-                elif id == ant.msgID_BurstData:
-                    pass
+                if TaskTrainer in Due or QuarterSecond:
+                    Sample = RefreshTrainer(QuarterSecond, usbTrainer.modeResistance)
+                    HandleSample(QuarterSecond)
 
-                else: error = "Unknown message ID"
+                if TaskGUI in Due:
+                    ShowStatus()
 
                 #---------------------------------------------------------------
-                # Unsupported channel, message or page can be silently ignored
-                # Show WHAT we ignore, not to be blind for surprises!
+                # Broadcast and receive ANT+ responses
                 #---------------------------------------------------------------
-                if error and (PrintWarnings or debug.on(debug.Data1)): logfile.Write(\
-                    "ANT Dongle:%s: synch=%s, len=%2s, id=%s, check=%s, channel=%s, page=%s(%s) info=%s" % \
-                    (error, synch, length, hex(id), checksum, Channel, DataPageNumber, hex(DataPageNumber), logfile.HexSpace(info)))
+                messages = BroadcastMessages(AntMessages)
+                if messages:
+                    HandleAntData(AntWrite(messages))
+                elif AntDongle.Receiver:
+                    HandleAntData(AntDongle.Read(False, wait=False))
 
-            #-------------------------------------------------------------------
-            # WAIT untill CycleTime is done
-            #-------------------------------------------------------------------
-            ElapsedTime = time.time() - StartTime
-            SleepTime = CycleTime - ElapsedTime
-            if SleepTime > 0:
-                time.sleep(SleepTime)
-                if debug.on(debug.Data2): logfile.Write ("Sleep(%4.2f) to fill %s seconds done." % (SleepTime, CycleTime) )
-            else:
-                if ElapsedTime > CycleTime * 2 and debug.on(debug.Any):
-                    logfile.Write ("Tacx2Dongle; Processing time %5.3f is %5.3f longer than planned %5.3f (seconds)" % (ElapsedTime, SleepTime * -1, CycleTime) )
-                pass
+                #---------------------------------------------------------------
+                # The logfile is flushed periodically, not on each record
+                #---------------------------------------------------------------
+                if TaskLog in Due:
+                    logfile.Flush()
+
+                Timing.Stop('Cycle', CycleStart)
 
-            EventCounter += 1           # Increment and ...
-            EventCounter &= 0xff        # maximize to 255
-            
     except KeyboardInterrupt:
         logfile.Console ("Stopped")
     #---------------------------------------------------------------------------
@@ -1236,7 +1504,18 @@ def Tacx2DongleSub(self, Restart):
     #---------------------------------------------------------------------------
     # Stop devices
     #---------------------------------------------------------------------------
+    AntDongle.StopReceiver()
     AntDongle.ResetDongle()
-    TacxTrainer.SendToTrainer(True, usbTrainer.modeStop)
+    StopTrainer()
+    if AntDongle.OK:
+        logfile.Console(AntDongle.Statistics())
+    if TacxTrainer.Statistics():
+        logfile.Console(TacxTrainer.Statistics())
+    logfile.Console(Dispatcher.Statistics())
+    if not clv.Asyncio:
+        logfile.Console(Scheduler.Statistics())
+    logfile.Console(Timing.Report())
+    logfile.AutoFlush = True
+    logfile.Flush()
 
     return True
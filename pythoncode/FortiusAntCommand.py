@@ -1,7 +1,14 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2020-12-10"
+__version__ = "2026-10-18"
+# 2026-10-18    -A also in console mode; the profile is recorded in a file
+#               --PollRate at least 50Hz with -A
+# 2026-10-18    Added: --PollRate, --AntRate
+# 2026-10-18    Added: --Asyncio
+# 2026-10-18    Added: --UsbAsync, --TrainerThread, --UsbRecord, --UsbReplay,
+#                      --UsbReplayFast, --UsbEmulator, --AntReceiver,
+#                      --AntSharding; -D accepts a list of antDongle types
 # 2020-12-10    GradeAdjust defined as integer%
 #               float (-p and -c); decimal-comma is replaced by decimal-point.
 #               Removed: -u uphill
@@ -73,6 +80,17 @@ class CommandLineVariables(object):
     SimulateTrainer = False
     TacxType        = False
     Tacx_iVortex    = False
+    AntReceiver     = False      # introduced 2026-10-18; ANT-dongle read by dedicated thread
+    AntSharding     = 'masters'  # introduced 2026-10-18; Placement of channels over multiple ANT-dongles
+    AntRate         = 0          # introduced 2026-10-18; ANT+ broadcast rate (Hz), 0=channel period of each profile
+    Asyncio         = False      # introduced 2026-10-18; Main loop as asyncio coroutines
+    PollRate        = 4          # introduced 2026-10-18; Trainer polling rate (Hz)
+    TrainerThread   = False      # introduced 2026-10-18; Trainer polled by dedicated thread
+    UsbAsync        = False      # introduced 2026-10-18; USB-transfers in background thread
+    UsbEmulator     = False      # introduced 2026-10-18; (Headunit, Brake) to be emulated
+    UsbRecord       = False      # introduced 2026-10-18; Record USB-frames to this file
+    UsbReplay       = False      # introduced 2026-10-18; Replay USB-frames from this file
+    UsbReplayFast   = False      # introduced 2026-10-18; Replay as fast as possible
 
     #---------------------------------------------------------------------------
     # Deprecated
@@ -101,10 +119,12 @@ class CommandLineVariables(object):
         #-----------------------------------------------------------------------
         parser = argparse.ArgumentParser(description='Program to broadcast data from USB Tacx Fortius trainer, and to receive resistance data for the trainer')
         parser.add_argument('-a','--autostart', help='Automatically start',                                 required=False, action='store_true')
-        parser.add_argument('-A','--PedalStrokeAnalysis', help='Pedal Stroke Analysis',                     required=False, action='store_true')
+        parser.add_argument('-A','--PedalStrokeAnalysis', help='Pedal Stroke Analysis; in console mode recorded in a file',
+                                                                                                            required=False, action='store_true')
         parser.add_argument('-c','--CalibrateRR',help='calibrate Rolling Resistance for Magnetic Brake',    required=False, default=False)
         parser.add_argument('-d','--debug',     help='Show debugging data',                                 required=False, default=False)
-        parser.add_argument('-D','--antDeviceID',help='Use this antDongle type only',                       required=False, default=False)
+        parser.add_argument('-D','--antDeviceID',help='Use this antDongle type only; a list (e.g. 4104,4105) to use multiple dongles (0: any type)',
+                                                                                                            required=False, default=False)
         parser.add_argument('-g','--gui',       help='Run with graphical user interface',                   required=False, action='store_true')
         parser.add_argument('-G','--GradeAdjust',help='Adjust slope%% in GradeMode (factor/factorDownhill)',required=False, default=False)
         parser.add_argument('-H','--hrm',       help='Pair this ANT+ Heart Rate Monitor (0: any, -1: none); Tacx HRM is used if not specified',
@@ -122,6 +142,28 @@ class CommandLineVariables(object):
 #scs    parser.add_argument('-S','--scs',       help='Pair this Speed Cadence Sensor (0: default device)',  required=False, default=False)
         parser.add_argument('-t','--TacxType',  help='Specify Tacx Type; e.g. i-Vortex, default=autodetect',required=False, default=False)
         parser.add_argument('-x','--exportTCX', help='Export TCX file',                                     required=False, action='store_true')
+        parser.add_argument('--AntReceiver',    help='Read the ANT dongle in a dedicated thread; commands from the CTP are handled immediatly',
+                                                                                                            required=False, action='store_true')
+        parser.add_argument('--AntRate',        help='Broadcast rate of the ANT+ profiles in Hz (1..4); default: the channel period of each profile (FE 4, HRM 4.06, PWR 4.006, SCS 4.05)',
+                                                                                                            required=False, default=False)
+        parser.add_argument('--AntSharding',    help='Placement of the ANT channels over multiple dongles (-D list); masters: masters on the first dongle, slaves on the others; spread: round robin',
+                                                                                                            required=False, default='masters', choices=['masters', 'spread'])
+        parser.add_argument('--Asyncio',        help='Run trainer, ANT, user-interface and logging as asyncio coroutines; a slow user-interface or disk does not delay the trainer',
+                                                                                                            required=False, action='store_true')
+        parser.add_argument('--PollRate',       help='Polling rate of the trainer in Hz (4..100); default: 4, 50 with pedal stroke analysis (-A)',
+                                                                                                            required=False, default=False)
+        parser.add_argument('--TrainerThread', help='Poll the trainer in a dedicated thread, independent of ANT and user-interface',
+                                                                                                            required=False, action='store_true')
+        parser.add_argument('--UsbAsync',       help='Keep USB transfers with the trainer running in background',
+                                                                                                            required=False, action='store_true')
+        parser.add_argument('--UsbEmulator',    help='Emulate a Tacx headunit with brake; e.g. 1932:1941 (default) or 1942:1901',
+                                                                                                            required=False, default=False, nargs='?', const='1932:1941')
+        parser.add_argument('--UsbRecord',      help='Record the USB frames exchanged with the trainer in this file',
+                                                                                                            required=False, default=False)
+        parser.add_argument('--UsbReplay',      help='Replay a USB recording instead of using the trainer',
+                                                                                                            required=False, default=False)
+        parser.add_argument('--UsbReplayFast',  help='Replay the USB recording as fast as possible',
+                                                                                                            required=False, action='store_true')
 
         #-----------------------------------------------------------------------
         # Parse
@@ -142,6 +184,12 @@ class CommandLineVariables(object):
         self.Resistance             = args.Resistance
         self.SimulateTrainer        = args.simulate
         self.exportTCX              = args.exportTCX or self.manual or self.manualGrade
+        self.AntReceiver            = args.AntReceiver
+        self.AntSharding            = args.AntSharding
+        self.Asyncio                = args.Asyncio
+        self.TrainerThread          = args.TrainerThread
+        self.UsbAsync               = args.UsbAsync
+        self.UsbReplayFast          = args.UsbReplayFast
 
         if self.manual and self.manualGrade:
             logfile.Console("-m and -M are mutually exclusive; manual power selected")
@@ -171,12 +219,24 @@ class CommandLineVariables(object):
         #-----------------------------------------------------------------------
         # Get antDeviceID
         #-----------------------------------------------------------------------
+        # - one type    : use a dongle of this type
+        # - a list      : use a dongle of each type; 0 = any type
+        #                 the channels are placed on the dongles by AntSharding
+        #-----------------------------------------------------------------------
         if args.antDeviceID:
             try:
-                self.antDeviceID = int(args.antDeviceID)
+                IDs = [int(ID) for ID in args.antDeviceID.split(',')]
+                if len(IDs) == 1:
+                    self.antDeviceID = IDs[0]
+                else:
+                    self.antDeviceID = [ID or None for ID in IDs]
             except:
                 logfile.Console('Command line error; -D incorrect antDeviceID=%s' % args.antDeviceID)
 
+        if self.AntSharding != 'masters' and not isinstance(self.antDeviceID, list):
+            logfile.Console('Command line error; --AntSharding requires a list of dongles (-D)')
+            self.AntSharding = 'masters'
+
         #-----------------------------------------------------------------------
         # Get HRM
         # - None: read HRM from Tacx Fortius and broadcast as HRM master device
@@ -274,13 +334,89 @@ class CommandLineVariables(object):
                 logfile.Console('Command line error; -t incorrect value=%s' % args.TacxType)
                 args.TacxType = False
 
+        #-----------------------------------------------------------------------
+        # Get headunit and brake to be emulated
+        #-----------------------------------------------------------------------
+        if args.UsbEmulator:
+            try:
+                hu, brake = args.UsbEmulator.split(':')
+                hu, brake = int(hu, 16), int(brake, 16)
+                assert hu in (0x1932, 0x1942) and brake in (0x1941, 0x1901)
+            except:
+                logfile.Console('Command line error; --UsbEmulator incorrect value=%s' % args.UsbEmulator)
+            else:
+                if self.SimulateTrainer or self.Tacx_iVortex or args.UsbReplay:
+                    logfile.Console("--UsbEmulator is not possible with -s, -t or --UsbReplay")
+                else:
+                    self.UsbEmulator = (hu, brake)
+
+        #-----------------------------------------------------------------------
+        # Get USB record/replay files
+        #-----------------------------------------------------------------------
+        if args.UsbRecord and args.UsbReplay:
+            logfile.Console("--UsbRecord and --UsbReplay are mutually exclusive; replay selected")
+        elif args.UsbRecord:
+            self.UsbRecord = args.UsbRecord
+
+        if args.UsbReplay:
+            self.UsbReplay = args.UsbReplay
+
+        if (self.UsbRecord or self.UsbReplay) and (self.SimulateTrainer or self.Tacx_iVortex):
+            logfile.Console("--UsbRecord/--UsbReplay is not possible for this Tacx type")
+            self.UsbRecord = False
+            self.UsbReplay = False
+
+        if self.UsbReplayFast and not self.UsbReplay:
+            logfile.Console("--UsbReplayFast ignored, --UsbReplay not specified")
+            self.UsbReplayFast = False
+
+        #-----------------------------------------------------------------------
+        # i-Vortex is refreshed through ANT, which cannot be done in a thread
+        #-----------------------------------------------------------------------
+        if self.TrainerThread and self.Tacx_iVortex:
+            logfile.Console("Trainer thread is not possible for this Tacx type")
+            self.TrainerThread = False
+
         #-----------------------------------------------------------------------
         # Check pedal stroke analysis
         #-----------------------------------------------------------------------
-        if args.PedalStrokeAnalysis and (not args.gui or self.Tacx_iVortex):
-            logfile.Console("Pedal stroke analysis is not possible in console mode or this Tacx type")
+        if args.PedalStrokeAnalysis and self.Tacx_iVortex:
+            logfile.Console("Pedal stroke analysis is not possible for this Tacx type")
             self.PedalStrokeAnalysis = False
 
+        #-----------------------------------------------------------------------
+        # Get trainer polling rate and ANT+ broadcast rate
+        # - the trainer is polled fast for pedal stroke analysis
+        # - ANT+ is broadcast at most once per channel period; a message more
+        #   often is not transmitted, a message less often is repeated
+        #-----------------------------------------------------------------------
+        if self.PedalStrokeAnalysis:
+            self.PollRate = 50
+
+        if args.PollRate:
+            try:
+                self.PollRate = float(args.PollRate.replace(',', '.'))
+            except:
+                logfile.Console('Command line error; --PollRate incorrect value=%s' % args.PollRate)
+            else:
+                if self.PollRate < 4 or self.PollRate > 100:
+                    logfile.Console('Command line error; --PollRate must be 4..100 Hz')
+                    self.PollRate = min(100, max(4, self.PollRate))
+
+                if self.PedalStrokeAnalysis and self.PollRate < 50:
+                    logfile.Console('Pedal stroke analysis requires --PollRate 50 or more')
+                    self.PollRate = 50
+
+        if args.AntRate:
+            try:
+                self.AntRate = float(args.AntRate.replace(',', '.'))
+            except:
+                logfile.Console('Command line error; --AntRate incorrect value=%s' % args.AntRate)
+            else:
+                if self.AntRate < 1 or self.AntRate > 4:
+                    logfile.Console('Command line error; --AntRate must be 1..4 Hz')
+                    self.AntRate = min(4, max(1, self.AntRate))
+
         #-----------------------------------------------------------------------
         # If nothing specified at all, help the poor windows-users
         #-----------------------------------------------------------------------
@@ -313,6 +449,7 @@ class CommandLineVariables(object):
             self.gui                    = True      # Show gui
             self.hrm                    = 0         # Pair with HRM
             self.PedalStrokeAnalysis    = True      # Show it
+            self.PollRate               = 50        # Poll fast to show it
 
 
     def print(self):
@@ -342,6 +479,18 @@ class CommandLineVariables(object):
 #scs        if v or self.args.scs:           logfile.Console("-S %s" % self.scs )
             if v or self.args.TacxType:      logfile.Console("-t %s" % self.TacxType)
             if      self.exportTCX:          logfile.Console("-x")
+            if      self.AntReceiver:        logfile.Console("--AntReceiver")
+            if v or self.args.AntSharding != 'masters':
+                                             logfile.Console("--AntSharding %s" % self.AntSharding)
+            if      self.AntRate:            logfile.Console("--AntRate %s" % self.AntRate)
+            if      self.Asyncio:            logfile.Console("--Asyncio")
+            if v or self.args.PollRate:      logfile.Console("--PollRate %s" % self.PollRate)
+            if      self.TrainerThread:      logfile.Console("--TrainerThread")
+            if      self.UsbAsync:           logfile.Console("--UsbAsync")
+            if      self.UsbEmulator:        logfile.Console("--UsbEmulator %s" % self.args.UsbEmulator)
+            if      self.UsbRecord:          logfile.Console("--UsbRecord %s" % self.UsbRecord)
+            if      self.UsbReplay:          logfile.Console("--UsbReplay %s" % self.UsbReplay)
+            if      self.UsbReplayFast:      logfile.Console("--UsbReplayFast")
 
         except:
             pass # May occur when incorrect command line parameters, error already given before
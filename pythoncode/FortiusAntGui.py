@@ -1,7 +1,8 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2020-11-04"
+__version__ = "2026-10-18"
+# 2026-10-18    Ctrl-T calls callTimingReport()
 # 2020-11-04    WindowTitle separated into FortiusAntTitle.py
 # 2020-10-01    Version 3.2.2:
 #               - Enable manual mode withoout ANT dongle
@@ -127,6 +128,11 @@ class frmFortiusAntGui(wx.Frame):
         # ----------------------------------------------------------------------
         self.Bind(wx.EVT_CLOSE, self.OnClose)
         self.Bind(wx.EVT_PAINT, self.OnPaint)              # Draw the bitmap
+
+        idTimingReport = wx.NewId()                        # Ctrl-T
+        self.Bind(wx.EVT_MENU, self.OnTimingReport, id=idTimingReport)
+        self.SetAcceleratorTable(wx.AcceleratorTable( \
+                                    [(wx.ACCEL_CTRL, ord('T'), idTimingReport)]))
         self.Iconize(False)                                # un-iconize
 #       print(self.GetPosition())
 #       self.Center()                                      # It does not center the frame on the screen...
@@ -619,6 +625,9 @@ class frmFortiusAntGui(wx.Frame):
             time.sleep(0.250)                       # sleep 0.250 second (like Tacx2Dongle)
         return True
 
+    def callTimingReport(self):
+        print("callTimingReport not defined by application class")
+
     # --------------------------------------------------------------------------
     # A u t o s t a r t
     # --------------------------------------------------------------------------
@@ -951,6 +960,18 @@ class frmFortiusAntGui(wx.Frame):
 
             self.callIdleFunction()
 
+    # --------------------------------------------------------------------------
+    # O n T i m i n g R e p o r t
+    # --------------------------------------------------------------------------
+    # input:        Ctrl-T pressed
+    #
+    # Description:  Show the duration of the phases of the running loop
+    #
+    # Output:       None
+    # --------------------------------------------------------------------------
+    def OnTimingReport(self, event):
+        self.callTimingReport()
+
     # --------------------------------------------------------------------------
     # O n C l i c k _ b t n L o c a t e H W
     # --------------------------------------------------------------------------
@@ -1,7 +1,9 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2020-05-07"
+__version__ = "2026-10-18"
+# 2026-10-18    Angle calculation moved to pedalStroke.AngleProfile(), so that
+#               it is available without wx (console mode)
 # 2020-05-07    pylint error free
 # 2020-05-01    First version
 #-------------------------------------------------------------------------------
@@ -12,6 +14,7 @@ import wx
 import math
 import random
 import logfile
+import pedalStroke
 
 # ------------------------------------------------------------------------------
 # Create the RadarGraph window
@@ -58,27 +61,7 @@ class clsRadarGraph():
     # Output:       None
     # --------------------------------------------------------------------------
     def PedalStrokeAnalysis(self, info, Cadence):
-        Adjust = 0
-        StartTime = info[0][0]                  # First element = at pedelecho
-        data      = []
-        for i in info:
-            Timestamp = i[0]                    # Time of the measurement
-            Delta     = (Timestamp - StartTime) # Elapsed time in seconds
-            dps       = Cadence / 60 * 360      # Cadence = Rotations/minute
-                                                # dps = Degrees/second
-
-            Angle     = int( Delta * dps )      # Angle since PedalEcho
-            Angle    += Adjust
-            if Angle >= 360:
-                Angle -= 360
-
-            Power     = int( i[1] )
-            d = (Angle, Power)
-            # s = ""
-            # logfile.Write('Angle=%3s power=%5s Time=%s' % (Angle, Power, i[0]))
-            data.append(d)
-        self.ShowRadarGraph(data)
-        pass
+        self.ShowRadarGraph(pedalStroke.AngleProfile(info, Cadence))
 
     def ShowRadarGraph(self, data):
         # logfile.Console('ShowRadarGraph')
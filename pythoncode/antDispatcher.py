@@ -0,0 +1,189 @@
+#-------------------------------------------------------------------------------
+# Version info
+#-------------------------------------------------------------------------------
+__version__ = "2026-10-18"
+# 2026-10-18    Extended data is not passed in info, but in ExtendedData
+# 2026-10-18    First version; table-driven dispatching of the messages received
+#               from the ANT-dongle, replacing the if/elif chains in
+#               FortiusAntBody.Tacx2DongleSub() and ExplorAnt
+#-------------------------------------------------------------------------------
+import time
+
+import antDongle         as ant
+
+#-------------------------------------------------------------------------------
+# c l s A n t H a n d l e r
+#-------------------------------------------------------------------------------
+# A registered handler and its counters; one handler can be registered for
+# multiple (message id, channel, page) combinations and counts for all.
+#-------------------------------------------------------------------------------
+class clsAntHandler():
+    def __init__(self, Name, Function):
+        self.Name       = Name
+        self.Function   = Function
+        self.Calls      = 0
+        self.Time       = 0             # Total time spent in handler (seconds)
+        self.MaxTime    = 0
+
+#-------------------------------------------------------------------------------
+# c l s A n t D i s p a t c h e r
+#-------------------------------------------------------------------------------
+# Handlers are registered for (message id, channel, page); channel and page
+# can be None, meaning "any".
+#
+# Dispatch() takes the message id, channel and page directly from the message
+# and looks up the handler in a dictionary, in the following order:
+#       (id, channel, page)
+#       (id, channel, None)
+#       (id, None,    None)
+# so the cost of a message does not depend on the number of handlers.
+#
+# A handler is called as Function(info, Channel, DataPageNumber) and returns
+# None if the message is handled, or a text explaining why not.
+#
+# For a data message with extended data (see antDongle.unmsgExtendedData),
+# info is the payload only and ExtendedData is set during the call; e.g. to
+# know the paired device without requesting the ChannelID.
+#-------------------------------------------------------------------------------
+class clsAntDispatcher():
+    def __init__(self):
+        self.Handlers   = {}            # (id, channel, page) -> clsAntHandler
+        self.Registered = []            # the handlers, in order of registration
+        self.MessageIDs = set()
+        self.Unhandled  = 0
+        self.StartTime  = time.time()
+        self.ExtendedData = None        # Of the message being dispatched
+
+    #---------------------------------------------------------------------------
+    # R e g i s t e r
+    #---------------------------------------------------------------------------
+    # input         Function        handler, see above
+    #               MessageID       message id to be handled
+    #               Channel         channel, None = any channel
+    #               Pages           list of data pages, None = any page
+    #               Name            for the statistics; default function name
+    #
+    # function      Add handler to the table
+    #
+    # returns       none
+    #---------------------------------------------------------------------------
+    def Register(self, Function, MessageID, Channel=None, Pages=None, Name=None):
+        assert Channel != None or Pages == None, "Pages require a Channel"
+        Handler = clsAntHandler(Name or Function.__name__, Function)
+        self.Registered.append(Handler)
+        self.MessageIDs.add(MessageID)
+        for Page in (Pages or (None,)):
+            Key = (MessageID, Channel, Page)
+            assert Key not in self.Handlers, "Handler registered twice for %s" % (Key,)
+            self.Handlers[Key] = Handler
+
+    #---------------------------------------------------------------------------
+    # D i s p a t c h
+    #---------------------------------------------------------------------------
+    # input         d               a complete message as received from dongle
+    #
+    # function      Call the handler for the message
+    #               The sequence number of burst data is only split-off for
+    #               burst data, not for each message (see DecomposeMessage).
+    #
+    # returns       None if handled, otherwise error text
+    #---------------------------------------------------------------------------
+    def Dispatch(self, d):
+        length          = d[1]
+        id              = d[2]
+        Channel         = d[3] if length >= 1 else -1
+        DataPageNumber  = d[4] if length >= 2 else -1
+        if id == ant.msgID_BurstData:
+            Channel    &= 0b00011111
+        if length > ant.DataPayloadLength and id in ant.DataMessageIDs:
+            self.ExtendedData = ant.unmsgExtendedData(d)
+            length            = ant.DataPayloadLength
+        else:
+            self.ExtendedData = None
+
+        Handlers = self.Handlers
+        Handler  = Handlers.get((id, Channel, DataPageNumber))
+        if Handler == None:
+            Handler = Handlers.get((id, Channel, None))
+            if Handler == None:
+                Handler = Handlers.get((id, None, None))
+                if Handler == None:
+                    self.Unhandled += 1
+                    return "Unknown channel" if id in self.MessageIDs else "Unknown message ID"
+
+        start  = time.perf_counter()
+        rtn    = Handler.Function(d[3:3+length], Channel, DataPageNumber)
+        elapsed= time.perf_counter() - start
+        Handler.Calls += 1
+        Handler.Time  += elapsed
+        if elapsed > Handler.MaxTime: Handler.MaxTime = elapsed
+        return rtn
+
+    #---------------------------------------------------------------------------
+    # S t a t i s t i c s
+    #---------------------------------------------------------------------------
+    def Statistics(self):
+        Elapsed = max(time.time() - self.StartTime, 1)
+        rtn = "ANT dispatcher: %s messages not handled" % self.Unhandled
+        for h in sorted(self.Registered, key=lambda h: h.Calls, reverse=True):
+            if h.Calls:
+                rtn += "\n    %-28s %7s calls %6.2f/s avg %6.1fus max %7.1fus" % \
+                       (h.Name, h.Calls, h.Calls / Elapsed, \
+                        h.Time / h.Calls * 1e6, h.MaxTime * 1e6)
+        return rtn
+
+#-------------------------------------------------------------------------------
+# Main program to test the previous functions
+#-------------------------------------------------------------------------------
+if __name__ == "__main__":
+    import antFrames
+    import debug
+    debug.deactivate()
+
+    Handled = []
+    def Page25(info, Channel, DataPageNumber):  Handled.append(('page25', Channel, DataPageNumber))
+    def OtherFE(info, Channel, DataPageNumber): return "Unknown FE data page"
+    def Response(info, Channel, DataPageNumber):Handled.append(('response', Channel))
+
+    Dispatcher = clsAntDispatcher()
+    Dispatcher.Register(Page25,   ant.msgID_BroadcastData, ant.channel_FE, [25])
+    Dispatcher.Register(OtherFE,  ant.msgID_BroadcastData, ant.channel_FE)
+    Dispatcher.Register(Response, ant.msgID_ChannelResponse)
+
+    Broadcast = antFrames.Compose(ant.msgID_BroadcastData, b'\x00\x19\x57\x5a\x00\x64\x00\x00\x30')
+    assert Dispatcher.Dispatch(Broadcast) == None
+    assert Dispatcher.Dispatch(antFrames.Compose(ant.msgID_BroadcastData, b'\x00\x10' + bytes(7))) == "Unknown FE data page"
+    assert Dispatcher.Dispatch(antFrames.Compose(ant.msgID_BroadcastData, b'\x01\x10' + bytes(7))) == "Unknown channel"
+    assert Dispatcher.Dispatch(antFrames.Compose(ant.msgID_ChannelResponse, b'\x03\x01\x03')) == None
+    assert Dispatcher.Dispatch(antFrames.Compose(ant.msgID_ChannelID, b'\x03\x01\x03\x04\x05')) == "Unknown message ID"
+    assert Handled == [('page25', 0, 25), ('response', 3)], Handled
+
+    def Extended(info, Channel, DataPageNumber):
+        Handled.append((bytes(info), Dispatcher.ExtendedData))
+    Dispatcher.Register(Extended, ant.msgID_BroadcastData, ant.channel_HRM_s)
+    Payload = b'\x01\x04' + bytes(7)
+    assert Dispatcher.Dispatch(antFrames.Compose(ant.msgID_BroadcastData, Payload + \
+                               b'\xc0\x39\x30\x78\x01\x20\xc4\x00')) == None
+    assert Dispatcher.Dispatch(antFrames.Compose(ant.msgID_BroadcastData, Payload)) == None
+    assert Handled[2:] == [(Payload, (12345, 0x78, 1, -60)), (Payload, None)], Handled
+    print ('Tests passed')
+
+    #---------------------------------------------------------------------------
+    # Benchmark: dispatcher versus DecomposeMessage + if/elif
+    #---------------------------------------------------------------------------
+    N = 100000
+    def IfElse(d):
+        _synch, _length, id, info, _checksum, _rest, Channel, DataPageNumber = ant.DecomposeMessage(d)
+        if id == ant.msgID_AcknowledgedData:
+            pass
+        elif id == ant.msgID_BroadcastData:
+            if Channel == ant.channel_HRM_s:
+                pass
+            elif Channel == ant.channel_FE:
+                if DataPageNumber == 25: Page25(info, Channel, DataPageNumber)
+    for f, Name in ((IfElse, 'if/elif'), (Dispatcher.Dispatch, 'dispatcher')):
+        start = time.perf_counter()
+        for _ in range(N):
+            f(Broadcast)
+        print ('%-10s: %4.2fus/message' % (Name, (time.perf_counter() - start) * 1e6 / N))
+    print (Dispatcher.Statistics())
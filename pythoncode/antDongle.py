@@ -1,7 +1,43 @@
 #---------------------------------------------------------------------------
 # Version info
 #---------------------------------------------------------------------------
-__version__ = "2020-11-18"
+__version__ = "2026-10-18"
+# 2026-10-18    Read() waits for a quiet dongle max Timeout seconds; under
+#                   continuous traffic it would never return
+# 2026-10-18    GetDongle() enumerates the USB-bus on each call; the cached
+#                   devices may be stale after re-plugging
+# 2026-10-18    ChannelPeriod_FE/HRM/PWR/SCS and ChannelPeriodSeconds(), so that
+#               FortiusAntBody broadcasts each profile at its channel period
+# 2026-10-18    Extended messages (msg6E_LibConfig); the dongle appends the
+#               device (and RSSI) to each received data message, so that the
+#               paired device is known without ChannelID requests.
+#               DecomposeMessage() returns the payload without extended data,
+#               unmsgExtendedData() decodes the extended data
+# 2026-10-18    clsAntDonglePool; the channels are placed over multiple dongles
+#               (-D list, --AntSharding), traffic is reported per dongle
+#               A dongle is claimed by one clsAntDongle only
+# 2026-10-18    Dongle reconnect restores the channels itself: the channel
+#               setup and the paired devices are recorded and replayed after
+#               reconnect; retried with exponential backoff, immediately when
+#               the USB-bus changes. The application is restarted only when
+#               the channels cannot be restored.
+# 2026-10-18    ChannelSetup(); the channel configuration messages are sent
+#               for all channels at once and the responses are matched by
+#               channel and message id, instead of a read-timeout per message
+#               ResetDongle() waits for the StartUp message, not 500ms
+# 2026-10-18    msgPageNN/msgUnpageNN use the precompiled codecs of antPages;
+#               msgUnpage's return named tuples (compatible with tuples)
+# 2026-10-18    Read() uses antFrames.clsAntFrameParser; a message split over
+#               two .read()'s is no longer lost
+# 2026-10-18    StartReceiver(); a thread drains the dongle continuously and
+#               routes the messages to per-channel queues, so that the
+#               application can wake up on a message (WaitForData)
+# 2026-10-18    Write(pipelined=True) sends all messages, then reads once;
+#               responses are grouped by channel in ChannelResponses
+# 2026-10-18    GetDongle() tries the dongle that worked last time first
+#               (hardwareCache), so other dongles are not reset and probed
+# 2026-10-18    GetDongle() uses usbTopology.find(); the USB-bus is enumerated
+#               once and cached until a device is (dis)connected
 # 2020-11-18    Retry added when intiating USB dongle as suggested by @martin-vi
 # 2020-11-03    If there is no dongle, Write() and Read() become completely
 #               dummy, so that we can run without ANTdongle.
@@ -79,6 +115,7 @@ __version__ = "2020-11-18"
 # 2019-12-30    strings[] replaced by messages[]
 #---------------------------------------------------------------------------
 import binascii
+import collections
 import glob
 import os
 import platform
@@ -86,6 +123,7 @@ import re
 if platform.system() == 'False':
     import serial                   # pylint: disable=import-error
 import struct
+import threading
 import usb.core
 import time
 
@@ -94,6 +132,10 @@ import logfile
 import structConstants      as sc
 
 import FortiusAntCommand    as cmd
+import antFrames
+import antPages
+import hardwareCache
+import usbTopology
 
 #---------------------------------------------------------------------------
 # Our own choice what channels are used
@@ -120,6 +162,19 @@ channel_VTX_s       = channel_VTX # slave=Cycle Training Program
 channel_VHU_s       = 5           # ANT+ Channel for Tacx i-Vortex Headunit
                                   # slave=Cycle Training Program
 
+#---------------------------------------------------------------------------
+# Channel periods, in 1/32768 seconds, as defined by the ANT+ profiles
+# The master sends a message every channel period; the data of the message
+# is refreshed by FortiusAntBody at the same rate.
+#---------------------------------------------------------------------------
+ChannelPeriod_FE    = 8192        # 4 Hz
+ChannelPeriod_HRM   = 8070        # 4,06 Hz
+ChannelPeriod_PWR   = 8182        # 4,0059 Hz
+ChannelPeriod_SCS   = 8086        # 4,05 Hz
+
+def ChannelPeriodSeconds(ChannelPeriod):
+    return ChannelPeriod / 32768
+
 #---------------------------------------------------------------------------
 # i-Vortex Headunit modes
 #---------------------------------------------------------------------------
@@ -195,10 +250,18 @@ msgID_RequestMessage                    = 0x4d
 msgID_ChannelID                         = 0x51          # Set, but also receive master channel - but how/when?
 msgID_ChannelTransmitPower              = 0x60
 
+msgID_LibConfig                         = 0x6e
 msgID_StartUp                           = 0x6f
 
 msgID_BurstData                         = 0x50
 
+DataMessageIDs          = (msgID_BroadcastData, msgID_AcknowledgedData, msgID_BurstData)
+DataPayloadLength       = 9             # channel + 8 bytes data
+
+LibConfig_ChannelID     = 0x80          # Extended data: device of the message
+LibConfig_RSSI          = 0x40          #                signal strength
+LibConfig_RxTimestamp   = 0x20          #                time of reception
+
 # profile.xlsx: antplus_device_type
 DeviceTypeID_antfs                      =  1
 DeviceTypeID_bike_power                 = 11
@@ -247,6 +310,12 @@ TransmitPower_0dBm      = 0x03          # 9.4.3     Output Power Level Settings
 RfFrequency_2457Mhz     =   57          # 9.5.2.6   Channel RF Frequency
 RfFrequency_2466Mhz     =   66          # used for Tacx i-Vortex only
 RfFrequency_2478Mhz     = 0x4e          # used for Tacx i-Vortex Headunit
+
+#---------------------------------------------------------------------------
+# The dongles in use, so that a clsAntDonglePool does not get the same dongle
+# twice: {hardwareCache.DeviceKey: clsAntDongle}
+#---------------------------------------------------------------------------
+Claimed                 = {}
 #---------------------------------------------------------------------------
 # c l s A n t D o n g l e
 #---------------------------------------------------------------------------
@@ -263,7 +332,12 @@ class clsAntDongle():
     DeviceID            = None
     Message             = ''
     Cycplus             = False
+    ExtendedMessages    = False          # Extended data enabled, see Calibrate()
     DongleReconnected   = True
+    ChannelResponses    = {}             # Responses of last pipelined Write()
+    SetupBatch          = None           # Collected by BeginChannelSetup()
+    Reconnecting        = False          # No nested reconnect when reading
+    Receiver            = None           # The receiver thread, if started
     
     #-----------------------------------------------------------------------
     # _ _ i n i t _ _
@@ -272,6 +346,19 @@ class clsAntDongle():
     #-----------------------------------------------------------------------
     def __init__(self, DeviceID = None):
         self.DeviceID = DeviceID
+        self.WriteStats = {False: [0, 0], True: [0, 0]}  # pipelined: [count, seconds]
+        self.Queues     = {}                    # Receiver: {channel: deque}
+        self.Received   = threading.Condition() # Receiver: notified on data
+        self.Sequence   = 0                     # Receiver: order of arrival
+        self.ReceiverStats = [0, 0]             # Receiver: [messages, overflows]
+        self.SetupStats = [0, 0, 0]             # ChannelSetup: [calls, messages, seconds]
+        self.ChannelState  = {}                 # Replayed on reconnect: {channel: messages}
+                                                #   channel None = dongle (network keys)
+        self.PairedDevices = {}                 # {channel: msg51 with the paired device}
+        self.ReconnectStats= [0, 0, 0]          # [reconnects, restored, seconds]
+        self.Traffic    = [0, 0]                # [messages sent, received]
+        self.StartTime  = time.monotonic()
+        self.Parser     = antFrames.clsAntFrameParser()
         self.OK       = True                    # Otherwise we're disabled!!
         self.OK       = self.__GetDongle()
 
@@ -288,15 +375,25 @@ class clsAntDongle():
     # returns   True/False
     #-----------------------------------------------------------------------
     def __GetDongle(self):
+        self.Parser.Reset()                     # Data of previous dongle
         self.Message            = ''
         self.Cycplus            = False
         self.DongleReconnected  = False
+        for Key in [k for k, d in Claimed.items() if d is self]:
+            del Claimed[Key]                    # Released, may be another now
+        usbTopology.Invalidate()                # Dongle may be re-plugged
 
         if self.DeviceID == None:
             dongles = { (4104, "Suunto"), (4105, "Garmin"), (4100, "Older") }
         else:
             dongles = { (self.DeviceID, "(provided)")                       }
 
+        #-------------------------------------------------------------------
+        # The dongle that was used last time is tried first
+        #-------------------------------------------------------------------
+        Last    = hardwareCache.Get('Dongle', 'Last') or {}
+        dongles = sorted(dongles, key=lambda d: d[0] != Last.get('idProduct'))
+
         #-------------------------------------------------------------------
         # https://github.com/pyusb/pyusb/blob/master/docs/tutorial.rst
         #-------------------------------------------------------------------
@@ -315,7 +412,9 @@ class clsAntDongle():
                 # Note: filter on idVendor=0x0fcf is removed
                 #-----------------------------------------------------------
                 self.Message = "No (free) ANT-dongle found"
-                devAntDongles = usb.core.find(find_all=True, idProduct=ant_pid)
+                devAntDongles = usbTopology.find(find_all=True, idProduct=ant_pid)
+                devAntDongles = sorted(devAntDongles, key=lambda d: \
+                                hardwareCache.DeviceKey(d) != Last.get('Key'))
             except Exception as e:
                 logfile.Console("GetDongle - Exception: %s" % e)
                 if "AttributeError" in str(e):
@@ -329,6 +428,8 @@ class clsAntDongle():
                 # Try all dongles of this type (as returned by usb.core.find)
                 #-----------------------------------------------------------
                 for self.devAntDongle in devAntDongles:
+                    if hardwareCache.DeviceKey(self.devAntDongle) in Claimed:
+                        continue                # In use by another clsAntDongle
                     if debug.on(debug.Function):
                         s = "GetDongle - Try dongle: manufacturer=%7s, product=%15s, vendor=%6s, product=%6s(%s)" %\
                             (self.devAntDongle.manufacturer, self.devAntDongle.product, \
@@ -366,11 +467,17 @@ class clsAntDongle():
                                                                 # done here to have explicit error-handling.
                             if debug.on(debug.Function): logfile.Write ("GetDongle - Send reset string to dongle")
                             self.devAntDongle.write(0x01, reset_string)
-                            time.sleep(0.500)                           # after reset, 500ms before next action
-
 
+                            #---------------------------------------------------
+                            # After reset, 500ms before next action; or until
+                            # the dongle tells it's started
+                            #---------------------------------------------------
                             if debug.on(debug.Function): logfile.Write ("GetDongle - Read answer")
-                            reply = self.Read(False)
+                            reply   = []
+                            Timeout = time.monotonic() + 0.500
+                            while time.monotonic() < Timeout and \
+                                  msgID_StartUp not in [d[2] for d in reply]:
+                                reply.extend(self.__ReadAvailable())
 
 
                             if debug.on(debug.Function): logfile.Write ("GetDongle - Check for an ANT+ reply")
@@ -383,6 +490,11 @@ class clsAntDongle():
                                     self.Message = self.Message.replace('\0','')          # .manufacturer is NULL-terminated
                                     if 'CYCPLUS' in self.Message:
                                         self.Cycplus = True
+                                    Key = hardwareCache.DeviceKey(self.devAntDongle)
+                                    hardwareCache.Put('Dongle', 'Last', \
+                                        {'Key'      : Key,
+                                         'idProduct': ant_pid})
+                                    if Key: Claimed[Key] = self
 
                             #---------------------------------------------------
                             # If found, then done - else retry to reset
@@ -397,6 +509,7 @@ class clsAntDongle():
                     except Exception as e:
                         logfile.Console("GetDongle - Exception: %s" % e)
                         self.Message = "GetDongle: " + str(e)
+                        usbTopology.Invalidate()            # Device may be gone
 
                     #-------------------------------------------------------
                     # If found, don't try the next ANT-dongle of this type
@@ -423,15 +536,23 @@ class clsAntDongle():
     #
     #           receive     after sending the data, receive all responses
     #           drop        the caller does not process the returned data
+    #           pipelined   False: after each message, the responses are read
+    #                              until timeout (20ms per message!)
+    #                       True:  all messages are sent, then the responses
+    #                              are read in one pass (one timeout)
     #
     # function  write all strings to antDongle
     #           read responses from antDongle
     #
+    # output    ChannelResponses    pipelined: {channel: [responses]} for the
+    #                               channels messages were sent to
+    #
     # returns   rtn         the string-array as received from antDongle
     #-----------------------------------------------------------------------
-    def Write(self, messages, receive=True, drop=True):
+    def Write(self, messages, receive=True, drop=True, pipelined=False):
         rtn = []
         if self.OK:                      # If no dongle ==> no action at all
+            StartTime = time.monotonic()
             for message in messages:
                 #-----------------------------------------------------------
                 # Logging
@@ -450,14 +571,64 @@ class clsAntDongle():
                                                             # returns:
                 except Exception as e:
                     logfile.Console("AntDongle.Write exception (message lost): " + str(e))
+                else:
+                    self.Traffic[0] += 1
 
                 #-----------------------------------------------------------
                 # Read all responses
                 #-----------------------------------------------------------
-                if receive:
+                if receive and not pipelined:
                     data = self.Read(drop)
                     for d in data: rtn.append(d)
 
+            #---------------------------------------------------------------
+            # Pipelined: read all responses and match them to the channels
+            #---------------------------------------------------------------
+            if receive and pipelined:
+                rtn = self.Read(drop)
+                self.ChannelResponses = {}
+                for message in messages:
+                    self.ChannelResponses[DecomposeMessage(message)[6]] = []
+                for d in rtn:
+                    Channel = DecomposeMessage(d)[6]
+                    if Channel in self.ChannelResponses:
+                        self.ChannelResponses[Channel].append(d)
+                if debug.on(debug.Data1):
+                    logfile.Write ("AntDongle.Write() pipelined, responses per channel: %s" % \
+                        ', '.join(['%s=%s' % (c, len(r)) for c, r in self.ChannelResponses.items()]))
+
+            self.WriteStats[pipelined][0] += 1
+            self.WriteStats[pipelined][1] += time.monotonic() - StartTime
+
+        return rtn
+
+    #---------------------------------------------------------------------------
+    # S t a t i s t i c s
+    #---------------------------------------------------------------------------
+    # returns   Average time of Write() calls, sequential and pipelined
+    #---------------------------------------------------------------------------
+    def Statistics(self):
+        rtn = "ANT Write():"
+        for pipelined in (False, True):
+            Count, Seconds = self.WriteStats[pipelined]
+            rtn += " %s %s calls, avg %4.1fms;" % \
+                    ('pipelined' if pipelined else 'sequential', Count, \
+                     Seconds * 1000 / Count if Count else 0)
+        if self.SetupStats[0]:
+            rtn += " channel setup %s calls, %s messages, avg %4.1fms;" % \
+                    (self.SetupStats[0], self.SetupStats[1], \
+                     self.SetupStats[2] * 1000 / self.SetupStats[0])
+        if self.ReconnectStats[0]:
+            rtn += " %s reconnects, %s channels restored, avg gap %4.0fms;" % \
+                    (self.ReconnectStats[0], self.ReconnectStats[1], \
+                     self.ReconnectStats[2] * 1000 / self.ReconnectStats[0])
+        if self.ReceiverStats[0]:
+            rtn += " receiver %s messages, %s lost (queue full);" % tuple(self.ReceiverStats)
+        Elapsed = max(time.monotonic() - self.StartTime, 1)
+        rtn += " traffic %s sent (%4.1f/s), %s received (%4.1f/s);" % \
+                (self.Traffic[0], self.Traffic[0] / Elapsed, \
+                 self.Traffic[1], self.Traffic[1] / Elapsed)
+        rtn += " " + self.Parser.Statistics()
         return rtn
 
     #---------------------------------------------------------------------------
@@ -517,22 +688,109 @@ class clsAntDongle():
         #
         # When an AntDongle is unplugged and put back in again, the reading from
         # the dongle continues. BUT: the channel definition is lost.
-        # So we have to signal to the calling application to repair!
-        #
-        # Still, this recovery is not useless. The dongle is connected again.
-        # the caller must redo the channels.
+        # The recorded channels are restored; only if that fails, we have to
+        # signal to the calling application to repair!
         # ----------------------------------------------------------------------
-        while failed:
-            logfile.Console('ANT Dongle not available; try to reconnect after 1 second')
-            time.sleep(1)
-            if self.__GetDongle():
-                failed = False       # Exception resolved
-                self.DongleReconnected = True
-                logfile.Console('ANT Dongle reconnected, application restarts')
+        if failed and not self.Reconnecting:
+            self.__Reconnect()
 
         return trv
 
-    def Read(self, drop):
+    #---------------------------------------------------------------------------
+    # R e c o n n e c t
+    #---------------------------------------------------------------------------
+    # function  Get the dongle again and restore the channels
+    #
+    #           The retry-delay doubles from ReconnectDelay to ReconnectMaxDelay;
+    #           when the USB-bus changes (the dongle is plugged in again) it's
+    #           retried immediately.
+    #
+    #           After reconnect, ChannelState is replayed, without reset and
+    #           calibration; a paired slave channel is set to the paired device.
+    #           If that fails, DongleReconnected is raised and the application
+    #           restarts as before.
+    #
+    # returns   none
+    #---------------------------------------------------------------------------
+    ReconnectDelay      = 0.05                  # seconds
+    ReconnectMaxDelay   = 2
+
+    def __Reconnect(self):
+        logfile.Console('ANT Dongle not available; try to reconnect')
+        StartTime         = time.monotonic()
+        Delay             = self.ReconnectDelay
+        self.Reconnecting = True
+        try:
+            while True:
+                usbTopology.Invalidate()                # Dongle reconnected elsewhere
+                if self.__GetDongle():
+                    break
+                #---------------------------------------------------------------
+                # Wait for the next attempt, or a change on the USB-bus
+                #---------------------------------------------------------------
+                Signature = usbTopology.BusSignature()
+                Timeout   = time.monotonic() + Delay
+                while time.monotonic() < Timeout:
+                    time.sleep(min(0.05, Delay))
+                    if Signature != None and Signature != usbTopology.BusSignature():
+                        break
+                Delay = min(Delay * 2, self.ReconnectMaxDelay)
+
+            #-------------------------------------------------------------------
+            # Restore the channels
+            #-------------------------------------------------------------------
+            restored = self.__Restore()
+        finally:
+            self.Reconnecting = False
+
+        self.ReconnectStats[0] += 1
+        self.ReconnectStats[2] += time.monotonic() - StartTime
+        if restored:
+            self.ReconnectStats[1] += len(self.ChannelState) - (None in self.ChannelState)
+            logfile.Console('ANT Dongle reconnected, channels restored after %4.0fms' % \
+                            ((time.monotonic() - StartTime) * 1000))
+        else:
+            self.DongleReconnected = True
+            logfile.Console('ANT Dongle reconnected, application restarts')
+
+    #---------------------------------------------------------------------------
+    # R e s t o r e
+    #---------------------------------------------------------------------------
+    # function  Replay the recorded network keys and channels
+    #
+    # returns   True when restored
+    #---------------------------------------------------------------------------
+    def __Restore(self):
+        if not self.ChannelState:
+            return False                                # Nothing to restore
+        batch = []
+        for Channel, messages in self.ChannelState.items():
+            if Channel in self.PairedDevices:
+                messages = [self.PairedDevices[Channel] if m[2] == msgID_ChannelID \
+                            else m for m in messages]
+            if Channel != None:
+                batch.append(messages)
+        if debug.on(debug.Function):
+            logfile.Write ("AntDongle.Restore() channels %s, paired %s" % \
+                           (list(self.ChannelState), list(self.PairedDevices)))
+        #-----------------------------------------------------------------------
+        # Network keys first, then all channels in one batch
+        #-----------------------------------------------------------------------
+        rtn = True
+        if None in self.ChannelState:
+            rtn = self.__ChannelSetup([self.ChannelState[None]])
+        if rtn and batch:
+            rtn = self.__ChannelSetup(batch)
+        return rtn
+
+    def Read(self, drop, wait=True, Timeout=0.25):
+        #-------------------------------------------------------------------
+        # The receiver thread reads the dongle, take what it has received
+        # (the receiver itself reads directly, e.g. when reconnecting)
+        #-------------------------------------------------------------------
+        if self.Receiver and threading.current_thread() is not self.Receiver:
+            return self.__ReadQueues(None, wait, Timeout)
+
         #-------------------------------------------------------------------
         # Read from antDongle untill no more data (timeout), or error
         # Usually, dongle gives one buffer at the time, starting with 0xa4
@@ -540,70 +798,326 @@ class clsAntDongle():
         #
         # https://www.thisisant.com/forum/view/viewthread/812
         #-------------------------------------------------------------------
-        data = []
+        data     = []
+        Deadline = time.monotonic() + Timeout
         while self.OK:                   # If no dongle ==> no action at all
             trv = self.__ReadAndRetry()
             if len(trv) == 0:
                 break
-            # --------------------------------------------------------------------------
-            # Handle content returned by .read()
-            # --------------------------------------------------------------------------
-            if debug.on(debug.Data1): logfile.Write('devAntDongle.read(0x81,1000,20) returns %s ' \
-                                                    % logfile.HexSpaceL(trv))
-
-            if len(trv) > 900: logfile.Console("Dongle.Read() too much data from .read()" )
-            start  = 0
-            while start < len(trv):
-                error = False
-                #-------------------------------------------------------
-                # Each message starts with a4; skip characters if not
-                #-------------------------------------------------------
-                skip = start
-                while skip < len(trv) and trv[skip] != 0xa4:
-                    skip += 1
-                if skip != start:
-                    logfile.Console("Dongle.Read: %s characters skipped " % (skip - start))
-                    start = skip
-                #-------------------------------------------------------
-                # Second character in the buffer (element in trv) is length of
-                # the info; add four for synch, len, id and checksum
-                #-------------------------------------------------------
-                if start + 1 < len(trv):
-                    length = trv[start+1] + 4
-                    if start + length <= len(trv):
-                        #-------------------------------------------------------
-                        # Check length and checksum
-                        # Append to return array when correct
-                        #-------------------------------------------------------
-                        d = bytes(trv[start : start+length])
-                        checksum = d[-1:]
-                        expected = CalcChecksum(d)
-
-                        if expected != checksum:
-                            error = "error: checksum incorrect"
-                            logfile.Console("%s checksum=%s expected=%s data=%s" % \
-                                ( error, logfile.HexSpace(checksum), logfile.HexSpace(expected), logfile.HexSpace(d) ) )
-                        else:
-                            data.append(d)                         # add data to array
-                            if drop == True:
-                                DongleDebugMessage ("Dongle    drop   :", d)
-                            else:
-                                DongleDebugMessage ("Dongle    receive:", d)
-                    else:
-                        error = "error: message exceeds buffer length"
-                        break
-                else:
-                    break
-                if error:
-                    logfile.Console("Dongle.Read: %s" % (error))
-                #-------------------------------------------------------
-                # Next buffer in trv
-                #-------------------------------------------------------
-                start += length
+            if time.monotonic() > Deadline:
+                data.extend(self.__Parse(trv, drop))
+                break
+            data.extend(self.__Parse(trv, drop))
         if self.OK and debug.on(debug.Function):
             logfile.Write ("AntDongle.Read() returns: " + logfile.HexSpaceL(data))
         return data
 
+    #---------------------------------------------------------------------------
+    # P a r s e
+    #---------------------------------------------------------------------------
+    # input     trv            the buffer returned by .read()
+    #           drop           see Read()
+    #
+    # function  split the buffer in messages and verify the checksums
+    #           an incomplete message is completed on the next call
+    #
+    # returns   array of data-buffers
+    #---------------------------------------------------------------------------
+    def __Parse(self, trv, drop):
+        if debug.on(debug.Data1): logfile.Write('devAntDongle.read(0x81,1000,20) returns %s ' \
+                                                % logfile.HexSpaceL(trv))
+
+        if len(trv) > 900: logfile.Console("Dongle.Read() too much data from .read()" )
+
+        data = [bytes(frame) for frame in self.Parser.Parse(trv)]
+        self.Traffic[1] += len(data)
+        for d in data:
+            #---------------------------------------------------------------
+            # Remember the device a slave channel is paired with
+            #---------------------------------------------------------------
+            if d[2] == msgID_ChannelID and d[1] == 5 and d[3] in self.ChannelState:
+                Channel, DeviceNumber, DeviceTypeID, TransmissionType = unmsg51_ChannelID(d[3:8])
+                if DeviceNumber:
+                    self.PairedDevices[Channel] = msg51_ChannelID(Channel, \
+                                        DeviceNumber, DeviceTypeID, TransmissionType)
+            #---------------------------------------------------------------
+            # or the device of an extended message on a slave channel
+            #---------------------------------------------------------------
+            elif d[1] > DataPayloadLength and d[3] in self.ChannelState and \
+                 d[3] not in self.PairedDevices and \
+                 not self.ChannelState[d[3]][0][4] & ChannelType_BidirectionalTransmit:
+                ExtendedData = unmsgExtendedData(d)
+                if ExtendedData and ExtendedData.DeviceNumber:
+                    self.PairedDevices[d[3]] = msg51_ChannelID(d[3], ExtendedData.DeviceNumber, \
+                                        ExtendedData.DeviceTypeID, ExtendedData.TransmissionType)
+            if drop == True:
+                DongleDebugMessage ("Dongle    drop   :", d)
+            else:
+                DongleDebugMessage ("Dongle    receive:", d)
+        return data
+
+    #---------------------------------------------------------------------------
+    # S t a r t R e c e i v e r ,   S t o p R e c e i v e r
+    #---------------------------------------------------------------------------
+    # input     Channels       the channels that get their own queue
+    #
+    # function  Without receiver, the dongle is only read after a Write() or
+    #           an explicit Read(); a command from the CTP waits in the dongle
+    #           until the application does so (up to 250ms).
+    #
+    #           The receiver thread reads the dongle continuously and routes
+    #           each message to the queue of its channel; messages of other
+    #           channels (or without channel) go to the general queue (None).
+    #           Each queue is a ring buffer; when full, the oldest message
+    #           is lost.
+    #
+    #           Read()          returns the messages of all queues
+    #                           (in order of arrival), as before
+    #           ReadChannel()   returns the messages of one channel
+    #           WaitForData()   waits until a message arrives
+    #---------------------------------------------------------------------------
+    QueueSize = 64
+
+    def StartReceiver(self, Channels):
+        if self.OK and not self.Receiver:
+            if debug.on(debug.Function):
+                logfile.Write ("AntDongle.StartReceiver(%s)" % Channels)
+            with self.Received:
+                self.Queues = {}
+                for Channel in list(Channels) + [None]:
+                    self.Queues[Channel] = collections.deque(maxlen=self.QueueSize)
+            self.ReceiverActive = True
+            self.Receiver = threading.Thread(target=self.__Receive, \
+                                             name='AntReceiver', daemon=True)
+            self.Receiver.start()
+
+    def StopReceiver(self):
+        if self.Receiver:
+            if debug.on(debug.Function): logfile.Write ("AntDongle.StopReceiver()")
+            self.ReceiverActive = False
+            self.Receiver.join(1)
+            self.Receiver = None
+
+    def __Receive(self):
+        while self.ReceiverActive and self.OK:
+            trv = self.__ReadAndRetry()
+            if len(trv) == 0:
+                continue
+            data = self.__Parse(trv, False)
+            with self.Received:
+                for d in data:
+                    Channel = DecomposeMessage(d)[6]
+                    q = self.Queues.get(Channel, self.Queues[None])
+                    if len(q) == q.maxlen:
+                        self.ReceiverStats[1] += 1
+                    self.Sequence += 1
+                    q.append((self.Sequence, d))
+                    self.ReceiverStats[0] += 1
+                self.Received.notify_all()
+
+    #---------------------------------------------------------------------------
+    # R e a d C h a n n e l
+    #---------------------------------------------------------------------------
+    # input     Channel        as specified on StartReceiver()
+    #
+    # function  take the received messages for one channel
+    #
+    # returns   array of data-buffers
+    #---------------------------------------------------------------------------
+    def ReadChannel(self, Channel):
+        return self.__ReadQueues([Channel], False)
+
+    def __ReadQueues(self, Channels, wait, Timeout=0.25):
+        with self.Received:
+            #---------------------------------------------------------------
+            # As Read() without receiver: wait until the dongle is quiet
+            # for 20ms, so that all responses to a Write() are returned;
+            # but not longer than Timeout, traffic may be continuous
+            #---------------------------------------------------------------
+            if wait:
+                Deadline = time.monotonic() + Timeout
+                while True:
+                    Remaining = Deadline - time.monotonic()
+                    if Remaining <= 0 or not self.Received.wait(min(0.02, Remaining)):
+                        break
+            #---------------------------------------------------------------
+            # Take the messages from the queues, in order of arrival
+            #---------------------------------------------------------------
+            data = []
+            for Channel, q in self.Queues.items():
+                if Channels == None or Channel in Channels:
+                    data.extend(q)
+                    q.clear()
+        data = [d for _, d in sorted(data, key=lambda x: x[0])]
+        if data and debug.on(debug.Function):
+            logfile.Write ("AntDongle.Read() returns: " + logfile.HexSpaceL(data))
+        return data
+
+    #---------------------------------------------------------------------------
+    # W a i t F o r D a t a
+    #---------------------------------------------------------------------------
+    # input     Timeout        seconds
+    #           Channels       the channels to wait for, None = all
+    #           MessageIDs     the message id's to wait for, None = all
+    #                          e.g. msgID_AcknowledgedData to wait for a
+    #                          command, not for the event of a broadcast
+    #
+    # function  wait until a message is received (receiver only)
+    #
+    # returns   True if a message is available, False if timed out
+    #---------------------------------------------------------------------------
+    def WaitForData(self, Timeout, Channels=None, MessageIDs=None):
+        if not self.Receiver:
+            time.sleep(max(0, Timeout))
+            return False
+
+        with self.Received:
+            return self.Received.wait_for(lambda: self.Available(Channels, MessageIDs), \
+                                          max(0, Timeout))
+
+    #---------------------------------------------------------------------------
+    # A v a i l a b l e
+    #---------------------------------------------------------------------------
+    # input     Channels, MessageIDs    see WaitForData()
+    #
+    # function  check the queues; to be called with Received acquired
+    #
+    # returns   True if a message is available
+    #---------------------------------------------------------------------------
+    def Available(self, Channels=None, MessageIDs=None):
+        for Channel, q in self.Queues.items():
+            if Channels == None or Channel in Channels:
+                for _, d in q:
+                    if MessageIDs == None or d[2] in MessageIDs:
+                        return True
+        return False
+
+    #---------------------------------------------------------------------------
+    # C h a n n e l S e t u p
+    #---------------------------------------------------------------------------
+    # input     messages       the configuration messages of one channel (or
+    #                          of the dongle, see Calibrate)
+    #
+    # function  Without BeginChannelSetup(), the messages are sent right away.
+    #           Between BeginChannelSetup() and EndChannelSetup(), the
+    #           *_ChannelConfig() messages are collected and sent together.
+    #
+    #           The n-th message of all channels is sent in one step, so that
+    #           the order within a channel is kept. After each step the
+    #           responses are read until all are received, no read-timeout
+    #           per message:
+    #           - a ChannelResponse (0x40) for (channel, initiating message id)
+    #             with response code 0 (RESPONSE_NO_ERROR); any other code is
+    #             an error and the setup is stopped right away
+    #           - for a RequestMessage (0x4d), the requested message
+    #           Channel events (initiating message id 0x01) and other messages
+    #           are dropped, as before.
+    #           A missing response is reported, but is not an error.
+    #
+    # returns   True if no error response is received
+    #---------------------------------------------------------------------------
+    SetupTimeout = 0.25                         # seconds per step
+
+    def BeginChannelSetup(self):
+        self.SetupBatch = []
+
+    def EndChannelSetup(self):
+        batch           = self.SetupBatch
+        self.SetupBatch = None
+        return self.__ChannelSetup(batch)
+
+    def ChannelSetup(self, messages):
+        #-----------------------------------------------------------------------
+        # Record for Restore(); a channel by its AssignChannel message, the
+        # messages of the dongle itself (Calibrate) as channel None
+        #-----------------------------------------------------------------------
+        if messages[0][2] == msgID_AssignChannel:
+            Channel = messages[0][3]
+            self.PairedDevices.pop(Channel, None)
+        else:
+            Channel = None
+        self.ChannelState[Channel] = messages
+
+        if self.SetupBatch != None:
+            self.SetupBatch.append(messages)
+            return True
+        else:
+            return self.__ChannelSetup([messages])
+
+    def __ChannelSetup(self, batch):
+        if not self.OK or not batch: return self.OK
+        StartTime = time.monotonic()
+        rtn       = True
+        Steps     = max([len(messages) for messages in batch])
+        for step in range(0, Steps):
+            #-------------------------------------------------------------------
+            # Send the n-th message of each channel and what is expected back
+            #-------------------------------------------------------------------
+            messages = [m[step] for m in batch if step < len(m)]
+            pending  = set()
+            for message in messages:
+                id, Channel = message[2], message[3]
+                if id == msgID_RequestMessage:
+                    if message[4] == msgID_ChannelID:
+                        pending.add((Channel, msgID_ChannelID))
+                    else:
+                        pending.add((None, message[4]))     # No channel in reply
+                else:
+                    pending.add((Channel, id))
+            self.Write(messages, False)
+
+            #-------------------------------------------------------------------
+            # Read until all responses are received, stop on error
+            #-------------------------------------------------------------------
+            Timeout = time.monotonic() + self.SetupTimeout
+            while pending and rtn and time.monotonic() < Timeout \
+                          and not self.DongleReconnected:
+                for d in self.__ReadAvailable():
+                    id, Channel = d[2], (d[3] if d[1] else None)
+                    if id == msgID_ChannelResponse:
+                        Channel, id, ResponseCode = unmsg64_ChannelResponse(d[3:6])
+                        if id == msgID_RF_EVENT:
+                            continue                        # Event, not a response
+                        if (Channel, id) in pending and ResponseCode:
+                            logfile.Console("ANT channel setup: channel %s message %s failed; response code %s" \
+                                            % (Channel, hex(id), ResponseCode))
+                            rtn = False
+                    if   (Channel, id) in pending: pending.remove((Channel, id))
+                    elif (None,    id) in pending: pending.remove((None,    id))
+
+            if not rtn or self.DongleReconnected:
+                rtn = False
+                break
+            if pending:
+                logfile.Console("ANT channel setup: no response for %s" % \
+                    ', '.join(['channel %s message %s' % (c, hex(i)) for c, i in sorted(pending, key=str)]))
+
+        self.SetupStats[0] += 1
+        self.SetupStats[1] += sum([len(messages) for messages in batch])
+        self.SetupStats[2] += time.monotonic() - StartTime
+        if debug.on(debug.Function):
+            logfile.Write ("AntDongle.ChannelSetup(%s channels) returns %s in %4.0fms" % \
+                           (len(batch), rtn, (time.monotonic() - StartTime) * 1000))
+        return rtn
+
+    #---------------------------------------------------------------------------
+    # R e a d A v a i l a b l e
+    #---------------------------------------------------------------------------
+    # function  read what the dongle has returned, at most one read-timeout
+    #
+    # returns   array of data-buffers
+    #---------------------------------------------------------------------------
+    def __ReadAvailable(self):
+        if self.Receiver and threading.current_thread() is not self.Receiver:
+            data = self.__ReadQueues(None, False)
+            if not data:
+                with self.Received:
+                    self.Received.wait(0.02)
+                data = self.__ReadQueues(None, False)
+            return data
+        trv = self.__ReadAndRetry()
+        return self.__Parse(trv, True) if len(trv) else []
+
     #-----------------------------------------------------------------------
     # Standard dongle commands
     # Observation: all commands have two bytes 00 00 for which purpose is unclear
@@ -625,7 +1139,15 @@ class clsAntDongle():
             msg46_SetNetworkKey         (NetworkNumber = 0x01, NetworkKey=0x00),
                                                                 # network for Tacx i-Vortex
         ]
-        self.Write(messages)
+        #-----------------------------------------------------------------------
+        # Extended messages, last so that a dongle that does not support it
+        # is calibrated all the same; then the ChannelID must be requested
+        #-----------------------------------------------------------------------
+        self.ExtendedMessages = self.ChannelSetup(messages + \
+                            [msg6E_LibConfig(LibConfig_ChannelID | LibConfig_RSSI)])
+        if not self.ExtendedMessages:
+            self.ChannelState[None] = messages          # Not to be restored
+            if self.OK: logfile.Console("ANT dongle does not support extended messages")
 
     def ResetDongle(self):
         if self.Cycplus:
@@ -635,11 +1157,20 @@ class clsAntDongle():
             pass
         else:
             if self.OK and debug.on(debug.Data1): logfile.Write ("ResetDongle()")
+            self.ChannelState  = {}             # All channels are closed
+            self.PairedDevices = {}
             messages=[
                 msg4A_ResetSystem(),
             ]
             self.Write(messages, False)
-        time.sleep(0.500)                           # After Reset, 500ms before next action
+            #---------------------------------------------------------------
+            # After Reset, 500ms before next action; or until the dongle
+            # tells it's started
+            #---------------------------------------------------------------
+            Timeout = time.monotonic() + 0.500
+            while self.OK and time.monotonic() < Timeout:
+                if msgID_StartUp in [d[2] for d in self.__ReadAvailable()]:
+                    break
 
     def SlavePair_ChannelConfig(self, channel_pair, \
                                 DeviceNumber=0, DeviceTypeID=0, TransmissionType=0):
@@ -657,7 +1188,7 @@ class clsAntDongle():
             msg60_ChannelTransmitPower  (channel_pair, TransmitPower_0dBm),
             msg4B_OpenChannel           (channel_pair)
         ]
-        self.Write(messages, True, False)
+        self.ChannelSetup(messages)
 
     def Trainer_ChannelConfig(self):
         if self.OK:
@@ -667,11 +1198,11 @@ class clsAntDongle():
             msg42_AssignChannel         (channel_FE, ChannelType_BidirectionalTransmit, NetworkNumber=0x00),
             msg51_ChannelID             (channel_FE, DeviceNumber_FE, DeviceTypeID_FE, TransmissionType_IC_GDP),
             msg45_ChannelRfFrequency    (channel_FE, RfFrequency_2457Mhz),
-            msg43_ChannelPeriod         (channel_FE, ChannelPeriod=8192),           # 4 Hz
+            msg43_ChannelPeriod         (channel_FE, ChannelPeriod_FE),             # 4 Hz
             msg60_ChannelTransmitPower  (channel_FE, TransmitPower_0dBm),
             msg4B_OpenChannel           (channel_FE)
         ]
-        self.Write(messages)
+        self.ChannelSetup(messages)
 
     def SlaveTrainer_ChannelConfig(self, DeviceNumber):
         if DeviceNumber > 0: s = ", id=%s only" % DeviceNumber
@@ -683,12 +1214,12 @@ class clsAntDongle():
             msg42_AssignChannel         (channel_FE_s, ChannelType_BidirectionalReceive, NetworkNumber=0x00),
             msg51_ChannelID             (channel_FE_s, DeviceNumber, DeviceTypeID_FE, TransmissionType_IC_GDP),
             msg45_ChannelRfFrequency    (channel_FE_s, RfFrequency_2457Mhz),
-            msg43_ChannelPeriod         (channel_FE_s, ChannelPeriod=8192),         # 4 Hz
+            msg43_ChannelPeriod         (channel_FE_s, ChannelPeriod_FE),           # 4 Hz
             msg60_ChannelTransmitPower  (channel_FE_s, TransmitPower_0dBm),
             msg4B_OpenChannel           (channel_FE_s),
             msg4D_RequestMessage        (channel_FE_s, msgID_ChannelID)
         ]
-        self.Write(messages)
+        self.ChannelSetup(messages)
 
     def HRM_ChannelConfig(self):
         if self.OK:
@@ -698,11 +1229,11 @@ class clsAntDongle():
             msg42_AssignChannel         (channel_HRM, ChannelType_BidirectionalTransmit, NetworkNumber=0x00),
             msg51_ChannelID             (channel_HRM, DeviceNumber_HRM, DeviceTypeID_HRM, TransmissionType_IC),
             msg45_ChannelRfFrequency    (channel_HRM, RfFrequency_2457Mhz),
-            msg43_ChannelPeriod         (channel_HRM, ChannelPeriod=8070),          # 4,06 Hz
+            msg43_ChannelPeriod         (channel_HRM, ChannelPeriod_HRM),           # 4,06 Hz
             msg60_ChannelTransmitPower  (channel_HRM, TransmitPower_0dBm),
             msg4B_OpenChannel           (channel_HRM)
         ]
-        self.Write(messages)
+        self.ChannelSetup(messages)
 
     def SlaveHRM_ChannelConfig(self, DeviceNumber):
         if DeviceNumber > 0: s = ", id=%s only" % DeviceNumber
@@ -714,12 +1245,12 @@ class clsAntDongle():
             msg42_AssignChannel         (channel_HRM_s, ChannelType_BidirectionalReceive, NetworkNumber=0x00),
             msg51_ChannelID             (channel_HRM_s, DeviceNumber, DeviceTypeID_HRM, TransmissionType_IC),
             msg45_ChannelRfFrequency    (channel_HRM_s, RfFrequency_2457Mhz),
-            msg43_ChannelPeriod         (channel_HRM_s, ChannelPeriod=8070),        # 4,06 Hz
+            msg43_ChannelPeriod         (channel_HRM_s, ChannelPeriod_HRM),         # 4,06 Hz
             msg60_ChannelTransmitPower  (channel_HRM_s, TransmitPower_0dBm),
             msg4B_OpenChannel           (channel_HRM_s),
             msg4D_RequestMessage        (channel_HRM_s, msgID_ChannelID)
         ]
-        self.Write(messages)
+        self.ChannelSetup(messages)
 
     def PWR_ChannelConfig(self, DeviceNumber):
         if self.OK:
@@ -729,11 +1260,11 @@ class clsAntDongle():
             msg42_AssignChannel         (channel_PWR, ChannelType_BidirectionalTransmit, NetworkNumber=0x00),
             msg51_ChannelID             (channel_PWR, DeviceNumber_PWR, DeviceTypeID_PWR, TransmissionType_IC),
             msg45_ChannelRfFrequency    (channel_PWR, RfFrequency_2457Mhz),
-            msg43_ChannelPeriod         (channel_PWR, ChannelPeriod=8182),          # 4,0059 Hz
+            msg43_ChannelPeriod         (channel_PWR, ChannelPeriod_PWR),           # 4,0059 Hz
             msg60_ChannelTransmitPower  (channel_PWR, TransmitPower_0dBm),
             msg4B_OpenChannel           (channel_PWR),
         ]
-        self.Write(messages)
+        self.ChannelSetup(messages)
 
     def SCS_ChannelConfig(self, DeviceNumber):
         if self.OK:
@@ -743,11 +1274,11 @@ class clsAntDongle():
             msg42_AssignChannel         (channel_SCS, ChannelType_BidirectionalTransmit, NetworkNumber=0x00),
             msg51_ChannelID             (channel_SCS, DeviceNumber_SCS, DeviceTypeID_SCS, TransmissionType_IC),
             msg45_ChannelRfFrequency    (channel_SCS, RfFrequency_2457Mhz),
-            msg43_ChannelPeriod         (channel_SCS, ChannelPeriod=8086),          # 4,05 Hz
+            msg43_ChannelPeriod         (channel_SCS, ChannelPeriod_SCS),           # 4,05 Hz
             msg60_ChannelTransmitPower  (channel_SCS, TransmitPower_0dBm),
             msg4B_OpenChannel           (channel_SCS),
         ]
-        self.Write(messages)
+        self.ChannelSetup(messages)
 
     def SlaveSCS_ChannelConfig(self, DeviceNumber):
         if DeviceNumber > 0: s = ", id=%s only" % DeviceNumber
@@ -759,12 +1290,12 @@ class clsAntDongle():
             msg42_AssignChannel         (channel_SCS_s, ChannelType_BidirectionalReceive, NetworkNumber=0x00),
             msg51_ChannelID             (channel_SCS_s, DeviceNumber, DeviceTypeID_SCS, TransmissionType_IC),
             msg45_ChannelRfFrequency    (channel_SCS_s, RfFrequency_2457Mhz),
-            msg43_ChannelPeriod         (channel_SCS_s, ChannelPeriod=8086),        # 4,05 Hz
+            msg43_ChannelPeriod         (channel_SCS_s, ChannelPeriod_SCS),         # 4,05 Hz
             msg60_ChannelTransmitPower  (channel_SCS_s, TransmitPower_0dBm),
             msg4B_OpenChannel           (channel_SCS_s),
             msg4D_RequestMessage        (channel_SCS_s, msgID_ChannelID)
         ]
-        self.Write(messages)
+        self.ChannelSetup(messages)
 
     def VTX_ChannelConfig(self):                         # Pretend to be a Tacx i-Vortex
         if self.OK:
@@ -779,7 +1310,7 @@ class clsAntDongle():
             msg4B_OpenChannel           (channel_VTX),
             msg4D_RequestMessage        (channel_VTX, msgID_ChannelID)
         ]
-        self.Write(messages)
+        self.ChannelSetup(messages)
 
     def SlaveVTX_ChannelConfig(self, DeviceNumber):     # Listen to a Tacx i-Vortex
         if DeviceNumber > 0: s = ", id=%s only" % DeviceNumber
@@ -796,7 +1327,7 @@ class clsAntDongle():
             msg4B_OpenChannel           (channel_VTX_s),
             msg4D_RequestMessage        (channel_VTX_s, msgID_ChannelID)
         ]
-        self.Write(messages)
+        self.ChannelSetup(messages)
 
     def SlaveVHU_ChannelConfig(self, DeviceNumber):     # Listen to a Tacx i-Vortex Headunit
                                                         # See comment above msgPage000_TacxVortexHU_StayAlive
@@ -815,7 +1346,7 @@ class clsAntDongle():
             msg4B_OpenChannel           (channel_VHU_s),
             msg4D_RequestMessage        (channel_VHU_s, msgID_ChannelID)
         ]
-        self.Write(messages)
+        self.ChannelSetup(messages)
 
     def PowerDisplay_unused(self):
         if self.OK and debug.on(debug.Data1): logfile.Write ("powerdisplay()")
@@ -832,6 +1363,221 @@ class clsAntDongle():
         ]
         self.Write(messages)
 
+#-------------------------------------------------------------------------------
+# c l s A n t D o n g l e P o o l
+#-------------------------------------------------------------------------------
+# function  Multiple dongles used as one clsAntDongle; each channel is placed
+#           on one dongle, so that air time and USB-endpoint are shared by
+#           less channels.
+#
+#           Policy  'masters'   master channels (FE, HRM, PWR, SCS, VTX) on the
+#                               first dongle, slave channels on the others
+#                   'spread'    round robin over all dongles
+#
+#           The channel is placed on AssignChannel, the first message of a
+#           *_ChannelConfig(); all messages for that channel go to its dongle.
+#           Messages for the dongle itself (reset, network key, capabilities)
+#           go to all dongles.
+#           Dongles that are not found are left out; with one dongle found,
+#           the pool behaves as clsAntDongle.
+#
+#           The *_ChannelConfig() functions are inherited, the functions that
+#           access the dongle are implemented here, calling the dongles.
+#---------------------------------------------------------------------------
+class clsAntDonglePool(clsAntDongle):
+    def __init__(self, DeviceIDs, Policy='masters'):
+        self.Policy     = Policy
+        self.Placement  = {}                    # {channel: dongle}
+        self.Dongles    = []
+        for DeviceID in DeviceIDs:
+            Dongle = clsAntDongle(DeviceID)
+            if Dongle.OK:
+                self.Dongles.append(Dongle)
+            else:
+                logfile.Console("AntDonglePool: dongle %s not found; %s" % (DeviceID, Dongle.Message))
+        #-----------------------------------------------------------------------
+        # One condition for all dongles, so that WaitForData() wakes up on data
+        # of each dongle
+        #-----------------------------------------------------------------------
+        self.Received   = threading.Condition()
+        for Dongle in self.Dongles:
+            Dongle.Received = self.Received
+
+        if self.Dongles:
+            self.Message = "Using %s dongle%s: %s" % (len(self.Dongles), \
+                            's' if len(self.Dongles) > 1 else '', \
+                            ', '.join([d.Message.replace('Using ', '').replace(' dongle', '') \
+                                       for d in self.Dongles]))
+        else:
+            self.Message = "No (free) ANT-dongle found"
+
+    #---------------------------------------------------------------------------
+    # The pool is OK when one of the dongles is OK
+    #---------------------------------------------------------------------------
+    @property
+    def OK(self):
+        return any([d.OK for d in self.Dongles])
+
+    @property
+    def Cycplus(self):
+        return any([d.Cycplus for d in self.Dongles])
+
+    @property
+    def ExtendedMessages(self):
+        return all([d.ExtendedMessages for d in self.Dongles])
+
+    @property
+    def DongleReconnected(self):
+        return any([d.DongleReconnected for d in self.Dongles])
+
+    @property
+    def Receiver(self):
+        return any([d.Receiver for d in self.Dongles])
+
+    def ApplicationRestart(self):
+        for Dongle in self.Dongles: Dongle.ApplicationRestart()
+
+    #---------------------------------------------------------------------------
+    # P l a c e
+    #---------------------------------------------------------------------------
+    # input     message         AssignChannel
+    #
+    # function  select the dongle for the channel, according the policy
+    #
+    # returns   dongle
+    #---------------------------------------------------------------------------
+    def __Place(self, message):
+        Channel = message[3]
+        Master  = message[4] & ChannelType_BidirectionalTransmit
+        Dongles = self.Dongles
+        if self.Policy == 'masters' and len(Dongles) > 1:
+            Dongles = Dongles[:1] if Master else Dongles[1:]
+        Placed  = [d for c, d in self.Placement.items() if c != Channel]
+        Dongle  = min(Dongles, key=lambda d: Placed.count(d))   # least channels
+        self.Placement[Channel] = Dongle
+        if debug.on(debug.Function):
+            logfile.Write ("AntDonglePool: channel %s (%s) placed on dongle %s" % \
+                (Channel, 'master' if Master else 'slave', self.Dongles.index(Dongle)))
+        return Dongle
+
+    #---------------------------------------------------------------------------
+    # D o n g l e s F o r
+    #---------------------------------------------------------------------------
+    # input     message
+    #
+    # returns   the dongles the message is sent to
+    #---------------------------------------------------------------------------
+    def __DonglesFor(self, message):
+        id = message[2]
+        if id in (msgID_ResetSystem, msgID_SetNetworkKey) or \
+           (id == msgID_RequestMessage and message[4] != msgID_ChannelID):
+            return self.Dongles
+        if id == msgID_AssignChannel:
+            return [self.__Place(message)]
+        Channel = message[3] if message[1] else None
+        return [self.Placement.get(Channel, self.Dongles[0])]
+
+    #---------------------------------------------------------------------------
+    # W r i t e ,   R e a d
+    #---------------------------------------------------------------------------
+    # function  the messages are sent to their dongles, then read from all
+    #           dongles; see clsAntDongle.Write()
+    #---------------------------------------------------------------------------
+    def Write(self, messages, receive=True, drop=True, pipelined=False):
+        rtn = []
+        if self.OK:
+            Batches = collections.OrderedDict([(d, []) for d in self.Dongles])
+            for message in messages:
+                for Dongle in self.__DonglesFor(message):
+                    Batches[Dongle].append(message)
+            #-------------------------------------------------------------------
+            # Sequential: the dongles are written one after the other
+            # Pipelined:  all dongles are written, then all are read
+            #-------------------------------------------------------------------
+            for Dongle, Batch in Batches.items():
+                if Batch:
+                    rtn.extend(Dongle.Write(Batch, receive and not pipelined, drop, pipelined))
+            if receive and pipelined:
+                rtn = self.Read(drop)
+                self.ChannelResponses = {}
+                for message in messages:
+                    self.ChannelResponses[DecomposeMessage(message)[6]] = []
+                for d in rtn:
+                    Channel = DecomposeMessage(d)[6]
+                    if Channel in self.ChannelResponses:
+                        self.ChannelResponses[Channel].append(d)
+        return rtn
+
+    def Read(self, drop, wait=True, Timeout=0.25):
+        data = []
+        for Dongle in self.Dongles:
+            data.extend(Dongle.Read(drop, wait, Timeout))
+        return data
+
+    #---------------------------------------------------------------------------
+    # S t a t i s t i c s
+    #---------------------------------------------------------------------------
+    # returns   the statistics of each dongle, with the channels placed on it
+    #---------------------------------------------------------------------------
+    def Statistics(self):
+        rtn = "ANT dongle pool (%s):" % self.Policy
+        for i, Dongle in enumerate(self.Dongles):
+            Channels = sorted([c for c, d in self.Placement.items() if d is Dongle])
+            rtn += "\n    dongle %s %s, channels %s; %s" % \
+                    (i, Dongle.Message.replace('Using ', ''), Channels, Dongle.Statistics())
+        return rtn
+
+    #---------------------------------------------------------------------------
+    # S t a r t R e c e i v e r ,   S t o p R e c e i v e r ,   R e a d C h a n n e l ,
+    # W a i t F o r D a t a
+    #---------------------------------------------------------------------------
+    # function  a receiver thread per dongle; the queue of a channel is taken
+    #           from the dongle the channel is placed on
+    #---------------------------------------------------------------------------
+    def StartReceiver(self, Channels):
+        for Dongle in self.Dongles: Dongle.StartReceiver(Channels)
+
+    def StopReceiver(self):
+        for Dongle in self.Dongles: Dongle.StopReceiver()
+
+    def ReadChannel(self, Channel):
+        return self.Placement.get(Channel, self.Dongles[0]).ReadChannel(Channel)
+
+    def WaitForData(self, Timeout, Channels=None, MessageIDs=None):
+        if not self.Receiver:
+            time.sleep(max(0, Timeout))
+            return False
+
+        with self.Received:
+            return self.Received.wait_for(lambda: self.Available(Channels, MessageIDs), \
+                                          max(0, Timeout))
+
+    def Available(self, Channels=None, MessageIDs=None):
+        return any([d.Available(Channels, MessageIDs) for d in self.Dongles])
+
+    #---------------------------------------------------------------------------
+    # C h a n n e l S e t u p
+    #---------------------------------------------------------------------------
+    # function  each dongle sets up its own channels, see clsAntDongle
+    #---------------------------------------------------------------------------
+    def BeginChannelSetup(self):
+        for Dongle in self.Dongles: Dongle.BeginChannelSetup()
+
+    def EndChannelSetup(self):
+        return all([d.EndChannelSetup() for d in self.Dongles])
+
+    def ChannelSetup(self, messages):
+        if not self.Dongles: return False
+        return all([d.ChannelSetup(messages) for d in self.__DonglesFor(messages[0])])
+
+    def Calibrate(self):
+        self.Placement = {}
+        for Dongle in self.Dongles: Dongle.Calibrate()
+
+    def ResetDongle(self):
+        self.Placement = {}
+        for Dongle in self.Dongles: Dongle.ResetDongle()
+
 #-------------------------------------------------------------------------------
 # E n u m e r a t e A l l
 #-------------------------------------------------------------------------------
@@ -887,20 +1633,11 @@ def CalcChecksum (message):
 # C o m p o s e   A N T   M e s s a g e
 #-------------------------------------------------------------------------------
 def ComposeMessage(id, info):
-    fSynch      = sc.unsigned_char
-    fLength     = sc.unsigned_char
-    fId         = sc.unsigned_char
-    fInfo       = str(len(info)) + sc.char_array  # 9 character string
-
-    format  =    sc.no_alignment + fSynch + fLength + fId + fInfo
-    data    = struct.pack (format, 0xa4,    len(info), id,  info)
     #-----------------------------------------------------------------------
-    # Add the checksum
+    # synch, length, id, info and the checksum
     # (antifier added \00\00 after each message for unknown reason)
     #-----------------------------------------------------------------------
-    data += calc_checksum(data)
-
-    return data
+    return antFrames.Compose(id, info)
 
 def DecomposeMessage(d):
     synch       = 0
@@ -932,6 +1669,13 @@ def DecomposeMessage(d):
         _SequenceNumber = (Channel & 0b11100000) >> 5 # Upper 3 bits
         Channel         =  Channel & 0b00011111       # Lower 5 bits
 
+    #---------------------------------------------------------------------------
+    # Extended data is not returned as part of info, so that info is the same
+    # with or without extended messages; see unmsgExtendedData()
+    #---------------------------------------------------------------------------
+    if length > DataPayloadLength and id in DataMessageIDs:
+        info = info[:DataPayloadLength]
+
     return synch, length, id, info, checksum, rest, Channel, DataPageNumber
 
 #-------------------------------------------------------------------------------
@@ -979,6 +1723,7 @@ def DongleDebugMessage(text, d):
         elif id == msgID_RequestMessage         : id_ = 'Request Message'
         elif id == msgID_ChannelID              : id_ = 'Channel ID'
         elif id == msgID_ChannelTransmitPower   : id_ = 'Channel TransmitPower'
+        elif id == msgID_LibConfig              : id_ = 'Lib Config'
         elif id == msgID_StartUp                : id_ = 'Start up'
         elif id == msgID_RF_EVENT               : id_ = 'RF event'  # D00000652..._Rev_5.1.pdf 9.5.6.1 Channel response
         else                                    : id_ = '??'
@@ -1039,6 +1784,9 @@ def DongleDebugMessage(text, d):
 
             if p != None:        p_ = " p=%s(%s)" % (p, p_)     # Page, show number and name
 
+            if length > DataPayloadLength:                      # Extended data
+                                 p_ += ", nr=%s, ID=%s, tt=%s, rssi=%s" % unmsgExtendedData(d)
+
         elif id == msgID_RF_EVENT:
             pass                                                # We could fill info with error code
 
@@ -1168,6 +1916,64 @@ def msg60_ChannelTransmitPower(ChannelNumber, TransmitPower):
     msg     = ComposeMessage (0x60, info)
     return msg
 
+# ------------------------------------------------------------------------------
+# A N T   M e s s a g e   6 E   L i b C o n f i g
+# ------------------------------------------------------------------------------
+# D00000652_ANT_Message_Protocol_and_Usage_Rev_5.1.pdf
+# 7.1.1 Flagged extended data
+# 9.5.2.20 Lib Config (0x6E)
+#
+# Flags             LibConfig_ChannelID, LibConfig_RSSI, LibConfig_RxTimestamp
+#                   0 = extended messages disabled
+# ------------------------------------------------------------------------------
+def msg6E_LibConfig(Flags):
+    format  =    sc.no_alignment + sc.unsigned_char + sc.unsigned_char
+    info    = struct.pack(format,  0,                 Flags)
+    msg     = ComposeMessage (0x6e, info)
+    return msg
+
+# ------------------------------------------------------------------------------
+# U n m s g   E x t e n d e d D a t a
+# ------------------------------------------------------------------------------
+# input     d       a complete data message, as received from dongle
+#
+# function  When extended messages are enabled, a data message is followed by
+#           a flag-byte and the fields indicated by the flags:
+#
+#           0       channel
+#           1...8   data
+#           9       flag-byte
+#           LibConfig_ChannelID     device number (2), device type, transmission type
+#           LibConfig_RSSI          measurement type, RSSI (dBm), threshold
+#           LibConfig_RxTimestamp   rx timestamp (2)
+#
+# returns   ExtendedData(DeviceNumber, DeviceTypeID, TransmissionType, RSSI)
+#           fields not present are None
+#           None if the message has no extended data
+# ------------------------------------------------------------------------------
+ExtendedData = collections.namedtuple('ExtendedData', \
+                        ['DeviceNumber', 'DeviceTypeID', 'TransmissionType', 'RSSI'])
+
+def unmsgExtendedData(d):
+    length = d[1]
+    if length <= DataPayloadLength or d[2] not in DataMessageIDs:
+        return None
+
+    Flags            = d[3 + DataPayloadLength]
+    i                = 4 + DataPayloadLength        # first extended field
+    DeviceNumber     = None
+    DeviceTypeID     = None
+    TransmissionType = None
+    RSSI             = None
+    if Flags & LibConfig_ChannelID and i + 4 <= 3 + length:
+        DeviceNumber, DeviceTypeID, TransmissionType = \
+                struct.unpack_from(sc.little_endian + sc.unsigned_short + \
+                                   sc.unsigned_char + sc.unsigned_char, d, i)
+        i += 4
+    if Flags & LibConfig_RSSI and i + 3 <= 3 + length:
+        RSSI = struct.unpack_from(sc.signed_char, d, i + 1)[0]
+    return ExtendedData(DeviceNumber, DeviceTypeID, TransmissionType, RSSI)
+
 # ------------------------------------------------------------------------------
 # U n m s g 6 4   C h a n n e l R e s p o n s e
 # ------------------------------------------------------------------------------
@@ -1203,19 +2009,10 @@ def msgPage16_PowerOnly (Channel, EventCount, Cadence, AccumulatedPower, Current
     Cadence               = int(min(0xff,   Cadence         ))
     AccumulatedPower      = int(min(0xffff, AccumulatedPower))
     CurrentPower          = int(min(0xffff, CurrentPower    ))
+    PedalPower            = 0xff
 
-    fChannel              = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber       = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fEventCount           = sc.unsigned_char
-    fPedalPower           = sc.unsigned_char
-    fInstantaneousCadence = sc.unsigned_char
-    fAccumulatedPower     = sc.unsigned_short
-    fInstantaneousPower   = sc.unsigned_short
-
-    format = sc.no_alignment +  fChannel + fDataPageNumber + fEventCount + fPedalPower + fInstantaneousCadence + fAccumulatedPower + fInstantaneousPower
-    info   = struct.pack(format, Channel,   DataPageNumber,   EventCount,   0xff,         Cadence,                AccumulatedPower,   CurrentPower)
-
-    return info
+    return antPages.PWR_PowerOnly.pack(Channel, DataPageNumber, EventCount, \
+                        PedalPower, Cadence, AccumulatedPower, CurrentPower)
 
 # ------------------------------------------------------------------------------
 # P a g e 0 0   T a c x V o r t e x D a t a S p e e d
@@ -1241,48 +2038,16 @@ def msgPage16_PowerOnly (Channel, EventCount, Cadence, AccumulatedPower, Current
 def msgPage00_TacxVortexDataSpeed (Channel, Power, Speed, Cadence):
     DataPageNumber      = 0
 
-    fChannel            = sc.unsigned_char  # 0 First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # payload[0]        First byte of the ANT+ datapage
-    fPower              = sc.unsigned_short # payload[1 and 2]  Watts, big-endian
-    fSpeed              = sc.unsigned_short # payload[3 and 4]  cm/s, big-endian
-    fReserved           = sc.pad * 2        # payload[5 and 6]
-    fCadence            = sc.unsigned_char  # payload[7]
-
-    format = sc.big_endian +    fChannel + fDataPageNumber +    fPower +    fSpeed + fReserved + fCadence
-    info   = struct.pack(format, Channel ,  DataPageNumber , int(Power), int(Speed),          int(Cadence))
-
-    # print('msgPage00_TacxVortexDataSpeed', info, Channel, Power, Speed, Cadence)
-
-    return info
+    return antPages.VTX_DataSpeed.pack(Channel, DataPageNumber, int(Power), int(Speed), int(Cadence))
 
 def msgUnpage00_TacxVortexDataSpeed (info):
-    nChannel            = 0
-    fChannel            = sc.unsigned_char  # 0 First byte of the ANT+ message content
-
-    nDataPageNumber     = 1
-    fDataPageNumber     = sc.unsigned_char  # payload[0]        First byte of the ANT+ datapage
-
-    nPower              = 2
-    fPower              = sc.unsigned_short # payload[1 and 2]  Watts, big-endian
-
-    nSpeed              = 3
-    fSpeed              = sc.unsigned_short # payload[3 and 4]  cm/s, big-endian
-
-    fReserved           = sc.pad * 2        # payload[5 and 6]
+    page = antPages.VTX_DataSpeed.unpack(info)
 
-    nCadence            = 4
-    fCadence            = sc.unsigned_char  # payload[7]
-
-    format= sc.big_endian + fChannel + fDataPageNumber + fPower + fSpeed + fReserved + fCadence
-    tuple = struct.unpack (format, info)
-
-    _Channel            =  tuple[nChannel]
-    _DataPageNumber     =  tuple[nDataPageNumber]
-    UsingVirtualSpeed   = (tuple[nPower] & 0x8000) >> 15 # B 1000 0000 0000 0000
-    CalibrationState    = (tuple[nPower] & 0x6000) >> 13 # B 0110 0000 0000 0000
-    Power               =  tuple[nPower] & 0x07ff        # B 0000 0111 1111 1111
-    Speed               =  tuple[nSpeed] & 0x03ff        # B 0000 0011 1111 1111
-    Cadence             =  tuple[nCadence]
+    UsingVirtualSpeed   = (page.Power & 0x8000) >> 15   # B 1000 0000 0000 0000
+    CalibrationState    = (page.Power & 0x6000) >> 13   # B 0110 0000 0000 0000
+    Power               =  page.Power & 0x07ff          # B 0000 0111 1111 1111
+    Speed               =  page.Speed & 0x03ff          # B 0000 0011 1111 1111
+    Cadence             =  page.Cadence
 
     return UsingVirtualSpeed, Power, Speed, CalibrationState, Cadence
 
@@ -1307,38 +2072,11 @@ def msgUnpage00_TacxVortexDataSpeed (info):
 #                                                ch p  s1 s2 serial-- alarm
 # ------------------------------------------------------------------------------
 def msgUnpage01_TacxVortexDataSerial (info):
-    nChannel            = 0
-    fChannel            = sc.unsigned_char  #0 First byte of the ANT+ message content
-
-    nDataPageNumber     = 1
-    fDataPageNumber     = sc.unsigned_char  # payload[0] First byte of the ANT+ datapage
-
-    nS1                 = 2
-    fS1                 = sc.unsigned_char  # payload[1]
+    page = antPages.VTX_DataSerial.unpack(info)
 
-    nS2                 = 3
-    fS2                 = sc.unsigned_char  # payload[2]
+    Serial              =  page.S3 * 256 * 256 + page.Serial
 
-    nS3                 = 4
-    fS3                 = sc.unsigned_char  # payload[3]
-
-    nSerial             = 5
-    fSerial             = sc.unsigned_short # payload[4, 5]
-
-    nAlarm              = 6
-    fAlarm              = sc.unsigned_short # payload[6, 7]
-
-    format= sc.big_endian + fChannel + fDataPageNumber + fS1 + fS2 + fS3 + fSerial + fAlarm
-    tuple = struct.unpack (format, info)
-
-    _Channel            =  tuple[nChannel]
-    _DataPageNumber     =  tuple[nDataPageNumber]
-    S1                  =  tuple[nS1]
-    S2                  =  tuple[nS2]
-    Serial              =  tuple[nS3] * 256 * 256 + tuple[nSerial]
-    Alarm               =  tuple[nAlarm]
-
-    return S1, S2, Serial, Alarm
+    return page.S1, page.S2, Serial, page.Alarm
 
 # ------------------------------------------------------------------------------
 # P a g e 0 2   T a c x V o r t e x D a t a V e r s i o n
@@ -1358,33 +2096,9 @@ def msgUnpage01_TacxVortexDataSerial (info):
 #                                                ch p  rrrrrrrr ma mi build
 # ------------------------------------------------------------------------------
 def msgUnpage02_TacxVortexDataVersion (info):
-    nChannel            = 0
-    fChannel            = sc.unsigned_char  #0 First byte of the ANT+ message content
-
-    nDataPageNumber     = 1
-    fDataPageNumber     = sc.unsigned_char  # payload[0] First byte of the ANT+ datapage
-
-    fReserved           = sc.pad * 3        # payload[1, 2, 3]
-
-    nMajor              = 2
-    fMajor              = sc.unsigned_char  # payload[4]
-
-    nMinor              = 3
-    fMinor              = sc.unsigned_char  # payload[5]
-
-    nBuild              = 4
-    fBuild              = sc.unsigned_short # payload[6, 7]
+    page = antPages.VTX_DataVersion.unpack(info)
 
-    format= sc.big_endian + fChannel + fDataPageNumber + fReserved + fMajor + fMinor + fBuild
-    tuple = struct.unpack (format, info)
-
-    _Channel            =  tuple[nChannel]
-    _DataPageNumber     =  tuple[nDataPageNumber]
-    Major               =  tuple[nMajor]
-    Minor               =  tuple[nMinor]
-    Build               =  tuple[nBuild]
-
-    return Major, Minor, Build
+    return page.Major, page.Minor, page.Build
 
 # ------------------------------------------------------------------------------
 # P a g e 0 3   T a c x V o r t e x D a t a C a l i b r a t i o n
@@ -1408,43 +2122,12 @@ def msgUnpage02_TacxVortexDataVersion (info):
 def msgPage03_TacxVortexDataCalibration (Channel, Calibration, VortexID):
     DataPageNumber      = 3
 
-    fChannel            = sc.unsigned_char  #0 First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # payload[0] First byte of the ANT+ datapage
-    fReserved           = sc.pad * 4        # payload[1, 2, 3, 4]
-    fCalibration        = sc.unsigned_char  # payload[5]
-    fVortexID           = sc.unsigned_short # payload[6, 7]
-
-    format= sc.big_endian +     fChannel + fDataPageNumber + fReserved + fCalibration + fVortexID
-    info   = struct.pack(format, Channel,   DataPageNumber,               Calibration,   VortexID)
-
-    # print('msgPage03_TacxVortexDataCalibration', info, Channel, Calibration, VortexID)
-
-    return info
+    return antPages.VTX_DataCalibration.pack(Channel, DataPageNumber, Calibration, VortexID)
 
 def msgUnpage03_TacxVortexDataCalibration (info):
-    nChannel            = 0
-    fChannel            = sc.unsigned_char  #0 First byte of the ANT+ message content
-
-    nDataPageNumber     = 1
-    fDataPageNumber     = sc.unsigned_char  # payload[0] First byte of the ANT+ datapage
-
-    fReserved           = sc.pad * 4        # payload[1, 2, 3, 4]
-
-    nCalibration        = 2
-    fCalibration        = sc.unsigned_char  # payload[5]
-
-    nVortexID           = 3
-    fVortexID           = sc.unsigned_short # payload[6, 7]
-
-    format= sc.big_endian + fChannel + fDataPageNumber + fReserved + fCalibration + fVortexID
-    tuple = struct.unpack (format, info)
+    page = antPages.VTX_DataCalibration.unpack(info)
 
-    _Channel            =  tuple[nChannel]
-    _DataPageNumber     =  tuple[nDataPageNumber]
-    Calibration         =  tuple[nCalibration]
-    VortexID            =  tuple[nVortexID]
-
-    return Calibration, VortexID
+    return page.Calibration, page.VortexID
 
 # ------------------------------------------------------------------------------
 # P a g e 1 6   T a c x V o r t e x S e t F C S e r i a l
@@ -1459,18 +2142,10 @@ def msgUnpage03_TacxVortexDataCalibration (info):
 # ------------------------------------------------------------------------------
 def msgPage16_TacxVortexSetFCSerial (Channel, VortexID):
     DataPageNumber      = 16
+    Command             = 0x55              # coupling request
+    Subcommand          = 0x7F              # no explanation...
 
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fVortexID           = sc.unsigned_short
-    fCommand            = sc.unsigned_char  # 0x55 = coupling request
-    fSubcommand         = sc.unsigned_char  # no explanation...
-    fReserved           = sc.pad * 3
-
-    format = sc.big_endian +    fChannel + fDataPageNumber + fVortexID + fCommand + fSubcommand + fReserved
-    info   = struct.pack(format, Channel,   DataPageNumber,   VortexID,   0x55,      0x7F)
-
-    return info
+    return antPages.VTX_Command.pack(Channel, DataPageNumber, VortexID, Command, Subcommand, 0, 0)
 
 # ------------------------------------------------------------------------------
 # P a g e 1 6   T a c x V o r t e x S t a r t C a l i b r a t i o n
@@ -1484,18 +2159,10 @@ def msgPage16_TacxVortexSetFCSerial (Channel, VortexID):
 # ------------------------------------------------------------------------------
 def msgPage16_TacxVortexStartCalibration (Channel, VortexID):
     DataPageNumber      = 16
+    Command             = 0x00
+    Subcommand          = 0xFF              # signals calibration start
 
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fVortexID           = sc.unsigned_short
-    fCommand            = sc.unsigned_char  # 0x00
-    fSubcommand         = sc.unsigned_char  # 0xFF signals calibration start
-    fReserved           = sc.pad * 3
-
-    format = sc.big_endian +    fChannel + fDataPageNumber + fVortexID + fCommand + fSubcommand + fReserved
-    info   = struct.pack(format, Channel,   DataPageNumber,   VortexID,   0x00,     0xFF)
-
-    return info
+    return antPages.VTX_Command.pack(Channel, DataPageNumber, VortexID, Command, Subcommand, 0, 0)
 
 # ------------------------------------------------------------------------------
 # P a g e 1 6   T a c x V o r t e x S t o p C a l i b r a t i o n
@@ -1522,19 +2189,11 @@ def msgPage16_tacxVortexStopCalibration (Channel, VortexID):
 # ------------------------------------------------------------------------------
 def msgPage16_TacxVortexSetCalibrationValue (Channel, VortexID, CalibrationValue):
     DataPageNumber      = 16
+    Command             = 0x00
+    Subcommand          = 0x7F              # signals calibration start
 
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fVortexID           = sc.unsigned_short
-    fCommand            = sc.unsigned_char  #
-    fSubcommand         = sc.unsigned_char  # 0x7F signals calibration start
-    fCalibrationValue   = sc.unsigned_char
-    fReserved           = sc.pad * 2
-
-    format = sc.big_endian +    fChannel + fDataPageNumber + fVortexID + fCommand + fSubcommand + fCalibrationValue + fReserved
-    info   = struct.pack(format, Channel,   DataPageNumber,   VortexID,   0,        0x7F,         CalibrationValue  )
-
-    return info
+    return antPages.VTX_Command.pack(Channel, DataPageNumber, VortexID, Command, Subcommand, \
+                                     CalibrationValue, 0)
 
 # ------------------------------------------------------------------------------
 # P a g e 1 6   T a c x V o r t e x S e t P o w e r
@@ -1550,35 +2209,15 @@ def msgPage16_TacxVortexSetCalibrationValue (Channel, VortexID, CalibrationValue
 # ------------------------------------------------------------------------------
 def msgPage16_TacxVortexSetPower (Channel, VortexID, Power):
     DataPageNumber      = 16
-
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fVortexID           = sc.unsigned_short
-    fCommand            = sc.unsigned_char  # 0xAA power request
-    fSubcommand         = sc.unsigned_char
-    fNoCalibrationData  = sc.unsigned_char
-    fPower              = sc.unsigned_short # https://tacx.com/nl/product/i-vortex/
+    Command             = 0xAA              # power request
     Power = max(0, Power)                   # --> No simulation descent ==> power > 0
+                                            # https://tacx.com/nl/product/i-vortex/
 
-    format = sc.big_endian +    fChannel + fDataPageNumber +   fVortexID + fCommand + fSubcommand + fNoCalibrationData + fPower
-    info   = struct.pack(format, Channel,   DataPageNumber, int(VortexID),  0xAA,      0,            0,               int(Power))
-
-    return info
+    return antPages.VTX_Command.pack(Channel, DataPageNumber, int(VortexID), Command, 0, 0, int(Power))
 
 def msgUnpage16_TacxVortexSetPower (info):
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fVortexID           = sc.unsigned_short
-    fCommand            = sc.unsigned_char  # 0xAA power request
-    fSubcommand         = sc.unsigned_char
-    fNoCalibrationData  = sc.unsigned_char
-    fPower              = sc.unsigned_short
-
-    format = sc.big_endian +    fChannel + fDataPageNumber + fVortexID + fCommand + fSubcommand + fNoCalibrationData + fPower
-    tuple = struct.unpack (format, info)
-
           #Channel,  DataPageNumber, VortexID, Command,  Subcommand, NoCalibrationData, Power
-    return tuple[0], tuple[1],       tuple[2], tuple[3], tuple[4],   tuple[5],          tuple[6]
+    return antPages.VTX_Command.unpack(info)
 
 # ------------------------------------------------------------------------------
 #     P a g e 1 7 2   T a c x V o r t e x H U _ C h a n g e H e a d u n i t M o d e
@@ -1614,43 +2253,17 @@ def msgUnpage16_TacxVortexSetPower (info):
 # battery status.
 # ------------------------------------------------------------------------------
 def msgPage000_TacxVortexHU_StayAlive (Channel):        # No Power Off
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fReserved           = sc.pad * 8
-
-    format = sc.big_endian +    fChannel + fReserved
-    info   = struct.pack(format, Channel)
-
-    return info
+    return antPages.VHU_StayAlive.pack(Channel)
 
 def msgPage172_TacxVortexHU_ChangeHeadunitMode (Channel, Mode):
     DataPageNumber      = 172
+    Command             = 0x03              # Change headunit Mode
+                                            # Mode: 0x00=TrainerControl 0x02=SpecialMode 0x04=PCmode
 
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fCommand            = sc.unsigned_char  # 0x03 Change headunit Mode
-    fMode               = sc.unsigned_char  # 0x00=TrainerControl 0x02=SpecialMode 0x04=PCmode
-    fReserved           = sc.pad * 5
-
-    format = sc.big_endian +    fChannel + fDataPageNumber + fCommand + fMode + fReserved
-    info   = struct.pack(format, Channel,   DataPageNumber,   0x03,      Mode)
-
-    return info
+    return antPages.VHU_ChangeHeadunitMode.pack(Channel, DataPageNumber, Command, Mode)
 
 def msgUnpage221_TacxVortexHU_ButtonPressed (info):
-    fChannel            = sc.unsigned_char  # 0 First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # 1 First byte of the ANT+ datapage (payload)
-    fCommand            = sc.unsigned_char  # 2 0x10 Button press
-
-    nButton             = 3
-    fButton             = sc.unsigned_char  # 3 Button 1...5
-
-    fReserved           = sc.pad * 4        # -
-    fCount              = sc.unsigned_char  # 4
-
-    format = sc.big_endian +    fChannel + fDataPageNumber + fCommand + fButton + fReserved + fCount
-    tuple = struct.unpack (format, info)
-
-    return tuple[nButton]
+    return antPages.VHU_ButtonPressed.unpack(info).Button     # Button 1...5
 
 # ------------------------------------------------------------------------------
 # P a g e 1 6   G e n e r a l   F E   i n f o
@@ -1670,34 +2283,11 @@ def msgPage16_GeneralFEdata (Channel, ElapsedTime, DistanceTravelled, Speed, Hea
     HeartRate           = int(min(  0xff, HeartRate         ))
     Capabilities        = 0x30 | 0x03 | 0x00 | 0x00 # IN_USE | HRM | Distance | Speed
 
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fEquipmentType      = sc.unsigned_char
-    fElapsedTime        = sc.unsigned_char
-    fDistanceTravelled  = sc.unsigned_char
-    fSpeed              = sc.unsigned_short
-    fHeartRate          = sc.unsigned_char
-    fCapabilities       = sc.unsigned_char
-
-    format=   sc.no_alignment+fChannel+fDataPageNumber+fEquipmentType+fElapsedTime+fDistanceTravelled+fSpeed+fHeartRate+fCapabilities
-    info  =struct.pack(format, Channel, DataPageNumber, EquipmentType, ElapsedTime, DistanceTravelled, Speed, HeartRate, Capabilities)
-
-    return info
+    return antPages.FE_GeneralFEdata.pack(Channel, DataPageNumber, EquipmentType, \
+                        ElapsedTime, DistanceTravelled, Speed, HeartRate, Capabilities)
 
 def msgUnpage16_GeneralFEdata (info):
-    fChannel            = sc.unsigned_char  #0 First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  #1 First byte of the ANT+ datapage (payload)
-    fEquipmentType      = sc.unsigned_char  #2
-    fElapsedTime        = sc.unsigned_char  #3
-    fDistanceTravelled  = sc.unsigned_char  #4
-    fSpeed              = sc.unsigned_short #5
-    fHeartRate          = sc.unsigned_char  #6
-    fCapabilities       = sc.unsigned_char  #7
-
-    format=   sc.no_alignment+fChannel+fDataPageNumber+fEquipmentType+fElapsedTime+fDistanceTravelled+fSpeed+fHeartRate+fCapabilities
-    tuple = struct.unpack (format, info)
-
-    return tuple[0], tuple[1], tuple[2], tuple[3], tuple[4], tuple[5], tuple[6], tuple[7]
+    return antPages.FE_GeneralFEdata.unpack(info)
 
 # ------------------------------------------------------------------------------
 # P a g e 2 5   T r a i n e r   i n f o
@@ -1714,32 +2304,11 @@ def msgPage25_TrainerData(Channel, EventCounter, Cadence, AccumulatedPower, Curr
     CurrentPower        = int(min(0x0fff, CurrentPower      ))
     Flags               = 0x30          # Hmmm.... leave as is but do not understand the value
 
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fEvent              = sc.unsigned_char
-    fCadence            = sc.unsigned_char
-    fAccPower           = sc.unsigned_short
-    fInstPower          = sc.unsigned_short # The first four bits have another meaning!!
-    fFlags              = sc.unsigned_char
-
-    format=    sc.no_alignment + fChannel + fDataPageNumber + fEvent +      fCadence + fAccPower +       fInstPower +  fFlags
-    info  = struct.pack (format,  Channel,   DataPageNumber,   EventCounter, Cadence,   AccumulatedPower, CurrentPower, Flags)
-
-    return info
+    return antPages.FE_TrainerData.pack(Channel, DataPageNumber, EventCounter, \
+                        Cadence, AccumulatedPower, CurrentPower, Flags)
 
 def msgUnpage25_TrainerData(info):
-    fChannel            = sc.unsigned_char  #0 First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  #1 First byte of the ANT+ datapage (payload)
-    fEvent              = sc.unsigned_char  #2
-    fCadence            = sc.unsigned_char  #3
-    fAccPower           = sc.unsigned_short #4
-    fInstPower          = sc.unsigned_short #5 The first four bits have another meaning!!
-    fFlags              = sc.unsigned_char  #6
-
-    format= sc.no_alignment + fChannel + fDataPageNumber + fEvent + fCadence + fAccPower + fInstPower + fFlags
-    tuple = struct.unpack (format, info)
-
-    return tuple[0], tuple[1], tuple[2], tuple[3], tuple[4], tuple[5], tuple[6]
+    return antPages.FE_TrainerData.unpack(info)
 
 # ------------------------------------------------------------------------------
 # P a g e 4 8   B a s i c R e s i s t a n c e
@@ -1748,21 +2317,9 @@ def msgUnpage25_TrainerData(info):
 # Data page 48 (0x30) Basic Resistance
 # ------------------------------------------------------------------------------
 def msgUnpage48_BasicResistance(info):
-    _nChannel           = 0
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-
-    _nDataPageNumber    = 1
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-
-    fReserved           = sc.pad * 6
+    page = antPages.FE_BasicResistance.unpack(info)
 
-    nTotalResistance    = 2
-    fTotalResistance    = sc.unsigned_char
-
-    format = sc.no_alignment + fChannel + fDataPageNumber + fReserved + fTotalResistance
-    tuple  = struct.unpack (format, info)
-
-    rtn = tuple[nTotalResistance] * 0.005    # 0 ... 100%
+    rtn = page.TotalResistance * 0.005      # 0 ... 100%
 
     return rtn
 
@@ -1773,21 +2330,9 @@ def msgUnpage48_BasicResistance(info):
 # Data page 49 (0x31) Target Power
 # ------------------------------------------------------------------------------
 def msgUnpage49_TargetPower(info):
-    _nChannel           = 0
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
+    page = antPages.FE_TargetPower.unpack(info)
 
-    _nDataPageNumber    = 1
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-
-    fReserved           = sc.pad * 5
-
-    nTargetPower        = 2
-    fTargetPower        = sc.unsigned_short # units of 0.25Watt
-
-    format = sc.no_alignment + fChannel + fDataPageNumber + fReserved + fTargetPower
-    tuple  = struct.unpack (format, info)
-
-    TargetPower = tuple[nTargetPower] / 4   # returns units of 1Watt
+    TargetPower = page.TargetPower / 4      # units of 0.25Watt, returns units of 1Watt
 
     return TargetPower
 
@@ -1798,39 +2343,21 @@ def msgUnpage49_TargetPower(info):
 # Data page 50 (0x32) Wind Resistance
 # ------------------------------------------------------------------------------
 def msgUnpage50_WindResistance(info):
-    _nChannel           = 0
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-
-    _nDataPageNumber    = 1
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-
-    fReserved           = sc.pad * 4
-
-    nWindResistanceCoefficient = 2
-    fWindResistanceCoefficient = sc.unsigned_char
-
-    nWindSpeed          = 3
-    fWindSpeed          = sc.unsigned_char
+    page = antPages.FE_WindResistance.unpack(info)
 
-    nDraftingFactor     = 4
-    fDraftingFactor     = sc.unsigned_char
-
-    format = sc.no_alignment + fChannel + fDataPageNumber + fReserved + fWindResistanceCoefficient + fWindSpeed + fDraftingFactor
-    tuple  = struct.unpack (format, info)
-
-    WindResistance = tuple[nWindResistanceCoefficient]
+    WindResistance = page.WindResistanceCoefficient
     if WindResistance == 0xff:
         WindResistance = 0.51
     else:
         WindResistance = WindResistance * 0.01 # kg/m
 
-    WindSpeed = tuple[nWindSpeed]
+    WindSpeed = page.WindSpeed
     if WindSpeed == 0xff:
         WindSpeed = 0.0
     else:
         WindSpeed = WindSpeed - 127 # km/h
 
-    DraftingFactor = tuple[nDraftingFactor]
+    DraftingFactor = page.DraftingFactor
     if DraftingFactor == 0xff:
         DraftingFactor = 1.0
     else:
@@ -1845,29 +2372,14 @@ def msgUnpage50_WindResistance(info):
 # Data page 51 (0x33) Target Resistance
 # ------------------------------------------------------------------------------
 def msgUnpage51_TrackResistance(info):
-    _nChannel           = 0
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-
-    _nDataPageNumber    = 1
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-
-    fReserved           = sc.pad * 4
+    page = antPages.FE_TrackResistance.unpack(info)
 
-    nGrade              = 2
-    fGrade              = sc.unsigned_short
-
-    nRollingResistance  = 3
-    fRollingResistance  = sc.unsigned_char
-
-    format = sc.no_alignment + fChannel + fDataPageNumber + fReserved + fGrade + fRollingResistance
-    tuple  = struct.unpack (format, info)
-
-    Grade = tuple[nGrade]
+    Grade = page.Grade
     if Grade == 0xffff: Grade = 0
     Grade = Grade * 0.01 - 200          # -200% - 200%, units 0.01%
     Grade = round(Grade,2)
 
-    RollingResistance = tuple[nRollingResistance]
+    RollingResistance = page.RollingResistance
     if RollingResistance == 0xff:
         RollingResistance = 0.004
     else:
@@ -1882,38 +2394,17 @@ def msgUnpage51_TrackResistance(info):
 # Data page 55 (0x37) User Configuration
 # ------------------------------------------------------------------------------
 def msgUnpage55_UserConfiguration(info):
-    _nChannel           = 0
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-
-    _nDataPageNumber    = 1
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-
-    nUserWeight         = 2
-    fUserWeight         = sc.unsigned_short
-
-    fReserved           = sc.pad
-
-    nBicycleInfo        = 3
-    fBicycleInfo        = sc.unsigned_short
-
-    nBicycleWheelDiameter= 4
-    fBicycleWheelDiameter= sc.unsigned_char
-
-    nGearRatio          = 5
-    fGearRatio          = sc.unsigned_char
-
-    format = sc.no_alignment + fChannel + fDataPageNumber + fUserWeight + fReserved + fBicycleInfo + fBicycleWheelDiameter + fGearRatio
-    tuple  = struct.unpack (format, info)
+    page = antPages.FE_UserConfiguration.unpack(info)
 
-    UserWeigth                = tuple[nUserWeight] * 0.01                # 0 ... 655.34 kg
+    UserWeigth                = page.UserWeight * 0.01                   # 0 ... 655.34 kg
 
-    BicycleInfo               = tuple[nBicycleInfo]
+    BicycleInfo               = page.BicycleInfo
     _BicyleWheelDiameterOffset= (BicycleInfo & 0x000f)                   # 0 - 10 mm
     BicycleWeigth             = (BicycleInfo & 0xfff0) / 16 * 0.05       # 0 - 50 kg
 
-    BicyleWheelDiameter       = tuple[nBicycleWheelDiameter] * 0.01      # 0 - 2.54m
+    BicyleWheelDiameter       = page.BicycleWheelDiameter * 0.01         # 0 - 2.54m
 
-    GearRatio                 = tuple[nGearRatio] * 0.03                 # 0.03 - 7.65
+    GearRatio                 = page.GearRatio * 0.03                    # 0.03 - 7.65
 
     return UserWeigth, BicycleWeigth, BicyleWheelDiameter, GearRatio
 
@@ -1928,59 +2419,17 @@ def msgPage70_RequestDataPage(Channel, SlaveSerialNumber, DescriptorByte1, \
                 DescriptorByte2, NrTimes, RequestedPageNumber, CommandType):
     DataPageNumber      = 70
 
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSlaveSerialNumber  = sc.unsigned_short
-    fDescriptorByte1    = sc.unsigned_char
-    fDescriptorByte2    = sc.unsigned_char
-    fReqTransmissionResp= sc.unsigned_char
-    fRequestedPageNumber= sc.unsigned_char
-    fCommandType        = sc.unsigned_char
-
-    format=    sc.no_alignment + fChannel + fDataPageNumber + fSlaveSerialNumber + fDescriptorByte1 + \
-               fDescriptorByte2 + fReqTransmissionResp + fRequestedPageNumber + fCommandType
-
-    info  = struct.pack (format,  Channel,   DataPageNumber,   SlaveSerialNumber,   DescriptorByte1,  \
-                DescriptorByte2,   NrTimes,               RequestedPageNumber,   CommandType)
-
-    return info
+    return antPages.Common_RequestDataPage.pack(Channel, DataPageNumber, SlaveSerialNumber, \
+                DescriptorByte1, DescriptorByte2, NrTimes, RequestedPageNumber, CommandType)
 
 def msgUnpage70_RequestDataPage(info):
-    _nChannel           = 0
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-
-    _nDataPageNumber    = 1
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-
-    nSlaveSerialNumber  = 2
-    fSlaveSerialNumber  = sc.unsigned_short
-
-    nDescriptorByte1    = 3
-    fDescriptorByte1    = sc.unsigned_char
+    page = antPages.Common_RequestDataPage.unpack(info)
 
-    nDescriptorByte2    = 4
-    fDescriptorByte2    = sc.unsigned_char
-
-    nReqTransmissionResp= 5
-    fReqTransmissionResp= sc.unsigned_char
-
-    nRequestedPageNumber= 6
-    fRequestedPageNumber= sc.unsigned_char
-
-    nCommandType        = 7
-    fCommandType        = sc.unsigned_char
-
-    format = sc.no_alignment + fChannel + fDataPageNumber + fSlaveSerialNumber + \
-             fDescriptorByte1 + fDescriptorByte2 + fReqTransmissionResp + \
-             fRequestedPageNumber + fCommandType
-    tuple  = struct.unpack (format, info)
+    AckRequired         = page.ReqTransmissionResp & 0x80
+    NrTimes             = page.ReqTransmissionResp & 0x7f
 
-    ReqTranmissionResponse = tuple[nReqTransmissionResp]
-    AckRequired         = ReqTranmissionResponse & 0x80
-    NrTimes             = ReqTranmissionResponse & 0x7f
-
-    return tuple[nSlaveSerialNumber], tuple[nDescriptorByte1], tuple[nDescriptorByte2], \
-           AckRequired, NrTimes, tuple[nRequestedPageNumber], tuple[nCommandType]
+    return page.SlaveSerialNumber, page.DescriptorByte1, page.DescriptorByte2, \
+           AckRequired, NrTimes, page.RequestedPageNumber, page.CommandType
 
 # ------------------------------------------------------------------------------
 # P a g e 5 4 _ F E   C a p a b i l i t i e s
@@ -1991,19 +2440,8 @@ def msgUnpage70_RequestDataPage(info):
 def msgPage54_FE_Capabilities(Channel, Reserved1, Reserved2, Reserved3, Reserved4, MaximumResistance, CapabilitiesBits):
     DataPageNumber      = 54
 
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fReserved1          = sc.unsigned_char
-    fReserved2          = sc.unsigned_char
-    fReserved3          = sc.unsigned_char
-    fReserved4          = sc.unsigned_char
-    fMaximumResistance  = sc.unsigned_short
-    fCapabilitiesBits   = sc.unsigned_char
-
-    format=    sc.no_alignment + fChannel + fDataPageNumber + fReserved1 + fReserved2 + fReserved3 + fReserved4 + fMaximumResistance + fCapabilitiesBits
-    info  = struct.pack (format,  Channel,   DataPageNumber,   Reserved1 ,  Reserved2 ,  Reserved3 ,  Reserved4 ,  MaximumResistance,   CapabilitiesBits)
-
-    return info
+    return antPages.FE_Capabilities.pack(Channel, DataPageNumber, Reserved1, Reserved2, \
+                        Reserved3, Reserved4, MaximumResistance, CapabilitiesBits)
 
 # ------------------------------------------------------------------------------
 # P a g e 7 1 _ C o m m a n d S t a t u s
@@ -2014,20 +2452,8 @@ def msgPage54_FE_Capabilities(Channel, Reserved1, Reserved2, Reserved3, Reserved
 def msgPage71_CommandStatus(Channel, LastReceivedCommandID, SequenceNr, CommandStatus, Data1, Data2, Data3, Data4):
     DataPageNumber          = 71
 
-    fChannel                = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber         = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fLastReceivedCommandID  = sc.unsigned_char
-    fSequenceNr             = sc.unsigned_char
-    fCommandStatus          = sc.unsigned_char
-    fData1                  = sc.unsigned_char
-    fData2                  = sc.unsigned_char
-    fData3                  = sc.unsigned_char
-    fData4                  = sc.unsigned_char
-
-    format=    sc.no_alignment + fChannel + fDataPageNumber + fLastReceivedCommandID + fSequenceNr + fCommandStatus + fData1 + fData2 + fData3 + fData4
-    info  = struct.pack (format,  Channel,   DataPageNumber,   LastReceivedCommandID,   SequenceNr,   CommandStatus,   Data1,   Data2,   Data3,   Data4)
-
-    return info
+    return antPages.FE_CommandStatus.pack(Channel, DataPageNumber, LastReceivedCommandID, \
+                        SequenceNr, CommandStatus, Data1, Data2, Data3, Data4)
 
 # ------------------------------------------------------------------------------
 # P a g e 8 0 _ M a n u f a c t u r e r I n f o
@@ -2039,14 +2465,6 @@ def msgPage71_CommandStatus(Channel, LastReceivedCommandID, SequenceNr, CommandS
 def msgPage80_ManufacturerInfo(Channel, Reserved1, Reserved2, HWrevision, ManufacturerID, ModelNumber):
     DataPageNumber      = 80
 
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fReserved1          = sc.unsigned_char
-    fReserved2          = sc.unsigned_char
-    fHWrevision         = sc.unsigned_char
-    fManufacturerID     = sc.unsigned_short
-    fModelNumber        = sc.unsigned_short
-
     # page 28 byte 4,5,6,7- 15=dynastream, 89=tacx
     # antifier used 15 : "a4 09 4e 00 50 ff ff 01 0f 00 85 83 bb"
     # we use 89 (tacx) with the same ModelNumber
@@ -2054,24 +2472,11 @@ def msgPage80_ManufacturerInfo(Channel, Reserved1, Reserved2, HWrevision, Manufa
     # Should be variable and caller-supplied; perhaps it influences pairing
     # when trainer-software wants a specific device?
     #
-    format=    sc.no_alignment + fChannel + fDataPageNumber + fReserved1 + fReserved2 + fHWrevision + fManufacturerID + fModelNumber
-    info  = struct.pack (format,  Channel,   DataPageNumber,   Reserved1,   Reserved2,   HWrevision,   ManufacturerID,   ModelNumber)
-
-    return info
+    return antPages.Common_ManufacturerInfo.pack(Channel, DataPageNumber, Reserved1, \
+                        Reserved2, HWrevision, ManufacturerID, ModelNumber)
 
 def msgUnpage80_ManufacturerInfo(info):
-    fChannel            = sc.unsigned_char  #0 First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  #1 First byte of the ANT+ datapage (payload)
-    fReserved1          = sc.unsigned_char  #2
-    fReserved2          = sc.unsigned_char  #3
-    fHWrevision         = sc.unsigned_char  #4
-    fManufacturerID     = sc.unsigned_short #5
-    fModelNumber        = sc.unsigned_short #6
-
-    format= sc.no_alignment + fChannel + fDataPageNumber + fReserved1 + fReserved2 + fHWrevision + fManufacturerID + fModelNumber
-    tuple = struct.unpack (format, info)
-
-    return tuple[0], tuple[1], tuple[2], tuple[3], tuple[4], tuple[5], tuple[6]
+    return antPages.Common_ManufacturerInfo.unpack(info)
 
 # ------------------------------------------------------------------------------
 # P a g e 8 1   P r o d u c t I n f o r m a t i o n
@@ -2083,30 +2488,11 @@ def msgUnpage80_ManufacturerInfo(info):
 def msgPage81_ProductInformation(Channel, Reserved1, SWrevisionSupp, SWrevisionMain, SerialNumber):
     DataPageNumber      = 81
 
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fReserved1          = sc.unsigned_char
-    fSWrevisionSupp     = sc.unsigned_char
-    fSWrevisionMain     = sc.unsigned_char
-    fSerialNumber       = sc.unsigned_int
-
-    format=    sc.no_alignment + fChannel + fDataPageNumber + fReserved1 + fSWrevisionSupp + fSWrevisionMain + fSerialNumber
-    info  = struct.pack (format,  Channel,   DataPageNumber,   Reserved1,   SWrevisionSupp,   SWrevisionMain,   SerialNumber)
-
-    return info
+    return antPages.Common_ProductInformation.pack(Channel, DataPageNumber, Reserved1, \
+                        SWrevisionSupp, SWrevisionMain, SerialNumber)
 
 def msgUnpage81_ProductInformation(info):
-    fChannel            = sc.unsigned_char  #0 First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  #1 First byte of the ANT+ datapage (payload)
-    fReserved1          = sc.unsigned_char  #2
-    fSWrevisionSupp     = sc.unsigned_char  #3
-    fSWrevisionMain     = sc.unsigned_char  #4
-    fSerialNumber       = sc.unsigned_int   #5
-
-    format= sc.no_alignment + fChannel + fDataPageNumber + fReserved1 + fSWrevisionSupp + fSWrevisionMain + fSerialNumber
-    tuple = struct.unpack (format, info)
-
-    return tuple[0], tuple[1], tuple[2], tuple[3], tuple[4], tuple[5]
+    return antPages.Common_ProductInformation.unpack(info)
 
 # ------------------------------------------------------------------------------
 # P a g e 8 2   B a t t e r y S t a t u s
@@ -2118,22 +2504,8 @@ def msgUnpage81_ProductInformation(info):
 def msgPage82_BatteryStatus(Channel):
     DataPageNumber      = 82
 
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fReserved1          = sc.unsigned_char
-    fBatteryIdentifier  = sc.unsigned_char
-    fCumulativeTime1    = sc.unsigned_char
-    fCumulativeTime2    = sc.unsigned_char
-    fCumulativeTime3    = sc.unsigned_char
-    fBatteryVoltage     = sc.unsigned_char
-    fDescriptiveBitField= sc.unsigned_char
-
-    format=    sc.no_alignment + fChannel + fDataPageNumber + fReserved1 + fBatteryIdentifier + \
-                fCumulativeTime1 + fCumulativeTime2 + fCumulativeTime3 + \
-                fBatteryVoltage + fDescriptiveBitField
-    info  = struct.pack (format, Channel, DataPageNumber, 0xff, 0x00, 0,0,0, 0, 0x0f | 0x10 | 0x00)
-
-    return info
+    return antPages.Common_BatteryStatus.pack(Channel, DataPageNumber, 0xff, 0x00, \
+                        0, 0, 0, 0, 0x0f | 0x10 | 0x00)
 
 # ------------------------------------------------------------------------------
 # P a g e 0, 1, 2   H e a r t R a t e I n f o
@@ -2150,34 +2522,11 @@ def msgPage_Hrm (Channel, DataPageNumber, Spec1, Spec2, Spec3, HeartBeatEventTim
     HeartBeatCount      = int(min(  0xff, HeartBeatCount     ))
     HeartRate           = int(min(  0xff, HeartRate          ))
 
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSpec1              = sc.unsigned_char
-    fSpec2              = sc.unsigned_char
-    fSpec3              = sc.unsigned_char
-    fHeartBeatEventTime = sc.unsigned_short
-    fHeartBeatCount     = sc.unsigned_char
-    fHeartRate          = sc.unsigned_char
-
-    format      = sc.no_alignment + fChannel + fDataPageNumber + fSpec1 + fSpec2 + fSpec3 + fHeartBeatEventTime +  fHeartBeatCount + fHeartRate
-    info        = struct.pack (format, Channel, DataPageNumber,   Spec1,   Spec2,   Spec3,   HeartBeatEventTime,    HeartBeatCount,   HeartRate)
-
-    return info
+    return antPages.HRM_HeartRate.pack(Channel, DataPageNumber, Spec1, Spec2, Spec3, \
+                        HeartBeatEventTime, HeartBeatCount, HeartRate)
 
 def msgUnpage_Hrm (info):
-    fChannel            = sc.unsigned_char  #0 First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  #1 First byte of the ANT+ datapage (payload)
-    fSpec1              = sc.unsigned_char  #2
-    fSpec2              = sc.unsigned_char  #3
-    fSpec3              = sc.unsigned_char  #4
-    fHeartBeatEventTime = sc.unsigned_short #5
-    fHeartBeatCount     = sc.unsigned_char  #6
-    fHeartRate          = sc.unsigned_char  #7
-
-    format      = sc.no_alignment + fChannel + fDataPageNumber + fSpec1 + fSpec2 + fSpec3 + fHeartBeatEventTime +  fHeartBeatCount + fHeartRate
-    tuple = struct.unpack (format, info)
-
-    return tuple[0], tuple[1], tuple[2], tuple[3], tuple[4], tuple[5], tuple[6], tuple[7]
+    return antPages.HRM_HeartRate.unpack(info)
 
 # ------------------------------------------------------------------------------
 # P a g e 0   S p e e d C a d e n c e S e n s o r
@@ -2192,31 +2541,11 @@ def msgPage_SCS (Channel, CadenceEventTime, CadenceRevolutionCount, SpeedEventTi
     SpeedEventTime          = int(min(0xffff, SpeedEventTime        ))
     SpeedRevolutionCount    = int(min(0xffff, SpeedRevolutionCount  ))
 
-    fChannel                = sc.unsigned_char  # First byte of the ANT+ message content
-    _fDataPageNumber        = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fCadenceEventTime       = sc.unsigned_short
-    fCadenceRevolutionCount = sc.unsigned_short
-    fSpeedEventTime         = sc.unsigned_short
-    fSpeedRevolutionCount   = sc.unsigned_short
-
-    format      = sc.no_alignment + fChannel + fCadenceEventTime + \
-                        fCadenceRevolutionCount + fSpeedEventTime + fSpeedRevolutionCount
-    info        = struct.pack (format, Channel, CadenceEventTime,   \
-                        CadenceRevolutionCount,    SpeedEventTime,   SpeedRevolutionCount)
-
-    return info
+    return antPages.SCS_SpeedCadence.pack(Channel, CadenceEventTime, \
+                        CadenceRevolutionCount, SpeedEventTime, SpeedRevolutionCount)
 
 def msgUnpage_SCS (info):
-    fChannel                = sc.unsigned_char  # First byte of the ANT+ message content
-    _fDataPageNumber        = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fCadenceEventTime       = sc.unsigned_short
-    fCadenceRevolutionCount = sc.unsigned_short
-    fSpeedEventTime         = sc.unsigned_short
-    fSpeedRevolutionCount   = sc.unsigned_short
-
-    format      = sc.no_alignment + fChannel + fCadenceEventTime + \
-                        fCadenceRevolutionCount + fSpeedEventTime + fSpeedRevolutionCount
-    tuple = struct.unpack (format, info)
+    page = antPages.SCS_SpeedCadence.unpack(info)
 
     #      EventTime, CadenceRevolutionCount, EventTime, SpeedRevolutionCount
-    return tuple[1],  tuple[2],               tuple[3],  tuple[4]
+    return page[1],   page[2],                page[3],   page[4]
@@ -1,13 +1,37 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2020-05-07"
+__version__ = "2026-10-18"
+# 2026-10-18    Messages are preallocated frames (antPages.clsBroadcastFrame);
+#               pages 80 and 81 are encoded once, 16 and 25 patched in place
 # 2020-05-07    devAntDongle not needed, not used
 # 2020-05-07    pylint error free
 # 2020-02-18    First version, split-off from FortiusAnt.py
 #-------------------------------------------------------------------------------
 import time
 import antDongle         as ant
+import antPages
+
+#-------------------------------------------------------------------------------
+# The frames broadcasted on channel_FE
+#-------------------------------------------------------------------------------
+ManufacturerInfo = antPages.clsBroadcastFrame(ant.msgID_BroadcastData, antPages.Common_ManufacturerInfo,
+                        Channel=ant.channel_FE, DataPageNumber=80, Reserved1=0xff, Reserved2=0xff,
+                        HWrevision=ant.HWrevision_FE, ManufacturerID=ant.Manufacturer_tacx,
+                        ModelNumber=ant.ModelNumber_FE)
+ProductInformation = antPages.clsBroadcastFrame(ant.msgID_BroadcastData, antPages.Common_ProductInformation,
+                        Channel=ant.channel_FE, DataPageNumber=81, Reserved1=0xff,
+                        SWrevisionSupp=ant.SWrevisionSupp_FE, SWrevisionMain=ant.SWrevisionMain_FE,
+                        SerialNumber=ant.SerialNumber_FE)
+GeneralFEdata    = antPages.clsBroadcastFrame(ant.msgID_BroadcastData, antPages.FE_GeneralFEdata,
+                        ('ElapsedTime', 'DistanceTravelled', 'Speed', 'HeartRate'),
+                        Channel=ant.channel_FE, DataPageNumber=16,
+                        EquipmentType=0x19,                                 # Trainer
+                        Capabilities=0x30 | 0x03 | 0x00 | 0x00)             # IN_USE | HRM | Distance | Speed
+TrainerData      = antPages.clsBroadcastFrame(ant.msgID_BroadcastData, antPages.FE_TrainerData,
+                        ('EventCounter', 'Cadence', 'AccumulatedPower', 'CurrentPower'),
+                        Channel=ant.channel_FE, DataPageNumber=25,
+                        Flags=0x30)             # Hmmm.... leave as is but do not understand the value
 
 def Initialize():
     global EventCounter, AccumulatedPower, AccumulatedTimeCounter, DistanceTravelled, AccumulatedLastTime
@@ -28,6 +52,7 @@ def Initialize():
 # Output:       EventCounter, AccumulatedPower, AccumulatedTimeCounter, DistanceTravelled
 #
 # Returns:      fedata; next message to be broadcasted on ANT+ channel
+#               The frame is reused; to be sent before the next call
 # ------------------------------------------------------------------------------
 def BroadcastTrainerDataMessage (Cadence, CurrentPower, SpeedKmh, HeartRate):
     global EventCounter, AccumulatedPower, AccumulatedTimeCounter, DistanceTravelled, AccumulatedLastTime
@@ -50,18 +75,14 @@ def BroadcastTrainerDataMessage (Cadence, CurrentPower, SpeedKmh, HeartRate):
         #      page 28 byte 4,5,6,7- 15=dynastream, 89=tacx
         #-----------------------------------------------------------------------
         # comment = "(Manufacturer's info packet)"
-        info    = ant.msgPage80_ManufacturerInfo(ant.channel_FE, 0xff, 0xff, \
-                    ant.HWrevision_FE, ant.Manufacturer_tacx, ant.ModelNumber_FE)
-        fedata  = ant.ComposeMessage (ant.msgID_BroadcastData, info)
+        fedata  = ManufacturerInfo.Frame
         
     elif EventCounter % 64 in (62, 63):     # After 10 blocks of three messages, then 2 = 32 messages
         #-----------------------------------------------------------------------
         # Send first and second product info packet
         #-----------------------------------------------------------------------
         # comment = "(Product info packet)"
-        info    = ant.msgPage81_ProductInformation(ant.channel_FE, 0xff, \
-                    ant.SWrevisionSupp_FE, ant.SWrevisionMain_FE, ant.SerialNumber_FE)
-        fedata  = ant.ComposeMessage (ant.msgID_BroadcastData, info)
+        fedata  = ProductInformation.Frame
     
     elif EventCounter % 3 == 0:                                                                             
         #-----------------------------------------------------------------------
@@ -80,16 +101,20 @@ def BroadcastTrainerDataMessage (Cadence, CurrentPower, SpeedKmh, HeartRate):
         # comment = "(General fe data)"
         # Note: AccumulatedTimeCounter as first parameter,
         #       To be checked whether it should be AccumulatedTime (in 0.25 s)
-        info    = ant.msgPage16_GeneralFEdata (ant.channel_FE, AccumulatedTimeCounter, DistanceTravelled, SpeedKmh*1000*1000/3600, HeartRate)
-        fedata  = ant.ComposeMessage (ant.msgID_BroadcastData, info)
+        fedata  = GeneralFEdata.Patch(int(min(  0xff, AccumulatedTimeCounter         )), \
+                                      int(min(  0xff, DistanceTravelled              )), \
+                                      int(min(0xffff, SpeedKmh * 1000 * 1000 / 3600  )), \
+                                      int(min(  0xff, HeartRate                      )))
 
     else:
         #-----------------------------------------------------------------------
         # Send specific trainer data
         #-----------------------------------------------------------------------
         # comment = "(Specific trainer data)"
-        info    = ant.msgPage25_TrainerData(ant.channel_FE, EventCounter, Cadence, AccumulatedPower, CurrentPower)
-        fedata  = ant.ComposeMessage (ant.msgID_BroadcastData, info)
+        fedata  = TrainerData.Patch(int(min(  0xff, EventCounter     )), \
+                                    int(min(  0xff, Cadence          )), \
+                                    int(min(0xffff, AccumulatedPower )), \
+                                    int(min(0x0fff, CurrentPower     )))
 
     #-------------------------------------------------------------------------
     # Prepare for next event
@@ -0,0 +1,246 @@
+#-------------------------------------------------------------------------------
+# Version info
+#-------------------------------------------------------------------------------
+__version__ = "2026-10-18"
+# 2026-10-18    Compose() added, used by antDongle.ComposeMessage()
+# 2026-10-18    First version; streaming parser for the data read from the
+#               ANT-dongle, replacing the byte-by-byte parsing in Read()
+#-------------------------------------------------------------------------------
+import logfile
+
+#-------------------------------------------------------------------------------
+# ANT message structure
+#-------------------------------------------------------------------------------
+#   0       synch       0xa4
+#   1       length      of info
+#   2       id          message id
+#   3...    info        length bytes
+#   last    checksum    xor of all previous bytes
+#
+# Hence the xor of all bytes of a correct message, including the checksum, is 0
+#-------------------------------------------------------------------------------
+Synch           = 0xa4
+Overhead        = 4                 # synch, length, id and checksum
+
+#-------------------------------------------------------------------------------
+# X o r
+#-------------------------------------------------------------------------------
+# input         buffer (bytes, bytearray, memoryview)
+#
+# function      xor all bytes of the buffer
+#               Iterating the buffer is faster than indexing it (CalcChecksum)
+#               and, for messages of this size, faster than folding the
+#               buffer as one integer or functools.reduce().
+#
+# returns       the xor-value 0...255; 0 for a correct ANT message
+#-------------------------------------------------------------------------------
+def Xor(buffer):
+    x = 0
+    for b in buffer:
+        x ^= b
+    return x
+
+#-------------------------------------------------------------------------------
+# C o m p o s e
+#-------------------------------------------------------------------------------
+# input         id, info (bytes)
+#
+# function      Build the message: synch, length, id, info, checksum
+#
+# returns       message (bytes)
+#-------------------------------------------------------------------------------
+def Compose(id, info):
+    data = bytes((Synch, len(info), id)) + info
+    return data + bytes((Xor(data),))
+
+#-------------------------------------------------------------------------------
+# c l s A n t F r a m e P a r s e r
+#-------------------------------------------------------------------------------
+# Splits the data returned by consecutive .read()'s of the dongle into
+# messages:
+# - the synch byte is found with bytes.find()
+# - the checksum is verified with Xor()
+# - the messages are returned as memoryview's on the buffer; no copy
+# - an incomplete message at the end of a buffer is kept and completed with
+#   the data of the next .read(); no longer discarded
+# - on a checksum error, the synch is searched from the next byte, so that a
+#   false synch does not cause the next messages to be lost
+#
+# Parse() returns memoryview's that remain valid after the next Parse(),
+# since each Parse() works on a new (immutable) buffer.
+#-------------------------------------------------------------------------------
+class clsAntFrameParser():
+    def __init__(self):
+        self.Leftover       = b''
+        self.Frames         = 0         # Statistics
+        self.SplitFrames    = 0
+        self.SkippedBytes   = 0
+        self.ChecksumErrors = 0
+
+    #---------------------------------------------------------------------------
+    # R e s e t
+    #---------------------------------------------------------------------------
+    # function      Discard incomplete message, e.g. when dongle is reconnected
+    #---------------------------------------------------------------------------
+    def Reset(self):
+        self.Leftover = b''
+
+    #---------------------------------------------------------------------------
+    # P a r s e
+    #---------------------------------------------------------------------------
+    # input         trv         the data returned by .read()
+    #
+    # function      split into messages; keep incomplete message
+    #
+    # returns       list of memoryview's, one per correct message
+    #---------------------------------------------------------------------------
+    def Parse(self, trv):
+        if self.Leftover:
+            buffer = self.Leftover + bytes(trv)
+            Split  = len(self.Leftover)
+        else:
+            buffer = bytes(trv)
+            Split  = 0
+        view   = memoryview(buffer)
+        size   = len(buffer)
+        frames = []
+        start  = 0
+        while start < size:
+            #-------------------------------------------------------------------
+            # Each message starts with a4; skip characters if not
+            #-------------------------------------------------------------------
+            synch = buffer.find(Synch, start)
+            if synch < 0:
+                synch = size
+            if synch != start:
+                self.SkippedBytes += synch - start
+                logfile.Console("Dongle.Read: %s characters skipped " % (synch - start))
+                start = synch
+            if start + 1 >= size:
+                break                           # length not yet received
+            #-------------------------------------------------------------------
+            # Incomplete message is kept for the next Parse()
+            #-------------------------------------------------------------------
+            end = start + buffer[start + 1] + Overhead
+            if end > size:
+                break
+            #-------------------------------------------------------------------
+            # Correct message is returned, on checksum error synch again
+            #-------------------------------------------------------------------
+            frame = view[start:end]
+            if Xor(frame):
+                self.ChecksumErrors += 1
+                logfile.Console("Dongle.Read: error: checksum incorrect data=%s" % \
+                                logfile.HexSpace(bytes(frame)))
+                start += 1
+            else:
+                frames.append(frame)
+                if start < Split: self.SplitFrames += 1
+                start = end
+
+        self.Leftover = buffer[start:]
+        self.Frames  += len(frames)
+        return frames
+
+    #---------------------------------------------------------------------------
+    # S t a t i s t i c s
+    #---------------------------------------------------------------------------
+    def Statistics(self):
+        return "ANT frames: %s received, %s split over two reads, %s bytes skipped, %s checksum errors" % \
+               (self.Frames, self.SplitFrames, self.SkippedBytes, self.ChecksumErrors)
+
+#-------------------------------------------------------------------------------
+# Main program to test the previous functions
+#-------------------------------------------------------------------------------
+if __name__ == "__main__":
+    import time
+    import debug
+    debug.deactivate()
+
+    Message = Compose
+
+    #---------------------------------------------------------------------------
+    # The parsing as done by antDongle.Read() before
+    #---------------------------------------------------------------------------
+    def CalcChecksum (message):
+        xor_value = 0
+        length    = message[1] + 3
+        for i in range (0, length):
+            xor_value = xor_value ^ message[i]
+        return bytes([xor_value])
+
+    def OldParse(trv):
+        data  = []
+        start = 0
+        while start < len(trv):
+            skip = start
+            while skip < len(trv) and trv[skip] != 0xa4:
+                skip += 1
+            start = skip
+            if start + 1 < len(trv):
+                length = trv[start+1] + 4
+                if start + length <= len(trv):
+                    d = bytes(trv[start : start+length])
+                    if CalcChecksum(d) == d[-1:]:
+                        data.append(d)
+                else:
+                    break
+            else:
+                break
+            start += length
+        return data
+
+    Broadcast   = Message(0x4e, b'\x00\x19\x57\x5a\x00\x64\x00\x00\x30')
+    Acknowledged= Message(0x4f, b'\x00\x31\xff\xff\xff\xff\xff\x90\x01')
+    Response    = Message(0x40, b'\x00\x01\x03')
+    Stream      = Broadcast + Response + Acknowledged + Broadcast + Response
+
+    #---------------------------------------------------------------------------
+    # Test: Xor() equals the byte-by-byte calculation
+    #---------------------------------------------------------------------------
+    for m in (Broadcast, Acknowledged, Response, bytes(range(200)), b'\x01'):
+        x = 0
+        for b in m: x ^= b
+        assert Xor(m) == x, m
+
+    #---------------------------------------------------------------------------
+    # Test: the stream split at every position gives the same messages
+    #---------------------------------------------------------------------------
+    Expected = [Broadcast, Response, Acknowledged, Broadcast, Response]
+    for split in range(0, len(Stream) + 1):
+        p = clsAntFrameParser()
+        frames  = [bytes(f) for f in p.Parse(Stream[:split])]
+        frames += [bytes(f) for f in p.Parse(Stream[split:])]
+        assert frames == Expected, split
+        assert p.Leftover == b''
+
+    #---------------------------------------------------------------------------
+    # Test: split in three, garbage and a checksum error are skipped
+    #---------------------------------------------------------------------------
+    p = clsAntFrameParser()
+    Corrupt = bytearray(Broadcast); Corrupt[5] ^= 0xff
+    frames  = p.Parse(b'\x00\x00' + Broadcast[:2])
+    frames += p.Parse(Broadcast[2:7])
+    frames += p.Parse(Broadcast[7:] + bytes(Corrupt) + Acknowledged)
+    assert [bytes(f) for f in frames] == [Broadcast, Acknowledged]
+    assert p.SplitFrames == 1 and p.ChecksumErrors == 1, p.Statistics()
+    print ('Tests passed; ' + p.Statistics())
+
+    #---------------------------------------------------------------------------
+    # Benchmark: multi-message reads, as returned by .read() (array of bytes)
+    # Best of 5 runs, the machine may be busy
+    #---------------------------------------------------------------------------
+    import array
+    trv = array.array('B', Stream)
+    N   = 20000
+    p   = clsAntFrameParser()
+    for Parser, Name in ((OldParse, 'byte-by-byte'), (p.Parse, 'streaming')):
+        Best = None
+        for _ in range(5):
+            start = time.monotonic()
+            for _ in range(N):
+                Parser(trv)
+            elapsed = time.monotonic() - start
+            Best = elapsed if Best == None else min(Best, elapsed)
+        print ('%-12s: %s reads of %s messages (%s bytes) in %4.0fms = %4.2fus/message' % \
+               (Name, N, len(Expected), len(Stream), Best * 1000, Best * 1e6 / N / len(Expected)))
@@ -1,13 +1,23 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2020-05-07"
+__version__ = "2026-10-18"
+# 2026-10-18    Message is a preallocated frame, patched in place
 # 2020-05-07    devAntDongle not needed, not used
 # 2020-05-07    pylint error free
 # 2020-02-18    First version, split-off from FortiusAnt.py
 #-------------------------------------------------------------------------------
 import time
 import antDongle         as ant
+import antPages
+
+#-------------------------------------------------------------------------------
+# The frame broadcasted on channel_HRM; all fields but channel are patched
+#-------------------------------------------------------------------------------
+HeartRateFrame = antPages.clsBroadcastFrame(ant.msgID_BroadcastData, antPages.HRM_HeartRate,
+                        ('DataPageNumber', 'Spec1', 'Spec2', 'Spec3',
+                         'HeartBeatEventTime', 'HeartBeatCount', 'HeartRate'),
+                        Channel=ant.channel_HRM)
 
 def Initialize():
     global EventCounter, HeartBeatCounter, HeartBeatEventTime, HeartBeatTime, PageChangeToggle
@@ -70,8 +80,11 @@ def BroadcastHeartrateMessage (HeartRate):
         Spec3           = ant.ModelNumber_HRM
         # comment       = "(HR data p3)"
         
-    info   = ant.msgPage_Hrm (ant.channel_HRM, PageChangeToggle | DataPageNumber, Spec1, Spec2, Spec3, HeartBeatEventTime, HeartBeatCounter, HeartRate)
-    hrdata = ant.ComposeMessage (ant.msgID_BroadcastData, info)
+    hrdata = HeartRateFrame.Patch(int(min(0xff, PageChangeToggle | DataPageNumber)), \
+                        Spec1, Spec2, Spec3, \
+                        int(min(0xffff, HeartBeatEventTime * 1000/1024)), \
+                        int(min(  0xff, HeartBeatCounter)), \
+                        int(min(  0xff, HeartRate       )))
 
     #-------------------------------------------------------------------------
     # Prepare for next event
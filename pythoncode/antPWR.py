@@ -1,11 +1,33 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2020-06-11"
+__version__ = "2026-10-18"
+# 2026-10-18    Messages are preallocated frames (antPages.clsBroadcastFrame);
+#               pages 80, 81, 82 are encoded once, page 16 patched in place
 # 2020-06-11    First version, based upon antHRM.py
 #-------------------------------------------------------------------------------
 import time
 import antDongle         as ant
+import antPages
+
+#-------------------------------------------------------------------------------
+# The frames broadcasted on channel_PWR
+#-------------------------------------------------------------------------------
+ManufacturerInfo = antPages.clsBroadcastFrame(ant.msgID_BroadcastData, antPages.Common_ManufacturerInfo,
+                        Channel=ant.channel_PWR, DataPageNumber=80, Reserved1=0xff, Reserved2=0xff,
+                        HWrevision=ant.HWrevision_PWR, ManufacturerID=ant.Manufacturer_garmin,
+                        ModelNumber=ant.ModelNumber_PWR)
+ProductInformation = antPages.clsBroadcastFrame(ant.msgID_BroadcastData, antPages.Common_ProductInformation,
+                        Channel=ant.channel_PWR, DataPageNumber=81, Reserved1=0xff,
+                        SWrevisionSupp=ant.SWrevisionSupp_PWR, SWrevisionMain=ant.SWrevisionMain_PWR,
+                        SerialNumber=ant.SerialNumber_PWR)
+BatteryStatus    = antPages.clsBroadcastFrame(ant.msgID_BroadcastData, antPages.Common_BatteryStatus,
+                        Channel=ant.channel_PWR, DataPageNumber=82, Reserved1=0xff,
+                        DescriptiveBitField=0x0f | 0x10 | 0x00)
+PowerOnly        = antPages.clsBroadcastFrame(ant.msgID_BroadcastData, antPages.PWR_PowerOnly,
+                        ('EventCount', 'PedalPower', 'InstantaneousCadence',
+                         'AccumulatedPower', 'InstantaneousPower'),
+                        Channel=ant.channel_PWR, DataPageNumber=16)
 
 def Initialize():
     global EventCount, AccumulatedPower
@@ -16,21 +38,21 @@ def BroadcastMessage (CurrentPower, Cadence):
     global EventCount, AccumulatedPower
 
     if   EventCount % 120 == 0:           # Transmit page 0x50 = 80
-        info = ant.msgPage80_ManufacturerInfo(ant.channel_PWR, 0xff, 0xff, \
-            ant.HWrevision_PWR, ant.Manufacturer_garmin, ant.ModelNumber_PWR)
+        pwrdata = ManufacturerInfo.Frame
 
     elif EventCount % 121 == 0:           # Transmit page 0x51 = 81
-        info = ant.msgPage81_ProductInformation(ant.channel_PWR, 0xff, \
-            ant.SWrevisionSupp_PWR, ant.SWrevisionMain_PWR, ant.SerialNumber_PWR)
+        pwrdata = ProductInformation.Frame
 
     elif EventCount %  60 == 0:           # Transmit page 0x52 = 82
-        info = ant.msgPage82_BatteryStatus(ant.channel_PWR)
+        pwrdata = BatteryStatus.Frame
     
     else:
         AccumulatedPower += CurrentPower
-        info= ant.msgPage16_PowerOnly (ant.channel_PWR, EventCount, Cadence, AccumulatedPower, CurrentPower)
-
-    pwrdata = ant.ComposeMessage (ant.msgID_BroadcastData, info)
+        pwrdata = PowerOnly.Patch(int(min(0xff,   EventCount      )), \
+                                  0xff,                                 # PedalPower not used
+                                  int(min(0xff,   Cadence         )), \
+                                  int(min(0xffff, AccumulatedPower)), \
+                                  int(min(0xffff, CurrentPower    )))
 
     #-------------------------------------------------------------------------
     # Prepare for next event
@@ -0,0 +1,350 @@
+#-------------------------------------------------------------------------------
+# Version info
+#-------------------------------------------------------------------------------
+__version__ = "2026-10-18"
+# 2026-10-18    clsBroadcastFrame; preallocated frame, patched in place
+# 2026-10-18    First version; the layout of the ANT+ data pages in one table,
+#               compiled once into struct.Struct encoders and decoders;
+#               the codecs are bound to their names explicitly
+#-------------------------------------------------------------------------------
+import collections
+import struct
+
+import structConstants      as sc
+import antFrames
+
+#-------------------------------------------------------------------------------
+# Field formats, as used in the schema
+#-------------------------------------------------------------------------------
+B   = sc.unsigned_char
+H   = sc.unsigned_short
+I   = sc.unsigned_int
+def x(n): return (None, sc.pad * n)     # n reserved bytes
+
+Channel = ('Channel',        B)         # First byte of the ANT+ message content
+Page    = ('DataPageNumber', B)         # First byte of the ANT+ datapage (payload)
+
+#-------------------------------------------------------------------------------
+# The schema
+#-------------------------------------------------------------------------------
+# Each entry describes the info-part of an ANT message (channel + 8 bytes):
+#   Name        the codec is available as antPages.<Name>
+#   Profile     FE, PWR, HRM, SCS, VTX (i-Vortex), VHU (i-Vortex headunit) or
+#               Common (common data pages)
+#   Page        the data page number; None when not fixed for the layout
+#   ByteOrder   sc.no_alignment (ANT+) or sc.big_endian (Tacx i-Vortex)
+#   Fields      (name, format); name None for reserved bytes
+#
+# Refer:    https://www.thisisant.com/developer/resources/downloads#documents_tab
+#   trainer: D000001231_-_ANT+_Device_Profile_-_Fitness_Equipment_-_Rev_5.0_(6).pdf
+#   common:  D00001198_-_ANT+_Common_Data_Pages_Rev_3.1.pdf
+#   hrm:     D00000693_-_ANT+_Device_Profile_-_Heart_Rate_Rev_2.1.pdf
+#   power:   D00001086_ANT+_Device_Profile_-_Bicycle_Power_Rev_5.1.pdf
+#   scs:     D00001163_-_ANT+_Device_Profile_-_Bicycle_Speed_and_Cadence_2.1.pdf
+#   vortex:  GoldenCheetah\GoldenCheetah\src\ANT; ANTmessage.cpp
+#-------------------------------------------------------------------------------
+Schema = (
+  # Name                        Profile   Page  ByteOrder
+  ('FE_GeneralFEdata',          'FE',      16,  sc.no_alignment, (Channel, Page,
+        ('EquipmentType', B), ('ElapsedTime', B), ('DistanceTravelled', B),
+        ('Speed', H), ('HeartRate', B), ('Capabilities', B))),
+  ('FE_TrainerData',            'FE',      25,  sc.no_alignment, (Channel, Page,
+        ('EventCounter', B), ('Cadence', B), ('AccumulatedPower', H),
+        ('CurrentPower', H), ('Flags', B))),                # CurrentPower: 12 bits
+  ('FE_BasicResistance',        'FE',      48,  sc.no_alignment, (Channel, Page,
+        x(6), ('TotalResistance', B))),                     # 0.5%
+  ('FE_TargetPower',            'FE',      49,  sc.no_alignment, (Channel, Page,
+        x(5), ('TargetPower', H))),                         # 0.25Watt
+  ('FE_WindResistance',         'FE',      50,  sc.no_alignment, (Channel, Page,
+        x(4), ('WindResistanceCoefficient', B), ('WindSpeed', B),
+        ('DraftingFactor', B))),
+  ('FE_TrackResistance',        'FE',      51,  sc.no_alignment, (Channel, Page,
+        x(4), ('Grade', H), ('RollingResistance', B))),
+  ('FE_Capabilities',           'FE',      54,  sc.no_alignment, (Channel, Page,
+        ('Reserved1', B), ('Reserved2', B), ('Reserved3', B), ('Reserved4', B),
+        ('MaximumResistance', H), ('CapabilitiesBits', B))),
+  ('FE_UserConfiguration',      'FE',      55,  sc.no_alignment, (Channel, Page,
+        ('UserWeight', H), x(1), ('BicycleInfo', H),
+        ('BicycleWheelDiameter', B), ('GearRatio', B))),
+  ('FE_CommandStatus',          'FE',      71,  sc.no_alignment, (Channel, Page,
+        ('LastReceivedCommandID', B), ('SequenceNr', B), ('CommandStatus', B),
+        ('Data1', B), ('Data2', B), ('Data3', B), ('Data4', B))),
+
+  ('Common_RequestDataPage',    'Common',  70,  sc.no_alignment, (Channel, Page,
+        ('SlaveSerialNumber', H), ('DescriptorByte1', B), ('DescriptorByte2', B),
+        ('ReqTransmissionResp', B), ('RequestedPageNumber', B), ('CommandType', B))),
+  ('Common_ManufacturerInfo',   'Common',  80,  sc.no_alignment, (Channel, Page,
+        ('Reserved1', B), ('Reserved2', B), ('HWrevision', B),
+        ('ManufacturerID', H), ('ModelNumber', H))),
+  ('Common_ProductInformation', 'Common',  81,  sc.no_alignment, (Channel, Page,
+        ('Reserved1', B), ('SWrevisionSupp', B), ('SWrevisionMain', B),
+        ('SerialNumber', I))),
+  ('Common_BatteryStatus',      'Common',  82,  sc.no_alignment, (Channel, Page,
+        ('Reserved1', B), ('BatteryIdentifier', B), ('CumulativeTime1', B),
+        ('CumulativeTime2', B), ('CumulativeTime3', B), ('BatteryVoltage', B),
+        ('DescriptiveBitField', B))),
+
+  ('HRM_HeartRate',             'HRM',   None,  sc.no_alignment, (Channel, Page,
+        ('Spec1', B), ('Spec2', B), ('Spec3', B), ('HeartBeatEventTime', H),
+        ('HeartBeatCount', B), ('HeartRate', B))),          # Pages 0...4
+
+  ('PWR_PowerOnly',             'PWR',     16,  sc.no_alignment, (Channel, Page,
+        ('EventCount', B), ('PedalPower', B), ('InstantaneousCadence', B),
+        ('AccumulatedPower', H), ('InstantaneousPower', H))),
+
+  ('SCS_SpeedCadence',          'SCS',   None,  sc.no_alignment, (Channel,
+        ('CadenceEventTime', H), ('CadenceRevolutionCount', H),
+        ('SpeedEventTime', H), ('SpeedRevolutionCount', H))),   # No page number
+
+  ('VTX_DataSpeed',             'VTX',      0,  sc.big_endian,   (Channel, Page,
+        ('Power', H), ('Speed', H), x(2), ('Cadence', B))), # Power incl. flags
+  ('VTX_DataSerial',            'VTX',      1,  sc.big_endian,   (Channel, Page,
+        ('S1', B), ('S2', B), ('S3', B), ('Serial', H), ('Alarm', H))),
+  ('VTX_DataVersion',           'VTX',      2,  sc.big_endian,   (Channel, Page,
+        x(3), ('Major', B), ('Minor', B), ('Build', H))),
+  ('VTX_DataCalibration',       'VTX',      3,  sc.big_endian,   (Channel, Page,
+        x(4), ('Calibration', B), ('VortexID', H))),
+  ('VTX_Command',               'VTX',     16,  sc.big_endian,   (Channel, Page,
+        ('VortexID', H), ('Command', B), ('Subcommand', B),
+        ('CalibrationValue', B), ('Power', H))),
+
+  ('VHU_StayAlive',             'VHU',   None,  sc.big_endian,   (Channel,
+        x(8))),
+  ('VHU_ChangeHeadunitMode',    'VHU',    172,  sc.big_endian,   (Channel, Page,
+        ('Command', B), ('Mode', B), x(5))),
+  ('VHU_ButtonPressed',         'VHU',    221,  sc.big_endian,   (Channel, Page,
+        ('Command', B), ('Button', B), x(4), ('Count', B))),
+)
+
+#-------------------------------------------------------------------------------
+# c l s P a g e C o d e c
+#-------------------------------------------------------------------------------
+# The compiled entry of the schema:
+#   pack(values...)     returns info (bytes); values for all named fields,
+#                       in the order of the schema
+#   unpack(info)        returns a named tuple; fields in the order of the
+#                       schema, so can be unpacked as a plain tuple
+#   Struct, Tuple       the struct.Struct and named tuple class
+#-------------------------------------------------------------------------------
+class clsPageCodec():
+    def __init__(self, Name, Profile, Page, ByteOrder, Fields):
+        self.Name    = Name
+        self.Profile = Profile
+        self.Page    = Page
+        self.ByteOrder = ByteOrder
+        self.Layout  = Fields
+        self.Fields  = tuple(f for f, _ in Fields if f)
+        self.Struct  = struct.Struct(ByteOrder + ''.join(fmt for _, fmt in Fields))
+        self.Tuple   = collections.namedtuple(Name, self.Fields)
+        self.size    = self.Struct.size
+
+        self.pack    = self.Struct.pack                 # No extra call level
+        make         = self.Tuple._make
+        unpack       = self.Struct.unpack
+        self.unpack  = lambda info: make(unpack(info))
+
+    def __repr__(self):
+        return 'clsPageCodec(%s, page=%s, %s)' % (self.Name, self.Page, self.Struct.format)
+
+#-------------------------------------------------------------------------------
+# Compile the schema
+# Codecs        {Name: codec}
+# ByPage        {(Profile, Page): codec}
+#-------------------------------------------------------------------------------
+Codecs = {}
+ByPage = {}
+for _entry in Schema:
+    _codec = clsPageCodec(*_entry)
+    Codecs[_codec.Name] = _codec
+    if _codec.Page != None:
+        ByPage[(_codec.Profile, _codec.Page)] = _codec
+
+#-------------------------------------------------------------------------------
+# The codecs by name, as antPages.<Name>; bound explicitly so that the names
+# are known to pyflakes and the IDE. Checked against the schema in the test.
+#-------------------------------------------------------------------------------
+FE_GeneralFEdata          = Codecs['FE_GeneralFEdata']
+FE_TrainerData            = Codecs['FE_TrainerData']
+FE_BasicResistance        = Codecs['FE_BasicResistance']
+FE_TargetPower            = Codecs['FE_TargetPower']
+FE_WindResistance         = Codecs['FE_WindResistance']
+FE_TrackResistance        = Codecs['FE_TrackResistance']
+FE_Capabilities           = Codecs['FE_Capabilities']
+FE_UserConfiguration      = Codecs['FE_UserConfiguration']
+FE_CommandStatus          = Codecs['FE_CommandStatus']
+Common_RequestDataPage    = Codecs['Common_RequestDataPage']
+Common_ManufacturerInfo   = Codecs['Common_ManufacturerInfo']
+Common_ProductInformation = Codecs['Common_ProductInformation']
+Common_BatteryStatus      = Codecs['Common_BatteryStatus']
+HRM_HeartRate             = Codecs['HRM_HeartRate']
+PWR_PowerOnly             = Codecs['PWR_PowerOnly']
+SCS_SpeedCadence          = Codecs['SCS_SpeedCadence']
+VTX_DataSpeed             = Codecs['VTX_DataSpeed']
+VTX_DataSerial            = Codecs['VTX_DataSerial']
+VTX_DataVersion           = Codecs['VTX_DataVersion']
+VTX_DataCalibration       = Codecs['VTX_DataCalibration']
+VTX_Command               = Codecs['VTX_Command']
+VHU_StayAlive             = Codecs['VHU_StayAlive']
+VHU_ChangeHeadunitMode    = Codecs['VHU_ChangeHeadunitMode']
+VHU_ButtonPressed         = Codecs['VHU_ButtonPressed']
+
+#-------------------------------------------------------------------------------
+# L o o k u p
+#-------------------------------------------------------------------------------
+# input         Profile, Page
+#
+# function      Find the codec for a received data page
+#
+# returns       codec, None if not defined
+#-------------------------------------------------------------------------------
+def Lookup(Profile, Page):
+    return ByPage.get((Profile, Page), None)
+
+#-------------------------------------------------------------------------------
+# c l s B r o a d c a s t F r a m e
+#-------------------------------------------------------------------------------
+# A complete ANT message (synch, length, id, info, checksum) in a preallocated
+# buffer, for the pages a master channel broadcasts every quarter second:
+# - the message is encoded once, with the values provided on creation
+# - the Dynamic fields (contiguous in the layout) are patched in place by
+#   Patch(); the checksum is updated from the xor of the static bytes, which
+#   is calculated once, and the xor of the patched bytes.
+# - a frame without Dynamic fields (manufacturer, product, battery) is
+#   never encoded again.
+#
+# The returned bytearray is reused on the next Patch(), so must be written
+# to the dongle before; as done in the main loop.
+#
+# input         MessageID   e.g. msgID_BroadcastData
+#               Codec       the page layout
+#               Dynamic     the names of the fields to be patched
+#               Values      the values of the other fields (default 0)
+#-------------------------------------------------------------------------------
+class clsBroadcastFrame():
+    def __init__(self, MessageID, Codec, Dynamic = (), **Values):
+        assert set(Values) <= set(Codec.Fields), Values
+        Header      = antFrames.Overhead - 1            # synch, length, id
+        self.Codec  = Codec
+        self.Frame  = bytearray(antFrames.Overhead + Codec.size)
+        self.Frame[0:Header] = bytes((antFrames.Synch, Codec.size, MessageID))
+        Codec.Struct.pack_into(self.Frame, Header, *[Values.get(f, 0) for f in Codec.Fields])
+
+        #-----------------------------------------------------------------------
+        # The byte-range of the dynamic fields
+        #-----------------------------------------------------------------------
+        Offset = Header
+        Start  = End = None
+        Format = ''
+        for name, fmt in Codec.Layout:
+            size = struct.calcsize(Codec.ByteOrder + fmt)
+            if name in Dynamic:
+                assert End in (None, Offset), "Dynamic fields must be contiguous"
+                if Start == None: Start = Offset
+                End     = Offset + size
+                Format += fmt
+            Offset += size
+
+        if Dynamic:
+            self.Offset   = Start
+            self.Struct   = struct.Struct(Codec.ByteOrder + Format)
+            self.Span     = memoryview(self.Frame)[Start:End]
+            self.StaticXor= antFrames.Xor(self.Frame[:-1]) ^ antFrames.Xor(self.Span)
+        self.Frame[-1]    = antFrames.Xor(self.Frame[:-1])
+
+    #---------------------------------------------------------------------------
+    # P a t c h
+    #---------------------------------------------------------------------------
+    # input         values of the Dynamic fields, in the order of the layout
+    #
+    # returns       the frame (bytearray)
+    #---------------------------------------------------------------------------
+    def Patch(self, *values):
+        self.Struct.pack_into(self.Frame, self.Offset, *values)
+        self.Frame[-1] = self.StaticXor ^ antFrames.Xor(self.Span)
+        return self.Frame
+
+#-------------------------------------------------------------------------------
+# Main program to test the previous functions
+#-------------------------------------------------------------------------------
+if __name__ == "__main__":
+    import time
+
+    #---------------------------------------------------------------------------
+    # All layouts are one ANT message: channel + 8 bytes
+    #---------------------------------------------------------------------------
+    for name, codec in Codecs.items():
+        assert codec.size == 9, codec
+        assert globals().get(name) is codec, name    # Bound above
+    print ('%s codecs compiled' % len(Codecs))
+
+    #---------------------------------------------------------------------------
+    # The functions as they were in antDongle before
+    #---------------------------------------------------------------------------
+    def msgPage25_TrainerData(Channel, EventCounter, Cadence, AccumulatedPower, CurrentPower):
+        DataPageNumber      = 25
+        Flags               = 0x30
+        fChannel            = sc.unsigned_char
+        fDataPageNumber     = sc.unsigned_char
+        fEvent              = sc.unsigned_char
+        fCadence            = sc.unsigned_char
+        fAccPower           = sc.unsigned_short
+        fInstPower          = sc.unsigned_short
+        fFlags              = sc.unsigned_char
+        format=    sc.no_alignment + fChannel + fDataPageNumber + fEvent +      fCadence + fAccPower +       fInstPower +  fFlags
+        return struct.pack (format,  Channel,   DataPageNumber,   EventCounter, Cadence,   AccumulatedPower, CurrentPower, Flags)
+
+    def msgUnpage51_TrackResistance(info):
+        fChannel            = sc.unsigned_char
+        fDataPageNumber     = sc.unsigned_char
+        fReserved           = sc.pad * 4
+        fGrade              = sc.unsigned_short
+        fRollingResistance  = sc.unsigned_char
+        format = sc.no_alignment + fChannel + fDataPageNumber + fReserved + fGrade + fRollingResistance
+        tuple  = struct.unpack (format, info)
+        return tuple[2], tuple[3]
+
+    def ComposeMessage(id, info):
+        format  = sc.no_alignment + sc.unsigned_char + sc.unsigned_char + sc.unsigned_char + str(len(info)) + sc.char_array
+        data    = struct.pack (format, 0xa4, len(info), id, info)
+        xor_value = 0
+        for i in range (0, len(data)):
+            xor_value = xor_value ^ data[i]
+        return data + bytes([xor_value])
+
+    #---------------------------------------------------------------------------
+    # Test: identical results
+    #---------------------------------------------------------------------------
+    info = FE_TrainerData.pack(0, 25, 12, 90, 4000, 250, 0x30)
+    assert info == msgPage25_TrainerData(0, 12, 90, 4000, 250)
+    t    = FE_TrackResistance.unpack(b'\x00\x33\xff\xff\xff\xff\x20\x4f\x50')
+    assert (t.Grade, t.RollingResistance) == msgUnpage51_TrackResistance(b'\x00\x33\xff\xff\xff\xff\x20\x4f\x50')
+    assert Lookup('FE', 51) is FE_TrackResistance
+
+    Frame = clsBroadcastFrame(0x4e, FE_TrainerData, ('EventCounter', 'Cadence', \
+                'AccumulatedPower', 'CurrentPower'), DataPageNumber=25, Flags=0x30)
+    for v in ((12, 90, 4000, 250), (13, 91, 4250, 0), (255, 0, 65535, 4093)):
+        assert Frame.Patch(*v) == ComposeMessage(0x4e, msgPage25_TrainerData(0, *v))
+
+    #---------------------------------------------------------------------------
+    # Benchmark, best of 5 runs
+    #---------------------------------------------------------------------------
+    def Benchmark(Name, Old, New, N = 100000):
+        rtn = []
+        for function in (Old, New):
+            Best = None
+            for _ in range(5):
+                start = time.monotonic()
+                for _ in range(N): function()
+                elapsed = time.monotonic() - start
+                Best = elapsed if Best == None else min(Best, elapsed)
+            rtn.append(Best * 1e6 / N)
+        print ('%-22s: before %5.2fus, schema %5.2fus (%3.1fx)' % (Name, rtn[0], rtn[1], rtn[0] / rtn[1]))
+
+    Benchmark('encode page 25',  lambda: msgPage25_TrainerData(0, 12, 90, 4000, 250), \
+                                 lambda: FE_TrainerData.pack(0, 25, 12, 90, 4000, 250, 0x30))
+    Benchmark('broadcast page 25',lambda: ComposeMessage(0x4e, msgPage25_TrainerData(0, 12, 90, 4000, 250)), \
+                                 lambda: Frame.Patch(12, 90, 4000, 250))
+    Benchmark('compose message',  lambda: ComposeMessage(0x4e, info), \
+                                 lambda: antFrames.Compose(0x4e, info))
+    Benchmark('decode page 51',  lambda: msgUnpage51_TrackResistance(info), \
+                                 lambda: FE_TrackResistance.unpack(info))
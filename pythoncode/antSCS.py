@@ -1,14 +1,24 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2020-06-16"
+__version__ = "2026-10-18"
+# 2026-10-18    Message is a preallocated frame, patched in place
 # 2020-06-16    Modified: device-by-zero due to zero Cadence/SpeedKmh
 # 2020-06-09    First version, based upon antHRM.py
 #-------------------------------------------------------------------------------
 import time
 import antDongle         as ant
+import antPages
 import logfile
 
+#-------------------------------------------------------------------------------
+# The frame broadcasted on channel_SCS
+#-------------------------------------------------------------------------------
+SpeedCadence = antPages.clsBroadcastFrame(ant.msgID_BroadcastData, antPages.SCS_SpeedCadence,
+                        ('CadenceEventTime', 'CadenceRevolutionCount',
+                         'SpeedEventTime', 'SpeedRevolutionCount'),
+                        Channel=ant.channel_SCS)
+
 def Initialize():
     global PedalEchoPreviousCount, CadenceEventTime, CadenceEventCount, SpeedEventTime, SpeedEventCount
     PedalEchoPreviousCount = 0               # There is no previous
@@ -66,8 +76,10 @@ def BroadcastMessage (_PedalEchoTime, PedalEchoCount, SpeedKmh, Cadence):
     #-------------------------------------------------------------------------
     # Compose message
     #-------------------------------------------------------------------------
-    info    = ant.msgPage_SCS (ant.channel_SCS, CadenceEventTime, CadenceEventCount, SpeedEventTime, SpeedEventCount)
-    scsdata = ant.ComposeMessage (ant.msgID_BroadcastData, info)
+    scsdata = SpeedCadence.Patch(int(min(0xffff, CadenceEventTime )), \
+                                 int(min(0xffff, CadenceEventCount)), \
+                                 int(min(0xffff, SpeedEventTime   )), \
+                                 int(min(0xffff, SpeedEventCount  )))
 
     #-------------------------------------------------------------------------
     # Return message to be sent
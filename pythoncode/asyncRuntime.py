@@ -0,0 +1,170 @@
+#-------------------------------------------------------------------------------
+# Version info
+#-------------------------------------------------------------------------------
+__version__ = "2026-10-18"
+# 2026-10-18    First version; asyncio runtime for FortiusAntBody (--Asyncio)
+#-------------------------------------------------------------------------------
+import asyncio
+import concurrent.futures
+import time
+
+import scheduler
+
+#-------------------------------------------------------------------------------
+# c l s A s y n c R u n t i m e
+#-------------------------------------------------------------------------------
+# The main loop of FortiusAntBody does everything in sequence; when the GUI
+# pipe or the disk is slow, the next trainer refresh is late.
+#
+# In this runtime each activity is a coroutine:
+# - Periodic(Name, Period, Function) is called every Period seconds, on the
+#   absolute deadlines of scheduler.clsScheduler; Function may be a coroutine
+# - Add(Coroutine) is an event-driven coroutine, e.g. waiting for ANT data
+#
+# Blocking I/O is done in executors, each one thread, so that the order of the
+# USB- or ANT-transfers is kept:
+# - await RunInExecutor(Executor, Function, *args) when the result is needed
+# - Offload(Executor, Function, *args) for slow consumers (GUI, logfile);
+#   when the previous job is not finished yet, the job is dropped (counted)
+#   so a slow consumer never delays the other coroutines.
+#
+# The coroutines run until Running() returns False, or one of them fails;
+# the exception is raised by Run().
+#-------------------------------------------------------------------------------
+class clsAsyncRuntime():
+    def __init__(self, Running):
+        self.Running    = Running               # Function; stop when False
+        self.Scheduler  = scheduler.clsScheduler()
+        self.Coroutines = []
+        self.Executors  = {}                    # Name -> ThreadPoolExecutor
+        self.Pending    = {}                    # Name -> Future of Offload()
+        self.Dropped    = {}                    # Name -> number of dropped jobs
+
+    #---------------------------------------------------------------------------
+    # E x e c u t o r
+    #---------------------------------------------------------------------------
+    # input         Name            e.g. 'Trainer', 'AntDongle', 'GUI'
+    #
+    # returns       the executor (one thread) with that name
+    #---------------------------------------------------------------------------
+    def Executor(self, Name):
+        if Name not in self.Executors:
+            self.Executors[Name] = concurrent.futures.ThreadPoolExecutor(1, Name)
+            self.Dropped[Name]   = 0
+        return self.Executors[Name]
+
+    #---------------------------------------------------------------------------
+    # R u n I n E x e c u t o r
+    #---------------------------------------------------------------------------
+    # returns       awaitable for the result of Function(*args)
+    #---------------------------------------------------------------------------
+    def RunInExecutor(self, Name, Function, *args):
+        return asyncio.get_running_loop().run_in_executor(self.Executor(Name), Function, *args)
+
+    #---------------------------------------------------------------------------
+    # O f f l o a d
+    #---------------------------------------------------------------------------
+    # returns       True if the job is started, False if dropped
+    #---------------------------------------------------------------------------
+    def Offload(self, Name, Function, *args):
+        Executor = self.Executor(Name)
+        Pending  = self.Pending.get(Name)
+        if Pending and not Pending.done():
+            self.Dropped[Name] += 1
+            return False
+        self.Pending[Name] = Executor.submit(Function, *args)
+        return True
+
+    #---------------------------------------------------------------------------
+    # P e r i o d i c   a n d   A d d
+    #---------------------------------------------------------------------------
+    def Periodic(self, Name, Period, Function):
+        Task = self.Scheduler.AddTask(Name, Period)
+        self.Coroutines.append(self.__Periodic(Task, Function))
+        return Task
+
+    def Add(self, Coroutine):
+        self.Coroutines.append(Coroutine)
+
+    async def __Periodic(self, Task, Function):
+        while self.Running():
+            await self.Scheduler.WaitAsync([Task])
+            if self.Scheduler.Due([Task]):
+                rtn = Function()
+                if asyncio.iscoroutine(rtn):
+                    await rtn
+
+    #---------------------------------------------------------------------------
+    # R u n
+    #---------------------------------------------------------------------------
+    # function      Run all coroutines until Running() is False; then wait for
+    #               the executors to finish their jobs
+    #
+    # returns       none
+    #---------------------------------------------------------------------------
+    def Run(self):
+        try:
+            asyncio.run(self.__Main())
+        finally:
+            for Executor in self.Executors.values():
+                Executor.shutdown(wait=True)
+
+    async def __Main(self):
+        Tasks = [asyncio.ensure_future(c) for c in self.Coroutines]
+        while self.Running():
+            Done, _ = await asyncio.wait(Tasks, timeout=0.1, \
+                                         return_when=asyncio.FIRST_EXCEPTION)
+            if any([t.exception() for t in Done]):
+                break
+        for t in Tasks:
+            t.cancel()
+        for rtn in await asyncio.gather(*Tasks, return_exceptions=True):
+            if isinstance(rtn, Exception):
+                raise rtn
+
+    #---------------------------------------------------------------------------
+    # S t a t i s t i c s
+    #---------------------------------------------------------------------------
+    def Statistics(self):
+        rtn = "Asyncio runtime; " + self.Scheduler.Statistics()
+        for Name in self.Dropped:
+            if self.Dropped[Name]:
+                rtn += "\n    %-14s %s jobs dropped, executor busy" % (Name, self.Dropped[Name])
+        return rtn
+
+#-------------------------------------------------------------------------------
+# Main program to test the previous functions
+#-------------------------------------------------------------------------------
+if __name__ == "__main__":
+    #---------------------------------------------------------------------------
+    # Test: a slow consumer (300ms per job) does not delay the fast task
+    #---------------------------------------------------------------------------
+    StartTime = time.monotonic()
+    Runtime   = clsAsyncRuntime(lambda: time.monotonic() - StartTime < 2)
+    Slow      = []
+    Fast      = Runtime.Periodic('Fast', 0.02,  lambda: None)
+    Consumer  = Runtime.Periodic('Consumer', 0.1, \
+                    lambda: Runtime.Offload('Slow', lambda: Slow.append(time.sleep(0.3))))
+
+    async def Transfer():
+        return await Runtime.RunInExecutor('Usb', time.sleep, 0.01)
+    Usb       = Runtime.Periodic('Usb', 0.05, Transfer)
+
+    Runtime.Run()
+    print (Runtime.Statistics())
+    assert Fast.Overruns == 0 and Usb.Overruns == 0, (Fast.Overruns, Usb.Overruns)
+    assert 6 <= len(Slow) <= 8 and Runtime.Dropped['Slow'] >= 12, (len(Slow), Runtime.Dropped)
+
+    #---------------------------------------------------------------------------
+    # Test: an exception in a coroutine stops the runtime and is raised
+    #---------------------------------------------------------------------------
+    def Fails():
+        raise ValueError('Coroutine failed')
+    Runtime = clsAsyncRuntime(lambda: True)
+    Runtime.Periodic('Fails', 0.1, Fails)
+    try:
+        Runtime.Run()
+        assert False, 'Exception expected'
+    except ValueError as e:
+        print ('Raised:', e)
+    print ('Tests passed')
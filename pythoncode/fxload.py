@@ -1,9 +1,21 @@
 #!/usr/bin/python3
 
+# 2026-10-18 Firmware image parsed once and cached (merged records);
+#            waitForDevice() polls for re-enumeration after upload
+# 2026-10-18 Image cached in a per-user folder, written atomically and
+#            verified (sha256 of the hex-file and length); waitForDevice()
+#            also accepts the device at the same bus-address
+# 2026-10-18 waitForDisconnect(); the device at the same bus-address may answer
+#            before it has disconnected
+
 # pip3 install pyusb
 
 import usb.core
 import usb.util
+import hashlib
+import os
+import struct
+import tempfile
 import time
 import optparse
 
@@ -81,6 +93,132 @@ def writeEzusbVendor_RwInternal(device, addr, data):
 
     assert device.ctrl_transfer(usb.util.CTRL_TYPE_VENDOR | usb.util.CTRL_OUT | usb.util.CTRL_RECIPIENT_DEVICE, EZUSB_RW_INTERNAL, addr, 0, data, timeout = 1000) == len(data)
     
+# Firmware image cache
+# ====================
+#
+# Parsing the Intel-hex file (and sending one control transfer per record) is
+# done once per firmware file. The parsed image is a list of (address, data)
+# segments where contiguous records are merged, up to MAXTRANSFER bytes per
+# control transfer (same limit as fxload/ezusb.c uses for internal memory).
+#
+# The image is cached in memory and as binary blob in a per-user cache-folder,
+# keyed by the sha256 of the hex-file; so a changed file is parsed again.
+# The blob is written to a temporary file that is renamed, so that a blob is
+# never seen half-written.
+#
+# Blob format, little-endian:
+#   header          <magic:4><sha256 of hex-file:32><length of segments:4>
+#   per segment     <address:2><length:2><data:length>
+# A blob that does not match the hex-file, or is inconsistent, is ignored and
+# the hex-file is parsed.
+
+MAXTRANSFER = 1023
+
+_imageCache = {}
+
+_blobMagic  = b'FXL1'
+_blobHeader = struct.Struct('<4s32sI')
+
+def _cacheFolder():
+    base = os.environ.get('LOCALAPPDATA') or os.environ.get('XDG_CACHE_HOME') or \
+           os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'FortiusANT')
+
+def _blobFilename(digest):
+    return os.path.join(_cacheFolder(), 'fxload-%s.bin' % digest.hex())
+
+def _segmentsToBlob(digest, segments):
+    data = b''.join([struct.pack('<HH', address, len(data)) + bytes(data) for address, data in segments])
+    return _blobHeader.pack(_blobMagic, digest, len(data)) + data
+
+def _blobToSegments(digest, blob):
+    magic, blobDigest, length = _blobHeader.unpack_from(blob, 0)
+    i = _blobHeader.size
+    if magic != _blobMagic or blobDigest != digest or length != len(blob) - i:
+        raise ValueError("Firmware cache does not match")
+
+    segments = []
+    while i < len(blob):
+        address, length = struct.unpack_from('<HH', blob, i)
+        if i + 4 + length > len(blob):
+            raise ValueError("Firmware cache truncated")
+        segments.append( (address, blob[i+4:i+4+length]) )
+        i += 4 + length
+    return segments
+
+def _writeBlob(blobname, blob):
+    folder = os.path.dirname(blobname)
+    os.makedirs(folder, mode=0o700, exist_ok=True)
+    fd, tmpname = tempfile.mkstemp(dir=folder, prefix='fxload-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(blob)
+        os.replace(tmpname, blobname)
+    except Exception:
+        os.remove(tmpname)
+        raise
+
+def parseHexFirmware(lines, maxsize):
+    segments = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        assert line[0] == ':'
+
+        bytecount = int( line[1:3], 16 )
+        address   = int( line[3:7], 16 )
+        rec_type  = int( line[7:9], 16 )
+        check     = int( line[-2:], 16 )
+        data = bytearray.fromhex(line[9:9+2*bytecount])
+
+        cks = ~(bytecount+(address>>8)+address+rec_type+sum(data))+1
+        if(cks & 0xff != check):
+            raise ValueError("Checksum wrong")
+
+        if rec_type == 0x01:
+            break
+        if bytecount == 0x00:
+            continue
+
+        assert address + bytecount <= maxsize
+
+        # merge with previous segment if contiguous
+        if segments:
+            prev_address, prev_data = segments[-1]
+            if prev_address + len(prev_data) == address and len(prev_data) + bytecount <= MAXTRANSFER:
+                prev_data.extend(data)
+                continue
+        segments.append( (address, data) )
+    return segments
+
+def getFirmwareImage(filename, maxsize):
+    with open(filename, 'rb') as file:
+        content = file.read()
+    digest = hashlib.sha256(content).digest()
+
+    if digest in _imageCache:
+        return _imageCache[digest]
+
+    segments = None
+    blobname = _blobFilename(digest)
+    try:
+        with open(blobname, 'rb') as blob:
+            segments = _blobToSegments(digest, blob.read())
+        print('....Firmware image from cache %s' % blobname)
+    except Exception:
+        pass                                    # absent, or parse hex-file
+
+    if segments is None:
+        segments = parseHexFirmware(content.decode('ascii').splitlines(), maxsize)
+        try:
+            _writeBlob(blobname, _segmentsToBlob(digest, segments))
+        except Exception:
+            pass                                    # cache is optional
+
+    _imageCache[digest] = segments
+    return segments
+
 def loadHexFirmware(device, filename):
 
     # MAXSIZE_DEFAULT = 0x1b40
@@ -93,36 +231,60 @@ def loadHexFirmware(device, filename):
     startCPU = bytes([0x00])
 
     print('Load firmware %s for %s' % (filename, device2name(device)))
-    with open(filename, 'r') as file:
-        # bmRequestType, bmRequest, wValue and wIndex
-        print('....Stop CPU')
-        writeEzusbVendor_RwInternal(device, cpucs_addr, stopCPU)
+    segments = getFirmwareImage(filename, MAXSIZE)
 
-        for line in file:
-            assert line[0] == ':'
+    # bmRequestType, bmRequest, wValue and wIndex
+    print('....Stop CPU')
+    writeEzusbVendor_RwInternal(device, cpucs_addr, stopCPU)
 
-            bytecount = int( line[1:3], 16 )
-            address   = int( line[3:7], 16 )
-            rec_type  = int( line[7:9], 16 )
-            # bighex = 0 if bytecount == 0 else int( line[9:-3], 16 )
-            check     = int( line[-3:], 16 )
-            data = bytearray([ int( line[i:i+2], 16 ) for i in range(9, len(line)-4, 2) ])
-
-            cks = ~(bytecount+(address>>8)+address+rec_type+sum(data))+1
-            if(cks & 0xff != check):
-                raise ValueError("Checksum wrong")
-
-            if rec_type == 0x01:
-                break
-            if bytecount == 0x00:
-                continue
+    for address, data in segments:
+        writeEzusbVendor_RwInternal(device, address, data)
 
-            assert address + bytecount <= MAXSIZE            
-            writeEzusbVendor_RwInternal(device, address, data)
-
-        print('....Start CPU')
-        writeEzusbVendor_RwInternal(device, cpucs_addr, startCPU)
+    print('....Start CPU')
+    writeEzusbVendor_RwInternal(device, cpucs_addr, startCPU)
 
+# Re-enumeration
+# ==============
+#
+# After firmware upload the device disconnects and re-connects, possibly with
+# another product ID (e.g. e6be -> 1942). Instead of waiting a fixed time, the
+# bus is polled until the device is back and answers a GET_STATUS request; it
+# may come back at the same bus/address (e.g. the T1902 remains 1902).
+#
+# When the product ID remains the same, the old device may still answer
+# before it disconnects; then first waitForDisconnect() until the device is
+# no longer enumerated at its bus/address (gone, or back at another address).
+#
+# waitForDisconnect() returns False after timeout (perhaps the disconnect was
+# too short to be noticed); waitForDevice() returns the device, or None after
+# timeout.
+
+def deviceAnswers(device):
+    GET_STATUS = 0x00
+    try:
+        device.ctrl_transfer(usb.util.CTRL_TYPE_STANDARD | usb.util.CTRL_IN | usb.util.CTRL_RECIPIENT_DEVICE, GET_STATUS, 0, 0, 2, timeout = 100)
+    except Exception:
+        return False
+    return True
+
+def waitForDisconnect(device, timeout=2, interval=0.01):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        devices = usb.core.find(find_all=True, idVendor=device.idVendor, idProduct=device.idProduct)
+        if not [ d for d in devices if (d.bus, d.address) == (device.bus, device.address) ]:
+            return True
+        time.sleep(interval)
+    return False
+
+def waitForDevice(idVendor, idProduct, timeout=10, interval=0.1):
+    deadline = time.monotonic() + timeout
+    while True:
+        time.sleep(interval)
+        devices = usb.core.find(find_all=True, idVendor=idVendor, idProduct=idProduct)
+        devices = [ d for d in devices if deviceAnswers(d) ]
+        if devices or time.monotonic() > deadline:
+            break
+    return devices[0] if devices else None
 
 
 def ihxSplitTo1(filename):
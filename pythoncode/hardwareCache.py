@@ -0,0 +1,97 @@
+#-------------------------------------------------------------------------------
+# Version info
+#-------------------------------------------------------------------------------
+__version__ = "2026-10-18"
+# 2026-10-18    First version; identity of headunit, brake and ANT-dongle as
+#               probed during a previous start
+#-------------------------------------------------------------------------------
+import json
+
+import debug
+import logfile
+
+#-------------------------------------------------------------------------------
+# The hardware cache
+#-------------------------------------------------------------------------------
+# A small json-file, in the same folder as the logfiles, containing:
+#   "Headunit": { DeviceKey: {DeviceSerial, MotorBrakeUnitType, ...,
+#                             Calibrate, CalibrateTime} }
+#   "Dongle":   { "Last":    {Key, idProduct} }
+#
+# DeviceKey identifies the USB-port the device is connected to (vendor,
+# product, bus and port path).
+# The headunit serial is stored in the entry and must be verified by the user
+# of the cache, so that another headunit on the same port is not mistaken; the
+# motor brake behind it is verified after start (usbTrainer).
+# The dongle entry has no serial; it's only the first dongle to try, which is
+# verified by opening it.
+#
+# The cache is an optimization only; when absent or corrupt it's ignored.
+#-------------------------------------------------------------------------------
+CacheFile           = 'FortiusAnt.hardware.json'
+CalibrateValidity   = 30 * 60       # seconds a calibration value is reused
+
+Cache               = None
+
+def __Load():
+    global Cache
+    if Cache == None:
+        try:
+            with open(CacheFile, 'r') as f:
+                Cache = json.load(f)
+        except Exception:
+            Cache = {}
+    return Cache
+
+def __Save():
+    try:
+        with open(CacheFile, 'w') as f:
+            json.dump(Cache, f, indent=1)
+    except Exception as e:
+        logfile.Console("Hardware cache cannot be saved: %s" % e)
+
+#-------------------------------------------------------------------------------
+# D e v i c e K e y
+#-------------------------------------------------------------------------------
+# input         pyusb device
+#
+# function      Compose key from USB bus path
+#
+# returns       'vvvv:pppp@bus-port.port', None if not a real USB-device
+#               (e.g. emulated or replayed)
+#-------------------------------------------------------------------------------
+def DeviceKey(dev):
+    try:
+        ports = '.'.join([str(p) for p in (dev.port_numbers or ())])
+        rtn   = '%04x:%04x@%s-%s' % (dev.idVendor, dev.idProduct, dev.bus, ports)
+    except Exception:
+        rtn   = None
+    return rtn
+
+#-------------------------------------------------------------------------------
+# G e t ,   P u t
+#-------------------------------------------------------------------------------
+# input         Section ("Headunit", "Dongle"), Key, Values (dictionary)
+#
+# function      Get entry from cache / Add values to entry and save cache
+#
+# returns       Get: dictionary, None if not found
+#-------------------------------------------------------------------------------
+def Get(Section, Key):
+    rtn = None
+    if Key != None:
+        rtn = __Load().get(Section, {}).get(Key, None)
+    if debug.on(debug.Function):
+        logfile.Write ("hardwareCache.Get(%s, %s) returns %s" % (Section, Key, rtn))
+    return rtn
+
+def Put(Section, Key, Values):
+    if Key != None:
+        __Load().setdefault(Section, {}).setdefault(Key, {}).update(Values)
+        __Save()
+
+#-------------------------------------------------------------------------------
+# Main program to test the previous functions
+#-------------------------------------------------------------------------------
+if __name__ == "__main__":
+    print (json.dumps(__Load(), indent=1))
@@ -1,7 +1,9 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2020-11-25"
+__version__ = "2026-10-18"
+# 2026-10-18    AutoFlush and Flush() added; in the Tacx2Dongle loop flushing
+#               is a scheduled task, not done on every Write()
 # 2020-11-25    Small textual modifications (time->Time)
 #               .utcnow() replaced by .now()
 # 2020-11-19    json PedalEcho added and time-format made JAVA-style
@@ -167,6 +169,22 @@ def Print(*objects, sep=' ', end='\n'):
 #
 # Refer https://strftime.org/ for format codes
 # hh:mm:ss,ddd is 12 characters (%f for microseconds provides 6 digits)
+#-------------------------------------------------------------------------------
+# When AutoFlush is set, Write() flushes stdout and the logfile after each
+# record. Time-critical loops set AutoFlush = False and call Flush() periodically.
+#-------------------------------------------------------------------------------
+AutoFlush = True
+
+def Flush():
+    sys.stdout.flush()
+    try:
+        if debug.on():
+            fLogfile.flush()
+            if debug.on(debug.LogfileJson):
+                LogfileJson.jsonFile.flush()
+    except:
+        pass
+
 #-------------------------------------------------------------------------------
 # In the beginning, Write() replaced print() AND writes all printed messages to
 # logfile. Then Write() was used to fill the logfile, taking for granted that
@@ -181,7 +199,7 @@ def Console (logText):
 def Write (logText, console=False):
     logText = datetime.now().strftime('%H:%M:%S,%f')[0:12] + ": " + logText
     if console: print (logText)
-    sys.stdout.flush()
+    if AutoFlush: sys.stdout.flush()
 
     if debug.on():
         try:
@@ -192,7 +210,7 @@ def Write (logText, console=False):
     try:
         if debug.on():
             fLogfile.write(logText + "\n")         # \r\n
-            fLogfile.flush()
+            if AutoFlush: fLogfile.flush()
     except:
 #       print ("logfile.Write (" + logText + ") called, but logfile is not opened.")
         pass
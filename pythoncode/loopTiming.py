@@ -0,0 +1,168 @@
+#-------------------------------------------------------------------------------
+# Version info
+#-------------------------------------------------------------------------------
+__version__ = "2026-10-18"
+# 2026-10-18    First version; duration per phase of the Tacx2Dongle and Runoff
+#               loops in fixed-size histograms
+#-------------------------------------------------------------------------------
+import threading
+import time
+
+#-------------------------------------------------------------------------------
+# c l s H i s t o g r a m
+#-------------------------------------------------------------------------------
+# Histogram of durations with fixed memory, like a HdrHistogram:
+# - the value is in microseconds
+# - values below 32us are counted exactly
+# - above that, each power of two is divided into 16 buckets, so the error of
+#   a percentile is at most 1/16 (6%)
+# - up to 2^27us (134 seconds); larger values go into the last bucket
+# So the histogram has 32 + 22 * 16 = 384 counters, whatever the number of
+# recorded values; the maximum is kept exactly.
+#-------------------------------------------------------------------------------
+SubBucketBits   = 5
+SubBucketCount  = 1 << SubBucketBits                    # 32
+SubBucketHalf   = SubBucketCount >> 1                   # 16
+MaxShift        = 27 - SubBucketBits                    # 2^27us = 134s
+BucketCount     = SubBucketCount + MaxShift * SubBucketHalf
+
+class clsHistogram():
+    def __init__(self):
+        self.Counts     = [0] * BucketCount
+        self.Count      = 0
+        self.Total      = 0                 # microseconds
+        self.Max        = 0                 # microseconds
+
+    #---------------------------------------------------------------------------
+    # R e c o r d
+    #---------------------------------------------------------------------------
+    # input         Seconds
+    #---------------------------------------------------------------------------
+    def Record(self, Seconds):
+        us = int(Seconds * 1e6 + 0.5)
+        if us < 0: us = 0
+        if us < SubBucketCount:
+            i = us
+        else:
+            Shift = us.bit_length() - SubBucketBits
+            if Shift > MaxShift:
+                i = BucketCount - 1
+            else:
+                i = SubBucketCount + (Shift - 1) * SubBucketHalf + (us >> Shift) - SubBucketHalf
+        self.Counts[i] += 1
+        self.Count     += 1
+        self.Total     += us
+        if us > self.Max: self.Max = us
+
+    #---------------------------------------------------------------------------
+    # P e r c e n t i l e
+    #---------------------------------------------------------------------------
+    # input         Percentile      e.g. 50 or 99
+    #
+    # returns       highest value (us) of the bucket where the percentile is,
+    #               but never above the maximum
+    #---------------------------------------------------------------------------
+    def Percentile(self, Percentile):
+        if self.Count == 0:
+            return 0
+        Needed = max(1, int(self.Count * Percentile / 100 + 0.5))
+        Seen   = 0
+        for i, n in enumerate(self.Counts):
+            Seen += n
+            if Seen >= Needed:
+                break
+        if i < SubBucketCount:
+            rtn = i
+        else:
+            Shift = (i - SubBucketCount) // SubBucketHalf + 1
+            Sub   = (i - SubBucketCount) %  SubBucketHalf + SubBucketHalf
+            rtn   = ((Sub + 1) << Shift) - 1
+        return min(rtn, self.Max)
+
+#-------------------------------------------------------------------------------
+# c l s P h a s e T i m i n g
+#-------------------------------------------------------------------------------
+# A histogram per phase of the loop, in order of first use.
+# Usage:
+#       t = Timing.Start()
+#       ... receive ...
+#       t = Timing.Stop('Trainer receive', t)       # Returns the time now,
+#       ... physics ...                             # which is the start of
+#       t = Timing.Stop('Trainer physics', t)       # the next phase
+#
+# Phases can be recorded by different threads (e.g. the trainer thread), as
+# long as each phase is recorded by one thread.
+#-------------------------------------------------------------------------------
+class clsPhaseTiming():
+    def __init__(self):
+        self.Lock       = threading.Lock()              # Adding a phase only
+        self.Reset()
+
+    def Reset(self):
+        self.Phases     = {}                            # Name -> clsHistogram
+        self.StartTime  = time.monotonic()
+
+    def Start(self):
+        return time.perf_counter()
+
+    def Stop(self, Name, StartTime):
+        Now = time.perf_counter()
+        Histogram = self.Phases.get(Name)
+        if Histogram == None:
+            with self.Lock:
+                Histogram = self.Phases.setdefault(Name, clsHistogram())
+        Histogram.Record(Now - StartTime)
+        return Now
+
+    #---------------------------------------------------------------------------
+    # R e p o r t
+    #---------------------------------------------------------------------------
+    # returns       text with p50/p99/max per phase, in milliseconds
+    #---------------------------------------------------------------------------
+    def Report(self):
+        Elapsed = time.monotonic() - self.StartTime
+        rtn = "%-36s %8s %8s %8s %8s %8s" % ("Loop timing (%1.0f seconds)" % Elapsed, \
+              'count', 'avg ms', 'p50 ms', 'p99 ms', 'max ms')
+        for Name, h in list(self.Phases.items()):
+            rtn += "\n    %-32s %8s %8.2f %8.2f %8.2f %8.2f" % (Name, h.Count, \
+                   h.Total / max(h.Count, 1) / 1000, h.Percentile(50) / 1000, \
+                   h.Percentile(99) / 1000, h.Max / 1000)
+        return rtn
+
+Timing = clsPhaseTiming()                   # Used by FortiusAntBody, usbTrainer
+
+#-------------------------------------------------------------------------------
+# Main program to test the previous functions
+#-------------------------------------------------------------------------------
+if __name__ == "__main__":
+    import random
+    #---------------------------------------------------------------------------
+    # Test: percentiles are within the bucket precision (1/16)
+    #---------------------------------------------------------------------------
+    h      = clsHistogram()
+    Values = [random.expovariate(1 / 0.005) for _ in range(100000)]   # 5ms avg
+    for v in Values: h.Record(v)
+    Values.sort()
+    for p in (50, 90, 99, 99.9):
+        Exact = int(Values[int(len(Values) * p / 100 + 0.5) - 1] * 1e6 + 0.5)
+        assert Exact <= h.Percentile(p) <= Exact * 17 / 16 + 1, (p, Exact, h.Percentile(p))
+    assert h.Max == int(Values[-1] * 1e6 + 0.5) and h.Count == len(Values)
+
+    for us in (0, 31, 32, 33, 1000, 65535, 10**8):
+        h = clsHistogram()
+        h.Record(us / 1e6)
+        assert h.Percentile(50) == us, (us, h.Percentile(50))
+    h.Record(1000)                              # Beyond range, last bucket
+    assert h.Counts[-1] == 1 and h.Max == 10**9
+    print ('Tests passed')
+
+    #---------------------------------------------------------------------------
+    # Benchmark: cost of one phase
+    #---------------------------------------------------------------------------
+    N     = 100000
+    Begin = Timing.Start()
+    t     = Begin
+    for _ in range(N):
+        t = Timing.Stop('Empty phase', t)
+    print ('Stop(): %4.2fus/phase' % ((t - Begin) * 1e6 / N))
+    print (Timing.Report())
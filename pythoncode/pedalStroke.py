@@ -0,0 +1,174 @@
+#-------------------------------------------------------------------------------
+# Version info
+#-------------------------------------------------------------------------------
+__version__ = "2026-10-18"
+# 2026-10-18    First version; pedal stroke analysis without user interface;
+#               AngleProfile() taken from RadarGraph, clsPedalStrokeRecorder
+#               records the profile of each stroke in the session file
+#-------------------------------------------------------------------------------
+import time
+from   datetime         import datetime
+
+#-------------------------------------------------------------------------------
+# Constants
+#-------------------------------------------------------------------------------
+Sectors         = 24        # The crank revolution in sectors of 15 degrees
+MaxStrokeTime   = 3.0       # Seconds; one revolution at 20 rpm
+FlushTime       = 10        # Seconds between two flushes of the recording
+
+#-------------------------------------------------------------------------------
+# A n g l e P r o f i l e
+#-------------------------------------------------------------------------------
+# input         info = list of tuples(Time,  Power)
+#               Cadence
+#
+# Description:  When the right pedal is to the front (0 degrees) then the
+#               pedalecho is given (left pedal is back). "Adjust" is for
+#               possible improvement if ever needed.
+#
+# returns       data = list of tuples(Angle, Power)
+#-------------------------------------------------------------------------------
+def AngleProfile(info, Cadence, Adjust = 0):
+    StartTime = info[0][0]                  # First element = at pedelecho
+    dps       = Cadence / 60 * 360          # Cadence = Rotations/minute
+                                            # dps = Degrees/second
+    data      = []
+    for i in info:
+        Delta     = i[0] - StartTime        # Elapsed time in seconds
+        Angle     = int( Delta * dps )      # Angle since PedalEcho
+        Angle    += Adjust
+        if Angle >= 360:
+            Angle -= 360
+        data.append((Angle, int(i[1])))
+    return data
+
+#-------------------------------------------------------------------------------
+# c l s P e d a l S t r o k e R e c o r d e r
+#-------------------------------------------------------------------------------
+# The pedal stroke analysis when there is no RadarGraph (console mode).
+#
+# For each stroke the average power per sector is written as a line in the
+# recording (csv, same name as the logfile):
+#       Time, Cadence, power at 0 degrees, at 15 degrees, ... at 345 degrees
+# A sector without measurement is empty; at 50Hz polling and 90rpm there are
+# 33 measurements per stroke, so some sectors are empty.
+#
+# The average over the session is kept per sector, for Report().
+# The cost is per stroke (about 1.5 per second), not per poll of the trainer.
+#-------------------------------------------------------------------------------
+class clsPedalStrokeRecorder():
+    def __init__(self, filename = None):
+        if filename == None:
+            filename = 'FortiusANT.' + datetime.now().strftime('%Y-%m-%d %H-%M-%S') + '.pedalstroke.csv'
+        self.filename   = filename
+        self.Strokes    = 0
+        self.Total      = [0] * Sectors     # Sum of the sector averages
+        self.Count      = [0] * Sectors     # Number of strokes per sector
+        self.Last       = [None] * Sectors  # Profile of the last stroke
+        self.FlushTime  = time.monotonic()
+        self.File       = open(filename, 'w')
+        self.File.write('Time,Cadence,' + \
+            ','.join(['%s' % (s * 360 // Sectors) for s in range(Sectors)]) + '\n')
+
+    #---------------------------------------------------------------------------
+    # R e c o r d
+    #---------------------------------------------------------------------------
+    # input         info, Cadence   as for AngleProfile()
+    #
+    # returns       the profile of the stroke; average power per sector
+    #---------------------------------------------------------------------------
+    def Record(self, info, Cadence):
+        Power = [0] * Sectors
+        n     = [0] * Sectors
+        for Angle, p in AngleProfile(info, Cadence):
+            s = min(Angle * Sectors // 360, Sectors - 1)
+            Power[s] += p
+            n[s]     += 1
+
+        Profile = [None] * Sectors
+        for s in range(Sectors):
+            if n[s]:
+                Profile[s]     = Power[s] / n[s]
+                self.Total[s] += Profile[s]
+                self.Count[s] += 1
+        self.Strokes += 1
+        self.Last     = Profile
+
+        self.File.write('%s,%s,%s\n' % (datetime.now().strftime('%H:%M:%S.%f')[0:12], \
+            Cadence, ','.join(['' if p == None else '%1.0f' % p for p in Profile])))
+        if time.monotonic() - self.FlushTime >= FlushTime:
+            self.Flush()
+        return Profile
+
+    #---------------------------------------------------------------------------
+    # P r o f i l e   a n d   R e p o r t
+    #---------------------------------------------------------------------------
+    # returns       average power per sector over the session (None = no data)
+    #               resp. the text for the console
+    #---------------------------------------------------------------------------
+    def Profile(self):
+        return [self.Total[s] / self.Count[s] if self.Count[s] else None \
+                for s in range(Sectors)]
+
+    def Report(self):
+        Profile = self.Profile()
+        Known   = [p for p in Profile if p != None]
+        rtn     = "Pedal stroke profile (%s strokes), average power per angle" % self.Strokes
+        if Known:
+            Peak = Profile.index(max(Known))
+            rtn += "; peak %1.0fW at %s degrees, min/avg %3.0f%%" % (Profile[Peak], \
+                   Peak * 360 // Sectors, min(Known) / max(sum(Known) / len(Known), 1) * 100)
+        for Row in range(0, Sectors, 6):
+            rtn += "\n   "
+            for s in range(Row, Row + 6):
+                rtn += " %3s: %4s" % (s * 360 // Sectors, \
+                       '-' if Profile[s] == None else '%1.0fW' % Profile[s])
+        return rtn
+
+    def Flush(self):
+        self.File.flush()
+        self.FlushTime = time.monotonic()
+
+    def Close(self):
+        self.File.close()
+
+#-------------------------------------------------------------------------------
+# Main program to test the previous functions
+#-------------------------------------------------------------------------------
+if __name__ == "__main__":
+    import os
+    import tempfile
+    #---------------------------------------------------------------------------
+    # Test: 90rpm, 50Hz; power peaks at 90 degrees
+    #---------------------------------------------------------------------------
+    import math
+    filename = os.path.join(tempfile.mkdtemp(), 'test.pedalstroke.csv')
+    r        = clsPedalStrokeRecorder(filename)
+    Cadence  = 90
+    for Stroke in range(100):
+        info = [(Stroke * 60 / Cadence + t * 0.02, \
+                 200 + 150 * math.sin(math.radians(t * 0.02 * Cadence * 6))) \
+                for t in range(int(60 / Cadence / 0.02) + 1)]
+        r.Record(info, Cadence)
+    r.Close()
+    Profile = r.Profile()
+    Peak    = Profile.index(max([p for p in Profile if p != None]))
+    assert 75 <= Peak * 360 // Sectors <= 105, Peak
+    with open(filename) as f:
+        Lines = f.readlines()
+    assert len(Lines) == 101 and len(Lines[1].split(',')) == 2 + Sectors, Lines[1]
+    assert AngleProfile([(0, 100), (0.5, 200)], 60) == [(0, 100), (180, 200)]
+    print (r.Report())
+    print ('Tests passed')
+
+    #---------------------------------------------------------------------------
+    # Benchmark: cost per stroke
+    #---------------------------------------------------------------------------
+    r     = clsPedalStrokeRecorder(filename)
+    N     = 10000
+    Begin = time.perf_counter()
+    for _ in range(N):
+        r.Record(info, Cadence)
+    print ('Record(): %4.0fus/stroke' % ((time.perf_counter() - Begin) * 1e6 / N))
+    r.Close()
+    os.remove(filename)
@@ -0,0 +1,187 @@
+#-------------------------------------------------------------------------------
+# Version info
+#-------------------------------------------------------------------------------
+__version__ = "2026-10-18"
+# 2026-10-18    Due() for a subset of the tasks and WaitAsync() added, so that
+#               each coroutine of asyncRuntime waits for its own task
+# 2026-10-18    First version; periodic tasks with absolute deadlines on
+#               time.monotonic(), for the loops in FortiusAntBody
+#-------------------------------------------------------------------------------
+import asyncio
+import time
+
+#-------------------------------------------------------------------------------
+# c l s T a s k
+#-------------------------------------------------------------------------------
+# A periodic task, e.g. trainer polling or ANT broadcast.
+#
+# The next deadline is the previous deadline + Period, not the time the task
+# was done + Period; so the processing time and the inaccuracy of sleep()
+# do not add up, the task runs exactly 1/Period times per second.
+#
+# When the task is late more than a Period, the missed runs are not made up
+# (e.g. no burst of ANT broadcasts), they are counted as overruns and the next
+# deadline is the first one in the future.
+#-------------------------------------------------------------------------------
+class clsTask():
+    def __init__(self, Name, Period, Deadline):
+        self.Name       = Name
+        self.Period     = Period            # seconds
+        self.Deadline   = Deadline          # time.monotonic() of next run
+        self.Runs       = 0                 # Statistics
+        self.Overruns   = 0
+        self.Late       = 0                 # Total lateness (seconds)
+        self.MaxLate    = 0
+
+#-------------------------------------------------------------------------------
+# c l s S c h e d u l e r
+#-------------------------------------------------------------------------------
+# Usage:
+#       Scheduler   = scheduler.clsScheduler()
+#       TaskTrainer = Scheduler.AddTask('Trainer',       0.02)
+#       TaskANT     = Scheduler.AddTask('ANT broadcast', 0.25)
+#       while ...:
+#           Scheduler.Wait()
+#           Due = Scheduler.Due()
+#           if TaskTrainer in Due: ...
+#           if TaskANT     in Due: ...
+#
+# All tasks are due right after being added.
+# time.monotonic() is used, so that a change of the clock (e.g. summertime or
+# time synchronisation) does not affect the timing.
+#-------------------------------------------------------------------------------
+class clsScheduler():
+    def __init__(self, Clock = time.monotonic):
+        self.Clock      = Clock
+        self.Tasks      = []
+        self.StartTime  = Clock()
+
+    #---------------------------------------------------------------------------
+    # A d d T a s k
+    #---------------------------------------------------------------------------
+    # input         Name, Period (seconds)
+    #
+    # returns       the task, to be checked against Due()
+    #---------------------------------------------------------------------------
+    def AddTask(self, Name, Period):
+        Task = clsTask(Name, Period, self.Clock())
+        self.Tasks.append(Task)
+        return Task
+
+    #---------------------------------------------------------------------------
+    # D u e
+    #---------------------------------------------------------------------------
+    # input         Tasks           optional, the tasks to be checked;
+    #                               default all tasks
+    #
+    # function      Determine the tasks of which the deadline has passed and
+    #               schedule their next deadline
+    #
+    # returns       list of tasks to be done now; may be empty
+    #---------------------------------------------------------------------------
+    def Due(self, Tasks = None):
+        Now = self.Clock()
+        rtn = []
+        for Task in (Tasks or self.Tasks):
+            if Now >= Task.Deadline:
+                Late           = Now - Task.Deadline
+                Task.Runs     += 1
+                Task.Late     += Late
+                Task.MaxLate   = max(Task.MaxLate, Late)
+                Task.Deadline += Task.Period
+                if Task.Deadline <= Now:            # Next deadline missed too
+                    Missed         = int((Now - Task.Deadline) / Task.Period) + 1
+                    Task.Overruns += Missed
+                    Task.Deadline += Missed * Task.Period
+                rtn.append(Task)
+        return rtn
+
+    #---------------------------------------------------------------------------
+    # W a i t
+    #---------------------------------------------------------------------------
+    # input         WaitFunction    optional, called as WaitFunction(Timeout)
+    #                               instead of sleep(); returns True when
+    #                               woken up before Timeout (e.g. WaitForData)
+    #
+    # function      Wait until the first deadline of all tasks
+    #
+    # returns       True when woken up by WaitFunction, False at deadline
+    #---------------------------------------------------------------------------
+    def Wait(self, WaitFunction = None):
+        while True:
+            Timeout = min([Task.Deadline for Task in self.Tasks]) - self.Clock()
+            if Timeout <= 0:
+                return False
+            if WaitFunction:
+                if WaitFunction(Timeout):
+                    return True
+            else:
+                time.sleep(Timeout)
+
+    #---------------------------------------------------------------------------
+    # W a i t A s y n c
+    #---------------------------------------------------------------------------
+    # input         Tasks           optional, as for Due()
+    #
+    # function      As Wait(), for a coroutine; other coroutines run meanwhile
+    #
+    # returns       none
+    #---------------------------------------------------------------------------
+    async def WaitAsync(self, Tasks = None):
+        Timeout = min([Task.Deadline for Task in (Tasks or self.Tasks)]) - self.Clock()
+        if Timeout > 0:
+            await asyncio.sleep(Timeout)
+
+    #---------------------------------------------------------------------------
+    # S t a t i s t i c s
+    #---------------------------------------------------------------------------
+    def Statistics(self):
+        Elapsed = max(self.Clock() - self.StartTime, 1)
+        rtn = "Scheduler:"
+        for Task in self.Tasks:
+            rtn += "\n    %-14s every %4.0fms: %6s runs %6.2f/s, %s overruns, late avg %4.1fms max %5.1fms" % \
+                   (Task.Name, Task.Period * 1000, Task.Runs, Task.Runs / Elapsed, \
+                    Task.Overruns, Task.Late / max(Task.Runs, 1) * 1000, Task.MaxLate * 1000)
+        return rtn
+
+#-------------------------------------------------------------------------------
+# Main program to test the previous functions
+#-------------------------------------------------------------------------------
+if __name__ == "__main__":
+    #---------------------------------------------------------------------------
+    # Test: simulated clock, a task that runs long does not cause drift
+    #---------------------------------------------------------------------------
+    Now = [100.0]
+    s   = clsScheduler(lambda: Now[0])
+    Fast= s.AddTask('Fast', 0.02)
+    ANT = s.AddTask('ANT',  0.25)
+    Runs= {Fast: [], ANT: []}
+    for i in range(1000):
+        for Task in s.Due():
+            Runs[Task].append(Now[0])
+        Now[0] += 0.005 if i != 500 else 0.3        # One long processing step
+    assert len(Runs[ANT]) == 21, len(Runs[ANT])
+    assert ANT.Overruns == 1 and Fast.Overruns == 14, (ANT.Overruns, Fast.Overruns)
+    # The ANT deadlines stay on the 250ms grid; only the run after the long
+    # step is late
+    OffGrid = [t for t in Runs[ANT] if abs((t - 100) / 0.25 - round((t - 100) / 0.25)) * 0.25 > 0.0051]
+    assert len(OffGrid) == 1, OffGrid
+    assert abs((ANT.Deadline - 100) / 0.25 - round((ANT.Deadline - 100) / 0.25)) < 1e-6
+    print ('Tests passed')
+    print (s.Statistics())
+
+    #---------------------------------------------------------------------------
+    # Real clock: 4 seconds of a 250ms task with 30ms jitter in the processing
+    #---------------------------------------------------------------------------
+    import random
+    s    = clsScheduler()
+    Task = s.AddTask('ANT', 0.25)
+    Start= time.monotonic()
+    Last = None
+    while Task.Runs < 17:
+        s.Wait()
+        if Task in s.Due():
+            Last = time.monotonic()
+            time.sleep(random.random() * 0.03)
+    print ('Real clock: 16 periods in %6.1fms (expected 4000ms)' % ((Last - Start) * 1000))
+    print (s.Statistics())
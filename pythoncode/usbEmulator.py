@@ -0,0 +1,332 @@
+#-------------------------------------------------------------------------------
+# Version info
+#-------------------------------------------------------------------------------
+__version__ = "2026-10-18"
+# 2026-10-18    Connect() replaces the headunit with the same vendor/product,
+#               so that a restart does not add another one to the bus
+# 2026-10-18    First version; software headunit T1932/T1942 with a T1941
+#               motor brake or T1901 magnetic brake (--UsbEmulator)
+#-------------------------------------------------------------------------------
+import array
+import random
+import struct
+import time
+
+import debug
+import logfile
+import structConstants   as sc
+
+#-------------------------------------------------------------------------------
+# Constants; refer to usbTrainer.py and TotalReverse
+#-------------------------------------------------------------------------------
+idVendor_Tacx   = 0x3561
+hu1932          = 0x1932
+hu1942          = 0x1942
+br1941          = 0x1941    # Motor brake
+br1901          = 0x1901    # Magnetic (eddy current) brake
+
+modeStop        = 0         # USB Tacx modes
+modeResistance  = 2
+modeCalibrate   = 3
+
+SpeedScale              = 289.75    # WheelSpeed / SpeedScale = km/h
+PowerResistanceFactor   = 128866    # Power = Resistance * WheelSpeed / factor
+
+#-------------------------------------------------------------------------------
+# Frames as sent by the host (refer SendToTrainerUSBData)
+#-------------------------------------------------------------------------------
+ControlFrame = struct.Struct(sc.no_alignment + \
+        sc.unsigned_int     + #  0...3  ControlCommand = 0x00010801
+        sc.short            + #  4, 5   Target
+        sc.unsigned_char    + #  6      PedalEcho
+        sc.pad              + #  7
+        sc.unsigned_char    + #  8      Mode
+        sc.unsigned_char    + #  9      Weight
+        sc.unsigned_short     # 10, 11  Calibrate
+        )
+
+#-------------------------------------------------------------------------------
+# Frames as sent by the headunit, 64 bytes (refer NewUsbFrame)
+#-------------------------------------------------------------------------------
+StatusFrame = struct.Struct(sc.no_alignment + \
+        sc.unsigned_short   + #  0, 1   DeviceSerial
+        sc.pad * 6          + #  2...7
+        sc.unsigned_char    + #  8      YearProduction
+        sc.pad * 3          + #  9...11
+        sc.unsigned_char    + # 12      HeartRate
+        sc.unsigned_char    + # 13      Buttons
+        sc.unsigned_char    + # 14      HeartDetect
+        sc.unsigned_char    + # 15      ErrorCount
+        sc.unsigned_short   + # 16, 17  Axis0
+        sc.unsigned_short   + # 18, 19  Axis1
+        sc.unsigned_short   + # 20, 21  Axis2
+        sc.unsigned_short   + # 22, 23  Axis3
+        sc.unsigned_int     + # 24...27 Header
+        sc.unsigned_int     + # 28...31 Distance
+        sc.unsigned_short   + # 32, 33  Speed
+        sc.pad * 4          + # 34...37
+        sc.short            + # 38, 39  CurrentResistance
+        sc.short            + # 40, 41  TargetResistance
+        sc.unsigned_char    + # 42      Events
+        sc.pad              + # 43
+        sc.unsigned_char    + # 44      Cadence
+        sc.pad              + # 45
+        sc.unsigned_char    + # 46      ModeEcho
+        sc.pad * 17           # 47...63 Checksum and filler
+        )
+
+VersionFrame = struct.Struct(sc.no_alignment + \
+        sc.pad * 24         + #  0...23
+        sc.unsigned_int     + # 24...27 Header
+        sc.unsigned_int     + # 28...31 MotorBrakeUnitFirmware 0.x.y.z
+        sc.unsigned_int     + # 32...35 MotorBrakeUnitSerial tt-YY-#####
+        sc.unsigned_short   + # 36, 37  Version2
+        sc.pad * 26           # 38...63
+        )
+
+#-------------------------------------------------------------------------------
+# The emulated USB-bus; usbEmulator.find() is the stand-in for usb.core.find()
+# Connect() is called on each GetTrainer(); as a re-plugged device, the new
+# headunit replaces the one with the same vendor and product.
+#-------------------------------------------------------------------------------
+Devices = []
+
+def Connect(Headunit = hu1932, Brake = br1941, Seed = None):
+    dev = clsHeadunitEmulator(Headunit, Brake, Seed)
+    Devices[:] = [d for d in Devices if (d.idVendor, d.idProduct) != \
+                                        (dev.idVendor, dev.idProduct)]
+    Devices.append(dev)
+    return dev
+
+def find(find_all = False, idVendor = None, idProduct = None, **_kwargs):
+    rtn = [d for d in Devices if idVendor  in (None, d.idVendor) \
+                             and idProduct in (None, d.idProduct)]
+    if find_all:
+        return rtn
+    elif rtn:
+        return rtn[0]
+    else:
+        return None
+
+#-------------------------------------------------------------------------------
+# c l s H e a d u n i t E m u l a t o r
+#-------------------------------------------------------------------------------
+# Behaves as the pyusb device of a Tacx headunit (New interface).
+#
+# write()   the host sends a control command (0x00010801) or the motor brake
+#           version request (0x00000002)
+# read()    returns the answer on the last command; the brake is simulated up
+#           to the moment of reading, so frames can be read at any rate.
+#
+# The emulated rider:
+#   - rides at RiderSpeed (km/h) with RiderCadence, as long as the brake does
+#     not require more than RiderPower (Watt); then speed and cadence drop.
+#   - the wheel accelerates towards that speed with the inertia of the
+#     flywheel (Weight = 0x0a) or of the virtual rider (Weight = kg).
+#   - Pedalling=False; the rider stops and the wheel runs out.
+# During calibration, the rider does not pedal and the motor brake keeps the
+# wheel at target speed; the (negative) resistance is the rolling resistance,
+# decreasing while the tyre warms up.
+#-------------------------------------------------------------------------------
+class clsHeadunitEmulator():
+    idVendor    = idVendor_Tacx
+
+    def __init__(self, Headunit = hu1932, Brake = br1941, Seed = None):
+        if debug.on(debug.Function):
+            logfile.Write ("clsHeadunitEmulator.__init__(%s, %s)" % (hex(Headunit), hex(Brake)))
+        self.idProduct      = Headunit
+        self.Brake          = Brake
+        self.Random         = random.Random(Seed)
+
+        self.DeviceSerial   = 12345
+        self.Year           = 18
+        self.Firmware       = 0x00010004            # 0.1.0.4
+        self.BrakeSerial    = int(hex(Brake)[-2:]) * 10000000 + 17 * 100000 + 23456
+        self.Version2       = 0x0411
+
+        self.RiderSpeed     = 30                    # km/h
+        self.RiderCadence   = 90                    # /min
+        self.RiderPower     = 250                   # Watt, maximum
+        self.Pedalling      = True
+        self.HeartRate      = 0                     # Calculated when zero
+        self.Buttons        = 0
+        self.ButtonFrames   = 0
+
+        self.Mode           = modeStop              # Last command received
+        self.Target         = 0
+        self.Weight         = 0x0a
+        self.AnswerVersion  = False
+
+        self.Speed          = 0.0                   # km/h
+        self.Cadence        = 0
+        self.Resistance     = 0.0
+        self.Friction       = 1400.0                # Rolling resistance, calibration
+        self.Crank          = 0.0                   # Revolutions, fraction used
+        self.Distance       = 0.0
+        self.PedalEcho      = 0
+
+        self.LastTime       = time.monotonic()
+        self.Reads          = 0                     # Statistics
+        self.Writes         = 0
+
+    def __str__(self):
+        return "Emulated Tacx headunit T%s, brake T%s" % \
+                                    (hex(self.idProduct)[2:], hex(self.Brake)[2:])
+
+    #---------------------------------------------------------------------------
+    # Functions to steer the emulated rider
+    #---------------------------------------------------------------------------
+    def SetRider(self, Speed = None, Cadence = None, Power = None, Pedalling = None):
+        if Speed     != None: self.RiderSpeed   = Speed
+        if Cadence   != None: self.RiderCadence = Cadence
+        if Power     != None: self.RiderPower   = Power
+        if Pedalling != None: self.Pedalling    = Pedalling
+
+    def PressButton(self, Button, Frames = 1):
+        self.Buttons      = Button
+        self.ButtonFrames = Frames
+
+    #---------------------------------------------------------------------------
+    # S i m u l a t e
+    #---------------------------------------------------------------------------
+    # input     time since previous simulation, last command
+    #
+    # function  Move brake and rider forward in time
+    #
+    # returns   None
+    #---------------------------------------------------------------------------
+    def __Simulate(self):
+        now           = time.monotonic()
+        dt            = min(0.5, now - self.LastTime)
+        self.LastTime = now
+
+        #-----------------------------------------------------------------------
+        # Resistance and speed the wheel is going to
+        #-----------------------------------------------------------------------
+        if self.Mode == modeCalibrate and self.Brake == br1941:
+            Resistance    = -self.Friction
+            Speed         = self.Target / SpeedScale
+            self.Friction = max(1000, self.Friction - 20 * dt)  # Tyre warming up
+            Cadence       = 0
+
+        else:
+            if self.Mode == modeResistance:
+                Resistance = self.Target
+                if self.Brake == br1901:                        # Steps of 260
+                    Resistance = 1039 + int(max(0, Resistance - 1900) / 150) * 260
+                    Resistance = min(4677, Resistance)
+            else:
+                Resistance = 0
+
+            if self.Pedalling:
+                Speed = self.RiderSpeed
+                if Resistance > 0:                              # Power limited?
+                    Speed = min(Speed, self.RiderPower * PowerResistanceFactor \
+                                        / Resistance / SpeedScale)
+                Cadence = self.RiderCadence * Speed / self.RiderSpeed
+            else:
+                Speed   = 0
+                Cadence = 0
+
+        #-----------------------------------------------------------------------
+        # Brake follows target in 0.1 second, wheel speed depends on inertia
+        #-----------------------------------------------------------------------
+        tau              = 0.5 if self.Weight <= 0x0a else self.Weight / 20
+        self.Resistance += (Resistance - self.Resistance) * min(1, dt / 0.1)
+        self.Speed      += (Speed      - self.Speed)      * min(1, dt / tau)
+        self.Cadence     = Cadence
+        self.Distance   += self.Speed * SpeedScale * dt
+
+        #-----------------------------------------------------------------------
+        # Pedal sensor: one event per crank revolution
+        #-----------------------------------------------------------------------
+        Crank           = self.Crank + self.Cadence / 60 * dt
+        self.PedalEcho  = 1 if int(Crank) != int(self.Crank) else 0
+        self.Crank      = Crank % 1000
+
+    #---------------------------------------------------------------------------
+    # pyusb interface
+    #---------------------------------------------------------------------------
+    def set_configuration(self, *_args, **_kwargs):
+        pass
+
+    def set_interface_altsetting(self, *_args, **_kwargs):
+        pass
+
+    def write(self, endpoint, data, _timeout = None):
+        assert endpoint == 0x02
+        self.__Simulate()
+        self.Writes += 1
+        data = bytes(data)
+        if len(data) >= ControlFrame.size:
+            Command, self.Target, _PedalEcho, self.Mode, Weight, _Calibrate = \
+                ControlFrame.unpack_from(data)
+            self.Weight        = max(0x0a, Weight)
+            self.AnswerVersion = False
+            if Command != 0x00010801:
+                logfile.Console("Emulated headunit: unknown command %s" % hex(Command))
+        elif len(data) == 4:
+            self.AnswerVersion = (struct.unpack(sc.unsigned_int, data)[0] == 0x00000002)
+        return len(data)
+
+    def read(self, endpoint, size_or_buffer, _timeout = None):
+        assert endpoint == 0x82
+        self.__Simulate()
+        self.Reads += 1
+
+        if self.AnswerVersion:
+            self.AnswerVersion = False
+            if self.Brake == br1941:
+                data = VersionFrame.pack(0x0c030008, self.Firmware, \
+                                         self.BrakeSerial, self.Version2)
+            else:
+                data = bytes(24)                    # No answer from T1901
+        else:
+            if self.ButtonFrames:
+                self.ButtonFrames -= 1
+                Buttons = self.Buttons
+            else:
+                Buttons = 0
+
+            HeartRate = self.HeartRate
+            if not HeartRate:
+                HeartRate = int(60 + self.Cadence * 0.8 + self.Random.random() * 2)
+
+            Resistance = int(self.Resistance + self.Random.uniform(-1, 1))
+
+            data = StatusFrame.pack(self.DeviceSerial, self.Year, HeartRate, \
+                    Buttons, 1, 0, 0, 0, 0, 0, 0x03130002, \
+                    int(self.Distance) & 0xffffffff, int(self.Speed * SpeedScale), \
+                    Resistance, int(self.Target), self.PedalEcho, \
+                    int(self.Cadence), self.Mode)
+
+        if isinstance(size_or_buffer, int):
+            rtn = array.array('B', data[:size_or_buffer])
+        else:
+            rtn = min(len(data), len(size_or_buffer))
+            size_or_buffer[:rtn] = array.array('B', data[:rtn])
+        return rtn
+
+#-------------------------------------------------------------------------------
+# Main program to test the previous functions
+# Frames per second the emulator can deliver, host-side encoding included
+#-------------------------------------------------------------------------------
+if __name__ == "__main__":
+    debug.deactivate()
+    Connect(hu1932, br1941, Seed=1)
+    dev  = find(idVendor=idVendor_Tacx, idProduct=hu1932)
+    print (dev)
+
+    dev.write(0x02, struct.pack(sc.unsigned_int, 0x00000002))
+    print ('Version: %s' % logfile.HexSpace(bytes(dev.read(0x82, 64, 30))))
+
+    N     = 100000
+    start = time.monotonic()
+    for i in range(0, N):
+        dev.write(0x02, ControlFrame.pack(0x00010801, 3000, 0, modeResistance, 0x0a, 1040))
+        data = dev.read(0x82, 64, 30)
+    elapsed = time.monotonic() - start
+    print ('%s frames in %4.2fs = %6.0f frames/s' % (N, elapsed, N / elapsed))
+
+    s = StatusFrame.unpack(bytes(data))
+    print ('Speed=%4.1fkm/h Cadence=%s Resistance=%s' % (s[12] / SpeedScale, s[16], s[13]))
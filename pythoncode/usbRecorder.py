@@ -0,0 +1,246 @@
+#-------------------------------------------------------------------------------
+# Version info
+#-------------------------------------------------------------------------------
+__version__ = "2026-10-18"
+# 2026-10-18    First version; record and replay the USB frames exchanged
+#               with a Tacx headunit (--UsbRecord, --UsbReplay);
+#               the recording is closed when the trainer is stopped;
+#               an empty or truncated recording is not replayed
+#-------------------------------------------------------------------------------
+import array
+import mmap
+import struct
+import threading
+import time
+
+import debug
+import logfile
+import structConstants   as sc
+
+#-------------------------------------------------------------------------------
+# File format
+#-------------------------------------------------------------------------------
+# The file consists of fixed-size records of 80 bytes, so that the file can be
+# memory-mapped and record n is found at offset n * RecordSize.
+#
+# Record 0 is the header:
+#   0...7   Magic           b'FANTUSB1'
+#   8, 9    idProduct       the headunit (hu1902, hu1932, ...)
+#   10...17 StartTime       time.time() when recording was started
+#
+# Record 1...n are frames:
+#   0...7   Time            seconds since start of recording (time.monotonic)
+#   8       Direction       0x02 = host -> headunit, 0x82 = headunit -> host
+#   9       Error           0 = frame, 1 = read timed out (Length = 0)
+#   10, 11  Length          number of valid bytes in Data
+#   12...75 Data            the frame (64 bytes max)
+#-------------------------------------------------------------------------------
+Magic           = b'FANTUSB1'
+RecordSize      = 80
+MaxFrameSize    = 64
+
+dirOut          = 0x02          # The endpoints as used for the Tacx headunit
+dirIn           = 0x82
+
+HeaderRecord    = struct.Struct(sc.little_endian + '8s' + sc.unsigned_short + sc.double)
+FrameRecord     = struct.Struct(sc.little_endian + sc.double + sc.unsigned_char + \
+                                sc.unsigned_char + sc.unsigned_short + str(MaxFrameSize) + 's')
+
+assert HeaderRecord.size <= RecordSize and FrameRecord.size <= RecordSize
+
+#-------------------------------------------------------------------------------
+# c l s U s b R e c o r d e r D e v i c e
+#-------------------------------------------------------------------------------
+# Wraps a pyusb device; read() and write() are passed to the device and every
+# frame (including timed out reads) is written to the recording.
+# After Close() the frames are passed to the device, but no longer recorded.
+#-------------------------------------------------------------------------------
+class clsUsbRecorderDevice():
+    def __init__(self, UsbDevice, filename, idProduct):
+        if debug.on(debug.Function):logfile.Write ("clsUsbRecorderDevice.__init__(%s)" % filename)
+        self.UsbDevice  = UsbDevice
+        self.idProduct  = idProduct
+        self.Lock       = threading.Lock()      # Trainer thread and main may write
+        self.Records    = 0
+        self.LastFlush  = time.monotonic()
+        self.StartTime  = time.monotonic()
+
+        self.File       = open(filename, 'wb')
+        self.File.write(HeaderRecord.pack(Magic, idProduct, time.time()).ljust(RecordSize, b'\0'))
+        logfile.Console("USB frames are recorded in %s" % filename)
+
+    def __Record(self, Direction, data, Error = 0):
+        record = FrameRecord.pack(time.monotonic() - self.StartTime, Direction, \
+                                  Error, len(data), bytes(data[:MaxFrameSize]))
+        with self.Lock:
+            if self.File.closed:
+                return
+            self.File.write(record.ljust(RecordSize, b'\0'))
+            self.Records += 1
+            if time.monotonic() - self.LastFlush > 1:
+                self.File.flush()
+                self.LastFlush = time.monotonic()
+
+    #---------------------------------------------------------------------------
+    # pyusb interface
+    #---------------------------------------------------------------------------
+    def read(self, endpoint, size_or_buffer, timeout = None):
+        try:
+            rtn = self.UsbDevice.read(endpoint, size_or_buffer, timeout)
+        except Exception as e:
+            if "timeout error" in str(e) or "timed out" in str(e) or isinstance(e, TimeoutError):
+                self.__Record(endpoint, b'', 1)
+            raise
+        if isinstance(size_or_buffer, int):
+            self.__Record(endpoint, rtn)
+        else:
+            self.__Record(endpoint, size_or_buffer[:rtn])
+        return rtn
+
+    def write(self, endpoint, data, timeout = None):
+        self.__Record(endpoint, data)
+        return self.UsbDevice.write(endpoint, data, timeout)
+
+    def set_configuration(self, *args, **kwargs):
+        return self.UsbDevice.set_configuration(*args, **kwargs)
+
+    def set_interface_altsetting(self, *args, **kwargs):
+        return self.UsbDevice.set_interface_altsetting(*args, **kwargs)
+
+    def Close(self):
+        with self.Lock:
+            if self.File.closed:
+                return
+            self.File.close()
+        logfile.Console("USB recording closed, %s frames" % self.Records)
+
+#-------------------------------------------------------------------------------
+# c l s U s b R e p l a y D e v i c e
+#-------------------------------------------------------------------------------
+# Behaves as a pyusb device, returning the recorded frames:
+# - read()  returns the next recorded headunit -> host frame; a recorded
+#           timeout raises TimeoutError, as the real device would do.
+#           Realtime: the frame is returned no earlier than recorded,
+#           relative to the first read().
+#           Fast:     frames are returned immediatly
+# - write() is accepted and counted only
+#
+# When all frames are replayed, read() times out.
+#-------------------------------------------------------------------------------
+class clsUsbReplayDevice():
+    def __init__(self, filename, Fast = False):
+        if debug.on(debug.Function):logfile.Write ("clsUsbReplayDevice.__init__(%s)" % filename)
+        self.OK         = False
+        self.Message    = ''
+        self.Fast       = Fast
+        self.idProduct  = 0
+        self.Frames     = 0                     # Records in the file
+        self.Cursor     = 1                     # Next record to be examined
+        self.Offset     = None                  # Replay clock - record clock
+        self.Reads      = 0                     # Statistics
+        self.Writes     = 0
+        self.mm         = None
+
+        #-----------------------------------------------------------------------
+        # The header is checked before the file is mapped; an empty file
+        # cannot be mapped and a short header cannot be unpacked
+        #-----------------------------------------------------------------------
+        self.File = None
+        try:
+            self.File = open(filename, 'rb')
+            Header    = self.File.read(RecordSize)
+            if len(Header) < HeaderRecord.size:
+                self.Message = "USB replay: %s is empty or truncated (%s bytes header)" % \
+                                                            (filename, len(Header))
+            else:
+                magic, self.idProduct, _StartTime = HeaderRecord.unpack_from(Header, 0)
+                if magic != Magic:
+                    self.Message = "USB replay: %s is not a USB recording" % filename
+                else:
+                    self.mm      = mmap.mmap(self.File.fileno(), 0, access=mmap.ACCESS_READ)
+                    self.Frames  = len(self.mm) // RecordSize
+                    self.OK      = True
+                    self.Message = "USB replay of %s frames from %s" % (self.Frames - 1, filename)
+        except Exception as e:
+            self.Message = "USB replay: cannot open %s: %s" % (filename, e)
+
+        if not self.OK:                         # Message is shown by the caller
+            if self.File:
+                self.File.close()
+            self.File = None
+
+    #---------------------------------------------------------------------------
+    # pyusb interface
+    #---------------------------------------------------------------------------
+    def read(self, endpoint, size_or_buffer, timeout = None):
+        #-----------------------------------------------------------------------
+        # Find next frame sent by the headunit
+        #-----------------------------------------------------------------------
+        while self.Cursor < self.Frames:
+            Time, Direction, Error, Length, Data = \
+                FrameRecord.unpack_from(self.mm, self.Cursor * RecordSize)
+            if Direction == endpoint: break
+            self.Cursor += 1
+        else:
+            raise TimeoutError("timed out (end of replay)")
+
+        #-----------------------------------------------------------------------
+        # Realtime: wait untill frame is due, but not longer than timeout
+        #-----------------------------------------------------------------------
+        if not self.Fast:
+            if self.Offset == None:
+                self.Offset = time.monotonic() - Time
+            Wait = Time + self.Offset - time.monotonic()
+            if timeout and Wait > timeout / 1000:
+                time.sleep(timeout / 1000)
+                raise TimeoutError("timed out")
+            if Wait > 0:
+                time.sleep(Wait)
+
+        self.Cursor += 1
+        self.Reads  += 1
+        if Error:
+            raise TimeoutError("timed out (recorded)")
+
+        if isinstance(size_or_buffer, int):
+            rtn = array.array('B', Data[:min(Length, size_or_buffer)])
+        else:
+            Length = min(Length, len(size_or_buffer))
+            size_or_buffer[:Length] = array.array('B', Data[:Length])
+            rtn = Length
+        return rtn
+
+    def write(self, _endpoint, data, _timeout = None):
+        self.Writes += 1
+        return len(data)
+
+    def set_configuration(self, *_args, **_kwargs):
+        pass
+
+    def set_interface_altsetting(self, *_args, **_kwargs):
+        pass
+
+    def Close(self):
+        if self.mm:
+            self.mm.close()
+            self.File.close()
+            self.mm = None
+
+#-------------------------------------------------------------------------------
+# Main program to test the previous functions
+# Usage: usbRecorder.py recording   ==> list the recorded frames
+#-------------------------------------------------------------------------------
+if __name__ == "__main__":
+    import sys
+    debug.deactivate()
+    if len(sys.argv) > 1:
+        dev = clsUsbReplayDevice(sys.argv[1], True)
+        print (dev.Message)
+        if dev.OK:
+            print ('headunit = %s' % hex(dev.idProduct))
+            for i in range(1, dev.Frames):
+                Time, Direction, Error, Length, Data = \
+                    FrameRecord.unpack_from(dev.mm, i * RecordSize)
+                print ('%9.3f %s %s len=%2s %s' % (Time, '>' if Direction == dirOut else '<', \
+                        'timeout' if Error else '       ', Length, logfile.HexSpace(Data[:Length])))
+            dev.Close()
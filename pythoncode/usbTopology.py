@@ -0,0 +1,136 @@
+#-------------------------------------------------------------------------------
+# Version info
+#-------------------------------------------------------------------------------
+__version__ = "2026-10-18"
+# 2026-10-18    First version; one USB-bus enumeration for the Tacx headunit
+#               and the ANT-dongles, cached until the bus changes
+#-------------------------------------------------------------------------------
+import os
+import time
+import usb.core
+
+import debug
+import logfile
+
+#-------------------------------------------------------------------------------
+# The cached topology
+#-------------------------------------------------------------------------------
+# usb.core.find() enumerates the complete bus on each call; GetTrainer() and
+# GetDongle() used to do that for each supported idProduct.
+# Now the bus is enumerated once and the found devices are classified by
+# (idVendor, idProduct). The result is reused until:
+# - the bus changes (hot-plug); on Linux detected from /sys/bus/usb/devices,
+#   where an entry is added/removed for each (dis)connected device.
+# - Invalidate() is called, because a device failed or must re-enumerate
+#   (e.g. after firmware upload). GetTrainer() and GetDongle() invalidate
+#   when they start, because hot-plug is not detected on Windows and a cached
+#   device may be stale; so one enumeration serves all idProducts of a search.
+# - a requested device is not found and the last enumeration is older than
+#   RescanInterval; for platforms where hot-plug cannot be detected.
+#-------------------------------------------------------------------------------
+RescanInterval  = 2                 # seconds
+
+Devices         = None              # {(idVendor, idProduct): [devices]}
+Signature       = None              # Bus signature at enumeration
+ScanTime        = 0                 # time.monotonic() at enumeration
+Scans           = 0                 # Statistics
+Finds           = 0
+
+#-------------------------------------------------------------------------------
+# B u s S i g n a t u r e
+#-------------------------------------------------------------------------------
+# input         none
+#
+# function      Get a cheap fingerprint of the connected devices
+#
+# returns       tuple, or None when not available on this platform
+#-------------------------------------------------------------------------------
+def BusSignature():
+    try:
+        rtn = tuple(sorted(os.listdir('/sys/bus/usb/devices')))
+    except Exception:
+        rtn = None
+    return rtn
+
+#-------------------------------------------------------------------------------
+# E n u m e r a t e
+#-------------------------------------------------------------------------------
+# input         none
+#
+# function      Enumerate the USB-bus and classify the devices
+#
+# returns       none; exceptions of usb.core.find() are passed to the caller
+#-------------------------------------------------------------------------------
+def Enumerate():
+    global Devices, Signature, ScanTime, Scans
+
+    Signature = BusSignature()
+    Classified = {}
+    for dev in usb.core.find(find_all=True):
+        Classified.setdefault((dev.idVendor, dev.idProduct), []).append(dev)
+
+    Devices  = Classified
+    ScanTime = time.monotonic()
+    Scans   += 1
+    if debug.on(debug.Function):
+        logfile.Write ("usbTopology.Enumerate() found: %s" % \
+            ', '.join(['%04x:%04x' % k for k in Devices]))
+
+#-------------------------------------------------------------------------------
+# I n v a l i d a t e
+#-------------------------------------------------------------------------------
+# function      Force enumeration on next find()
+#-------------------------------------------------------------------------------
+def Invalidate():
+    global Devices
+    if debug.on(debug.Function): logfile.Write ("usbTopology.Invalidate()")
+    Devices = None
+
+#-------------------------------------------------------------------------------
+# f i n d
+#-------------------------------------------------------------------------------
+# input         find_all, idVendor, idProduct; as usb.core.find()
+#
+# function      Find devices in the cached topology
+#
+# returns       as usb.core.find(): a list when find_all, else device or None
+#-------------------------------------------------------------------------------
+def __Match(idVendor, idProduct):
+    rtn = []
+    for (v, p), devs in Devices.items():
+        if idVendor in (None, v) and idProduct in (None, p):
+            rtn.extend(devs)
+    return rtn
+
+def find(find_all=False, idVendor=None, idProduct=None):
+    global Finds
+    Finds += 1
+
+    if Devices == None or (Signature != None and Signature != BusSignature()):
+        Enumerate()
+
+    rtn = __Match(idVendor, idProduct)
+
+    if not rtn and Signature == None and time.monotonic() - ScanTime > RescanInterval:
+        Enumerate()
+        rtn = __Match(idVendor, idProduct)
+
+    if find_all:
+        return rtn
+    elif rtn:
+        return rtn[0]
+    else:
+        return None
+
+#-------------------------------------------------------------------------------
+# Main program to test the previous functions
+#-------------------------------------------------------------------------------
+if __name__ == "__main__":
+    try:
+        for p in (0x1902, 0x1904, 0x1932, 0x1942, 0xe6be):
+            print ('Tacx %s: %s' % (hex(p), find(idVendor=0x3561, idProduct=p)))
+        for p in (4104, 4105, 4100):
+            print ('ANT  %s: %s devices' % (p, len(find(find_all=True, idProduct=p))))
+        print ('%s finds, %s enumerations' % (Finds, Scans))
+    except usb.core.NoBackendError as e:
+        print ("usbTopology - No backend, check libusb: " + str(e))
@@ -1,7 +1,60 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2020-12-10"
+__version__ = "2026-10-18"
+# 2026-10-18    The adaptive _ReadFrame() timeout is limited to one poll
+#                   interval (--PollRate)
+# 2026-10-18    Refresh() publishes an immutable TrainerSample (.Sample) by
+#                   assignment; GetSample() returns it without a lock
+# 2026-10-18    T1902 firmware upload: wait until the headunit has disconnected
+#                   before waiting until it answers again
+# 2026-10-18    A cached motor brake identity is verified during the first
+#                   cycles after start; when another brake is connected, the
+#                   identity is replaced and the cache rewritten
+# 2026-10-18    clsUsbAsyncTransfer.Read() returns the newest frame without
+#                   waiting; a frame seen before is reused (UsbReused), not
+#                   counted as empty, and _ReadFrame() does not retry
+# 2026-10-18    GetTrainer() enumerates the USB-bus on each call and opens a
+#                   stale device once more after enumeration; the bus is
+#                   enumerated again after a trainer USB-error
+# 2026-10-18    StopUsbRecording() closes the recording (--UsbRecord)
+# 2026-10-18    clsTacxTrainer.Lock; the setters, GetSample(), GetTarget() and
+#                   the calculations of Refresh() are mutual exclusive, so that
+#                   the trainer can be refreshed by another thread than the one
+#                   handling the ANT commands
+# 2026-10-18    clsUsbAsyncTransfer is started and stopped by the caller
+#                   (StartAsyncTransfer/StopAsyncTransfer), not running while
+#                   idle; Read() returns a frame only once (sequence number)
+# 2026-10-18    clsTrainerThread; pedal stroke samples limited to one stroke
+#                   at low cadence (pedalStroke.MaxStrokeTime)
+# 2026-10-18    Refresh() records the duration of receive, physics and send
+#                   in loopTiming
+# 2026-10-18    i-Vortex and headunit are paired from the extended data of
+#                   the ANT message; ChannelID requested only if not present
+# 2026-10-18    Short buffers: adaptive retry with back-off depending on the
+#                   short-frame rate, last good frame reused on time-out;
+#                   counters for short, empty and timed-out frames
+# 2026-10-18    The motor brake identity is taken from hardwareCache when the
+#                   same headunit is connected to the same USB-port;
+#                   calibration value is cached as well
+# 2026-10-18    clsTacxNewUsbTrainer.__init__() and _ReceiveFromTrainer() poll for
+#                   a valid frame instead of fixed 100ms sleeps; latency of
+#                   the initialisation steps is logged, see Statistics()
+# 2026-10-18    After firmware upload, GetTrainer() polls for re-enumeration
+#                   instead of sleeping 5 seconds
+# 2026-10-18    GetTrainer() uses usbTopology.find(); one USB-bus enumeration
+#                   for all headunits (and the ANT-dongle), cached
+# 2026-10-18    Added: --UsbEmulator; GetTrainer() finds the headunit that is
+#                   emulated by usbEmulator.clsHeadunitEmulator
+# 2026-10-18    Added: --UsbRecord, --UsbReplay; the USB-device is wrapped by
+#                   usbRecorder.clsUsbRecorderDevice or replaced by
+#                   usbRecorder.clsUsbReplayDevice
+# 2026-10-18    USB frame formats are compiled once (struct.Struct) and parsed
+#                   with unpack_from(); 48/64 byte frames are not padded
+# 2026-10-18    Added: clsTrainerThread, --TrainerThread polls the trainer in a
+#                   dedicated thread and publishes an immutable TrainerSample
+# 2026-10-18    Added: clsUsbAsyncTransfer, --UsbAsync keeps USB transfers
+#                   queued in a background thread (double-buffered frames)
 # 2020-12-10    Removed: -u uphill
 # 2020-12-03    For Magnetic brake -r uses the resistance table [0...13]
 #               introduced: Resistance2PowerMB(), under investigation!!
@@ -109,11 +162,12 @@ __version__ = "2020-12-10"
 # 2019-12-25    Target grade implemented; modes defined
 #-------------------------------------------------------------------------------
 import array
-import usb.core
+import collections
 import os
 import random
 import struct
 import sys
+import threading
 import time
 
 import antDongle         as ant
@@ -123,6 +177,12 @@ import structConstants   as sc
 from   FortiusAntGui                import mode_Power, mode_Grade
 import FortiusAntCommand as cmd
 import fxload
+import hardwareCache
+import loopTiming
+import pedalStroke
+import usbEmulator
+import usbRecorder
+import usbTopology
 
 #-------------------------------------------------------------------------------
 # Constants
@@ -146,6 +206,86 @@ modeResistance  = 2
 modeCalibrate   = 3
 modeMotorBrake  = 10        # To distinguish from the previous real modes
 
+#-------------------------------------------------------------------------------
+# The trainer values as published by Refresh() and clsTrainerThread (immutable)
+#-------------------------------------------------------------------------------
+TrainerSample = collections.namedtuple('TrainerSample', \
+                ['Time', 'Buttons', 'ButtonEvents', 'LastButton', 'Cadence', \
+                 'CurrentPower', 'CurrentResistance', 'HeartRate', \
+                 'PedalEcho', 'PedalEchoCount', 'PedalEchoTime', \
+                 'SpeedKmh', 'VirtualSpeedKmh', 'WheelSpeed'])
+
+#-------------------------------------------------------------------------------
+# USB frame formats; refer to TotalReverse
+#-------------------------------------------------------------------------------
+# The formats are compiled once, instead of composed for each received frame.
+# Frames are parsed with unpack_from() on the received buffer, so no copy is
+# made and bytes after the defined fields are simply ignored.
+#-------------------------------------------------------------------------------
+# Legacy interface (iMagic), 21 bytes
+#-------------------------------------------------------------------------------
+LegacyFrame = struct.Struct(sc.no_alignment + \
+        sc.unsigned_char    + #  0      StatusAndCursors
+        sc.unsigned_short   + #  1, 2   Speed (WheelSpeed / SpeedScale = km/h)
+        sc.unsigned_char    + #  3      Cadence
+        sc.unsigned_char    + #  4      HeartRate
+        sc.unsigned_int     + #  5...8  StopWatch
+        sc.unsigned_char    + #  9      CurrentResistance
+        sc.unsigned_char    + # 10      PedalSensor
+        sc.unsigned_char    + # 11      Axis0
+        sc.unsigned_char    + # 12      Axis1
+        sc.unsigned_char    + # 13      Axis2
+        sc.unsigned_char    + # 14      Axis3
+        sc.unsigned_char    + # 15      Counter
+        sc.unsigned_char    + # 16      WheelCount
+        sc.unsigned_char    + # 17      YearProduction
+        sc.unsigned_short   + # 18, 19  DeviceSerial
+        sc.unsigned_char      # 20      FirmwareVersion
+        )
+
+#-------------------------------------------------------------------------------
+# New interface (Fortius), 64 bytes expected, 48 bytes returned by some
+# trainers. The first 48 bytes are decoded, ChecksumMSB (48) is not used.
+#-------------------------------------------------------------------------------
+NewUsbFrame = struct.Struct(sc.no_alignment + \
+        sc.unsigned_short   + #  0, 1   DeviceSerial
+        sc.pad * 6          + #  2...7
+        sc.unsigned_char    + #  8      YearProduction
+        sc.pad * 3          + #  9...11
+        sc.unsigned_char    + # 12      HeartRate
+        sc.unsigned_char    + # 13      Buttons
+        sc.unsigned_char    + # 14      HeartDetect
+        sc.unsigned_char    + # 15      ErrorCount
+        sc.unsigned_short   + # 16, 17  Axis0
+        sc.unsigned_short   + # 18, 19  Axis1
+        sc.unsigned_short   + # 20, 21  Axis2
+        sc.unsigned_short   + # 22, 23  Axis3
+        sc.unsigned_int     + # 24...27 Header
+        sc.unsigned_int     + # 28...31 Distance
+        sc.unsigned_short   + # 32, 33  Speed (WheelSpeed / SpeedScale = km/h)
+        sc.pad * 2          + # 34, 35  Increases if you accellerate?
+        sc.pad * 2          + # 36, 37  Average power?
+        sc.short            + # 38, 39  CurrentResistance
+        sc.short            + # 40, 41  TargetResistance
+        sc.unsigned_char    + # 42      Events
+        sc.pad              + # 43
+        sc.unsigned_char    + # 44      Cadence
+        sc.pad              + # 45
+        sc.unsigned_char    + # 46      ModeEcho
+        sc.unsigned_char      # 47      ChecksumLSB
+        )
+
+#-------------------------------------------------------------------------------
+# New interface, answer to the T1941 Motor Brake Version Message
+#-------------------------------------------------------------------------------
+MotorBrakeFrame = struct.Struct(sc.no_alignment + \
+        sc.pad * 24         + #  0...23
+        sc.unsigned_int     + # 24...27 Header
+        sc.unsigned_int     + # 28...31 MotorBrakeUnitFirmware 0.x.y.z
+        sc.unsigned_int     + # 32...35 MotorBrakeUnitSerial tt-YY-#####
+        sc.unsigned_short     # 36, 37  Version2
+        )
+
 #-------------------------------------------------------------------------------
 # path to firmware files; since 29-3-2020 in same folder as .py or .exe
 #-------------------------------------------------------------------------------
@@ -166,6 +306,13 @@ fortius_fw = os.path.join(dirname, 'tacxfortius_1942_firmware.hex')
 #       -> clsTacxUsbTrainer
 #             -> clsTacxLegacyUsbTrainer    = Tacx iMagic
 #             -> clsTacxNewUsbTrainer       = Tacx Fortius
+#
+# clsUsbAsyncTransfer                       = Background USB-transfers (--UsbAsync)
+# clsTrainerThread                          = Background Refresh() (--TrainerThread)
+#
+# usbRecorder.clsUsbRecorderDevice          = USB-device, frames recorded (--UsbRecord)
+# usbRecorder.clsUsbReplayDevice            = USB-device, frames replayed (--UsbReplay)
+# usbEmulator.clsHeadunitEmulator           = USB-device, emulated headunit (--UsbEmulator)
 #-------------------------------------------------------------------------------
 # Class functions (more info in the classes)
 # ------------------------------------------
@@ -185,11 +332,20 @@ fortius_fw = os.path.join(dirname, 'tacxfortius_1942_firmware.hex')
 #     def SetUserConfiguration(UserWeight, ...)               # Store User
 #
 #     def Refresh(QuarterSecond, TacxMode)                    # Receive, Calculate, Send
+#     def GetSample()                                         # Return the published TrainerSample
+#     def _PublishSample()                                    # Publish TrainerSample after Refresh()
+#     def GetTarget()                                         # Return TargetMode, -Power, -Grade, -Resistance
 #     def SendToTrainer(QuarterSecond, TacxMode)              # To be defined by child class
 #     def _ReceiveFromTrainer()                               # To be defined by child class
+#     def StartAsyncTransfer()                                # To be defined by child class
+#     def StopAsyncTransfer()                                 # Stop background USB-transfers
+#     def StopUsbRecording()                                  # Close the recording (--UsbRecord)
 #     def TargetPower2Resistance()                            # To be defined by child class
 #
 #     def CalibrateSupported()                                # Return whether calibration supported
+#     def GetCachedCalibration()                              # Recent calibration of this trainer
+#     def SetCachedCalibration(Calibrate)                     # Store calibration for next start
+#     def Statistics()                                        # Return timing statistics (or None)
 #
 #     def _Grade2Power()                                      # Calculate required Power from Grade
 #                                                             # This is where the magic is done!
@@ -211,6 +367,7 @@ fortius_fw = os.path.join(dirname, 'tacxfortius_1942_firmware.hex')
 #     def Refresh(QuarterSecond, TacxMode)                    # Add USB-special(s) to parent.Refresh()
 #     def USB_Read()                                          # Read buffer from USB connected Tacx
 #     def SendToTrainer(tacxMode)                             # Send buffer to   USB connected Tacx
+#     def StartAsyncTransfer()                                # Continue USB-transfers in background
 #
 # class clsTacxLegacyUsbTrainer(clsTacxUsbTrainer)
 #     def TargetPower2Resistance()                            # Legacy conversion TargetPower -> TargetResistance
@@ -222,13 +379,21 @@ fortius_fw = os.path.join(dirname, 'tacxfortius_1942_firmware.hex')
 #     def TargetPower2Resistance()                            # New conversion TargetPower -> TargetResistance
 #     def CurrentResistance2Power()                           # New conversion CurrentResistance -> CurrentPower
 #     def SendToTrainerUSBData(TacxMode, ...)                 # Compose new buffer to be sent
+#     def _ReadFrame(Timeout)                                 # Poll for a valid frame (adaptive)
 #     def _ReceiveFromTrainer ()                              # Read and parse new data from trainer
+#     def _ParseMotorBrake(data)                              # Set motor brake identity
+#     def _VerifyMotorBrake(data)                             # Check cached motor brake identity
+#     def SendToTrainer(QuarterSecond, TacxMode)              # Ask motor brake version, when verifying
+#     def Statistics()                                        # Return timing statistics
 #
 #-------------------------------------------------------------------------------
 # c l s T a c x T r a i n e r           The parent for all trainers
 #-------------------------------------------------------------------------------
 class clsTacxTrainer():
     UsbDevice               = None          # clsHeadUnitLegacy and clsHeadUnitNew only!
+    UsbTransfer             = None          # clsUsbAsyncTransfer, when --UsbAsync
+    UsbSequence             = 0             # Sequence of the last frame read
+    UsbReused               = False         # USB_Read() returned no newer frame
     AntDevice               = None          # clsVortexTrainer only!
     OK                      = False
     Message                 = None
@@ -258,6 +423,8 @@ class clsTacxTrainer():
     Axis                    = 0             # int
     Buttons                 = 0             # int
     PreviousButtons         = 0             # int       Issue 135
+    ButtonEvents            = 0             # count of accepted button presses
+    LastButton              = 0             # the last accepted button press
     Cadence                 = 0             # int
     CurrentPower            = 0             # int
     CurrentResistance       = 0             # int
@@ -271,6 +438,7 @@ class clsTacxTrainer():
     CalculatedSpeedKmh      = 0             # see #Power2Speed#
     TargetResistanceFT      = 0             # int       Returned from trainer
     WheelSpeed              = 0             # int
+    Sample                  = None          # TrainerSample, see GetSample()
 
     # Other general variables
     clv                     = None          # Command line variables
@@ -283,6 +451,7 @@ class clsTacxTrainer():
     # USB devices only:
     Headunit                = 0             # The connected headunit in GetTrainer()
     Calibrate               = 0             # The value as established during calibration
+    HardwareKey             = None          # hardwareCache key of the headunit
     SpeedScale              = None          # To be set in sub-class
 
     def __init__(self, clv, Message):
@@ -290,6 +459,8 @@ class clsTacxTrainer():
         self.clv             = clv
         self.Message         = Message
         self.OK              = False
+        self.Lock            = threading.RLock()    # Target*, see Refresh()
+        self._PublishSample()
 
     #---------------------------------------------------------------------------
     # G e t T r a i n e r
@@ -323,26 +494,47 @@ class clsTacxTrainer():
         #-----------------------------------------------------------------------
         # Find supported trainer (actually we talk to a headunit)
         #-----------------------------------------------------------------------
-        for hu in [hu1902, hu1904, hu1932, hu1942, hue6be_nfw]:
-            try:
-                if debug.on(debug.Function):
-                    logfile.Write ("GetTrainer - Check for trainer %s" % (hex(hu)))
-                dev = usb.core.find(idVendor=idVendor_Tacx, idProduct=hu)      # find trainer USB device
-                if dev:
-                    msg = "Connected to Tacx Trainer T" + hex(hu)[2:]          # remove 0x from result
-                    if debug.on(debug.Data2 | debug.Function):
-                        logfile.Print (dev)
-                    break
-            except Exception as e:
-                if debug.on(debug.Function):
-                    logfile.Write ("GetTrainer - " + str(e))
+        if clv.UsbReplay:
+            #-------------------------------------------------------------------
+            # Replay a recording; the headunit is taken from the recording
+            #-------------------------------------------------------------------
+            dev = usbRecorder.clsUsbReplayDevice(clv.UsbReplay, clv.UsbReplayFast)
+            msg = dev.Message
+            if dev.OK:
+                hu  = dev.idProduct
+            else:
+                dev = False
+        else:
+            #-------------------------------------------------------------------
+            # The emulated headunit is found on the emulated USB-bus
+            #-------------------------------------------------------------------
+            if clv.UsbEmulator:
+                usbEmulator.Connect(*clv.UsbEmulator)
+                find = usbEmulator.find
+            else:
+                usbTopology.Invalidate()               # Device may be re-plugged
+                find = usbTopology.find                # Enumerated once, cached
 
-                if "AttributeError" in str(e):
-                    msg = "GetTrainer - Could not find USB trainer: " + str(e)
-                elif "No backend" in str(e):
-                    msg = "GetTrainer - No backend, check libusb: " + str(e)
-                else:
-                    msg = "GetTrainer: " + str(e)
+            for hu in [hu1902, hu1904, hu1932, hu1942, hue6be_nfw]:
+                try:
+                    if debug.on(debug.Function):
+                        logfile.Write ("GetTrainer - Check for trainer %s" % (hex(hu)))
+                    dev = find(idVendor=idVendor_Tacx, idProduct=hu)               # find trainer USB device
+                    if dev:
+                        msg = "Connected to Tacx Trainer T" + hex(hu)[2:]          # remove 0x from result
+                        if debug.on(debug.Data2 | debug.Function):
+                            logfile.Print (dev)
+                        break
+                except Exception as e:
+                    if debug.on(debug.Function):
+                        logfile.Write ("GetTrainer - " + str(e))
+
+                    if "AttributeError" in str(e):
+                        msg = "GetTrainer - Could not find USB trainer: " + str(e)
+                    elif "No backend" in str(e):
+                        msg = "GetTrainer - No backend, check libusb: " + str(e)
+                    else:
+                        msg = "GetTrainer: " + str(e)
 
         #-----------------------------------------------------------------------
         # Initialise trainer (if found)
@@ -356,33 +548,53 @@ class clsTacxTrainer():
             #-------------------------------------------------------------------
             if hu == hu1902:
                 LegacyProtocol = True
-                logfile.Console ("Initialising head unit T1902 (iMagic), please wait 5 seconds")
+
+            if clv.UsbReplay:
+                pass                                           # Recorded headunit was initialised
+
+            elif hu == hu1902:
+                logfile.Console ("Initialising head unit T1902 (iMagic), please wait")
                 logfile.Console (imagic_fw)   # Hint what may be wrong if absent
                 try:
+                    StartTime = time.monotonic()
                     fxload.loadHexFirmware(dev, imagic_fw)
                 except Exception as e:                         # file not found?
                     msg = "GetTrainer: " + str(e)
                     dev = False
                 else:
-                    time.sleep(5)
-                    msg = "T1902 head unit initialised (iMagic)"
+                    #-----------------------------------------------------------
+                    # Wait (max 5 seconds, as before) until it answers again;
+                    # the old device may answer until it has disconnected.
+                    #-----------------------------------------------------------
+                    if not fxload.waitForDisconnect(dev, 2):
+                        logfile.Console ("T1902 head unit did not disconnect after firmware upload")
+                    usbTopology.Invalidate()                   # Device re-enumerates
+                    newdev = fxload.waitForDevice(idVendor_Tacx, hu1902, 5)
+                    if newdev != None: dev = newdev
+                    msg = "T1902 head unit initialised (iMagic) in %3.1f seconds" \
+                                                % (time.monotonic() - StartTime)
 
             #-------------------------------------------------------------------
             # unintialised Fortius (as provided by antifier original code)
             #-------------------------------------------------------------------
-            if hu == hue6be_nfw:
-                logfile.Console ("Initialising head unit T1942 (Fortius), please wait 5 seconds")
+            elif hu == hue6be_nfw:
+                logfile.Console ("Initialising head unit T1942 (Fortius), please wait")
                 logfile.Console (fortius_fw)  # Hint what may be wrong if absent
                 try:
+                    StartTime = time.monotonic()
                     fxload.loadHexFirmware(dev, fortius_fw)
                 except Exception as e:                         # file not found?
                     msg = "GetTrainer: " + str(e)
                     dev = False
                 else:
-                    time.sleep(5)
-                    dev = usb.core.find(idVendor=idVendor_Tacx, idProduct=hu1942)
+                    #-----------------------------------------------------------
+                    # Wait (max 10 seconds) for re-enumeration as T1942
+                    #-----------------------------------------------------------
+                    usbTopology.Invalidate()                   # Device re-enumerates
+                    dev = fxload.waitForDevice(idVendor_Tacx, hu1942, 10)
                     if dev != None:
-                        msg = "T1942 head unit initialised (Fortius)"
+                        msg = "T1942 head unit initialised (Fortius) in %3.1f seconds" \
+                                                % (time.monotonic() - StartTime)
                         hu = hu1942
                     else:
                         msg = "GetTrainer - Unable to load firmware"
@@ -390,11 +602,37 @@ class clsTacxTrainer():
 
             #-------------------------------------------------------------------
             # Set configuration
+            # The found device may be stale (re-plugged or re-enumerated), then
+            # the USB-bus is enumerated and the device is tried once more.
             #-------------------------------------------------------------------
-            if dev != False:
-                dev.set_configuration()
-                if hu == hu1902:
-                    dev.set_interface_altsetting(0, 1)
+            for Retry in (False, True):
+                if dev == False:
+                    break
+                try:
+                    dev.set_configuration()
+                    if hu == hu1902:
+                        dev.set_interface_altsetting(0, 1)
+                    break
+                except Exception as e:
+                    if debug.on(debug.Function):
+                        logfile.Write ("GetTrainer - set_configuration: " + str(e))
+                    if Retry or clv.UsbReplay or clv.UsbEmulator:
+                        msg = "GetTrainer - Cannot open trainer: " + str(e)
+                        dev = False
+                    else:
+                        usbTopology.Invalidate()
+                        dev = usbTopology.find(idVendor=idVendor_Tacx, idProduct=hu) or False
+                        if dev == False:
+                            msg = "GetTrainer - Trainer disappeared: " + str(e)
+
+            #-------------------------------------------------------------------
+            # Record all frames from now on (the initialisation included)
+            #-------------------------------------------------------------------
+            if dev != False and clv.UsbRecord:
+                try:
+                    dev = usbRecorder.clsUsbRecorderDevice(dev, clv.UsbRecord, hu)
+                except Exception as e:
+                    logfile.Console ("GetTrainer - Cannot record USB frames: " + str(e))
 
             #-------------------------------------------------------------------
             # InitialiseTrainer (will not read cadence until init str is sent)
@@ -429,27 +667,35 @@ class clsTacxTrainer():
     # PowercurveFactor:
     # 10% steps insprired by 10-11-12...36-40-44 cassettes.
     # 0.1 ... 3 is arbitrary, where lowerbound 0 is definitely no good idea.
+    #
+    # The values are changed under self.Lock, because Refresh() may be called
+    # by another thread (clsTrainerThread, --Asyncio) than the caller.
     #---------------------------------------------------------------------------
     def ResetPowercurveFactor(self):
-        self.PowercurveFactor   = 1
+        with self.Lock:
+            self.PowercurveFactor   = 1
 
     def SetPowercurveFactorUp(self):
-        if self.PowercurveFactor < 3:
-            self.PowercurveFactor   *= 1.1
+        with self.Lock:
+            if self.PowercurveFactor < 3:
+                self.PowercurveFactor   *= 1.1
 
     def SetPowercurveFactorDown(self):
-        if self.PowercurveFactor > 0.1:
-            self.PowercurveFactor   /= 1.1
+        with self.Lock:
+            if self.PowercurveFactor > 0.1:
+                self.PowercurveFactor   /= 1.1
 
     def SetPower(self, Power):
         if debug.on(debug.Function):logfile.Write ("SetPower(%s)" % Power)
-        self.TargetMode         = mode_Power
-        self.TargetGrade        = 0
-        self.TargetPower        = Power
-        self.TargetResistance   = 0             # .Refresh() must be called
+        with self.Lock:
+            self.TargetMode         = mode_Power
+            self.TargetGrade        = 0
+            self.TargetPower        = Power
+            self.TargetResistance   = 0         # .Refresh() must be called
 
     def AddPower(self, deltaPower):
-        self.SetPower(self.TargetPower + deltaPower)
+        with self.Lock:
+            self.SetPower(self.TargetPower + deltaPower)
 
     def SetGrade(self, Grade):
         if debug.on(debug.Function):  logfile.Write   ("SetGrade(%s)" % Grade)
@@ -457,35 +703,40 @@ class clsTacxTrainer():
         if Grade >  30: Grade =  30
         if Grade < -30: Grade = -30
 
-        self.TargetMode         = mode_Grade
-        self.TargetGrade        = Grade
-        self.TargetPower        = 0             # .Refresh() must be called
-        self.TargetResistance   = 0             # .Refresh() must be called
+        with self.Lock:
+            self.TargetMode         = mode_Grade
+            self.TargetGrade        = Grade
+            self.TargetPower        = 0         # .Refresh() must be called
+            self.TargetResistance   = 0         # .Refresh() must be called
 
     def AddGrade(self, deltaGrade):
-        self.SetGrade(self.TargetGrade + deltaGrade)
+        with self.Lock:
+            self.SetGrade(self.TargetGrade + deltaGrade)
     
     def SetRollingResistance(self, RollingResistance):
         if debug.on(debug.Function):
             logfile.Write ("SetRollingResistance(%s[def=0.004])" % RollingResistance)
 
-        self.RollingResistance = RollingResistance
+        with self.Lock:
+            self.RollingResistance = RollingResistance
 
     def SetWind(self, WindResistance, WindSpeed, DraftingFactor):
         if debug.on(debug.Function):
             logfile.Write ("SetWind(%s[def=0.51], %s[def=0], %s[def=1])" % 
                 (WindResistance, WindSpeed, DraftingFactor) )
 
-        self.WindResistance = WindResistance
-        self.WindSpeed      = WindSpeed
-        self.DraftingFactor = DraftingFactor
+        with self.Lock:
+            self.WindResistance = WindResistance
+            self.WindSpeed      = WindSpeed
+            self.DraftingFactor = DraftingFactor
 
     def SetUserConfiguration(self, UserWeight, BicycleWeight, BicycleWheelDiameter, GearRatio):
-        self.BicycleWeight          = BicycleWeight
-        self.BicycleWheelDiameter   = BicycleWheelDiameter
-        self.GearRatio              = GearRatio
-        self.UserWeight             = UserWeight
-        self.UserAndBikeWeight      = UserWeight + BicycleWeight
+        with self.Lock:
+            self.BicycleWeight          = BicycleWeight
+            self.BicycleWheelDiameter   = BicycleWheelDiameter
+            self.GearRatio              = GearRatio
+            self.UserWeight             = UserWeight
+            self.UserAndBikeWeight      = UserWeight + BicycleWeight
 
     #---------------------------------------------------------------------------
     # SendToTrainer() and ReceivedFromTrainer() to be defined by sub-class
@@ -497,6 +748,27 @@ class clsTacxTrainer():
     def TargetPower2Resistance(self):
         self.TargetResistance = 0                    # child class must redefine
 
+    #---------------------------------------------------------------------------
+    # StartAsyncTransfer() to be defined by USB sub-class
+    # StopAsyncTransfer()  the following USB-transfers are blocking again
+    #---------------------------------------------------------------------------
+    def StartAsyncTransfer(self):
+        pass
+    def StopAsyncTransfer(self):
+        if self.UsbTransfer:
+            self.UsbTransfer.Stop()
+            logfile.Console(self.UsbTransfer.Statistics())
+            self.UsbTransfer = None
+            self.UsbReused   = False
+
+    #---------------------------------------------------------------------------
+    # StopUsbRecording() when the trainer is stopped; the following frames
+    #                    are not recorded (--UsbRecord)
+    #---------------------------------------------------------------------------
+    def StopUsbRecording(self):
+        if isinstance(self.UsbDevice, usbRecorder.clsUsbRecorderDevice):
+            self.UsbDevice.Close()
+
     #---------------------------------------------------------------------------
     # R e f r e s h
     #---------------------------------------------------------------------------
@@ -513,6 +785,13 @@ class clsTacxTrainer():
     #               but it's done here because some calculations depend on the
     #               wheelspeed, so must be redone after each _ReceiveFromTrainer()
     #
+    #               The calculations are done under self.Lock, so that Target***
+    #               cannot be changed halfway; receive and send are not, so that
+    #               the setters do not wait for the USB-transfers
+    #
+    #               The results are published in .Sample; the readers do not
+    #               read the variables that are written meanwhile
+    #
     # Output        Class variables match with Target***
     #---------------------------------------------------------------------------
     def Refresh(self, QuarterSecond, TacxMode):
@@ -521,161 +800,206 @@ class clsTacxTrainer():
         #-----------------------------------------------------------------------
         # FIrst get data from the trainer
         #-----------------------------------------------------------------------
+        Timing = loopTiming.Timing
+        t = Timing.Start()
         self._ReceiveFromTrainer()
+        t = Timing.Stop('Trainer receive', t)
 
         #-----------------------------------------------------------------------
         # Make all variables consistent
         #-----------------------------------------------------------------------
+        with self.Lock:
 
-        #-----------------------------------------------------------------------
-        # Issue 135
-        # Avoid multiple button press when polling faster than button released
-        #-----------------------------------------------------------------------
-        if self.PreviousButtons == 0:
-            # if self.Buttons: print('Button press %s' % self.Buttons)
-            # The button was NOT pressed the previous cycle
-            # Therefore the button is accepted (rising edge)
-            self.PreviousButtons = self.Buttons
-        else:
-            # if self.Buttons: print('Button press %s ignored' % self.Buttons)
-            # Remember the current state of Buttons, must become zero before
-            # a button press is accepted
-            self.PreviousButtons = self.Buttons
-            # Button was pressed previous cycle, so ignore now
-            self.Buttons = 0
-
-        #-----------------------------------------------------------------------
-        # PedalEcho for Speed and Cadence Sensor
-        #-----------------------------------------------------------------------
-        if self.PedalEcho == 1 and self.PreviousPedalEcho == 0:
-            self.PedalEchoCount += 1
-            self.PedalEchoTime   = time.time()
-        self.PreviousPedalEcho = self.PedalEcho
-
-        #-----------------------------------------------------------------------
-        # Calculate Virtual speed applying the digital gearbox
-        # if DOWN has been pressed, we pretend to be riding slower than the
-        #       trainer wheel rotates
-        # if UP has been pressed, we pretend to be faster than the trainer
-        #
-        # Note that Grade2Power() depends on the VirtualSpeed.
-        #-----------------------------------------------------------------------
-        self.VirtualSpeedKmh = self.SpeedKmh * self.PowercurveFactor
+            #-----------------------------------------------------------------------
+            # Issue 135
+            # Avoid multiple button press when polling faster than button released
+            #-----------------------------------------------------------------------
+            if self.PreviousButtons == 0:
+                # if self.Buttons: print('Button press %s' % self.Buttons)
+                # The button was NOT pressed the previous cycle
+                # Therefore the button is accepted (rising edge)
+                self.PreviousButtons = self.Buttons
+            else:
+                # if self.Buttons: print('Button press %s ignored' % self.Buttons)
+                # Remember the current state of Buttons, must become zero before
+                # a button press is accepted
+                self.PreviousButtons = self.Buttons
+                # Button was pressed previous cycle, so ignore now
+                self.Buttons = 0
 
-        # No negative value defined for ANT message Page25 (#)
-        if self.CurrentPower < 0: self.CurrentPower = 0 
+            if self.Buttons:                    # Administrate for clsTrainerThread
+                self.ButtonEvents += 1
+                self.LastButton    = self.Buttons
 
-        assert (self.TargetMode in (mode_Power, mode_Grade))
-        if self.TargetMode == mode_Power:
-            pass
-
-        elif self.TargetMode == mode_Grade:
-            self._Grade2Power()
+            #-----------------------------------------------------------------------
+            # PedalEcho for Speed and Cadence Sensor
+            #-----------------------------------------------------------------------
+            if self.PedalEcho == 1 and self.PreviousPedalEcho == 0:
+                self.PedalEchoCount += 1
+                self.PedalEchoTime   = time.time()
+            self.PreviousPedalEcho = self.PedalEcho
 
-        #-----------------------------------------------------------------------
-        # For all modes: To be implemented by USB-trainers; pass for others
-        #-----------------------------------------------------------------------
-        self.TargetPower2Resistance()
+            #-----------------------------------------------------------------------
+            # Calculate Virtual speed applying the digital gearbox
+            # if DOWN has been pressed, we pretend to be riding slower than the
+            #       trainer wheel rotates
+            # if UP has been pressed, we pretend to be faster than the trainer
+            #
+            # Note that Grade2Power() depends on the VirtualSpeed.
+            #-----------------------------------------------------------------------
+            self.VirtualSpeedKmh = self.SpeedKmh * self.PowercurveFactor
 
-        #-----------------------------------------------------------------------
-        # Antifier's calibration; valid for USB devices only
-        #                         non-USB classes will set PowerFactor=1
-        #
-        # The idea is that Power2Resistance gives insufficient resistance
-        # and that the formula can be corrected with the PowerFactor.
-        # Therefore before Send:
-        #       the TargetResistance is multiplied by factor
-        # and after Receive:
-        #       the CurrentResistance and CurrentPower are divided by factor
-        # Just for antifier upwards compatibility; usage unknown.
-        #-----------------------------------------------------------------------
-        if self.clv.PowerFactor:
-            self.TargetResistance  *= self.clv.PowerFactor  # Will be sent
+            # No negative value defined for ANT message Page25 (#)
+            if self.CurrentPower < 0: self.CurrentPower = 0 
 
-            self.CurrentResistance /= self.clv.PowerFactor  # Was just received
-            self.CurrentPower      /= self.clv.PowerFactor  # Was just received
+            assert (self.TargetMode in (mode_Power, mode_Grade))
+            if self.TargetMode == mode_Power:
+                pass
 
-        # ----------------------------------------------------------------------
-        # Dynamic Adjustment of Resistance
-        # ----------------------------------------------------------------------
-        # In PowerMode, first we calculate TargetResistance (based upon TargetPower and Speed)
-        # and as a consequence, the CurrentPower should be equal to TargetPower.
-        # If the Speed goes up, Resistance goes down (and vv).
-        #
-        # If CurrentPower does not match TargetPower (at a stable speed) the
-        # calculation may be off and we correct that here. This appeared to be
-        # usefull for very low target-powers (e.g. FTP=50Watt) because that's
-        # close to the power you need to ride without brake activated.
-        #
-        # Refer to SendToTrainerUSBData(); the minimum Resistance was limitted to
-        # avoid the motor-brake function, which seemed strange. But especially
-        # in these low-power situations, it is applicable. 
-        # So this entire section could be obsolete (realized with if True).
-        # ----------------------------------------------------------------------
-        # If the CurrentPower is higher than the TargetPower, we could correct
-        # with a factor (CurrentPower / TargetPower).
-        # To avoid too quick correct we adjust only partially every cycle.
-        #
-        # DynamicAdjust is limitted to range 0.1 ... 2
-        #
-        # Is disabled with "If False"
-        # ----------------------------------------------------------------------
-        if False:
-            if self.TargetMode != mode_Power or self.CurrentPower < 25:
-                self.DynamicAdjust = 1                  # and no further action
-            else:
-                da   = self.TargetPower / self.CurrentPower
-                Low  = 0.01     # Don't drop to 0, you would never get back again!
-                High = 2.0      # Just to have an upper limit
-                NrCycles = 10   # Adjust the full difference in X cycles
-
-                self.DynamicAdjust *= ( NrCycles + da ) / ( NrCycles + 1 )
-                self.DynamicAdjust = max(Low,  self.DynamicAdjust)
-                self.DynamicAdjust = min(High, self.DynamicAdjust)
-
-                # Write to logfile, but only when changing and not too many
-                if not (0.95 < da and da < 1.05) and (Low < self.DynamicAdjust and self.DynamicAdjust < High):
-                    logfile.Console ("CurrentPower %4.1f does not match TargetPower %3.0f ==> Correct = %3.2f" % \
-                                        (self.CurrentPower, self.TargetPower, self.DynamicAdjust)  \
-                                    )
-                # ------------------------------------------------------------------
-                # Dynamically adjust resistance
-                # Note: CurrentResistance and the CurrentPower remain unchanged!
-                # ------------------------------------------------------------------
-                self.TargetResistance *= self.DynamicAdjust    # Will be sent
+            elif self.TargetMode == mode_Grade:
+                self._Grade2Power()
 
-        # ----------------------------------------------------------------------
-        # Round after all these calculations
-        # ----------------------------------------------------------------------
-        self.TargetPower         = int(self.TargetPower)
-        self.TargetResistance    = int(self.TargetResistance)
-        self.CurrentResistance   = int(self.CurrentResistance)
-        self.CurrentPower        = int(self.CurrentPower)
-        self.SpeedKmh            = round(self.SpeedKmh,1)
-        self.VirtualSpeedKmh     = round(self.VirtualSpeedKmh,1)
+            #-----------------------------------------------------------------------
+            # For all modes: To be implemented by USB-trainers; pass for others
+            #-----------------------------------------------------------------------
+            self.TargetPower2Resistance()
 
-        # ----------------------------------------------------------------------
-        # Show the virtual cassette, calculated from a 10 teeth sprocket
-        # If PowercurveFactor = 1  : 15 teeth
-        # If PowercurveFactor = 0.9: 14 teeth
-        # Limit of PowercurveFactor is done at the up/down button
-        # 15 is choosen so that when going heavier, first 14,12,11 teeth is
-        #     shown. Numbers like 5,4,3 would be irrealistic in real world.
-        #     Of course the number of teeth is a reference number.
-        #
-        # Set FortiusAntGui.py OnPaint() for details.
-        #       PowercurveFactor = 0.1 = 150 teeth
-        #       PowercurveFactor = 0.5 =  30 teeth
-        #       PowercurveFactor = 1.0 =  15 teeth
-        #       PowercurveFactor = 2.0 =   8 teeth
-        #       PowercurveFactor = 3.0 =   5 teeth
-        # ----------------------------------------------------------------------
-        self.Teeth = int(15 / self.PowercurveFactor)
+            #-----------------------------------------------------------------------
+            # Antifier's calibration; valid for USB devices only
+            #                         non-USB classes will set PowerFactor=1
+            #
+            # The idea is that Power2Resistance gives insufficient resistance
+            # and that the formula can be corrected with the PowerFactor.
+            # Therefore before Send:
+            #       the TargetResistance is multiplied by factor
+            # and after Receive:
+            #       the CurrentResistance and CurrentPower are divided by factor
+            # Just for antifier upwards compatibility; usage unknown.
+            #-----------------------------------------------------------------------
+            if self.clv.PowerFactor:
+                self.TargetResistance  *= self.clv.PowerFactor  # Will be sent
+
+                self.CurrentResistance /= self.clv.PowerFactor  # Was just received
+                self.CurrentPower      /= self.clv.PowerFactor  # Was just received
+
+            # ----------------------------------------------------------------------
+            # Dynamic Adjustment of Resistance
+            # ----------------------------------------------------------------------
+            # In PowerMode, first we calculate TargetResistance (based upon TargetPower and Speed)
+            # and as a consequence, the CurrentPower should be equal to TargetPower.
+            # If the Speed goes up, Resistance goes down (and vv).
+            #
+            # If CurrentPower does not match TargetPower (at a stable speed) the
+            # calculation may be off and we correct that here. This appeared to be
+            # usefull for very low target-powers (e.g. FTP=50Watt) because that's
+            # close to the power you need to ride without brake activated.
+            #
+            # Refer to SendToTrainerUSBData(); the minimum Resistance was limitted to
+            # avoid the motor-brake function, which seemed strange. But especially
+            # in these low-power situations, it is applicable. 
+            # So this entire section could be obsolete (realized with if True).
+            # ----------------------------------------------------------------------
+            # If the CurrentPower is higher than the TargetPower, we could correct
+            # with a factor (CurrentPower / TargetPower).
+            # To avoid too quick correct we adjust only partially every cycle.
+            #
+            # DynamicAdjust is limitted to range 0.1 ... 2
+            #
+            # Is disabled with "If False"
+            # ----------------------------------------------------------------------
+            if False:
+                if self.TargetMode != mode_Power or self.CurrentPower < 25:
+                    self.DynamicAdjust = 1                  # and no further action
+                else:
+                    da   = self.TargetPower / self.CurrentPower
+                    Low  = 0.01     # Don't drop to 0, you would never get back again!
+                    High = 2.0      # Just to have an upper limit
+                    NrCycles = 10   # Adjust the full difference in X cycles
+
+                    self.DynamicAdjust *= ( NrCycles + da ) / ( NrCycles + 1 )
+                    self.DynamicAdjust = max(Low,  self.DynamicAdjust)
+                    self.DynamicAdjust = min(High, self.DynamicAdjust)
+
+                    # Write to logfile, but only when changing and not too many
+                    if not (0.95 < da and da < 1.05) and (Low < self.DynamicAdjust and self.DynamicAdjust < High):
+                        logfile.Console ("CurrentPower %4.1f does not match TargetPower %3.0f ==> Correct = %3.2f" % \
+                                            (self.CurrentPower, self.TargetPower, self.DynamicAdjust)  \
+                                        )
+                    # ------------------------------------------------------------------
+                    # Dynamically adjust resistance
+                    # Note: CurrentResistance and the CurrentPower remain unchanged!
+                    # ------------------------------------------------------------------
+                    self.TargetResistance *= self.DynamicAdjust    # Will be sent
+
+            # ----------------------------------------------------------------------
+            # Round after all these calculations
+            # ----------------------------------------------------------------------
+            self.TargetPower         = int(self.TargetPower)
+            self.TargetResistance    = int(self.TargetResistance)
+            self.CurrentResistance   = int(self.CurrentResistance)
+            self.CurrentPower        = int(self.CurrentPower)
+            self.SpeedKmh            = round(self.SpeedKmh,1)
+            self.VirtualSpeedKmh     = round(self.VirtualSpeedKmh,1)
+
+            # ----------------------------------------------------------------------
+            # Show the virtual cassette, calculated from a 10 teeth sprocket
+            # If PowercurveFactor = 1  : 15 teeth
+            # If PowercurveFactor = 0.9: 14 teeth
+            # Limit of PowercurveFactor is done at the up/down button
+            # 15 is choosen so that when going heavier, first 14,12,11 teeth is
+            #     shown. Numbers like 5,4,3 would be irrealistic in real world.
+            #     Of course the number of teeth is a reference number.
+            #
+            # Set FortiusAntGui.py OnPaint() for details.
+            #       PowercurveFactor = 0.1 = 150 teeth
+            #       PowercurveFactor = 0.5 =  30 teeth
+            #       PowercurveFactor = 1.0 =  15 teeth
+            #       PowercurveFactor = 2.0 =   8 teeth
+            #       PowercurveFactor = 3.0 =   5 teeth
+            # ----------------------------------------------------------------------
+            self.Teeth = int(15 / self.PowercurveFactor)
+            self._PublishSample()
+            t = Timing.Stop('Trainer physics', t)
             
         #-----------------------------------------------------------------------
         # Then send the results to the trainer again
         #-----------------------------------------------------------------------
         self.SendToTrainer(QuarterSecond, TacxMode)
+        Timing.Stop('Trainer send', t)
+
+    #---------------------------------------------------------------------------
+    # G e t S a m p l e ,   P u b l i s h S a m p l e
+    #---------------------------------------------------------------------------
+    # Input         Class variables as set by Refresh()
+    #
+    # Function      _PublishSample(): copy the actual trainer values into an
+    #               immutable sample, at the end of Refresh().
+    #               GetSample(): return the last published sample; assigning
+    #               an object is atomic, so no lock is needed to read it.
+    #
+    # Returns       TrainerSample
+    #---------------------------------------------------------------------------
+    def GetSample(self):
+        return self.Sample
+
+    def _PublishSample(self):
+        self.Sample = TrainerSample(time.time(), self.Buttons, self.ButtonEvents, \
+                    self.LastButton, self.Cadence, self.CurrentPower, \
+                    self.CurrentResistance, self.HeartRate, self.PedalEcho, \
+                    self.PedalEchoCount, self.PedalEchoTime, self.SpeedKmh, \
+                    self.VirtualSpeedKmh, self.WheelSpeed)
+
+    #---------------------------------------------------------------------------
+    # G e t T a r g e t
+    #---------------------------------------------------------------------------
+    # Function      Return the target values, consistent with each other
+    #
+    # Returns       (TargetMode, TargetPower, TargetGrade, TargetResistance)
+    #---------------------------------------------------------------------------
+    def GetTarget(self):
+        with self.Lock:
+            return (self.TargetMode, self.TargetPower, self.TargetGrade, \
+                    self.TargetResistance)
 
     #---------------------------------------------------------------------------
     # C a l i b r a t e S u p p o r t e d
@@ -693,6 +1017,42 @@ class clsTacxTrainer():
         #     return False
         return self.MotorBrake
 
+    #---------------------------------------------------------------------------
+    # G e t C a c h e d C a l i b r a t i o n
+    # S e t C a c h e d C a l i b r a t i o n
+    #---------------------------------------------------------------------------
+    # input     HardwareKey, Calibrate
+    #
+    # function  Get the calibration of this trainer, if done recently
+    #           (e.g. when restarted during a session)
+    #           Store the calibration of this trainer
+    #
+    # returns   Calibrate (0 if not available)
+    #---------------------------------------------------------------------------
+    def GetCachedCalibration(self):
+        rtn = 0
+        Identity = hardwareCache.Get('Headunit', self.HardwareKey)
+        if Identity and 'Calibrate' in Identity and \
+                time.time() - Identity['CalibrateTime'] < hardwareCache.CalibrateValidity:
+            rtn = Identity['Calibrate']
+        return rtn
+
+    def SetCachedCalibration(self, Calibrate):
+        hardwareCache.Put('Headunit', self.HardwareKey, \
+                    {'Calibrate': float(Calibrate), 'CalibrateTime': time.time()})
+
+    #---------------------------------------------------------------------------
+    # S t a t i s t i c s
+    #---------------------------------------------------------------------------
+    # input     none
+    #
+    # function  Timing statistics of the trainer communication
+    #
+    # returns   string, None if not available
+    #---------------------------------------------------------------------------
+    def Statistics(self):
+        return None
+
     #---------------------------------------------------------------------------
     # Convert G r a d e T o P o w e r           |  Grade = slope
     #---------------------------------------------------------------------------
@@ -930,6 +1290,11 @@ class clsSimulatedTrainer(clsTacxTrainer):
     # --------------------------------------------------------------------------
     def Refresh (self, _QuarterSecond=None, _TacxMode=None):
         if debug.on(debug.Function):logfile.Write ("clsSimulatedTrainer.Refresh()")
+        with self.Lock:
+            self.__Refresh()
+            self._PublishSample()
+
+    def __Refresh (self):
         # ----------------------------------------------------------------------
         # Trigger for pedalstroke analysis (PedalEcho)
         # Data for Speed and Cadence Sensor (-Time and -Count)
@@ -1025,6 +1390,8 @@ class clsTacxAntVortexTrainer(clsTacxTrainer):
     # input     __data as collected by HandleANTmessage
     #
     # function  Now provide data to TacxTrainer
+    #           under self.Lock, HandleANTmessage() may be called by another
+    #           thread (--Asyncio)
     #
     # returns   Buttons, Cadence, CurrentPower, SpeedKmh, Message
     #
@@ -1032,6 +1399,10 @@ class clsTacxAntVortexTrainer(clsTacxTrainer):
     #                WheelSpeed
     #---------------------------------------------------------------------------
     def _ReceiveFromTrainer(self):
+        with self.Lock:
+            self.__ReceiveFromTrainer()
+
+    def __ReceiveFromTrainer(self):
         # ----------------------------------------------------------------------
         # Data provided by data pages
         # ----------------------------------------------------------------------
@@ -1140,6 +1511,7 @@ class clsTacxAntVortexTrainer(clsTacxTrainer):
     def HandleANTmessage(self, msg):
         _synch, _length, id, info, _checksum, _rest, Channel, DataPageNumber = \
                                                        ant.DecomposeMessage(msg)
+        ExtendedData= ant.unmsgExtendedData(msg)        # The paired device
         dataHandled = False
         messages    = []
         #-----------------------------------------------------------------------
@@ -1156,7 +1528,12 @@ class clsTacxAntVortexTrainer(clsTacxTrainer):
                 #---------------------------------------------------------------
                 # Ask what device is paired
                 #---------------------------------------------------------------
-                if not self.__AntVTXpaired:
+                if self.__AntVTXpaired:
+                    pass
+                elif ExtendedData and ExtendedData.DeviceTypeID == ant.DeviceTypeID_VTX:
+                    self.__AntVTXpaired    = True
+                    self.__DeviceNumberVTX = ExtendedData.DeviceNumber
+                else:
                     msg = ant.msg4D_RequestMessage(ant.channel_VTX_s, ant.msgID_ChannelID)
                     messages.append ( msg )
 
@@ -1240,7 +1617,11 @@ class clsTacxAntVortexTrainer(clsTacxTrainer):
                 #---------------------------------------------------------------
                 # Ask what device is paired
                 #---------------------------------------------------------------
-                if not self.__AntVHUpaired:
+                if self.__AntVHUpaired:
+                    pass
+                elif ExtendedData and ExtendedData.DeviceTypeID == ant.DeviceTypeID_VHU:
+                    messages.extend ( self.__PairedVHU(ExtendedData.DeviceNumber) )
+                else:
                     msg = ant.msg4D_RequestMessage(ant.channel_VHU_s, ant.msgID_ChannelID)
                     messages.append ( msg )
 
@@ -1259,16 +1640,7 @@ class clsTacxAntVortexTrainer(clsTacxTrainer):
 
                 if DeviceTypeID == ant.DeviceTypeID_VHU:
                     dataHandled = True
-                    self.__AntVHUpaired    = True
-                    self.__DeviceNumberVHU = DeviceNumber
-
-                    #-----------------------------------------------------------
-                    # And tell to switch to PC-mode
-                    #-----------------------------------------------------------
-                    info = ant.msgPage172_TacxVortexHU_ChangeHeadunitMode (\
-                                             ant.channel_VHU_s, ant.VHU_PCmode)
-                    msg  = ant.ComposeMessage (ant.msgID_BroadcastData, info)
-                    messages.append ( msg )
+                    messages.extend ( self.__PairedVHU(DeviceNumber) )
 
             #-------------------------------------------------------------------
             # Outer loop does not need to handle channel_VHU_s messages
@@ -1283,6 +1655,290 @@ class clsTacxAntVortexTrainer(clsTacxTrainer):
 
         return dataHandled
 
+    #---------------------------------------------------------------------------
+    # PairedVHU()
+    #---------------------------------------------------------------------------
+    # The headunit is paired, either from ChannelID or from extended data;
+    # returns the message that tells the headunit to switch to PC-mode
+    #---------------------------------------------------------------------------
+    def __PairedVHU(self, DeviceNumber):
+        self.__AntVHUpaired    = True
+        self.__DeviceNumberVHU = DeviceNumber
+
+        info = ant.msgPage172_TacxVortexHU_ChangeHeadunitMode (\
+                                 ant.channel_VHU_s, ant.VHU_PCmode)
+        msg  = ant.ComposeMessage (ant.msgID_BroadcastData, info)
+        return [msg]
+
+#-------------------------------------------------------------------------------
+# c l s U s b A s y n c T r a n s f e r
+#-------------------------------------------------------------------------------
+# Blocking read(0x82, 64, 30) and write(0x02, data, 30) in every Refresh() can
+# stall the caller for up to 60ms, so CycleTimeFast cannot really be met.
+#
+# pyusb has no asynchronous transfers, so a thread is used to keep a write and
+# a read transfer in flight all the time:
+# - the headunit only answers after receiving a frame from the host, therefore
+#   the most recent command is (re-)sent every cycle
+# - the answer is read into the back-buffer of a pair of 64-byte buffers;
+#   when complete the buffers are swapped.
+# Read() returns the newest completed frame (front-buffer) without waiting
+# for a USB-transfer; Write() only replaces the command to be sent.
+# Each frame has a sequence number, so that the caller knows whether the frame
+# is seen before; then there is no newer frame, which is not an error.
+#
+# The thread writes to the headunit until Stop(); the owner must Stop() when
+# the trainer is stopped, so that the device is not used while idle or by a
+# next instance.
+#-------------------------------------------------------------------------------
+class clsUsbAsyncTransfer():
+    def __init__(self, UsbDevice, Interval = 0.01):
+        if debug.on(debug.Function):logfile.Write ("clsUsbAsyncTransfer.__init__()")
+        self.UsbDevice  = UsbDevice
+        self.Interval   = Interval              # Minimum time between transfers
+        self.Buffers    = [array.array('B', [0] * 64), array.array('B', [0] * 64)]
+        self.Lengths    = [0, 0]
+        self.Front      = 0                     # Buffer with the newest frame
+        self.Sequence   = 0                     # of the front-buffer; 0=none
+        self.Lock       = threading.Lock()      # Protects Front and Sequence
+        self.Command    = None                  # Most recent command to be sent
+        self.Running    = False
+        self.Thread     = None
+
+        self.StartTime  = 0                     # Statistics
+        self.Frames     = 0
+        self.Empty      = 0
+        self.Writes     = 0
+        self.Errors     = 0
+
+    def Start(self):
+        if not self.Running:
+            self.Running   = True
+            self.StartTime = time.monotonic()
+            self.Thread    = threading.Thread(target=self.__Transfer, daemon=True)
+            self.Thread.start()
+
+    def Stop(self):
+        self.Running = False
+        if self.Thread:
+            self.Thread.join()
+            self.Thread = None
+
+    #---------------------------------------------------------------------------
+    # W r i t e   /   R e a d
+    #---------------------------------------------------------------------------
+    # Write     The command is picked up by the next transfer-cycle
+    #
+    # Read      returns (Sequence, data); a copy of the newest completed frame,
+    #           without waiting. Sequence=0 and data is empty when no frame
+    #           is received yet.
+    #---------------------------------------------------------------------------
+    def Write(self, data):
+        self.Command = data
+
+    def Read(self):
+        with self.Lock:
+            return self.Sequence, self.Buffers[self.Front][:self.Lengths[self.Front]]
+
+    #---------------------------------------------------------------------------
+    # S t a t i s t i c s
+    #---------------------------------------------------------------------------
+    def Statistics(self):
+        Elapsed = max(0.001, time.monotonic() - self.StartTime)
+        return "USB async transfer: %s frames in %4.0f seconds = %4.1f Hz (empty=%s, writes=%s, errors=%s)" % \
+                (self.Frames, Elapsed, self.Frames / Elapsed, self.Empty, self.Writes, self.Errors)
+
+    #---------------------------------------------------------------------------
+    # The transfer thread
+    #---------------------------------------------------------------------------
+    def __Transfer(self):
+        if debug.on(debug.Function):logfile.Write ("clsUsbAsyncTransfer.__Transfer() started")
+        while self.Running:
+            StartTime = time.monotonic()
+            #-------------------------------------------------------------------
+            # Send most recent command
+            #-------------------------------------------------------------------
+            Command = self.Command
+            if Command != None:
+                try:
+                    self.UsbDevice.write(0x02, Command, 30)
+                    self.Writes += 1
+                except Exception as e:
+                    self.Errors += 1
+                    usbTopology.Invalidate()        # Device may be gone
+                    if self.Errors == 1 or debug.on(debug.Data2):
+                        logfile.Console("Write to USB trainer error: " + str(e))
+
+            #-------------------------------------------------------------------
+            # Receive in the back-buffer, then swap
+            #-------------------------------------------------------------------
+            Back = 1 - self.Front
+            n    = 0
+            try:
+                n = self.UsbDevice.read(0x82, self.Buffers[Back], 30)
+            except TimeoutError:
+                pass
+            except Exception as e:
+                if "timeout error" in str(e) or "timed out" in str(e):
+                    pass
+                else:
+                    self.Errors += 1
+                    usbTopology.Invalidate()        # Device may be gone
+                    if self.Errors == 1 or debug.on(debug.Data2):
+                        logfile.Console("Read from USB trainer error: " + str(e))
+
+            if n:
+                with self.Lock:
+                    self.Lengths[Back] = n
+                    self.Front         = Back
+                    self.Sequence     += 1
+                self.Frames += 1
+            else:
+                self.Empty  += 1
+
+            #-------------------------------------------------------------------
+            # Do not flood the headunit
+            #-------------------------------------------------------------------
+            SleepTime = self.Interval - (time.monotonic() - StartTime)
+            if SleepTime > 0: time.sleep(SleepTime)
+
+        if debug.on(debug.Function):logfile.Write ("clsUsbAsyncTransfer.__Transfer() ended")
+
+#-------------------------------------------------------------------------------
+# c l s T r a i n e r T h r e a d
+#-------------------------------------------------------------------------------
+# Without this class, Refresh() is called from the Tacx2Dongle, Runoff and Idle
+# loops; so the trainer is polled at the speed of those loops, including ANT,
+# the user-interface and logging.
+#
+# With --TrainerThread, this thread is the only one to use the trainer:
+# - Refresh() is called every PollTime seconds, using TacxMode as set by
+#   the caller
+# - after each Refresh() an immutable TrainerSample is published in .Sample;
+#   assigning an object is atomic, so the reader needs no lock
+# - pedal stroke data is collected at the polling rate and a completed stroke
+#   is published in .PedalStroke
+# - the setters of TacxTrainer (SetPower, SetGrade, ...) may be called by the
+#   consumer meanwhile; TacxTrainer.Lock keeps Refresh() consistent
+#
+# Stop() waits for the last Refresh(), then the caller may send modeStop.
+# GetSample() and GetPedalStroke() are to be called by ONE consumer.
+#-------------------------------------------------------------------------------
+class clsTrainerThread():
+    def __init__(self, TacxTrainer, PollTime, PedalStrokeAnalysis = False):
+        if debug.on(debug.Function):logfile.Write ("clsTrainerThread.__init__()")
+        self.TacxTrainer         = TacxTrainer
+        self.PollTime            = PollTime
+        self.PedalStrokeAnalysis = PedalStrokeAnalysis
+        self.TacxMode            = modeStop         # Set by the consumer
+        self.Sample              = TacxTrainer.GetSample()
+        self.PedalStroke         = None             # (Sequence, pdaInfo, Cadence)
+        self.Running             = False
+        self.Thread              = None
+
+        self.ButtonEvents        = self.Sample.ButtonEvents # Consumer-side
+        self.PedalStrokeSeq      = 0                        # Consumer-side
+
+        self.Refreshes           = 0                # Statistics
+        self.Overruns            = 0
+
+    def Start(self):
+        if not self.Running:
+            self.Running = True
+            self.Thread  = threading.Thread(target=self.__Poll, daemon=True)
+            self.Thread.start()
+
+    def Stop(self):
+        self.Running = False
+        if self.Thread:
+            self.Thread.join()
+            self.Thread = None
+
+    #---------------------------------------------------------------------------
+    # G e t S a m p l e
+    #---------------------------------------------------------------------------
+    # Function  Return the last published sample.
+    #           A button press, accepted by Refresh() since the previous call,
+    #           is returned once; even when the thread saw it 20ms only.
+    #
+    # Returns   TrainerSample
+    #---------------------------------------------------------------------------
+    def GetSample(self):
+        s = self.Sample
+        if s.ButtonEvents != self.ButtonEvents:
+            self.ButtonEvents = s.ButtonEvents
+            s = s._replace(Buttons = s.LastButton)
+        elif s.Buttons:
+            s = s._replace(Buttons = 0)             # Already returned
+        return s
+
+    #---------------------------------------------------------------------------
+    # G e t P e d a l S t r o k e
+    #---------------------------------------------------------------------------
+    # Returns   (pdaInfo, Cadence) of a stroke completed since previous call
+    #           None when no new stroke available
+    #---------------------------------------------------------------------------
+    def GetPedalStroke(self):
+        rtn    = None
+        Stroke = self.PedalStroke
+        if Stroke and Stroke[0] != self.PedalStrokeSeq:
+            self.PedalStrokeSeq = Stroke[0]
+            rtn = (Stroke[1], Stroke[2])
+        return rtn
+
+    #---------------------------------------------------------------------------
+    # S t a t i s t i c s
+    #---------------------------------------------------------------------------
+    def Statistics(self):
+        return "Trainer thread: %s refreshes, polltime=%sms, %s overruns" % \
+                (self.Refreshes, int(self.PollTime * 1000), self.Overruns)
+
+    #---------------------------------------------------------------------------
+    # The polling thread
+    #---------------------------------------------------------------------------
+    def __Poll(self):
+        if debug.on(debug.Function):logfile.Write ("clsTrainerThread.__Poll() started")
+        pdaInfo         = []                        # Collection of (time, power)
+        LastPedalEcho   = 0
+        Sequence        = 0
+        while self.Running:
+            StartTime = time.time()
+            #-------------------------------------------------------------------
+            # Receive, Calculate, Send and publish
+            #-------------------------------------------------------------------
+            try:
+                self.TacxTrainer.Refresh(True, self.TacxMode)
+            except Exception as e:
+                logfile.Console("Trainer thread; Refresh() error: " + str(e))
+            s = self.TacxTrainer.GetSample()
+            self.Sample     = s
+            self.Refreshes += 1
+
+            #-------------------------------------------------------------------
+            # Pedal stroke analysis at the polling rate
+            #-------------------------------------------------------------------
+            if self.PedalStrokeAnalysis:
+                if LastPedalEcho == 0 and s.PedalEcho == 1 and \
+                    len(pdaInfo) and s.Cadence:
+                    Sequence += 1
+                    self.PedalStroke = (Sequence, pdaInfo, s.Cadence)
+                    pdaInfo = []
+                elif len(pdaInfo) and s.Time - pdaInfo[0][0] > pedalStroke.MaxStrokeTime:
+                    pdaInfo = []                    # Not pedalling
+                pdaInfo.append((s.Time, s.CurrentPower))
+                LastPedalEcho = s.PedalEcho
+
+            #-------------------------------------------------------------------
+            # WAIT untill PollTime is done
+            #-------------------------------------------------------------------
+            SleepTime = self.PollTime - (time.time() - StartTime)
+            if SleepTime > 0:
+                time.sleep(SleepTime)
+            else:
+                self.Overruns += 1
+
+        if debug.on(debug.Function):logfile.Write ("clsTrainerThread.__Poll() ended")
+
 #-------------------------------------------------------------------------------
 # c l s T a c x U s b T r a i n e r
 #-------------------------------------------------------------------------------
@@ -1354,6 +2010,14 @@ class clsTacxUsbTrainer(clsTacxTrainer):
     # returns   data
     #---------------------------------------------------------------------------
     def USB_Read(self):
+        if self.UsbTransfer:                    # Newest frame, perhaps seen before
+            Sequence, data   = self.UsbTransfer.Read()
+            self.UsbReused   = (Sequence == self.UsbSequence)
+            self.UsbSequence = Sequence
+            if debug.on(debug.Data2):
+                logfile.Write   ("Trainer recv data=%s (len=%s) async reused=%s" % (logfile.HexSpace(data), len(data), self.UsbReused))
+            return data
+
         data = array.array('B', [])             # Empty array of bytes
         try:
             data = self.UsbDevice.read(0x82, 64, 30)
@@ -1364,6 +2028,7 @@ class clsTacxUsbTrainer(clsTacxTrainer):
                 pass
             else:
                 logfile.Console("Read from USB trainer error: " + str(e))
+                usbTopology.Invalidate()        # Device may be gone
         if debug.on(debug.Data2):
             logfile.Write   ("Trainer recv data=%s (len=%s)"    % (logfile.HexSpace(data), len(data)))
 #           logfile.Console ("Trainer recv data=%s (len=%s) %s" % (logfile.HexSpace(data), len(data), type(data)))
@@ -1458,10 +2123,34 @@ class clsTacxUsbTrainer(clsTacxTrainer):
                     logfile.Write ("                  tacx mode=%s target=%s pe=%s weight=%s cal=%s" % \
                                                 (TacxMode, Target, PedalEcho, Weight, Calibrate))
 
-                try:
-                    self.UsbDevice.write(0x02, data, 30)                             # send data to device
-                except Exception as e:
-                    logfile.Console("Write to USB trainer error: " + str(e))
+                if self.UsbTransfer:
+                    self.UsbTransfer.Write(data)                                    # sent by transfer thread
+                else:
+                    try:
+                        self.UsbDevice.write(0x02, data, 30)                         # send data to device
+                    except Exception as e:
+                        logfile.Console("Write to USB trainer error: " + str(e))
+                        usbTopology.Invalidate()                            # Device may be gone
+
+    #---------------------------------------------------------------------------
+    # S t a r t A s y n c T r a n s f e r
+    #---------------------------------------------------------------------------
+    # input     UsbDevice, clv.UsbAsync
+    #
+    # function  From now on, USB-transfers are done by clsUsbAsyncTransfer
+    #           Called by the Runoff and Tacx2Dongle loops, after the headunit
+    #           is initialized using blocking transfers in __init__(); stopped
+    #           by StopAsyncTransfer() at the end of the loop.
+    #
+    # returns   None
+    #---------------------------------------------------------------------------
+    def StartAsyncTransfer(self):
+        if self.clv.UsbAsync and not self.UsbTransfer:
+            self.UsbTransfer = clsUsbAsyncTransfer(self.UsbDevice)
+            self.UsbSequence = 0
+            self.UsbReused   = False
+            self.UsbTransfer.Start()
+            logfile.Console("USB async transfer started")
 
 #-------------------------------------------------------------------------------
 # c l s T a c x L e g a c y U s b T r a i n e r
@@ -1579,82 +2268,31 @@ class clsTacxLegacyUsbTrainer(clsTacxUsbTrainer):
         #-----------------------------------------------------------------------
         data = self.USB_Read()
 
-        #-----------------------------------------------------------------------
-        # Define buffer format
-        #-----------------------------------------------------------------------
-        nStatusAndCursors   = 0                 # 0
-        fStatusAndCursors   = sc.unsigned_char
-
-        nSpeed              = 1                 # 1, 2      Wheel speed (Speed = WheelSpeed / SpeedScale in km/h)
-        fSpeed              = sc.unsigned_short
-
-        nCadence            = 2                 # 3
-        fCadence            = sc.unsigned_char
-
-        nHeartRate          = 3                 # 4
-        fHeartRate          = sc.unsigned_char
-
-        #nStopWatch         = 4
-        fStopWatch          = sc.unsigned_int   # 5,6,7,8
-
-        nCurrentResistance  = 5                 # 9
-        fCurrentResistance  = sc.unsigned_char
-
-        nPedalSensor        = 6                 # 10
-        fPedalSensor        = sc.unsigned_char
-
-        #nAxis0             = 7                 # 11
-        fAxis0              = sc.unsigned_char
-
-        nAxis1              = 8                 # 12
-        fAxis1              = sc.unsigned_char
-
-        #nAxis2             = 9                 # 13
-        fAxis2              = sc.unsigned_char
-
-        #nAxis3             = 10                # 14
-        fAxis3              = sc.unsigned_char
-
-        #nCounter           = 11                # 15
-        fCounter            = sc.unsigned_char
-
-        #nWheelCount        = 12                # 16
-        fWheelCount         = sc.unsigned_char
-
-        #nYearProduction    = 13                # 17
-        fYearProduction     = sc.unsigned_char
-
-        #nDeviceSerial      = 14                # 18, 19
-        fDeviceSerial       = sc.unsigned_short
+        if self.UsbReused:                  # Async: no newer frame, keep values
+            pass
+        elif len(data) < LegacyFrame.size:
+            logfile.Console('Tacx returns insufficient data, len=%s' % len(data))
+        else:
+            #-------------------------------------------------------------------
+            # Parse buffer (see LegacyFrame)
+            # Note that the button-bits have an inversed logic:
+            #   1=not pushed, 0=pushed. Hence the xor.
+            #-------------------------------------------------------------------
+            StatusAndCursors, self.WheelSpeed, self.Cadence, self.HeartRate, \
+                _StopWatch, self.CurrentResistance, self.PedalEcho, _Axis0, \
+                self.Axis, _Axis2, _Axis3, _Counter, _WheelCount, \
+                _YearProduction, _DeviceSerial, _FirmwareVersion = \
+                LegacyFrame.unpack_from(data)
 
-        #nFirmwareVersion   = 15                # 20
-        fFirmwareVersion    = sc.unsigned_char
+            self.Buttons             = ((StatusAndCursors & 0xf0) >> 4) ^ 0x0f
 
-        #-----------------------------------------------------------------------
-        # Parse buffer
-        # Note that the button-bits have an inversed logic:
-        #   1=not pushed, 0=pushed. Hence the xor.
-        #-----------------------------------------------------------------------
-        format = sc.no_alignment + fStatusAndCursors + fSpeed + fCadence + fHeartRate + fStopWatch + fCurrentResistance + \
-                fPedalSensor + fAxis0 + fAxis1 + fAxis2 + fAxis3 + fCounter + fWheelCount + \
-                fYearProduction + fDeviceSerial + fFirmwareVersion
-        tuple = struct.unpack (format, data)
-
-        self.Axis                = tuple[nAxis1]
-        self.Buttons             = ((tuple[nStatusAndCursors] & 0xf0) >> 4) ^ 0x0f
-        self.Cadence             = tuple[nCadence]
-        self.CurrentResistance   = tuple[nCurrentResistance]
-        self.HeartRate           = tuple[nHeartRate]
-        self.PedalEcho           = tuple[nPedalSensor]
-        self.WheelSpeed          = tuple[nSpeed]
-
-        self.Wheel2Speed()
-        self.CurrentResistance2Power()
+            self.Wheel2Speed()
+            self.CurrentResistance2Power()
 
-        if debug.on(debug.Function):
-            logfile.Write ("ReceiveFromTrainer() = hr=%s Buttons=%s, Cadence=%s Speed=%s TargetRes=%s CurrentRes=%s CurrentPower=%s, pe=%s %s" % \
-                (  self.HeartRate, self.Buttons, self.Cadence, self.SpeedKmh, self.TargetResistance, self.CurrentResistance, self.CurrentPower, self.PedalEcho, self.Message) \
-                          )
+            if debug.on(debug.Function):
+                logfile.Write ("ReceiveFromTrainer() = hr=%s Buttons=%s, Cadence=%s Speed=%s TargetRes=%s CurrentRes=%s CurrentPower=%s, pe=%s %s" % \
+                    (  self.HeartRate, self.Buttons, self.Cadence, self.SpeedKmh, self.TargetResistance, self.CurrentResistance, self.CurrentPower, self.PedalEcho, self.Message) \
+                              )
 
 #-------------------------------------------------------------------------------
 # c l s T a c x N e w U s b T r a i n e r
@@ -1683,6 +2321,26 @@ class clsTacxNewUsbTrainer(clsTacxUsbTrainer):
                                                     # 01 = T1901 (Magnetic brake)
         self.Version2               = 0
 
+        self.DeviceSerial           = None          # Introduced 2026-10-18
+        self.HardwareKey            = hardwareCache.DeviceKey(UsbDevice)
+
+        self.InitLatency            = []            # Introduced 2026-10-18
+        self.ReceivePolls           = 0             # Reads for short buffers
+        self.ReceiveTimeMax         = 0             # Slowest _ReadFrame()
+
+        self.FramesGood             = 0             # Counters of received frames
+        self.FramesShort            = 0             # 0 < len < 40
+        self.FramesEmpty            = 0             # len = 0 (or USB timeout)
+        self.FramesTimedOut         = 0             # No valid frame in time
+        self.FramesReused           = 0             # LastGoodFrame used instead
+        self.FramesRepeated         = 0             # Async: no newer frame yet
+        self.ShortRate              = 0             # Recent short-frame rate 0...1
+        self.PollInterval           = 1 / clv.PollRate  # Max adaptive _ReadFrame()
+        self.LastGoodFrame          = None
+
+        self.MotorBrakeVerify       = 0             # Attempts left to verify cache
+        self.MotorBrakeAsked        = False         # Version asked, answer pending
+
         #---------------------------------------------------------------------------
         # Resistance values for MagneticBrake
         # - possible force values to be recv from device
@@ -1705,31 +2363,79 @@ class clsTacxNewUsbTrainer(clsTacxUsbTrainer):
         #---------------------------------------------------------------------------
         # Initial state = stop
         # Do not refresh() before sending a command
+        #
+        # 2026-10-18 Each step waits for the reply of the headunit (_ReadFrame)
+        #   instead of sleeping 100ms after each command.
         #---------------------------------------------------------------------------
+        StartTime = time.monotonic()
         self.SendToTrainer(True, modeStop)
-        time.sleep(0.1)                            # Allow head unit time to process
         self.Refresh(True, modeStop)
-        time.sleep(0.1)                            # Allow head unit time to process
+        self.__Latency('stop', StartTime)
 
-        if True:
+        #---------------------------------------------------------------------------
+        # 2026-10-18 The motor brake was probed during a previous start when
+        #   the same headunit (serial in the first frame) is on the same port.
+        #   The brake may have been swapped, so the version is asked during the
+        #   first cycles after start; see _VerifyMotorBrake().
+        #---------------------------------------------------------------------------
+        Identity = hardwareCache.Get('Headunit', self.HardwareKey)
+        if Identity and Identity.get('DeviceSerial') == self.DeviceSerial \
+                    and 'MotorBrakeUnitType' in Identity:
+            self.MotorBrakeUnitFirmware = Identity['MotorBrakeUnitFirmware']
+            self.MotorBrakeUnitSerial   = Identity['MotorBrakeUnitSerial']
+            self.MotorBrakeUnitYear     = Identity['MotorBrakeUnitYear']
+            self.MotorBrakeUnitType     = Identity['MotorBrakeUnitType']
+            self.Version2               = Identity['Version2']
+            self.MotorBrake             = Identity['MotorBrake']
+            self.MotorBrakeVerify       = 4
+            self.__Latency('version(cached)', time.monotonic())
+            logfile.Console ("Motor Brake Unit Firmware=%s Serial=%5s year=%s type=T19%s Version2=%s MotorBrake=%s (cached)" % \
+                            (   self.MotorBrakeUnitFirmware, self.MotorBrakeUnitSerial, \
+                                self.MotorBrakeUnitYear + 2000, self.MotorBrakeUnitType, \
+                                self.Version2, self.MotorBrake) \
+                            )
+        else:
             #-----------------------------------------------------------------------
             # Check motor brake version
             #-----------------------------------------------------------------------
+            StepTime = time.monotonic()
             self.SendToTrainer(True, modeMotorBrake)
-            time.sleep(0.1)                        # Allow head unit time to process
             self._ReceiveFromTrainer_MotorBrake()
-            time.sleep(0.1)                        # Allow head unit time to process
+            self.__Latency('version', StepTime)
+            self.__CacheMotorBrake()
 
             #-----------------------------------------------------------------------
             # Refresh with stop-command
             #-----------------------------------------------------------------------
+            StepTime = time.monotonic()
             self.SendToTrainer(True, modeStop)
-            time.sleep(0.1)                        # Allow head unit time to process
             self.Refresh(True, modeStop)
+            self.__Latency('stop', StepTime)
+
+        logfile.Console ("Headunit initialised in %sms (%s)" % \
+                            (int((time.monotonic() - StartTime) * 1000), \
+                             ', '.join(['%s=%sms' % l for l in self.InitLatency])))
 
         #---------------------------------------------------------------------------
         if debug.on(debug.Function):logfile.Write ("clsTacxNewUsbTrainer.__init__() done")
 
+    def __CacheMotorBrake(self, Values = {}):
+        if self.DeviceSerial != None:
+            hardwareCache.Put('Headunit', self.HardwareKey, \
+                dict({'DeviceSerial'          : self.DeviceSerial,
+                      'MotorBrakeUnitFirmware': self.MotorBrakeUnitFirmware,
+                      'MotorBrakeUnitSerial'  : self.MotorBrakeUnitSerial,
+                      'MotorBrakeUnitYear'    : self.MotorBrakeUnitYear,
+                      'MotorBrakeUnitType'    : self.MotorBrakeUnitType,
+                      'Version2'              : self.Version2,
+                      'MotorBrake'            : self.MotorBrake}, **Values))
+
+    def __Latency(self, Step, StartTime):
+        Latency = int((time.monotonic() - StartTime) * 1000)
+        self.InitLatency.append((Step, Latency))
+        if debug.on(debug.Function):
+            logfile.Write ("clsTacxNewUsbTrainer.__init__() %s done in %sms" % (Step, Latency))
+
     #---------------------------------------------------------------------------
     # Basic physics: Power = Resistance * Speed  <==> Resistance = Power / Speed
     #---------------------------------------------------------------------------
@@ -1931,6 +2637,74 @@ class clsTacxNewUsbTrainer(clsTacxUsbTrainer):
         data   = struct.pack (format, 0x00000002)
         return data
 
+    #---------------------------------------------------------------------------
+    # R e a d F r a m e
+    #---------------------------------------------------------------------------
+    # input     Timeout; None = adaptive
+    #
+    # function  Read from the headunit until a frame of 40+ bytes is received,
+    #           or Timeout seconds expired.
+    #           USB_Read() waits max 30ms for data; a short (or empty) buffer is
+    #           read again after a pause, giving the headunit time to talk to
+    #           the brake. The first pause is short (2ms) and doubles on every
+    #           retry (back-off).
+    #
+    #           Adaptive timeout: when short frames are rare, waiting is worth
+    #           it (max 0.4s, as the original 4 retries). When the headunit
+    #           returns short frames often (ShortRate, moving average over
+    #           about 20 reads), waiting would freeze the control loop; the
+    #           timeout drops to 50ms and the caller reuses the last good frame.
+    #           The timeout never exceeds one poll interval, so that the loop
+    #           is not stalled for more than one cycle.
+    #
+    #           With async transfer, the newest frame is returned at once; the
+    #           transfer thread keeps reading, so polling is of no use. A frame
+    #           seen before (UsbReused) is not counted.
+    #
+    # returns   data; may be a short buffer when timed out
+    #---------------------------------------------------------------------------
+    def _ReadFrame(self, Timeout = None):
+        if Timeout == None:
+            Timeout = min(self.PollInterval, max(0.05, 0.4 * (1 - self.ShortRate)))
+
+        StartTime = time.monotonic()
+        Pause     = 0.002
+        data      = self.USB_Read()         # Try without a sleep first!
+        while True:
+            if self.UsbReused:
+                break
+            #-------------------------------------------------------------------
+            # Count what's received and maintain the short-frame rate
+            #-------------------------------------------------------------------
+            if   len(data) >= 40: self.FramesGood  += 1
+            elif len(data) == 0:  self.FramesEmpty += 1
+            else:                 self.FramesShort += 1
+            self.ShortRate = self.ShortRate * 0.95 + (0.05 if len(data) < 40 else 0)
+
+            if len(data) >= 40 or self.UsbTransfer \
+                    or time.monotonic() - StartTime + Pause > Timeout:
+                break
+
+            if debug.on(debug.Any):
+                logfile.Write ('Poll because short buffer received, len=%s' % len(data))
+            self.ReceivePolls += 1
+            time.sleep(Pause)
+            Pause *= 2
+            data = self.USB_Read()
+
+        if len(data) < 40 and not self.UsbReused:
+            self.FramesTimedOut += 1
+        self.ReceiveTimeMax = max(self.ReceiveTimeMax, time.monotonic() - StartTime)
+        return data
+
+    def Statistics(self):
+        return "Trainer: initialised in %s; slowest receive %3.0fms, %s polls for short buffers\n" % \
+                (', '.join(['%s=%sms' % l for l in self.InitLatency]), \
+                 self.ReceiveTimeMax * 1000, self.ReceivePolls) + \
+               "Trainer frames: good=%s short=%s empty=%s timed-out=%s reused=%s repeated=%s" % \
+                (self.FramesGood, self.FramesShort, self.FramesEmpty, \
+                 self.FramesTimedOut, self.FramesReused, self.FramesRepeated)
+
     #---------------------------------------------------------------------------
     # R e c e i v e F r o m T r a i n e r
     #---------------------------------------------------------------------------
@@ -1967,127 +2741,72 @@ class clsTacxNewUsbTrainer(clsTacxUsbTrainer):
         # 2020-11-18 sleep() only done when too short buffer received
         #   As said this SHOULD occur seldomly; if frequently it's bad behaviour
         #   at this location. It is logged so that we don't mis it.
-        #-----------------------------------------------------------------------
-        retry = 4
-        data  = array.array('B', [])        # Empty Binary array
-        data  = self.USB_Read()             # Try without a sleep first!
-        while retry and len(data) < 40:
-            if debug.on(debug.Any):
-                logfile.Write ('Retry because short buffer received')
-            time.sleep(0.1)             # 2020-09-29 short delay @RogerPleijers
-            data = self.USB_Read()
-            retry -= 1
-
-        if len(data) < 40:
+        #
+        # 2026-10-18 No fixed sleep(0.1) anymore; _ReadFrame() polls for a valid
+        #   frame with back-off, the time depending on the short-frame rate.
+        #   If no valid frame is received, the last good frame is used again,
+        #   so that ERG-mode continues with the last known values; buttons and
+        #   pedal echo are not repeated.
+        #   The message is given once per 100 time-outs.
+        #   With async transfer, a frame seen before is parsed again without a
+        #   message; buttons and pedal echo are not repeated.
+        #   The answer on a version request (see SendToTrainer) is no status;
+        #   the previous frame is parsed again as well.
+        #-----------------------------------------------------------------------
+        data   = self._ReadFrame()
+        Reused = False
+        Repeat = self.UsbReused             # Async: no newer frame, not an error
+
+        if self.MotorBrakeAsked and not self.UsbReused:
+            self.MotorBrakeAsked = False
+            Repeat = self._VerifyMotorBrake(data)
+
+        if Repeat:
+            if self.LastGoodFrame == None:
+                return
+            data   = self.LastGoodFrame
+            Reused = True
+            self.FramesRepeated += 1
+        elif len(data) < 40 and self.LastGoodFrame != None:
+            data   = self.LastGoodFrame
+            Reused = True
+            self.FramesReused += 1
+
+        if len(data) < 40 or (Reused and not Repeat and self.FramesReused % 100 == 1):
             # 2020-09-29 the buffer is ignored when too short (was processed before)
-            logfile.Console('Tacx returns insufficient data, len=%s' % len(data))
+            if Reused:
+                logfile.Console('Tacx returns insufficient data, last good data used (%s times)' % \
+                                    self.FramesReused)
+            else:
+                logfile.Console('Tacx returns insufficient data, len=%s' % len(data))
             if self.clv.PedalStrokeAnalysis:
                 logfile.Console('To resolve, try to run without Pedal Stroke Analysis.')
             else:
                 logfile.Console('To resolve, check all cabling for loose contacts.')
-        else:
-            #-----------------------------------------------------------------------
-            # Define buffer format
-            #-----------------------------------------------------------------------
-            #nDeviceSerial      =  0                # 0...1
-            fDeviceSerial       = sc.unsigned_short
-
-            fFiller2_7          = sc.pad * ( 7 - 1) # 2...7
-
-            #nYearProduction    =  1                # 8
-            fYearProduction     = sc.unsigned_char
-
-            fFiller9_11         = sc.pad * (11 - 8) # 9...11
-
-            nHeartRate          =  2                # 12
-            fHeartRate          = sc.unsigned_char
-
-            nButtons            =  3                # 13
-            fButtons            = sc.unsigned_char
-
-            #nHeartDetect       =  4                # 14
-            fHeartDetect        = sc.unsigned_char
-
-            #nErrorCount        =  5                # 15
-            fErrorCount         = sc.unsigned_char
-
-            #nAxis0             =  6                # 16-17
-            fAxis0              = sc.unsigned_short
-
-            nAxis1              =  7                # 18-19
-            fAxis1              = sc.unsigned_short
-
-            #nAxis2             =  8                # 20-21
-            fAxis2              = sc.unsigned_short
-
-            #nAxis3             =  9                # 22-23
-            fAxis3              = sc.unsigned_short
-
-            #nHeader            = 10                # 24-27
-            fHeader             = sc.unsigned_int
-
-            #nDistance          = 11                # 28-31
-            fDistance           = sc.unsigned_int
-
-            nSpeed              = 12                # 32, 33            Wheel speed (Speed = WheelSpeed / SpeedScale in km/h)
-            fSpeed              = sc.unsigned_short
-
-            fFiller34_35        = sc.pad * 2        # 34...35           Increases if you accellerate?
-            fFiller36_37        = sc.pad * 2        # 36...37           Average power?
-
-            nCurrentResistance  = 13                # 38, 39
-            fCurrentResistance  = sc.short
-
-            nTargetResistance   = 14                # 40, 41
-            fTargetResistance   = sc.short
 
-            nEvents             = 15                # 42
-            fEvents             = sc.unsigned_char
-
-            fFiller43           = sc.pad            # 43
-
-            nCadence            = 16                # 44
-            fCadence            = sc.unsigned_char
-
-            fFiller45           = sc.pad            # 45
-
-            #nModeEcho          = 17                # 46
-            fModeEcho           = sc.unsigned_char
-
-            #nChecksumLSB       = 18                # 47
-            fChecksumLSB        = sc.unsigned_char
-
-            #nChecksumMSB       = 19                # 48
-            fChecksumMSB        = sc.unsigned_char
-
-            fFiller49_63        = sc.pad * (63 - 48)# 49...63
-
-            format = sc.no_alignment + fDeviceSerial + fFiller2_7 + fYearProduction + \
-                    fFiller9_11 + fHeartRate + fButtons + fHeartDetect + fErrorCount + \
-                    fAxis0 + fAxis1 + fAxis2 + fAxis3 + fHeader + fDistance + fSpeed + \
-                    fFiller34_35 + fFiller36_37 + fCurrentResistance + fTargetResistance + \
-                    fEvents + fFiller43 + fCadence + fFiller45 + fModeEcho + \
-                    fChecksumLSB + fChecksumMSB + fFiller49_63
+        if len(data) >= 40:
+            if not Reused:
+                self.LastGoodFrame = data
 
             #-----------------------------------------------------------------------
-            # Buffer must be 64 characters (struct.calcsize(format)),
-            # Note that tt_FortiusSB returns 48 bytes only; append with dummy
+            # 64 and 48 byte buffers are parsed as is (see NewUsbFrame),
+            # a shorter buffer is appended with dummy bytes
             #-----------------------------------------------------------------------
-            for _v in range( 64 - len(data) ):
-                data.append(0)
+            if len(data) < NewUsbFrame.size:
+                data = bytes(data) + bytes(NewUsbFrame.size - len(data))
 
             #-----------------------------------------------------------------------
             # Parse buffer
             #-----------------------------------------------------------------------
-            tuple = struct.unpack (format, data)
-            self.Axis               = tuple[nAxis1]
-            self.Buttons            = tuple[nButtons]
-            self.Cadence            = tuple[nCadence]
-            self.CurrentResistance  = tuple[nCurrentResistance]
-            self.HeartRate          = tuple[nHeartRate]
-            self.PedalEcho          = tuple[nEvents]
-            self.TargetResistanceFT = tuple[nTargetResistance]
-            self.WheelSpeed         = tuple[nSpeed]
+            self.DeviceSerial, _YearProduction, self.HeartRate, self.Buttons, \
+                _HeartDetect, _ErrorCount, _Axis0, self.Axis, _Axis2, _Axis3, \
+                _Header, _Distance, self.WheelSpeed, self.CurrentResistance, \
+                self.TargetResistanceFT, self.PedalEcho, self.Cadence, \
+                _ModeEcho, _ChecksumLSB = NewUsbFrame.unpack_from(data)
+
+            if Reused:
+                self.Buttons   = 0
+                self.PedalEcho = 0
 
             self.Wheel2Speed()
             self.CurrentResistance2Power()
@@ -2111,49 +2830,49 @@ class clsTacxNewUsbTrainer(clsTacxUsbTrainer):
         #-----------------------------------------------------------------------
         # Read from trainer
         #-----------------------------------------------------------------------
-        data  = array.array('B', [])        # Empty Binary array
-        data  = self.USB_Read()
-
+        # 2026-10-18 Poll until the version is received; a remaining status
+        #   frame (on the previous command) is skipped.
+        #   A T1901 magnetic brake does not answer, then Timeout applies and
+        #   the first received frame is parsed, as before.
+        #   Timeout is the total, as the two 100ms sleeps before; each
+        #   _ReadFrame() gets the remaining time minus one USB_Read().
+        #-----------------------------------------------------------------------
+        Timeout   = 0.2
+        ReadTime  = 0.03                    # USB_Read() waits max 30ms
+        StartTime = time.monotonic()
+        First     = None
+        while True:
+            Remaining = Timeout - (time.monotonic() - StartTime)
+            data      = self._ReadFrame(max(0, Remaining - ReadTime))
+            if len(data) >= 40:
+                if MotorBrakeFrame.unpack_from(data)[2] // 10000000 in (41, 42):
+                    break                   # Valid T1941/T1942 serial
+                if First == None: First = data
+            if Timeout - (time.monotonic() - StartTime) < ReadTime:
+                if First != None: data = First
+                break
+
+        self._ParseMotorBrake(data)
+
+    #---------------------------------------------------------------------------
+    # P a r s e M o t o r B r a k e
+    #---------------------------------------------------------------------------
+    # input     data; the answer on modeMotorBrake
+    #           Remark; added to the message
+    #
+    # function  Set the identity of the motor brake
+    #
+    # returns   None
+    #---------------------------------------------------------------------------
+    def _ParseMotorBrake(self, data, Remark = ''):
         if len(data) < 40:
             pass
         else:
             #-----------------------------------------------------------------------
-            # Define buffer format
-            #-----------------------------------------------------------------------
-            fFiller0_23             = sc.pad * 24       #  0...23
-
-            _nHeader                = 0
-            fHeader                 = sc.unsigned_int   # 24...27
-
-            nMotorBrakeUnitFirmware = 1
-            fMotorBrakeUnitFirmware = sc.unsigned_int   # 28...31   0.x.y.z
-
-            nMotorBrakeUnitSerial   = 2                 # 32...35   tt-YY-##### (tt=41 (T1941), YY=year,
-            fMotorBrakeUnitSerial   = sc.unsigned_int   #                 ##### brake individual serial)
-
-            nVersion2               = 3                 # 36, 37
-            fVersion2               = sc.unsigned_short
-
-            fFiller38_63            = sc.pad * (63-37)  # 38...63
-
-            format = sc.no_alignment + fFiller0_23 + fHeader + fMotorBrakeUnitFirmware + \
-                        fMotorBrakeUnitSerial + \
-                        fVersion2 + fFiller38_63
-
-            #-----------------------------------------------------------------------
-            # Buffer must be 64 characters (struct.calcsize(format)),
-            # Note that tt_FortiusSB returns 48 bytes only; append with dummy
+            # Parse buffer (see MotorBrakeFrame)
             #-----------------------------------------------------------------------
-            for _v in range( 64 - len(data) ):
-                data.append(0)
-
-            #-----------------------------------------------------------------------
-            # Parse buffer
-            #-----------------------------------------------------------------------
-            tuple = struct.unpack (format, data)
-            self.MotorBrakeUnitFirmware = tuple[nMotorBrakeUnitFirmware]
-            self.MotorBrakeUnitSerial   = tuple[nMotorBrakeUnitSerial]
-            self.Version2               = tuple[nVersion2]
+            _Header, self.MotorBrakeUnitFirmware, self.MotorBrakeUnitSerial, \
+                self.Version2 = MotorBrakeFrame.unpack_from(data)
 
             #-----------------------------------------------------------------------
             # Split serial; all decimal digits = tt-yy-#####
@@ -2182,8 +2901,103 @@ class clsTacxNewUsbTrainer(clsTacxUsbTrainer):
             #-----------------------------------------------------------------------
             # Important enough; always display
             #-----------------------------------------------------------------------
-            logfile.Console ("Motor Brake Unit Firmware=%s Serial=%5s year=%s type=T19%s Version2=%s MotorBrake=%s" % \
+            logfile.Console ("Motor Brake Unit Firmware=%s Serial=%5s year=%s type=T19%s Version2=%s MotorBrake=%s%s" % \
                             (   self.MotorBrakeUnitFirmware, self.MotorBrakeUnitSerial, \
                                 self.MotorBrakeUnitYear + 2000, self.MotorBrakeUnitType, \
-                                self.Version2, self.MotorBrake) \
+                                self.Version2, self.MotorBrake, Remark) \
                             )
+
+    #---------------------------------------------------------------------------
+    # V e r i f y M o t o r B r a k e
+    #---------------------------------------------------------------------------
+    # input     data; the frame received after asking the version
+    #
+    # function  The motor brake identity is taken from hardwareCache, while
+    #           the brake may have been swapped (same headunit, same port).
+    #           Therefore SendToTrainer() asks the version during the first
+    #           cycles after start (max MotorBrakeVerify times):
+    #           - the same brake answers: verified
+    #           - another motor brake answers: identity replaced, the cache
+    #             rewritten and the cached calibration discarded
+    #           - no answer at all: a T1901 magnetic brake does not answer;
+    #             if a motor brake was cached, the cache entry is discarded so
+    #             that the brake is probed at next start
+    #
+    # returns   True when data is the answer (so not a status frame)
+    #---------------------------------------------------------------------------
+    def _VerifyMotorBrake(self, data):
+        rtn = len(data) >= 40 and \
+              MotorBrakeFrame.unpack_from(data)[2] // 10000000 in (41, 42)
+        if rtn:
+            self.MotorBrakeVerify = 0
+            _Header, Firmware, Serial, Version2 = MotorBrakeFrame.unpack_from(data)
+            Cached = self.MotorBrakeUnitType  * 10000000 + \
+                     self.MotorBrakeUnitYear  *   100000 + \
+                     self.MotorBrakeUnitSerial
+            if self.MotorBrake and (Firmware, Serial, Version2) == \
+                        (self.MotorBrakeUnitFirmware, Cached, self.Version2):
+                if debug.on(debug.Function):
+                    logfile.Write ("clsTacxNewUsbTrainer._VerifyMotorBrake() cached identity verified")
+            else:
+                self._ParseMotorBrake(data, ' (changed)')
+                self.__CacheMotorBrake({'CalibrateTime': 0})
+
+        else:
+            self.MotorBrakeVerify -= 1
+            if self.MotorBrakeVerify == 0 and self.MotorBrake:
+                logfile.Console ("Motor Brake does not answer; identity is probed at next start")
+                self.__CacheMotorBrake({'DeviceSerial': None, 'CalibrateTime': 0})
+        return rtn
+
+    #---------------------------------------------------------------------------
+    # S e n d T o T r a i n e r
+    #---------------------------------------------------------------------------
+    # While verifying the cached motor brake, the version is asked instead of
+    # the resistance; the brake keeps the previous resistance meanwhile.
+    # Stop and calibrate commands are always sent.
+    #---------------------------------------------------------------------------
+    def SendToTrainer(self, QuarterSecond, TacxMode):
+        if self.MotorBrakeVerify and TacxMode == modeResistance:
+            TacxMode             = modeMotorBrake
+            self.MotorBrakeAsked = True
+        super().SendToTrainer(QuarterSecond, TacxMode)
+
+#-------------------------------------------------------------------------------
+# Main program to test the previous functions
+# Micro-benchmark: decode cost per frame, compiled versus composed format
+#-------------------------------------------------------------------------------
+if __name__ == "__main__":
+    import timeit
+
+    Frame64 = array.array('B', range(64))
+    Frame48 = array.array('B', range(48))
+    Legacy  = array.array('B', range(LegacyFrame.size))
+
+    def ComposedNewUsb(data):                   # As done before 2026-10-18
+        data   = array.array('B', data)
+        format = sc.no_alignment + sc.unsigned_short + sc.pad * 6 + \
+                 sc.unsigned_char + sc.pad * 3 + sc.unsigned_char * 4 + \
+                 sc.unsigned_short * 4 + sc.unsigned_int * 2 + \
+                 sc.unsigned_short + sc.pad * 4 + sc.short * 2 + \
+                 sc.unsigned_char + sc.pad + sc.unsigned_char + sc.pad + \
+                 sc.unsigned_char * 3 + sc.pad * 15
+        for _v in range( 64 - len(data) ):
+            data.append(0)
+        return struct.unpack (format, data)
+
+    def ComposedLegacy(data):
+        format = sc.no_alignment + sc.unsigned_char + sc.unsigned_short + \
+                 sc.unsigned_char * 2 + sc.unsigned_int + sc.unsigned_char * 9 + \
+                 sc.unsigned_short + sc.unsigned_char
+        return struct.unpack (format, data)
+
+    n = 100000
+    for name, f in (('NewUsb 64 composed ', lambda: ComposedNewUsb(Frame64)),
+                    ('NewUsb 64 compiled ', lambda: NewUsbFrame.unpack_from(Frame64)),
+                    ('NewUsb 48 composed ', lambda: ComposedNewUsb(Frame48)),
+                    ('NewUsb 48 compiled ', lambda: NewUsbFrame.unpack_from(Frame48)),
+                    ('MotorBrake compiled', lambda: MotorBrakeFrame.unpack_from(Frame64)),
+                    ('Legacy    composed ', lambda: ComposedLegacy(Legacy)),
+                    ('Legacy    compiled ', lambda: LegacyFrame.unpack_from(Legacy))):
+        t = timeit.timeit(f, number=n)
+        print ("%s %6.3f us/frame" % (name, t / n * 1000000))